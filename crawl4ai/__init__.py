@@ -3,7 +3,7 @@ import warnings
 
 from .async_webcrawler import AsyncWebCrawler, CacheMode
 # MODIFIED: Add SeedingConfig and VirtualScrollConfig here
-from .async_configs import BrowserConfig, CrawlerRunConfig, HTTPCrawlerConfig, LLMConfig, ProxyConfig, GeolocationConfig, SeedingConfig, VirtualScrollConfig, LinkPreviewConfig, MatchMode, DomainMapperConfig
+from .async_configs import BrowserConfig, CrawlerRunConfig, HTTPCrawlerConfig, LLMConfig, ProxyConfig, GeolocationConfig, SeedingConfig, VirtualScrollConfig, LinkPreviewConfig, NetworkCaptureConfig, MatchMode, DomainMapperConfig
 
 from .content_scraping_strategy import (
     ContentScrapingStrategy,
@@ -48,9 +48,15 @@ from .link_preview import LinkPreview
 from .async_dispatcher import (
     MemoryAdaptiveDispatcher,
     SemaphoreDispatcher,
+    ProcessFleetDispatcher,
+    FrontierDispatcher,
     RateLimiter,
+    RetryPolicy,
+    DeadLetterSink,
+    CrawlBudget,
     BaseDispatcher,
 )
+from .resource_sampler import ResourceSampler, ResourceSample
 from .docker_client import Crawl4aiDockerClient
 from .hub import CrawlerHub
 from .browser_profiler import BrowserProfiler
@@ -72,10 +78,17 @@ from .deep_crawling import (
     PathDepthScorer,
     BestFirstCrawlingStrategy,
     DFSDeepCrawlStrategy,
+    FrontierCrawlingStrategy,
     DeepCrawlDecorator,
     ContentRelevanceFilter,
     ContentTypeScorer,
 )
+from .frontier import (
+    CrawlFrontier,
+    FrontierItem,
+    InMemoryFrontier,
+    RedisFrontier,
+)
 # NEW: Import AsyncUrlSeeder
 from .async_url_seeder import AsyncUrlSeeder
 from .domain_mapper import DomainMapper
@@ -136,6 +149,11 @@ __all__ = [
     "BFSDeepCrawlStrategy",
     "BestFirstCrawlingStrategy",
     "DFSDeepCrawlStrategy",
+    "FrontierCrawlingStrategy",
+    "CrawlFrontier",
+    "FrontierItem",
+    "InMemoryFrontier",
+    "RedisFrontier",
     "FilterChain",
     "URLPatternFilter",
     "ContentTypeFilter",
@@ -181,7 +199,14 @@ __all__ = [
     "BaseDispatcher",
     "MemoryAdaptiveDispatcher",
     "SemaphoreDispatcher",
+    "ProcessFleetDispatcher",
+    "FrontierDispatcher",
     "RateLimiter",
+    "RetryPolicy",
+    "DeadLetterSink",
+    "CrawlBudget",
+    "ResourceSampler",
+    "ResourceSample",
     "CrawlerMonitor",
     "LinkPreview",
     "DisplayMode",
@@ -204,7 +229,8 @@ __all__ = [
     "BrowserAdapter",
     "PlaywrightAdapter", 
     "UndetectedAdapter",
-    "LinkPreviewConfig"
+    "LinkPreviewConfig",
+    "NetworkCaptureConfig",
 ]
 
 
@@ -15,6 +15,7 @@ from .config import (
     PAGE_TIMEOUT,
     IMAGE_SCORE_THRESHOLD,
     SOCIAL_MEDIA_DOMAINS,
+    DEFAULT_DOWNLOAD_PREVIEW_SIZE,
 )
 
 from .user_agent_generator import UAGen, ValidUAGenerator  # , OnlineUAGenerator
@@ -28,9 +29,10 @@ from .table_extraction import TableExtractionStrategy, DefaultTableExtraction
 
 from .cache_context import CacheMode
 from .proxy_strategy import ProxyRotationStrategy
+from .screenshot_pipeline import normalize_format
 
 import inspect
-from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 from enum import Enum
 
 # Type alias for URL matching
@@ -127,6 +129,7 @@ ALLOWED_DESERIALIZE_TYPES = {
     "BrowserConfig", "CrawlerRunConfig", "HTTPCrawlerConfig",
     "LLMConfig", "ProxyConfig", "GeolocationConfig",
     "SeedingConfig", "VirtualScrollConfig", "LinkPreviewConfig", "DomainMapperConfig",
+    "NetworkCaptureConfig",
     # Extraction strategies
     "JsonCssExtractionStrategy", "JsonXPathExtractionStrategy",
     "JsonLxmlExtractionStrategy", "LLMExtractionStrategy",
@@ -241,9 +244,11 @@ UNTRUSTED_FIELD_ALLOWLIST = {
         # cache
         "cache_mode", "bypass_cache", "disable_cache", "no_cache_read",
         "no_cache_write", "check_cache_freshness", "cache_validation_timeout",
+        "coalesce_requests",
         "fetch_ssl_certificate",
         # timing / waiting
-        "wait_until", "page_timeout", "wait_for", "wait_for_timeout",
+        "wait_until", "quiescence_window", "quiescence_timeout",
+        "page_timeout", "wait_for", "wait_for_timeout",
         "wait_for_images", "delay_before_return_html", "mean_delay", "max_range",
         # scrolling / rendering
         "ignore_body_visibility", "scan_full_page", "scroll_delay",
@@ -252,7 +257,8 @@ UNTRUSTED_FIELD_ALLOWLIST = {
         "adjust_viewport_to_content", "virtual_scroll_config",
         # media / capture
         "screenshot", "screenshot_wait_for", "screenshot_height_threshold",
-        "force_viewport_screenshot", "pdf", "capture_mhtml",
+        "force_viewport_screenshot", "screenshot_format", "screenshot_quality",
+        "screenshot_max_width", "screenshot_max_height", "pdf", "capture_mhtml",
         "image_description_min_word_threshold", "image_score_threshold",
         "table_score_threshold",
         # links / images filtering
@@ -302,6 +308,14 @@ def _clamp_untrusted(type_name: str, params: dict) -> dict:
         for f in ("page_timeout", "wait_for_timeout"):
             if f in params:
                 params[f] = _cap_timeout(params[f])
+        # The quiescence wait is in seconds; same bound as the timeouts above
+        if "quiescence_timeout" in params:
+            params["quiescence_timeout"] = _cap_timeout(
+                params["quiescence_timeout"] * 1000
+                if isinstance(params["quiescence_timeout"], (int, float)) else None
+            ) / 1000
+        if isinstance(params.get("quiescence_window"), (int, float)):
+            params["quiescence_window"] = max(0, min(params["quiescence_window"], _MAX_TIMEOUT_MS / 1000))
         if isinstance(params.get("max_scroll_steps"), int):
             params["max_scroll_steps"] = min(params["max_scroll_steps"], _MAX_SCROLL_STEPS)
     elif type_name == "BrowserConfig":
@@ -741,6 +755,8 @@ class BrowserConfig:
                                  Default: False.
         downloads_path (str or None): Directory to store downloaded files. If None and accept_downloads is True,
                                       a default path will be created. Default: None.
+        max_download_size (int or None): Bytes a browser download may have; larger downloads are
+                                         discarded instead of saved. None = unlimited. Default: None.
         storage_state (str or dict or None): An in-memory storage state (cookies, localStorage).
                                              Default: None.
         ignore_https_errors (bool): Ignore HTTPS certificate errors. Default: True.
@@ -771,11 +787,45 @@ class BrowserConfig:
                                         process to reclaim leaked memory. 0 = disabled.
                                         Recommended: 500-1000 for long-running crawlers.
                                         Default: 0.
+        page_pool_size (int): Number of pages (idle or in use) the pool keeps per browser context.
+                              Missing pages are created and stealthed ahead of time; finished pages
+                              are reset and reused instead of being closed. The reset covers
+                              navigation, routes, extra headers, viewport and crawl4ai's own event
+                              handlers, not changes made by user hooks: while a hook that is handed
+                              the page is set (on_page_context_created, before_goto, ...), pages are
+                              closed after each crawl as without a pool. 0 = disabled. Default: 0.
+        page_pool_max_uses (int): Crawls served by one pooled page before it is closed and replaced,
+                                  bounding leaks from long-lived pages. Default: 25.
+        browser_shards (int): Number of browser processes to launch behind one crawler. Pages are
+                              spread across them, and a crashed shard is restarted without
+                              affecting the others. Only for dedicated (locally launched,
+                              non-persistent) browsers. Default: 1.
+        shard_assignment (str): How pages are assigned to shards: "least_loaded" (fewest pages in
+                                flight) or "host_affinity" (same host, same shard).
+                                Default: "least_loaded".
+        subresource_cache_dir (str or None): Directory of an on-disk cache for static subresources
+                                             (scripts, stylesheets, fonts, images), shared across
+                                             contexts, shards and runs. Responses are stored only
+                                             when their Cache-Control/Expires headers allow it.
+                                             None = disabled. Default: None.
+        health_check_interval (float): Seconds between browser health checks (CDP ping, memory).
+                                       Crashes and disconnects are detected without it.
+                                       0 = no periodic checks. Default: 0.
+        health_ping_timeout (float): A CDP ping slower than this marks the browser unresponsive
+                                     and relaunches it. Default: 5.0.
+        max_browser_rss_mb (float or None): Relaunch the browser when the resident memory of its
+                                            processes exceeds this many MB. Checked every
+                                            health_check_interval. Default: None.
         avoid_ads (bool): If True, blocks ad-related and tracker network requests at the
                           browser context level using a curated blocklist of top ad/tracker
                           domains. Default: False.
         avoid_css (bool): If True, blocks loading of CSS files (css, less, scss, sass) to
                           reduce resource usage and speed up crawling. Default: False.
+        request_blocking_backend (str): How text_mode / avoid_css / avoid_ads blocking is applied.
+                                        "route": one Playwright route handler per context.
+                                        "cdp": Network.setBlockedURLs, so blocked requests never
+                                        reach Python (Chromium only; blocks by URL, not by
+                                        resource type). Default: "route".
     """
 
     def __init__(
@@ -803,6 +853,7 @@ class BrowserConfig:
         device_scale_factor: float = 1.0,
         accept_downloads: bool = False,
         downloads_path: str = None,
+        max_download_size: Optional[int] = None,
         storage_state: Union[str, dict, None] = None,
         ignore_https_errors: bool = True,
         java_script_enabled: bool = True,
@@ -826,9 +877,18 @@ class BrowserConfig:
         enable_stealth: bool = False,
         avoid_ads: bool = False,
         avoid_css: bool = False,
+        request_blocking_backend: str = "route",
         init_scripts: List[str] = None,
         memory_saving_mode: bool = False,
         max_pages_before_recycle: int = 0,
+        page_pool_size: int = 0,
+        page_pool_max_uses: int = 25,
+        browser_shards: int = 1,
+        shard_assignment: str = "least_loaded",
+        subresource_cache_dir: Optional[str] = None,
+        health_check_interval: float = 0.0,
+        health_ping_timeout: float = 5.0,
+        max_browser_rss_mb: Optional[float] = None,
     ):
         
         self.browser_type = browser_type
@@ -875,6 +935,9 @@ class BrowserConfig:
         self.device_scale_factor = device_scale_factor
         self.accept_downloads = accept_downloads
         self.downloads_path = downloads_path
+        if max_download_size is not None and max_download_size <= 0:
+            raise ValueError("max_download_size must be positive")
+        self.max_download_size = max_download_size
         self.storage_state = storage_state
         self.ignore_https_errors = ignore_https_errors
         self.java_script_enabled = java_script_enabled
@@ -893,9 +956,18 @@ class BrowserConfig:
         self.enable_stealth = enable_stealth
         self.avoid_ads = avoid_ads
         self.avoid_css = avoid_css
+        self.request_blocking_backend = request_blocking_backend
         self.init_scripts = init_scripts if init_scripts is not None else []
         self.memory_saving_mode = memory_saving_mode
         self.max_pages_before_recycle = max_pages_before_recycle
+        self.page_pool_size = page_pool_size
+        self.page_pool_max_uses = page_pool_max_uses
+        self.browser_shards = browser_shards
+        self.shard_assignment = shard_assignment
+        self.subresource_cache_dir = subresource_cache_dir
+        self.health_check_interval = health_check_interval
+        self.health_ping_timeout = health_ping_timeout
+        self.max_browser_rss_mb = max_browser_rss_mb
 
         fa_user_agenr_generator = ValidUAGenerator()
         if self.user_agent_mode == "random":
@@ -970,6 +1042,7 @@ class BrowserConfig:
             "device_scale_factor": self.device_scale_factor,
             "accept_downloads": self.accept_downloads,
             "downloads_path": self.downloads_path,
+            "max_download_size": self.max_download_size,
             "storage_state": self.storage_state,
             "ignore_https_errors": self.ignore_https_errors,
             "java_script_enabled": self.java_script_enabled,
@@ -988,9 +1061,18 @@ class BrowserConfig:
             "enable_stealth": self.enable_stealth,
             "avoid_ads": self.avoid_ads,
             "avoid_css": self.avoid_css,
+            "request_blocking_backend": self.request_blocking_backend,
             "init_scripts": self.init_scripts,
             "memory_saving_mode": self.memory_saving_mode,
             "max_pages_before_recycle": self.max_pages_before_recycle,
+            "page_pool_size": self.page_pool_size,
+            "page_pool_max_uses": self.page_pool_max_uses,
+            "browser_shards": self.browser_shards,
+            "shard_assignment": self.shard_assignment,
+            "subresource_cache_dir": self.subresource_cache_dir,
+            "health_check_interval": self.health_check_interval,
+            "health_ping_timeout": self.health_ping_timeout,
+            "max_browser_rss_mb": self.max_browser_rss_mb,
         }
 
 
@@ -1247,8 +1329,119 @@ class LinkPreviewConfig:
         return LinkPreviewConfig.from_dict(config_dict)
 
 
+class NetworkCaptureConfig:
+    """Limits, filters and output of capture_network_requests / capture_console_messages.
+
+    Without it, every request and response (with its full text body) is kept
+    in memory and attached to the result.
+    """
+
+    FORMATS = ("jsonl", "har")
+
+    def __init__(
+        self,
+        resource_types: Optional[List[str]] = None,
+        url_patterns: Optional[List[str]] = None,
+        status_ranges: Optional[List[Tuple[int, int]]] = None,
+        max_body_size: Optional[int] = None,
+        body_resource_types: Optional[List[str]] = None,
+        max_entries: Optional[int] = None,
+        max_console_messages: Optional[int] = None,
+        output_dir: Optional[str] = None,
+        output_format: str = "jsonl",
+    ):
+        """
+        Initialize network capture configuration.
+
+        Args:
+            resource_types: Only capture these Playwright resource types
+                (e.g. ["document", "xhr", "fetch"]). None = all.
+            url_patterns: Only capture URLs matching one of these glob patterns
+                (e.g. ["*/api/*"]). None = all.
+            status_ranges: Only capture responses whose status is in one of these
+                inclusive ranges (e.g. [(200, 299), (400, 599)]). None = all.
+            max_body_size: Bytes of a response body to keep; longer bodies are
+                truncated, and bodies whose Content-Length exceeds it are not
+                read at all. 0 = no bodies. None = unlimited.
+            body_resource_types: Resource types whose bodies are read. None = all.
+            max_entries: Keep only the newest N network events. None = unlimited.
+            max_console_messages: Keep only the newest N console messages. None = unlimited.
+            output_dir: Stream network events to a file in this directory as they
+                arrive, instead of keeping them in CrawlResult.network_requests.
+                The file path is in CrawlResult.network_capture_path.
+            output_format: "jsonl" (one event per line) or "har" (HAR 1.2,
+                one entry per response or failed request).
+        """
+        if output_format not in self.FORMATS:
+            raise ValueError(f"output_format must be one of {self.FORMATS}, got {output_format!r}")
+        if max_body_size is not None and max_body_size < 0:
+            raise ValueError("max_body_size must be >= 0")
+        for limit in (max_entries, max_console_messages):
+            if limit is not None and limit <= 0:
+                raise ValueError("max_entries and max_console_messages must be positive")
+        self.resource_types = resource_types
+        self.url_patterns = url_patterns
+        self.status_ranges = [tuple(r) for r in status_ranges] if status_ranges else None
+        self.max_body_size = max_body_size
+        self.body_resource_types = body_resource_types
+        self.max_entries = max_entries
+        self.max_console_messages = max_console_messages
+        self.output_dir = output_dir
+        self.output_format = output_format
+
+    @staticmethod
+    def from_dict(config_dict: Dict[str, Any]) -> "NetworkCaptureConfig":
+        """Create NetworkCaptureConfig from dictionary."""
+        if not config_dict:
+            return None
+        return NetworkCaptureConfig(**config_dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary format."""
+        return {
+            "resource_types": self.resource_types,
+            "url_patterns": self.url_patterns,
+            "status_ranges": [list(r) for r in self.status_ranges] if self.status_ranges else None,
+            "max_body_size": self.max_body_size,
+            "body_resource_types": self.body_resource_types,
+            "max_entries": self.max_entries,
+            "max_console_messages": self.max_console_messages,
+            "output_dir": self.output_dir,
+            "output_format": self.output_format,
+        }
+
+    def clone(self, **kwargs) -> "NetworkCaptureConfig":
+        """Create a copy with updated values."""
+        config_dict = self.to_dict()
+        config_dict.update(kwargs)
+        return NetworkCaptureConfig.from_dict(config_dict)
+
+
 class HTTPCrawlerConfig:
-    """HTTP-specific crawler configuration"""
+    """HTTP-specific crawler configuration
+
+    Transport options:
+        http2 (bool): Use an HTTP/2-capable transport (httpx). Requests to a host
+            are multiplexed over a few kept-alive connections; servers without
+            HTTP/2 are spoken to over HTTP/1.1. Default: False (aiohttp, HTTP/1.1).
+        max_connections_per_host (int or None): Cap on connections to a single host.
+            With http2=True each origin then gets its own connection pool, and its
+            requests are multiplexed over at most this many connections. None = only
+            the strategy-wide limit applies.
+        keepalive_expiry (float): Seconds an idle connection is kept open for reuse.
+        max_body_size (int or None): Bytes of (decompressed) body to accept. Larger
+            responses fail with ResponseTooLargeError, without being read to the end.
+            None = unlimited.
+
+    File downloads (non-HTML responses) are streamed to downloads_path rather
+    than buffered, so max_body_size does not apply to them:
+        max_download_size (int or None): Bytes a download may have. Larger downloads
+            fail with ResponseTooLargeError and the partial file is removed.
+            None = unlimited.
+        download_preview_size (int or None): Bytes of a text download (CSV, JSON, ...)
+            decoded into ``html``. The file on disk is always complete.
+            None = the whole file. Default: 1 MiB.
+    """
 
     method: str = "GET"
     headers: Optional[Dict[str, str]] = None
@@ -1257,6 +1450,12 @@ class HTTPCrawlerConfig:
     follow_redirects: bool = True
     verify_ssl: bool = True
     downloads_path: Optional[str] = None
+    http2: bool = False
+    max_connections_per_host: Optional[int] = None
+    keepalive_expiry: float = 15.0
+    max_body_size: Optional[int] = None
+    max_download_size: Optional[int] = None
+    download_preview_size: Optional[int] = DEFAULT_DOWNLOAD_PREVIEW_SIZE
 
     def __init__(
         self,
@@ -1267,6 +1466,12 @@ class HTTPCrawlerConfig:
         follow_redirects: bool = True,
         verify_ssl: bool = True,
         downloads_path: Optional[str] = None,
+        http2: bool = False,
+        max_connections_per_host: Optional[int] = None,
+        keepalive_expiry: float = 15.0,
+        max_body_size: Optional[int] = None,
+        max_download_size: Optional[int] = None,
+        download_preview_size: Optional[int] = DEFAULT_DOWNLOAD_PREVIEW_SIZE,
     ):
         self.method = method
         self.headers = headers
@@ -1275,6 +1480,20 @@ class HTTPCrawlerConfig:
         self.follow_redirects = follow_redirects
         self.verify_ssl = verify_ssl
         self.downloads_path = downloads_path
+        if max_connections_per_host is not None and max_connections_per_host <= 0:
+            raise ValueError("max_connections_per_host must be positive")
+        if max_body_size is not None and max_body_size <= 0:
+            raise ValueError("max_body_size must be positive")
+        if max_download_size is not None and max_download_size <= 0:
+            raise ValueError("max_download_size must be positive")
+        if download_preview_size is not None and download_preview_size < 0:
+            raise ValueError("download_preview_size must be >= 0")
+        self.http2 = http2
+        self.max_connections_per_host = max_connections_per_host
+        self.keepalive_expiry = keepalive_expiry
+        self.max_body_size = max_body_size
+        self.max_download_size = max_download_size
+        self.download_preview_size = download_preview_size
 
     @staticmethod
     def from_kwargs(kwargs: dict) -> "HTTPCrawlerConfig":
@@ -1286,6 +1505,12 @@ class HTTPCrawlerConfig:
             follow_redirects=kwargs.get("follow_redirects", True),
             verify_ssl=kwargs.get("verify_ssl", True),
             downloads_path=kwargs.get("downloads_path"),
+            http2=kwargs.get("http2", False),
+            max_connections_per_host=kwargs.get("max_connections_per_host"),
+            keepalive_expiry=kwargs.get("keepalive_expiry", 15.0),
+            max_body_size=kwargs.get("max_body_size"),
+            max_download_size=kwargs.get("max_download_size"),
+            download_preview_size=kwargs.get("download_preview_size", DEFAULT_DOWNLOAD_PREVIEW_SIZE),
         )
 
     def to_dict(self):
@@ -1297,6 +1522,12 @@ class HTTPCrawlerConfig:
             "follow_redirects": self.follow_redirects,
             "verify_ssl": self.verify_ssl,
             "downloads_path": self.downloads_path,
+            "http2": self.http2,
+            "max_connections_per_host": self.max_connections_per_host,
+            "keepalive_expiry": self.keepalive_expiry,
+            "max_body_size": self.max_body_size,
+            "max_download_size": self.max_download_size,
+            "download_preview_size": self.download_preview_size,
         }
 
     def clone(self, **kwargs):
@@ -1430,10 +1661,21 @@ class CrawlerRunConfig():
                                       Default: False.
         cache_validation_timeout (float): Timeout in seconds for cache validation HTTP requests.
                                           Default: 10.0.
+        coalesce_requests (bool): If True, concurrent crawls of the same URL with the same
+                                  fetch settings share one fetch; each caller still runs
+                                  its own scraping and extraction. Default: True.
 
         # Page Navigation and Timing Parameters
         wait_until (str): The condition to wait for when navigating, e.g. "domcontentloaded".
+                          "quiescent" navigates to domcontentloaded, then waits until the DOM
+                          has not changed and no request has been in flight for
+                          quiescence_window seconds; this wait replaces the fixed
+                          delay_before_return_html sleep.
                           Default: "domcontentloaded".
+        quiescence_window (float): Seconds of DOM and network silence that count as quiescent.
+                                   Default: 0.5.
+        quiescence_timeout (float): Upper bound in seconds for each quiescence wait (long-polling
+                                    pages never go quiet). Default: 10.0.
         page_timeout (int): Timeout in ms for page operations like navigation.
                             Default: 60000 (60 seconds).
         wait_for (str or None): A CSS selector or JS condition to wait for before extracting content.
@@ -1500,6 +1742,15 @@ class CrawlerRunConfig():
         force_viewport_screenshot (bool): If True, always take viewport-only screenshots regardless of page height.
                                           When False, uses automatic decision (viewport for short pages, full-page for long pages).
                                           Default: False.
+        screenshot_format (str): Screenshot encoding: "png", "jpeg" or "webp". Default: "png".
+        screenshot_quality (int): Quality (1-100) for "jpeg" and "webp" screenshots. Default: 85.
+        screenshot_max_width (int or None): Downscale screenshots wider than this, keeping the aspect ratio.
+                                            Default: None.
+        screenshot_max_height (int or None): Downscale screenshots taller than this, keeping the aspect ratio.
+                                             Default: None.
+        screenshot_dir (str or None): If set, screenshots are written to this directory (named by content
+                                      hash) and CrawlResult.screenshot_path is set instead of the base64
+                                      CrawlResult.screenshot. Default: None.
         pdf (bool): Whether to generate a PDF of the page.
                     Default: False.
         image_description_min_word_threshold (int): Minimum words for image description extraction.
@@ -1513,6 +1764,13 @@ class CrawlerRunConfig():
         table_extraction (TableExtractionStrategy): Strategy to use for table extraction.
                                      Default: DefaultTableExtraction with table_score_threshold.
 
+        # Network and Console Capturing Parameters
+        network_capture_config (NetworkCaptureConfig or dict or None): Filters, body size limit, ring-buffer
+                                                                       caps and streaming file output for
+                                                                       capture_network_requests and
+                                                                       capture_console_messages.
+                                                                       Default: None (capture everything in memory).
+
         # Virtual Scroll Parameters
         virtual_scroll_config (VirtualScrollConfig or dict or None): Configuration for handling virtual scroll containers.
                                                                      Used for capturing content from pages with virtualized 
@@ -1624,8 +1882,11 @@ class CrawlerRunConfig():
         # Cache Validation Parameters (Smart Cache)
         check_cache_freshness: bool = False,
         cache_validation_timeout: float = 10.0,
+        coalesce_requests: bool = True,
         # Page Navigation and Timing Parameters
         wait_until: str = "domcontentloaded",
+        quiescence_window: float = 0.5,
+        quiescence_timeout: float = 10.0,
         page_timeout: int = PAGE_TIMEOUT,
         wait_for: str = None,
         wait_for_timeout: int = None,
@@ -1656,6 +1917,11 @@ class CrawlerRunConfig():
         screenshot_wait_for: float = None,
         screenshot_height_threshold: int = SCREENSHOT_HEIGHT_TRESHOLD,
         force_viewport_screenshot: bool = False,
+        screenshot_format: str = "png",
+        screenshot_quality: int = 85,
+        screenshot_max_width: Optional[int] = None,
+        screenshot_max_height: Optional[int] = None,
+        screenshot_dir: Optional[str] = None,
         pdf: bool = False,
         capture_mhtml: bool = False,
         image_description_min_word_threshold: int = IMAGE_DESCRIPTION_MIN_WORD_THRESHOLD,
@@ -1678,6 +1944,7 @@ class CrawlerRunConfig():
         # Network and Console Capturing Parameters
         capture_network_requests: bool = False,
         capture_console_messages: bool = False,
+        network_capture_config: Union[NetworkCaptureConfig, Dict[str, Any]] = None,
         # Connection Parameters
         method: str = "GET",
         stream: bool = False,
@@ -1752,9 +2019,12 @@ class CrawlerRunConfig():
         # Cache Validation (Smart Cache)
         self.check_cache_freshness = check_cache_freshness
         self.cache_validation_timeout = cache_validation_timeout
+        self.coalesce_requests = coalesce_requests
 
         # Page Navigation and Timing Parameters
         self.wait_until = wait_until
+        self.quiescence_window = quiescence_window
+        self.quiescence_timeout = quiescence_timeout
         self.page_timeout = page_timeout
         self.wait_for = wait_for
         self.wait_for_timeout = wait_for_timeout
@@ -1787,6 +2057,11 @@ class CrawlerRunConfig():
         self.screenshot_wait_for = screenshot_wait_for
         self.screenshot_height_threshold = screenshot_height_threshold
         self.force_viewport_screenshot = force_viewport_screenshot
+        self.screenshot_format = normalize_format(screenshot_format)
+        self.screenshot_quality = screenshot_quality
+        self.screenshot_max_width = screenshot_max_width
+        self.screenshot_max_height = screenshot_max_height
+        self.screenshot_dir = screenshot_dir
         self.pdf = pdf
         self.capture_mhtml = capture_mhtml
         self.image_description_min_word_threshold = image_description_min_word_threshold
@@ -1819,6 +2094,14 @@ class CrawlerRunConfig():
         # Network and Console Capturing Parameters
         self.capture_network_requests = capture_network_requests
         self.capture_console_messages = capture_console_messages
+        if network_capture_config is None:
+            self.network_capture_config = None
+        elif isinstance(network_capture_config, NetworkCaptureConfig):
+            self.network_capture_config = network_capture_config
+        elif isinstance(network_capture_config, dict):
+            self.network_capture_config = NetworkCaptureConfig.from_dict(network_capture_config)
+        else:
+            raise ValueError("network_capture_config must be NetworkCaptureConfig object or dict")
 
         # Connection Parameters
         self.stream = stream
@@ -2123,8 +2406,11 @@ class CrawlerRunConfig():
             "disable_cache": self.disable_cache,
             "no_cache_read": self.no_cache_read,
             "no_cache_write": self.no_cache_write,
+            "coalesce_requests": self.coalesce_requests,
             "shared_data": self.shared_data,
             "wait_until": self.wait_until,
+            "quiescence_window": self.quiescence_window,
+            "quiescence_timeout": self.quiescence_timeout,
             "page_timeout": self.page_timeout,
             "wait_for": self.wait_for,
             "wait_for_timeout": self.wait_for_timeout,
@@ -2151,6 +2437,11 @@ class CrawlerRunConfig():
             "screenshot": self.screenshot,
             "screenshot_wait_for": self.screenshot_wait_for,
             "screenshot_height_threshold": self.screenshot_height_threshold,
+            "screenshot_format": self.screenshot_format,
+            "screenshot_quality": self.screenshot_quality,
+            "screenshot_max_width": self.screenshot_max_width,
+            "screenshot_max_height": self.screenshot_max_height,
+            "screenshot_dir": self.screenshot_dir,
             "pdf": self.pdf,
             "capture_mhtml": self.capture_mhtml,
             "image_description_min_word_threshold": self.image_description_min_word_threshold,
@@ -2170,6 +2461,7 @@ class CrawlerRunConfig():
             "log_console": self.log_console,
             "capture_network_requests": self.capture_network_requests,
             "capture_console_messages": self.capture_console_messages,
+            "network_capture_config": self.network_capture_config.to_dict() if self.network_capture_config else None,
             "method": self.method,
             "stream": self.stream,
             "prefetch": self.prefetch,
@@ -1,36 +1,51 @@
 from __future__ import annotations
 
 import asyncio
-import base64
 import time
 from abc import ABC, abstractmethod
-from typing import Callable, Dict, Any, List, Union
-from typing import Optional, AsyncGenerator, Final
+from typing import Callable, Dict, Any, List, Tuple, Union
+from typing import Optional, AsyncIterator, Final
 import os
 from playwright.async_api import Page, Error
 from playwright.async_api import TimeoutError as PlaywrightTimeoutError
-from io import BytesIO
-from PIL import Image, ImageDraw, ImageFont
 import hashlib
 import random
+import re
 import uuid
 from .js_snippet import load_js_script
 from .models import AsyncCrawlResponse
 from .config import SCREENSHOT_HEIGHT_TRESHOLD
+from .screenshot_pipeline import (
+    encode_image,
+    error_image,
+    normalize_format,
+    reencode,
+    stitch,
+    to_base64,
+    write_to_sink,
+)
 from .async_configs import BrowserConfig, CrawlerRunConfig, HTTPCrawlerConfig
 from .async_logger import AsyncLogger
 from .ssl_certificate import SSLCertificate
 from .user_agent_generator import ValidUAGenerator, UAGen
-from .browser_manager import BrowserManager
+from .browser_manager import BrowserManager, ShardedBrowserManager
+from .browser_health import BrowserCrashedError, crash_reason
+from .network_capture import NetworkCapture
+from .page_listeners import listen, unlisten
+from .charset import decode_body, decode_file, detect_charset, sniff_charset
+from .warc import WARCWriter
+from .dns_cache import CachedResolver, cached_httpx_transport
 from .browser_adapter import BrowserAdapter, PlaywrightAdapter, UndetectedAdapter
 
 import aiofiles
 import aiohttp
-import chardet
+import httpx
+import ssl
 from aiohttp.client import ClientTimeout
 from urllib.parse import urlparse
 from types import MappingProxyType
 import contextlib
+from collections import Counter, OrderedDict, deque
 from functools import partial
 
 class AsyncCrawlerStrategy(ABC):
@@ -43,6 +58,45 @@ class AsyncCrawlerStrategy(ABC):
     async def crawl(self, url: str, **kwargs) -> AsyncCrawlResponse:
         pass  # 4 + 3
 
+class _NetworkActivity:
+    """
+    Tracks a page's in-flight requests for wait_until="quiescent".
+
+    Listeners are attached before navigation and must be detached after the
+    crawl, so reused pages do not accumulate handlers.
+    """
+
+    def __init__(self, page: Page):
+        self.page = page
+        self.in_flight = set()
+        self.last_activity = time.monotonic()
+
+    def _started(self, request) -> None:
+        self.in_flight.add(request)
+        self.last_activity = time.monotonic()
+
+    def _done(self, request) -> None:
+        self.in_flight.discard(request)
+        self.last_activity = time.monotonic()
+
+    def attach(self) -> "_NetworkActivity":
+        listen(self.page, "request", self._started)
+        listen(self.page, "requestfinished", self._done)
+        listen(self.page, "requestfailed", self._done)
+        return self
+
+    def detach(self) -> None:
+        unlisten(self.page, "request", self._started)
+        unlisten(self.page, "requestfinished", self._done)
+        unlisten(self.page, "requestfailed", self._done)
+
+    def idle_for(self) -> float:
+        """Seconds without a request in flight (0 while one is)."""
+        if self.in_flight:
+            return 0.0
+        return time.monotonic() - self.last_activity
+
+
 class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
     """
     Crawler strategy using Playwright.
@@ -51,6 +105,7 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
         browser_config (BrowserConfig): Configuration object containing browser settings.
         logger (AsyncLogger): Logger instance for recording events and errors.
         _downloaded_files (List[str]): List of downloaded file paths.
+        _download_hashes (Dict[str, str]): sha256 of each downloaded file, by path.
         hooks (Dict[str, Callable]): Dictionary of hooks for custom behavior.
         browser_manager (BrowserManager): Manager for browser creation and management.
 
@@ -72,8 +127,20 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
 
     """
 
+    # Hooks that are handed the crawl's page (see _has_page_hooks)
+    _PAGE_HOOKS = (
+        "on_page_context_created",
+        "on_execution_started",
+        "on_execution_ended",
+        "before_goto",
+        "after_goto",
+        "before_return_html",
+        "before_retrieve_html",
+    )
+
     def __init__(
-        self, browser_config: BrowserConfig = None, logger: AsyncLogger = None, browser_adapter: BrowserAdapter = None, **kwargs
+        self, browser_config: BrowserConfig = None, logger: AsyncLogger = None, browser_adapter: BrowserAdapter = None,
+        warc_writer: Optional[WARCWriter] = None, **kwargs
     ):
         """
         Initialize the AsyncPlaywrightCrawlerStrategy with a browser configuration.
@@ -84,6 +151,7 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             logger: Logger instance for recording events and errors.
             browser_adapter (BrowserAdapter): Browser adapter for handling browser-specific operations.
                                            If None, defaults to PlaywrightAdapter.
+            warc_writer (WARCWriter): Archive every page navigation (and its redirects) to this WARC file.
             **kwargs: Additional arguments for backwards compatibility and extending functionality.
         """
         # Initialize browser config, either from provided object or kwargs
@@ -94,8 +162,11 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
         # Initialize browser adapter
         self.adapter = browser_adapter or PlaywrightAdapter()
 
+        self.warc_writer = warc_writer
+
         # Initialize session management
         self._downloaded_files = []
+        self._download_hashes = {}
 
         # Initialize hooks system
         self.hooks = {
@@ -110,8 +181,13 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             "before_retrieve_html": None,
         }
 
-        # Initialize browser manager with config
-        self.browser_manager = BrowserManager(
+        # Initialize browser manager with config (one per browser shard if requested)
+        manager_cls = (
+            ShardedBrowserManager
+            if self.browser_config.browser_shards > 1
+            else BrowserManager
+        )
+        self.browser_manager = manager_cls(
             browser_config=self.browser_config, 
             logger=self.logger,
             use_undetected=isinstance(self.adapter, UndetectedAdapter)
@@ -187,6 +263,15 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
         else:
             raise ValueError(f"Invalid hook type: {hook_type}")
 
+    def _has_page_hooks(self) -> bool:
+        """
+        Whether a hook that is handed the crawl's page is set.
+
+        Such hooks may attach handlers, init scripts or timeouts the page pool
+        cannot undo, so their pages are not reused.
+        """
+        return any(self.hooks.get(hook_type) for hook_type in self._PAGE_HOOKS)
+
     async def execute_hook(self, hook_type: str, *args, **kwargs):
         """
         Execute a hook function for a specific hook type.
@@ -295,6 +380,42 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                                 "or explicitly prefixed with 'js:' or 'css:'."
                             )
 
+    async def wait_for_quiescence(
+        self,
+        page: Page,
+        network: Optional[_NetworkActivity],
+        window: float = 0.5,
+        timeout: float = 10.0,
+    ) -> Tuple[float, bool]:
+        """
+        Wait until the DOM has not changed and no request has been in flight for ``window`` seconds.
+
+        Args:
+            page: Playwright page object
+            network: In-flight request tracker of the page, or None to watch the DOM only
+            window: Seconds of silence required
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            (seconds waited, whether the timeout was hit)
+        """
+        observer_js = load_js_script("quiescence_observer")
+        started = time.monotonic()
+        deadline = started + timeout
+        while True:
+            try:
+                dom_quiet = await page.evaluate(observer_js) / 1000
+            except Exception:
+                dom_quiet = 0.0  # document replaced mid-navigation; the next poll re-installs
+            net_quiet = network.idle_for() if network is not None else window
+            quiet = min(dom_quiet, net_quiet)
+            now = time.monotonic()
+            if quiet >= window:
+                return now - started, False
+            if now >= deadline:
+                return now - started, True
+            await asyncio.sleep(min(max(window - quiet, 0.05), deadline - now))
+
     async def csp_compliant_wait(
         self, page: Page, user_wait_function: str, timeout: float = 30000
     ):
@@ -345,6 +466,10 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
         """
         Process iframes on a page. This function will extract the content of each iframe and replace it with a div containing the extracted content.
 
+        Crawls no longer call this (see collect_frame_html and capture_html,
+        which inline iframes without rewriting the page); it is kept for
+        callers that want the live DOM rewritten.
+
         Args:
             page: Playwright page object
 
@@ -409,6 +534,114 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
         # Return the page object
         return page
 
+    async def collect_frame_html(self, page) -> Dict[str, str]:
+        """
+        Collect the body HTML of each iframe of the page, for capture_html.
+
+        Each <iframe> element is tagged with ``data-crawl4ai-frame="<index>"``
+        and its body is returned under that index. Unlike process_iframes,
+        the page DOM is not rewritten; frames of any origin are read through
+        Playwright.
+
+        Args:
+            page: Playwright page object
+
+        Returns:
+            Dict[str, str]: iframe index -> body HTML
+        """
+        contents = {}
+        for i, frame in enumerate(page.main_frame.child_frames):
+            try:
+                element = await frame.frame_element()
+                await element.evaluate("(el, i) => el.setAttribute('data-crawl4ai-frame', i)", str(i))
+                await frame.wait_for_load_state("load", timeout=30000)
+                contents[str(i)] = await frame.evaluate(
+                    "() => document.body ? document.body.innerHTML : ''"
+                )
+            except Exception as e:
+                self.logger.error(
+                    message="Error processing iframe {index}: {error}",
+                    tag="ERROR",
+                    params={"index": i, "error": str(e)},
+                )
+        return contents
+
+    async def capture_html(
+        self, page: Page, config: CrawlerRunConfig, frame_html: Optional[Dict[str, str]] = None
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        Serialize the page for processing, in a single pass.
+
+        - flatten_shadow_dom or collected iframes: one call of the
+          capture_document.js serializer, which inlines shadow roots and
+          iframe bodies while walking the DOM. A css_selector is applied to
+          the serialized document in the same call.
+        - css_selector: the outerHTML of all matches, in one evaluate call.
+        - otherwise: page.content().
+
+        Args:
+            page (Page): The Playwright page object
+            config (CrawlerRunConfig): Configuration of the crawl
+            frame_html (dict, optional): Output of collect_frame_html
+
+        Returns:
+            Tuple[str, dict]: The HTML, and capture stats
+                ({"method", "duration", "chars", "frames"})
+        """
+        start = time.perf_counter()
+        html = None
+        method = "content"
+        selectors = [s.strip() for s in config.css_selector.split(',')] if config.css_selector else None
+        if config.flatten_shadow_dom or frame_html:
+            method = "serializer"
+            options = {"shadow": bool(config.flatten_shadow_dom), "frames": frame_html or {}}
+            if selectors:
+                options["selectors"] = selectors
+            html = await self.adapter.evaluate(page, load_js_script("capture_document"), options)
+            if selectors and isinstance(html, list):
+                html = self._selector_result(html)
+            if not html or not isinstance(html, str):
+                # Fallback to normal capture if JS returned nothing
+                self.logger.warning(
+                    message="Document serializer returned no content, falling back to page.content()",
+                    tag="SCRAPE",
+                )
+                method = "content"
+                html = None
+        if html is None and selectors:
+            method = "selector"
+            try:
+                html_parts = await self.adapter.evaluate(
+                    page,
+                    """(selectors) => selectors.map(selector => {
+                        try {
+                            return Array.from(document.querySelectorAll(selector))
+                                .map(el => el.outerHTML)
+                                .join('');
+                        } catch (e) {
+                            return '';  // invalid selector
+                        }
+                    })""",
+                    selectors,
+                )
+            except Error as e:
+                raise RuntimeError(f"Failed to extract HTML content: {str(e)}")
+            html = self._selector_result(html_parts)
+        if html is None:
+            html = await page.content()
+
+        return html, {
+            "method": method,
+            "duration": time.perf_counter() - start,
+            "chars": len(html),
+            "frames": len(frame_html or {}),
+        }
+
+    @staticmethod
+    def _selector_result(html_parts: List[str]) -> str:
+        """Wrap the per-selector outerHTML captured for css_selector."""
+        return f"<div class='crawl4ai-result'>\n" + "\n".join(html_parts) + "\n</div>"
+
     async def create_session(self, **kwargs) -> str:
         """
         Creates a new browser session and returns its ID. A browse session is a unique openned page can be reused for multiple crawls.
@@ -457,7 +690,9 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
         screenshot_data = None
 
         if url.startswith(("http://", "https://", "view-source:")):
-            return await self._crawl_web(url, config)
+            return await self._crawl_web(
+                url, config, conditional_headers=kwargs.get("conditional_headers")
+            )
 
         elif url.startswith("file://") or url.startswith("raw://") or url.startswith("raw:"):
             # Check if browser processing is required for file:// or raw: URLs
@@ -489,8 +724,7 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                 local_file_path = url[7:]  # Remove 'file://' prefix
                 if not os.path.exists(local_file_path):
                     raise FileNotFoundError(f"Local file not found: {local_file_path}")
-                with open(local_file_path, "r", encoding="utf-8") as f:
-                    html = f.read()
+                html = await asyncio.to_thread(decode_file, local_file_path)
             else:
                 # Process raw HTML content (raw:// or raw:)
                 html = url[6:] if url.startswith("raw://") else url[4:]
@@ -505,14 +739,61 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                 get_delayed_content=None,
                 # For raw:/file:// URLs, use base_url if provided; don't fall back to the raw content
                 redirected_url=config.base_url,
+                body_size=0,
             )
         else:
             raise ValueError(
                 "URL must start with 'http://', 'https://', 'file://', or 'raw:'"
             )
 
+    async def _route_conditional_headers(
+        self, page: Page, url: str, headers: Dict[str, str]
+    ) -> Tuple[Any, Callable]:
+        """
+        Add ``headers`` (If-None-Match / If-Modified-Since) to the main document
+        request for ``url`` only; subresources keep their own validators.
+        Returns (pattern, handler), to unroute after the crawl.
+        """
+        async def handler(route, request):
+            if request.is_navigation_request() and request.frame == page.main_frame:
+                await route.fallback(headers={**request.headers, **headers})
+            else:
+                await route.fallback()
+
+        # A regex, not a glob: query strings contain glob characters
+        pattern = re.compile("^" + re.escape(url) + "$")
+        await page.route(pattern, handler)
+        return pattern, handler
+
+    async def _archive_navigation(self, response) -> None:
+        """Write the main document response, and the redirects before it, to the WARC file."""
+        hops = [response]
+        request = response.request
+        while request.redirected_from:
+            request = request.redirected_from
+            hop = await request.response()
+            if hop:
+                hops.append(hop)
+        for hop in reversed(hops):
+            try:
+                body = await hop.body() if hop is response else b""
+            except Error:
+                body = b""  # e.g. the page navigated away and the body was evicted
+            await self.warc_writer.write_exchange(
+                hop.url,
+                hop.status,
+                await hop.all_headers(),
+                body,
+                await hop.request.all_headers(),
+                hop.request.method,
+                hop.status_text,
+            )
+
     async def _crawl_web(
-        self, url: str, config: CrawlerRunConfig
+        self,
+        url: str,
+        config: CrawlerRunConfig,
+        conditional_headers: Optional[Dict[str, str]] = None,
     ) -> AsyncCrawlResponse:
         """
         Internal method to crawl web URLs with the specified configuration.
@@ -534,10 +815,18 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
 
         # Reset downloaded files list for new crawl
         self._downloaded_files = []
+        self._download_hashes = {}
         
-        # Initialize capture lists
-        captured_requests = []
-        captured_console = []
+        # Initialize captures
+        network_capture = None
+        capture_limits = config.network_capture_config
+        captured_console = deque(
+            maxlen=capture_limits.max_console_messages if capture_limits else None
+        )
+        network_activity = None
+        revalidate_route = None
+        handle_download = None
+        wait_timings = {}
 
         # Handle user agent with magic mode.
         # For persistent contexts the UA is locked at browser launch time
@@ -616,84 +905,13 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
 
             # Network Request Capturing
             if config.capture_network_requests:
-                async def handle_request_capture(request):
-                    try:
-                        post_data_str = None
-                        try:
-                            # Be cautious with large post data
-                            post_data = request.post_data_buffer
-                            if post_data:
-                                 # Attempt to decode, fallback to base64 or size indication
-                                 try:
-                                     post_data_str = post_data.decode('utf-8', errors='replace')
-                                 except UnicodeDecodeError:
-                                     post_data_str = f"[Binary data: {len(post_data)} bytes]"
-                        except Exception:
-                            post_data_str = "[Error retrieving post data]"
-
-                        captured_requests.append({
-                            "event_type": "request",
-                            "url": request.url,
-                            "method": request.method,
-                            "headers": dict(request.headers), # Convert Header dict
-                            "post_data": post_data_str,
-                            "resource_type": request.resource_type,
-                            "is_navigation_request": request.is_navigation_request(),
-                            "timestamp": time.time()
-                        })
-                    except Exception as e:
-                        if self.logger:
-                            self.logger.warning(f"Error capturing request details for {request.url}: {e}", tag="CAPTURE")
-                        captured_requests.append({"event_type": "request_capture_error", "url": request.url, "error": str(e), "timestamp": time.time()})
-
-                async def handle_response_capture(response):
-                    try:
-                        try:
-                            # body = await response.body()
-                            # json_body = await response.json()
-                            text_body = await response.text()
-                        except Exception as e:
-                            body = None
-                            # json_body = None
-                            # text_body = None
-                        captured_requests.append({
-                            "event_type": "response",
-                            "url": response.url,
-                            "status": response.status,
-                            "status_text": response.status_text,
-                            "headers": dict(response.headers), # Convert Header dict
-                            "from_service_worker": response.from_service_worker,
-                            "request_timing": response.request.timing, # Detailed timing info
-                            "timestamp": time.time(),
-                            "body" : {
-                                # "raw": body,
-                                # "json": json_body,
-                                "text": text_body
-                            }
-                        })
-                    except Exception as e:
-                        if self.logger:
-                            self.logger.warning(f"Error capturing response details for {response.url}: {e}", tag="CAPTURE")
-                        captured_requests.append({"event_type": "response_capture_error", "url": response.url, "error": str(e), "timestamp": time.time()})
-
-                async def handle_request_failed_capture(request):
-                     try:
-                        captured_requests.append({
-                            "event_type": "request_failed",
-                            "url": request.url,
-                            "method": request.method,
-                            "resource_type": request.resource_type,
-                            "failure_text": str(request.failure) if request.failure else "Unknown failure",
-                            "timestamp": time.time()
-                        })
-                     except Exception as e:
-                        if self.logger:
-                            self.logger.warning(f"Error capturing request failed details for {request.url}: {e}", tag="CAPTURE")
-                        captured_requests.append({"event_type": "request_failed_capture_error", "url": request.url, "error": str(e), "timestamp": time.time()})
-
-                page.on("request", handle_request_capture)
-                page.on("response", handle_response_capture)
-                page.on("requestfailed", handle_request_failed_capture)
+                network_capture = NetworkCapture(config.network_capture_config, url, self.logger)
+                await network_capture.open()
+                network_capture.attach(page)
+
+            # In-flight request tracking for wait_until="quiescent" (before goto)
+            if config.wait_until == "quiescent":
+                network_activity = _NetworkActivity(page).attach()
 
             # Console Message Capturing
             handle_console = None
@@ -713,12 +931,10 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
 
             # Set up download handling
             if self.browser_config.accept_downloads:
-                page.on(
-                    "download",
-                    lambda download: asyncio.create_task(
-                        self._handle_download(download)
-                    ),
-                )
+                def handle_download(download):
+                    asyncio.create_task(self._handle_download(download))
+
+                listen(page, "download", handle_download)
 
             # Handle page navigation and content loading
             if not config.js_only:
@@ -726,6 +942,10 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
 
                 # Check if this is a file:// or raw: URL that needs set_content() instead of goto()
                 is_local_content = url.startswith("file://") or url.startswith("raw://") or url.startswith("raw:")
+                # "quiescent" is ours, not Playwright's: navigate to DOM ready, then wait below
+                nav_wait_until = (
+                    "domcontentloaded" if config.wait_until == "quiescent" else config.wait_until
+                )
 
                 if is_local_content:
                     # Load local content using set_content() instead of network navigation
@@ -733,13 +953,12 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                         local_file_path = url[7:]  # Remove 'file://' prefix
                         if not os.path.exists(local_file_path):
                             raise FileNotFoundError(f"Local file not found: {local_file_path}")
-                        with open(local_file_path, "r", encoding="utf-8") as f:
-                            html_content = f.read()
+                        html_content = await asyncio.to_thread(decode_file, local_file_path)
                     else:
                         # raw:// or raw:
                         html_content = url[6:] if url.startswith("raw://") else url[4:]
 
-                    await page.set_content(html_content, wait_until=config.wait_until)
+                    await page.set_content(html_content, wait_until=nav_wait_until)
                     response = None
                     # For raw: URLs, only use base_url if provided; don't fall back to the raw HTML string
                     redirected_url = config.base_url
@@ -759,8 +978,13 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                                 }
                             )
 
+                        if conditional_headers:
+                            revalidate_route = await self._route_conditional_headers(
+                                page, url, conditional_headers
+                            )
+
                         response = await page.goto(
-                            url, wait_until=config.wait_until, timeout=config.page_timeout
+                            url, wait_until=nav_wait_until, timeout=config.page_timeout
                         )
                         redirected_url = page.url
                         redirected_status_code = response.status if response else None
@@ -799,6 +1023,18 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                         status_code = first_resp.status
                         response_headers = first_resp.headers
 
+                    if conditional_headers and status_code == 304:
+                        # Not modified: the caller serves its cached copy
+                        return AsyncCrawlResponse(
+                            html="",
+                            response_headers=response_headers,
+                            status_code=304,
+                            redirected_url=redirected_url,
+                        )
+
+                    if response is not None and self.warc_writer is not None:
+                        await self._archive_navigation(response)
+
                 await self.execute_hook(
                     "after_goto", page, context=context, url=url, response=response, config=config
                 )
@@ -885,12 +1121,20 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             #     if not config.ignore_body_visibility:
             #         raise Error(f"Body element is hidden: {visibility_info}")
 
+            if network_activity is not None:
+                waited, timed_out = await self.wait_for_quiescence(
+                    page, network_activity, config.quiescence_window, config.quiescence_timeout
+                )
+                wait_timings["after_load"] = waited
+                wait_timings["timed_out"] = timed_out
+
             # Handle content loading and viewport adjustment
             if not self.browser_config.text_mode and (
                 config.wait_for_images or config.adjust_viewport_to_content
             ):
                 await page.wait_for_load_state("domcontentloaded")
-                await asyncio.sleep(0.1)
+                if network_activity is None:
+                    await asyncio.sleep(0.1)
 
                 # Check for image loading with improved error handling
                 images_loaded = await self.csp_compliant_wait(
@@ -999,7 +1243,13 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
 
             # Pre-content retrieval hooks and delay
             await self.execute_hook("before_retrieve_html", page, context=context, config=config)
-            if config.delay_before_return_html:
+            if network_activity is not None:
+                waited, timed_out = await self.wait_for_quiescence(
+                    page, network_activity, config.quiescence_window, config.quiescence_timeout
+                )
+                wait_timings["before_html"] = waited
+                wait_timings["timed_out"] = wait_timings.get("timed_out", False) or timed_out
+            elif config.delay_before_return_html:
                 await asyncio.sleep(config.delay_before_return_html)
 
             # --- Phase 3: Post-wait JS (runs on fully-loaded page) ---
@@ -1037,9 +1287,8 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                         params={"error": str(e)},
                     )
 
-            # Process iframes if needed
-            if config.process_iframes:
-                page = await self.process_iframes(page)
+            # Collect iframe bodies; the HTML capture below inlines them
+            frame_html = await self.collect_frame_html(page) if config.process_iframes else None
 
             # Handle CMP/consent popup removal (before generic overlay removal)
             if config.remove_consent_popups:
@@ -1049,40 +1298,9 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             if config.remove_overlay_elements:
                 await self.remove_overlay_elements(page)
 
-            # --- Phase 5: HTML capture ---
-
-            if config.flatten_shadow_dom:
-                # Use JS to serialize the full DOM including shadow roots
-                flatten_js = load_js_script("flatten_shadow_dom")
-                html = await self.adapter.evaluate(page, flatten_js)
-                if not html or not isinstance(html, str):
-                    # Fallback to normal capture if JS returned nothing
-                    self.logger.warning(
-                        message="Shadow DOM flattening returned no content, falling back to page.content()",
-                        tag="SCRAPE",
-                    )
-                    html = await page.content()
-            elif config.css_selector:
-                try:
-                    selectors = [s.strip() for s in config.css_selector.split(',')]
-                    html_parts = []
+            # --- Phase 5: HTML capture (the document is serialized once) ---
 
-                    for selector in selectors:
-                        try:
-                            content = await self.adapter.evaluate(page,
-                                f"""Array.from(document.querySelectorAll("{selector}"))
-                                    .map(el => el.outerHTML)
-                                    .join('')"""
-                            )
-                            html_parts.append(content)
-                        except Error as e:
-                            print(f"Warning: Could not get content for selector '{selector}': {str(e)}")
-
-                    html = f"<div class='crawl4ai-result'>\n" + "\n".join(html_parts) + "\n</div>"
-                except Error as e:
-                    raise RuntimeError(f"Failed to extract HTML content: {str(e)}")
-            else:
-                html = await page.content()
+            html, capture_stats = await self.capture_html(page, config, frame_html)
 
             await self.execute_hook(
                 "before_return_html", page=page, html=html, context=context, config=config
@@ -1092,6 +1310,7 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             start_export_time = time.perf_counter()
             pdf_data = None
             screenshot_data = None
+            screenshot_path = None
             mhtml_data = None
 
             if config.pdf:
@@ -1103,15 +1322,26 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             if config.screenshot:
                 if config.screenshot_wait_for:
                     await asyncio.sleep(config.screenshot_wait_for)
-                screenshot_data = await self.take_screenshot(
-                    page,
+                screenshot_kwargs = dict(
                     screenshot_height_threshold=config.screenshot_height_threshold,
                     force_viewport_screenshot=config.force_viewport_screenshot,
                     scan_full_page=config.scan_full_page,
-                    scroll_delay=config.scroll_delay
+                    scroll_delay=config.scroll_delay,
+                    screenshot_format=config.screenshot_format,
+                    screenshot_quality=config.screenshot_quality,
+                    screenshot_max_width=config.screenshot_max_width,
+                    screenshot_max_height=config.screenshot_max_height,
                 )
+                if config.screenshot_dir:
+                    # File sink: keep the bytes out of the result (and the cache)
+                    screenshot_bytes = await self.capture_screenshot(page, **screenshot_kwargs)
+                    screenshot_path = await asyncio.to_thread(
+                        write_to_sink, screenshot_bytes, config.screenshot_dir, config.screenshot_format
+                    )
+                else:
+                    screenshot_data = await self.take_screenshot(page, **screenshot_kwargs)
 
-            if screenshot_data or pdf_data or mhtml_data:
+            if screenshot_data or screenshot_path or pdf_data or mhtml_data:
                 self.logger.info(
                     message="Exporting media (PDF/MHTML/screenshot) took {duration:.2f}s",
                     tag="EXPORT",
@@ -1150,6 +1380,7 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                 js_execution_result=execution_result,
                 status_code=status_code,
                 screenshot=screenshot_data,
+                screenshot_path=screenshot_path,
                 pdf_data=pdf_data,
                 mhtml_data=mhtml_data,
                 get_delayed_content=get_delayed_content,
@@ -1157,24 +1388,39 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                 downloaded_files=(
                     self._downloaded_files if self._downloaded_files else None
                 ),
+                downloaded_file_hashes=self._download_hashes or None,
                 redirected_url=redirected_url,
                 redirected_status_code=redirected_status_code,
                 # Include captured data if enabled
-                network_requests=captured_requests if config.capture_network_requests else None,
-                console_messages=captured_console if config.capture_console_messages else None,
+                network_requests=network_capture.entries if network_capture else None,
+                network_capture_path=network_capture.path if network_capture else None,
+                console_messages=list(captured_console) if config.capture_console_messages else None,
+                wait_timings=wait_timings or None,
+                capture_stats=capture_stats,
             )
 
         except Exception as e:
+            # The browser died underneath this crawl: report it as retryable
+            reason = crash_reason(page)
+            if reason:
+                raise BrowserCrashedError(
+                    f"Browser crashed ({reason}) while crawling {url}"
+                ) from e
             raise e
 
         finally:
             # Always clean up event listeners to prevent accumulation
             # across reuses (even for session pages).
             try:
-                if config.capture_network_requests:
-                    page.remove_listener("request", handle_request_capture)
-                    page.remove_listener("response", handle_response_capture)
-                    page.remove_listener("requestfailed", handle_request_failed_capture)
+                if network_activity is not None:
+                    network_activity.detach()
+                if revalidate_route is not None:
+                    await page.unroute(*revalidate_route)
+                if network_capture is not None:
+                    network_capture.detach(page)
+                    await network_capture.close()
+                if handle_download is not None:
+                    unlisten(page, "download", handle_download)
                 if config.capture_console_messages:
                     if hasattr(self.adapter, 'retrieve_console_messages'):
                         final_messages = await self.adapter.retrieve_console_messages(page)
@@ -1191,31 +1437,39 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                 except Exception:
                     pass
 
+                # With a page pool, the page is reset and kept for the next crawl
+                recycled = False
+                try:
+                    recycled = await self.browser_manager.recycle_page(
+                        page, reusable=not self._has_page_hooks()
+                    )
+                except Exception:
+                    pass
+
                 # Close the page unless it's the last one in a headless/managed browser
                 try:
                     all_contexts = page.context.browser.contexts
                     total_pages = sum(len(context.pages) for context in all_contexts)
-                    if not (total_pages <= 1 and (self.browser_config.use_managed_browser or self.browser_config.headless)):
+                    if not recycled and not (total_pages <= 1 and (self.browser_config.use_managed_browser or self.browser_config.headless)):
                         await page.close()
                 except Exception:
                     pass
 
-    # async def _handle_full_page_scan(self, page: Page, scroll_delay: float = 0.1):
     async def _handle_full_page_scan(self, page: Page, scroll_delay: float = 0.1, max_scroll_steps: Optional[int] = None):
         """
         Helper method to handle full page scanning.
 
         How it works:
-        1. Get the viewport height.
-        2. Scroll to the bottom of the page.
-        3. Get the total height of the page.
-        4. Scroll back to the top of the page.
-        5. Scroll to the bottom of the page again.
-        6. Continue scrolling until the bottom of the page is reached.
+        1. Scroll down one step at a time inside the page (adaptive_scroll.js).
+        2. After each step, wait until the DOM settles rather than for a fixed
+           delay; steps grow (up to two viewports) while the page settles fast.
+        3. At the bottom, wait up to scroll_delay for the document to grow; stop
+           when it does not (no-growth) or after max_scroll_steps.
+        4. Scroll back to the top, then to the bottom of the page.
 
         Args:
             page (Page): The Playwright page object
-            scroll_delay (float): The delay between page scrolls
+            scroll_delay (float): Upper bound in seconds for the wait after each scroll step
             max_scroll_steps (Optional[int]): Maximum number of scroll steps to perform. Defaults to 10 to prevent infinite scroll hangs.
 
         """
@@ -1234,43 +1488,26 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             viewport_height = viewport_size.get(
                 "height", self.browser_config.viewport_height
             )
-            current_position = viewport_height
 
-            # await page.evaluate(f"window.scrollTo(0, {current_position})")
-            await self.safe_scroll(page, 0, current_position, delay=scroll_delay)
-            # await self.csp_scroll_to(page, 0, current_position)
-            # await asyncio.sleep(scroll_delay)
-
-            # total_height = await page.evaluate("document.documentElement.scrollHeight")
-            dimensions = await self.get_page_dimensions(page)
-            total_height = dimensions["height"]
-
-            scroll_step_count = 0
-            while current_position < total_height:
-                #### 
-                # NEW FEATURE: Check if we've reached the maximum allowed scroll steps
-                # This prevents infinite scrolling on very long pages or infinite scroll scenarios
-                # If max_scroll_steps is None, this check is skipped (unlimited scrolling - original behavior)
-                ####
-                if max_scroll_steps is not None and scroll_step_count >= max_scroll_steps:
-                    break
-                current_position = min(current_position + viewport_height, total_height)
-                await self.safe_scroll(page, 0, current_position, delay=scroll_delay)
-
-                # Increment the step counter for max_scroll_steps tracking
-                scroll_step_count += 1
-                
-                # await page.evaluate(f"window.scrollTo(0, {current_position})")
-                # await asyncio.sleep(scroll_delay)
-
-                # new_height = await page.evaluate("document.documentElement.scrollHeight")
-                dimensions = await self.get_page_dimensions(page)
-                new_height = dimensions["height"]
-
-                if new_height > total_height:
-                    total_height = new_height
+            delay_ms = max(scroll_delay, 0) * 1000
+            scan = await self.adapter.evaluate(
+                page,
+                load_js_script("adaptive_scroll"),
+                {
+                    "viewport": viewport_height,
+                    "maxSteps": max_scroll_steps,
+                    "delayMs": delay_ms,
+                    "quietMs": min(100, delay_ms),
+                    "maxStepFactor": 2,
+                },
+            )
+            total_height = scan["height"]
+            self.logger.debug(
+                message="Full page scan: {steps} steps, stopped on {reason}",
+                tag="PAGE_SCAN",
+                params={"steps": scan["steps"], "reason": scan["stopped"]},
+            )
 
-            # await page.evaluate("window.scrollTo(0, 0)")
             await self.safe_scroll(page, 0, 0)
 
         except Exception as e:
@@ -1280,24 +1517,23 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                 params={"error": str(e)},
             )
         else:
-            # await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
             await self.safe_scroll(page, 0, total_height)
 
     async def _handle_virtual_scroll(self, page: Page, config: "VirtualScrollConfig"):
         """
         Handle virtual scroll containers (e.g., Twitter-like feeds) by capturing
         content at different scroll positions and merging unique elements.
-        
-        Following the design:
-        1. Get container HTML
-        2. Scroll by container height
-        3. Wait and check if container HTML changed
-        4. Three cases:
-           - No change: continue scrolling
-           - New items added (appended): continue (items already in page)
-           - Items replaced: capture HTML chunk and add to list
-        5. After N scrolls, merge chunks if any were captured
-        
+
+        How it works:
+        1. Capture the container's items, hashed by normalized text in the page.
+        2. Scroll by scroll_by and wait for the container to change, at most
+           wait_after_scroll seconds.
+        3. Each step ships back only the items with hashes not seen before.
+        4. Stop after scroll_count steps, or at the end of the container when a
+           step brings no new items.
+        5. If items seen earlier were removed from the DOM (the list recycles
+           its nodes), replace the container content with all captured items.
+
         Args:
             page: The Playwright page object
             config: Virtual scroll configuration
@@ -1305,147 +1541,49 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
         try:
             # Import VirtualScrollConfig to avoid circular import
             from .async_configs import VirtualScrollConfig
-            
+
             # Ensure config is a VirtualScrollConfig instance
             if isinstance(config, dict):
                 config = VirtualScrollConfig.from_dict(config)
-            
+
             self.logger.info(
                 message="Starting virtual scroll capture for container: {selector}",
                 tag="VSCROLL",
                 params={"selector": config.container_selector}
             )
-            
-            # JavaScript function to handle virtual scroll capture
-            virtual_scroll_js = """
-            async (config) => {
-                const container = document.querySelector(config.container_selector);
-                if (!container) {
-                    throw new Error(`Container not found: ${config.container_selector}`);
-                }
-                
-                // List to store HTML chunks when content is replaced
-                const htmlChunks = [];
-                let previousHTML = container.innerHTML;
-                let scrollCount = 0;
-                
-                // Determine scroll amount
-                let scrollAmount;
-                if (typeof config.scroll_by === 'number') {
-                    scrollAmount = config.scroll_by;
-                } else if (config.scroll_by === 'page_height') {
-                    scrollAmount = window.innerHeight;
-                } else { // container_height
-                    scrollAmount = container.offsetHeight;
-                }
-                
-                // Perform scrolling
-                while (scrollCount < config.scroll_count) {
-                    // Scroll the container
-                    container.scrollTop += scrollAmount;
-                    
-                    // Wait for content to potentially load
-                    await new Promise(resolve => setTimeout(resolve, config.wait_after_scroll * 1000));
-                    
-                    // Get current HTML
-                    const currentHTML = container.innerHTML;
-                    
-                    // Determine what changed
-                    if (currentHTML === previousHTML) {
-                        // Case 0: No change - continue scrolling
-                        console.log(`Scroll ${scrollCount + 1}: No change in content`);
-                    } else if (currentHTML.startsWith(previousHTML)) {
-                        // Case 1: New items appended - content already in page
-                        console.log(`Scroll ${scrollCount + 1}: New items appended`);
-                    } else {
-                        // Case 2: Items replaced - capture the previous HTML
-                        console.log(`Scroll ${scrollCount + 1}: Content replaced, capturing chunk`);
-                        htmlChunks.push(previousHTML);
-                    }
-                    
-                    // Update previous HTML for next iteration
-                    previousHTML = currentHTML;
-                    scrollCount++;
-                    
-                    // Check if we've reached the end
-                    if (container.scrollTop + container.clientHeight >= container.scrollHeight - 10) {
-                        console.log(`Reached end of scrollable content at scroll ${scrollCount}`);
-                        // Capture final chunk if content was replaced
-                        if (htmlChunks.length > 0) {
-                            htmlChunks.push(currentHTML);
-                        }
-                        break;
-                    }
-                }
-                
-                // If we have chunks (case 2 occurred), merge them
-                if (htmlChunks.length > 0) {
-                    console.log(`Merging ${htmlChunks.length} HTML chunks`);
-                    
-                    // Parse all chunks to extract unique elements
-                    const tempDiv = document.createElement('div');
-                    const seenTexts = new Set();
-                    const uniqueElements = [];
-                    
-                    // Process each chunk
-                    for (const chunk of htmlChunks) {
-                        tempDiv.innerHTML = chunk;
-                        const elements = tempDiv.children;
-                        
-                        for (let i = 0; i < elements.length; i++) {
-                            const element = elements[i];
-                            // Normalize text for deduplication
-                            const normalizedText = element.innerText
-                                .toLowerCase()
-                                .replace(/[\\s\\W]/g, ''); // Remove spaces and symbols
-                            
-                            if (!seenTexts.has(normalizedText)) {
-                                seenTexts.add(normalizedText);
-                                uniqueElements.push(element.outerHTML);
-                            }
-                        }
-                    }
-                    
-                    // Replace container content with merged unique elements
-                    container.innerHTML = uniqueElements.join('\\n');
-                    console.log(`Merged ${uniqueElements.length} unique elements from ${htmlChunks.length} chunks`);
-                    
-                    return {
-                        success: true,
-                        chunksCount: htmlChunks.length,
-                        uniqueCount: uniqueElements.length,
-                        replaced: true
-                    };
-                } else {
-                    console.log('No content replacement detected, all content remains in page');
-                    return {
-                        success: true,
-                        chunksCount: 0,
-                        uniqueCount: 0,
-                        replaced: false
-                    };
-                }
-            }
-            """
-            
-            # Execute virtual scroll capture
-            result = await self.adapter.evaluate(page, virtual_scroll_js, config.to_dict())
-            
-            if result.get("replaced", False):
+
+            step_js = load_js_script("virtual_scroll_step")
+            items: List[str] = []
+            replaced = False
+            for step in range(config.scroll_count + 1):
+                # Step 0 captures what is rendered before the first scroll
+                batch = await self.adapter.evaluate(
+                    page, step_js, {**config.to_dict(), "scroll": step > 0, "reset": step == 0}
+                )
+                items.extend(batch["new_items"])
+                replaced = batch["replaced"]
+                if step > 0 and batch["at_end"] and not batch["new_items"]:
+                    break
+
+            if replaced:
+                await self.adapter.evaluate(
+                    page,
+                    """([selector, html]) => {
+                        document.querySelector(selector).innerHTML = html;
+                    }""",
+                    [config.container_selector, "\n".join(items)],
+                )
                 self.logger.success(
-                    message="Virtual scroll completed. Merged {unique} unique elements from {chunks} chunks",
+                    message="Virtual scroll completed. Merged {unique} unique elements from {steps} steps",
                     tag="VSCROLL",
-                    params={
-                        "unique": result.get("uniqueCount", 0),
-                        "chunks": result.get("chunksCount", 0)
-                    }
+                    params={"unique": len(items), "steps": step}
                 )
             else:
                 self.logger.info(
                     message="Virtual scroll completed. Content was appended, no merging needed",
                     tag="VSCROLL"
                 )
-            
+
         except Exception as e:
             self.logger.error(
                 message="Virtual scroll capture failed: {error}",
@@ -1462,8 +1600,9 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
         1. Get the suggested filename.
         2. Get the download path.
         3. Log the download.
-        4. Start the download.
-        5. Save the downloaded file.
+        4. Enforce BrowserConfig.max_download_size on the finished download,
+           deleting it without copying when it is too large.
+        5. Save the downloaded file and hash it.
         6. Log the completion.
 
         Args:
@@ -1487,8 +1626,35 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             )
 
             start_time = time.perf_counter()
+            # The browser streams the download itself, so the limit can only be
+            # checked once it is complete: on the browser's own copy when it is
+            # local, else (remote browser) on the saved file
+            limit = self.browser_config.max_download_size
+            browser_copy = None
+            if limit is not None:
+                try:
+                    browser_copy = await download.path()
+                except Error:
+                    pass  # path() is unavailable when connected remotely
+                if browser_copy is not None:
+                    size = os.path.getsize(browser_copy)
+                    if size > limit:
+                        await download.delete()
+                        self._reject_download(suggested_filename, size, limit)
+                        return
+
             await download.save_as(download_path)
             end_time = time.perf_counter()
+
+            if limit is not None and browser_copy is None:
+                size = os.path.getsize(download_path)
+                if size > limit:
+                    os.remove(download_path)
+                    await download.delete()
+                    self._reject_download(suggested_filename, size, limit)
+                    return
+
+            self._download_hashes[download_path] = await asyncio.to_thread(_file_sha256, download_path)
             self._downloaded_files.append(download_path)
 
             self.logger.success(
@@ -1507,6 +1673,13 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                 params={"error": str(e)},
             )
 
+    def _reject_download(self, filename: str, size: int, limit: int) -> None:
+        self.logger.warning(
+            message="Skipped download {filename}: {size} bytes, over max_download_size={limit}",
+            tag="FETCH",
+            params={"filename": filename, "size": size, "limit": limit},
+        )
+
     async def remove_overlay_elements(self, page: Page) -> None:
         """
         Removes popup overlays, modals, cookie notices, and other intrusive elements from the page.
@@ -1743,7 +1916,11 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                     page,
                     screenshot_height_threshold=screenshot_height_threshold,
                     scan_full_page=getattr(config, 'scan_full_page', True),
-                    scroll_delay=config.scroll_delay if config else 0.2
+                    scroll_delay=config.scroll_delay if config else 0.2,
+                    screenshot_format=config.screenshot_format,
+                    screenshot_quality=config.screenshot_quality,
+                    screenshot_max_width=config.screenshot_max_width,
+                    screenshot_max_height=config.screenshot_max_height,
                 )
 
             return screenshot_data, pdf_data, mhtml_data
@@ -1757,51 +1934,63 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             )
             # Return error image for screenshot if it was requested
             if config and config.screenshot:
-                img = Image.new("RGB", (800, 600), color="black")
-                draw = ImageDraw.Draw(img)
-                font = ImageFont.load_default()
-                draw.text((10, 10), error_message, fill=(255, 255, 255), font=font)
-                buffered = BytesIO()
-                img.save(buffered, format="JPEG")
-                screenshot_data = base64.b64encode(buffered.getvalue()).decode("utf-8")
+                screenshot_data = to_base64(error_image(error_message))
             return screenshot_data, pdf_data, mhtml_data
         finally:
             # Clean up the page
             if page:
                 try:
                     await self.browser_manager.release_page_with_context(page)
-                    await page.close()
+                    if not await self.browser_manager.recycle_page(page):
+                        await page.close()
                 except Exception:
                     pass
 
+    @staticmethod
+    def _screenshot_options(kwargs) -> Dict[str, Any]:
+        """Output format, quality and bounds from take_screenshot kwargs."""
+        return {
+            "fmt": normalize_format(kwargs.get("screenshot_format")),
+            "quality": kwargs.get("screenshot_quality") or 85,
+            "max_width": kwargs.get("screenshot_max_width"),
+            "max_height": kwargs.get("screenshot_max_height"),
+        }
+
+    async def _screenshot_needs_scroll(self, page, kwargs) -> bool:
+        # Viewport-only when forced, or when full-page scanning is off
+        if kwargs.get("force_viewport_screenshot", False) or not kwargs.get("scan_full_page", True):
+            return False
+        return await self.page_need_scroll(page)
+
+    async def capture_screenshot(self, page, **kwargs) -> bytes:
+        """
+        Take a screenshot of the current page and return the encoded image bytes.
+
+        Same decision logic and kwargs as take_screenshot, without the base64
+        step. Used by the file sink (CrawlerRunConfig.screenshot_dir).
+        """
+        if await self._screenshot_needs_scroll(page, kwargs):
+            return await self._capture_scrolled(page, **kwargs)
+        return await self._capture_viewport(page, **kwargs)
+
     async def take_screenshot(self, page, **kwargs) -> str:
         """
         Take a screenshot of the current page.
 
         Args:
             page (Page): The Playwright page object
-            kwargs: Additional keyword arguments
+            kwargs: Additional keyword arguments (screenshot_format,
+                screenshot_quality, screenshot_max_width, screenshot_max_height,
+                force_viewport_screenshot, scan_full_page, scroll_delay, ...)
 
         Returns:
             str: The base64-encoded screenshot data
         """
-        # Check if viewport-only screenshot is forced
-        force_viewport = kwargs.get('force_viewport_screenshot', False)
-        scan_full_page = kwargs.get('scan_full_page', True)
-
-        if force_viewport or not scan_full_page:
-            # Use viewport-only screenshot
-            return await self.take_screenshot_naive(page)
-
-        need_scroll = await self.page_need_scroll(page)
-
-        if not need_scroll:
-            # Page is short enough, just take a screenshot
-            return await self.take_screenshot_naive(page)
-        else:
+        if await self._screenshot_needs_scroll(page, kwargs):
             # Page is too long, try to take a full-page screenshot
             return await self.take_screenshot_scroller(page, **kwargs)
-            # return await self.take_screenshot_from_pdf(await self.export_pdf(page))
+        # Page is short enough (or viewport-only was requested)
+        return await self.take_screenshot_naive(page, **kwargs)
 
     async def take_screenshot_from_pdf(self, pdf_data: bytes) -> str:
         """
@@ -1818,11 +2007,10 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
         try:
             from pdf2image import convert_from_bytes
 
-            images = convert_from_bytes(pdf_data)
-            final_img = images[0].convert("RGB")
-            buffered = BytesIO()
-            final_img.save(buffered, format="JPEG")
-            return base64.b64encode(buffered.getvalue()).decode("utf-8")
+            images = await asyncio.to_thread(convert_from_bytes, pdf_data)
+            return await asyncio.to_thread(
+                lambda: to_base64(encode_image(images[0].convert("RGB"), "jpeg"))
+            )
         except Exception as e:
             error_message = f"Failed to take PDF-based screenshot: {str(e)}"
             self.logger.error(
@@ -1831,28 +2019,16 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                 params={"error": error_message},
             )
             # Return error image as fallback
-            img = Image.new("RGB", (800, 600), color="black")
-            draw = ImageDraw.Draw(img)
-            font = ImageFont.load_default()
-            draw.text((10, 10), error_message, fill=(255, 255, 255), font=font)
-            buffered = BytesIO()
-            img.save(buffered, format="JPEG")
-            return base64.b64encode(buffered.getvalue()).decode("utf-8")
+            return to_base64(error_image(error_message))
 
-    async def take_screenshot_scroller(self, page: Page, **kwargs) -> str:
+    async def _capture_scrolled(self, page: Page, **kwargs) -> bytes:
         """
-        Attempt to set a large viewport and take a full-page screenshot.
-        If still too large, segment the page as before.
-
-        Requires pdf2image and poppler.
-
-        Args:
-            page (Page): The Playwright page object
-            kwargs: Additional keyword arguments
+        Capture a tall page segment by segment and stitch the segments.
 
-        Returns:
-            str: The base64-encoded screenshot data
+        Segments are captured as JPEG on the event loop; decoding, stitching
+        and the final encode run in a worker thread.
         """
+        options = self._screenshot_options(kwargs)
         try:
             # Save original viewport so we can restore it after capture
             original_viewport = page.viewport_size
@@ -1878,7 +2054,7 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             # Set a large viewport
             large_viewport_height = min(
                 page_height,
-                kwargs.get("screenshot_height_threshold", SCREENSHOT_HEIGHT_TRESHOLD),
+                kwargs.get("screenshot_height_threshold") or SCREENSHOT_HEIGHT_TRESHOLD,
             )
             await page.set_viewport_size(
                 {"width": page_width, "height": large_viewport_height}
@@ -1909,10 +2085,8 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                 await page.evaluate(f"window.scrollTo(0, {y_offset})")
                 await asyncio.sleep(scroll_delay)  # wait for render (respects scroll_delay config)
 
-                # Capture the current segment
-                seg_shot = await page.screenshot(full_page=False, type="jpeg", quality=85)
-                img = Image.open(BytesIO(seg_shot)).convert("RGB")
-                segments.append(img)
+                # Capture the current segment; decoding waits for the worker thread
+                segments.append(await page.screenshot(full_page=False, type="jpeg", quality=85))
 
             # Unfreeze element dimensions and restore original viewport
             await page.evaluate("""
@@ -1924,20 +2098,7 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             """)
             await page.set_viewport_size(original_viewport)
 
-            total_height = sum(img.height for img in segments)
-            stitched = Image.new("RGB", (segments[0].width, total_height))
-            offset = 0
-            for img in segments:
-                # stitched.paste(img, (0, offset))
-                stitched.paste(img.convert("RGB"), (0, offset))
-                offset += img.height
-
-            buffered = BytesIO()
-            stitched = stitched.convert("RGB")
-            stitched.save(buffered, format="PNG")
-            encoded = base64.b64encode(buffered.getvalue()).decode("utf-8")
-
-            return encoded
+            return await asyncio.to_thread(stitch, segments, **options)
         except Exception as e:
             error_message = f"Failed to take large viewport screenshot: {str(e)}"
             self.logger.error(
@@ -1945,31 +2106,37 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                 tag="ERROR",
                 params={"error": error_message},
             )
-            # return error image
-            img = Image.new("RGB", (800, 600), color="black")
-            draw = ImageDraw.Draw(img)
-            font = ImageFont.load_default()
-            draw.text((10, 10), error_message, fill=(255, 255, 255), font=font)
-            buffered = BytesIO()
-            img.save(buffered, format="JPEG")
-            return base64.b64encode(buffered.getvalue()).decode("utf-8")
-        # finally:
-        #     await page.close()
-
-    async def take_screenshot_naive(self, page: Page) -> str:
+            # In the requested format: a file sink names the file after it
+            return await asyncio.to_thread(error_image, error_message, options["fmt"])
+
+    async def take_screenshot_scroller(self, page: Page, **kwargs) -> str:
         """
-        Takes a screenshot of the current page.
+        Attempt to set a large viewport and take a full-page screenshot.
+        If still too large, segment the page as before.
 
         Args:
-            page (Page): The Playwright page instance
+            page (Page): The Playwright page object
+            kwargs: Additional keyword arguments
 
         Returns:
-            str: Base64-encoded screenshot image
+            str: The base64-encoded screenshot data
         """
+        data = await self._capture_scrolled(page, **kwargs)
+        return await asyncio.to_thread(to_base64, data)
+
+    async def _capture_viewport(self, page: Page, **kwargs) -> bytes:
+        """Capture the current viewport, encoded per the screenshot options."""
+        options = self._screenshot_options(kwargs)
         try:
+            fmt = options["fmt"]
+            if fmt == "webp" or options["max_width"] or options["max_height"]:
+                # Playwright cannot produce these directly; re-encode off the loop
+                screenshot = await page.screenshot(full_page=False)
+                return await asyncio.to_thread(reencode, screenshot, **options)
+            if fmt == "jpeg":
+                return await page.screenshot(full_page=False, type="jpeg", quality=options["quality"])
             # The page is already loaded, just take the screenshot
-            screenshot = await page.screenshot(full_page=False)
-            return base64.b64encode(screenshot).decode("utf-8")
+            return await page.screenshot(full_page=False)
         except Exception as e:
             error_message = f"Failed to take screenshot: {str(e)}"
             self.logger.error(
@@ -1977,18 +2144,21 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                 tag="ERROR",
                 params={"error": error_message},
             )
+            return await asyncio.to_thread(error_image, error_message, fmt)
 
-            # Generate an error image
-            img = Image.new("RGB", (800, 600), color="black")
-            draw = ImageDraw.Draw(img)
-            font = ImageFont.load_default()
-            draw.text((10, 10), error_message, fill=(255, 255, 255), font=font)
+    async def take_screenshot_naive(self, page: Page, **kwargs) -> str:
+        """
+        Takes a screenshot of the current page.
+
+        Args:
+            page (Page): The Playwright page instance
+            kwargs: Screenshot format, quality and bounds (see take_screenshot)
 
-            buffered = BytesIO()
-            img.save(buffered, format="JPEG")
-            return base64.b64encode(buffered.getvalue()).decode("utf-8")
-        # finally:
-        #     await page.close()
+        Returns:
+            str: Base64-encoded screenshot image
+        """
+        data = await self._capture_viewport(page, **kwargs)
+        return await asyncio.to_thread(to_base64, data)
 
     async def export_storage_state(self, path: str = None) -> dict:
         """
@@ -2446,6 +2616,15 @@ def _nofollow_opener(path, flags):
     return os.open(path, flags | os.O_NOFOLLOW)
 
 
+def _file_sha256(path: str, chunk_size: int = 1024 * 1024) -> str:
+    """sha256 hex digest of a file, read in chunks (run it off the event loop)."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(partial(f.read, chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
 class HTTPCrawlerError(Exception):
     """Base error class for HTTP crawler specific exceptions"""
     pass
@@ -2456,6 +2635,11 @@ class ConnectionTimeoutError(HTTPCrawlerError):
     pass
 
 
+class ResponseTooLargeError(HTTPCrawlerError):
+    """Raised when a response body exceeds HTTPCrawlerConfig.max_body_size (or a download max_download_size)"""
+    pass
+
+
 class HTTPStatusError(HTTPCrawlerError):
     """Raised for unexpected status codes"""
     def __init__(self, status_code: int, message: str):
@@ -2466,14 +2650,24 @@ class HTTPStatusError(HTTPCrawlerError):
 class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
     """
     Fast, lightweight HTTP-only crawler strategy optimized for memory efficiency.
+
+    With HTTPCrawlerConfig(http2=True) requests go through an HTTP/2-capable
+    httpx client instead of aiohttp, so a single-host crawl multiplexes over a
+    few kept-alive connections. connection_stats() reports how well
+    connections were reused.
     """
     
-    __slots__ = ('logger', 'max_connections', 'dns_cache_ttl', 'chunk_size', '_session', 'hooks', 'browser_config')
+    __slots__ = (
+        'logger', 'max_connections', 'dns_cache_ttl', 'chunk_size', '_session', 'hooks', 'browser_config',
+        '_clients', '_client_requests', '_ssl_context', '_stats',
+    )
 
     DEFAULT_TIMEOUT: Final[int] = 30
     DEFAULT_CHUNK_SIZE: Final[int] = 64 * 1024  
     DEFAULT_MAX_CONNECTIONS: Final[int] = min(32, (os.cpu_count() or 1) * 4)
     DEFAULT_DNS_CACHE_TTL: Final[int] = 300
+    # httpx clients kept when max_connections_per_host gives each origin its own
+    MAX_HTTPX_CLIENTS = 256
     VALID_SCHEMES: Final = frozenset({'http', 'https', 'file', 'raw'})
 
     _BASE_HEADERS: Final = MappingProxyType({
@@ -2491,15 +2685,24 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
         logger: Optional[AsyncLogger] = None,
         max_connections: int = DEFAULT_MAX_CONNECTIONS,
         dns_cache_ttl: int = DEFAULT_DNS_CACHE_TTL,
-        chunk_size: int = DEFAULT_CHUNK_SIZE
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        warc_writer: Optional[WARCWriter] = None,
     ):
-        """Initialize the HTTP crawler with config"""
+        """Initialize the HTTP crawler with config; ``warc_writer`` archives every response"""
         self.browser_config = browser_config or HTTPCrawlerConfig()
         self.logger = logger
         self.max_connections = max_connections
         self.dns_cache_ttl = dns_cache_ttl
         self.chunk_size = chunk_size
+        self.warc_writer = warc_writer
         self._session: Optional[aiohttp.ClientSession] = None
+        # HTTP/2 transport: one httpx client per proxy URL (proxies are client-wide
+        # in httpx), and per origin with max_connections_per_host; least recently
+        # used first
+        self._clients: "OrderedDict[Tuple[Optional[str], Optional[str]], httpx.AsyncClient]" = OrderedDict()
+        self._client_requests: Counter = Counter()  # client -> requests in flight
+        self._ssl_context = None
+        self._stats = {"requests": 0, "connections_opened": 0, "tls_handshakes": 0, "http2_requests": 0}
         
         self.hooks = {
             k: partial(self._execute_hook, k) 
@@ -2549,17 +2752,124 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
         if not self._session:
             connector = aiohttp.TCPConnector(
                 limit=self.max_connections,
-                ttl_dns_cache=self.dns_cache_ttl,
-                use_dns_cache=True,
+                limit_per_host=self.browser_config.max_connections_per_host or 0,
+                keepalive_timeout=self.browser_config.keepalive_expiry,
+                # The process-wide DNS cache replaces aiohttp's per-connector one
+                resolver=CachedResolver(max_age=self.dns_cache_ttl),
+                use_dns_cache=False,
                 force_close=False
             )
             self._session = aiohttp.ClientSession(
                 headers=dict(self._BASE_HEADERS),
                 connector=connector,
-                timeout=ClientTimeout(total=self.DEFAULT_TIMEOUT)
+                timeout=ClientTimeout(total=self.DEFAULT_TIMEOUT),
+                trace_configs=[self._aiohttp_trace_config()],
+            )
+
+    def connection_stats(self) -> Dict[str, int]:
+        """
+        Connection reuse counters since the strategy was created.
+
+        requests counts requests sent on the wire (redirect hops included);
+        connections_reused is the number of them that did not need a new connection.
+        """
+        stats = dict(self._stats)
+        stats["connections_reused"] = max(stats["requests"] - stats["connections_opened"], 0)
+        return stats
+
+    def _aiohttp_trace_config(self) -> aiohttp.TraceConfig:
+        async def on_request(session, ctx, params):
+            self._stats["requests"] += 1
+            ctx.https = params.url.scheme == "https"
+
+        async def on_connection_created(session, ctx, params):
+            self._stats["connections_opened"] += 1
+            if getattr(ctx, "https", False):
+                self._stats["tls_handshakes"] += 1
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(on_request)
+        trace_config.on_request_redirect.append(on_request)
+        trace_config.on_connection_create_end.append(on_connection_created)
+        return trace_config
+
+    async def _on_httpx_trace(self, event_name: str, info: Dict[str, Any]) -> None:
+        # httpcore trace events, e.g. "connection.connect_tcp.complete",
+        # "http2.send_request_headers.started"
+        if event_name.endswith(".connect_tcp.complete"):
+            self._stats["connections_opened"] += 1
+        elif event_name.endswith(".start_tls.complete"):
+            self._stats["tls_handshakes"] += 1
+        elif event_name.endswith(".send_request_headers.started"):
+            self._stats["requests"] += 1
+            if event_name.startswith("http2."):
+                self._stats["http2_requests"] += 1
+
+    @contextlib.asynccontextmanager
+    async def _httpx_client(self, url: str, proxy_url: Optional[str]) -> AsyncIterator[httpx.AsyncClient]:
+        """
+        The httpx client for a request, held for its duration.
+
+        httpx pools cap connections per client, not per host, so
+        max_connections_per_host is enforced with one client per origin,
+        limited to that many connections. Idle clients beyond
+        MAX_HTTPX_CLIENTS are closed, least recently used first.
+        """
+        per_host = self.browser_config.max_connections_per_host
+        origin = None
+        if per_host:
+            parsed = urlparse(url)
+            origin = f"{parsed.scheme}://{parsed.netloc}".lower()
+        key = (proxy_url, origin)
+        client = self._clients.get(key)
+        created = client is None
+        if created:
+            if self.browser_config.verify_ssl:
+                # One context for every client: the CA store is loaded once
+                if self._ssl_context is None:
+                    self._ssl_context = ssl.create_default_context()
+                verify = self._ssl_context
+            else:
+                verify = False
+            client = httpx.AsyncClient(
+                transport=cached_httpx_transport(
+                    http2=True,
+                    verify=verify,
+                    proxy=proxy_url,
+                    limits=httpx.Limits(
+                        max_connections=min(per_host, self.max_connections) if per_host else self.max_connections,
+                        max_keepalive_connections=self.max_connections,
+                        keepalive_expiry=self.browser_config.keepalive_expiry,
+                    ),
+                ),
             )
+            self._clients[key] = client
+        self._clients.move_to_end(key)
+        self._client_requests[client] += 1
+        try:
+            if created:
+                await self._close_idle_clients()
+            yield client
+        finally:
+            self._client_requests[client] -= 1
+            if not self._client_requests[client]:
+                del self._client_requests[client]
+
+    async def _close_idle_clients(self) -> None:
+        for key, client in list(self._clients.items()):
+            if len(self._clients) <= self.MAX_HTTPX_CLIENTS:
+                return
+            if client not in self._client_requests:
+                del self._clients[key]
+                await client.aclose()
 
     async def close(self) -> None:
+        clients, self._clients = list(self._clients.values()), OrderedDict()
+        for client in clients:
+            try:
+                await asyncio.wait_for(client.aclose(), timeout=5.0)
+            except Exception:
+                pass
         if self._session and not self._session.closed:
             try:
                 await asyncio.wait_for(self._session.close(), timeout=5.0)
@@ -2572,23 +2882,15 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
             finally:
                 self._session = None
 
-    async def _stream_file(self, path: str) -> AsyncGenerator[memoryview, None]:
-        async with aiofiles.open(path, mode='rb') as f:
-            while chunk := await f.read(self.chunk_size):
-                yield memoryview(chunk)
-
     async def _handle_file(self, path: str) -> AsyncCrawlResponse:
         if not os.path.exists(path):
             raise FileNotFoundError(f"Local file not found: {path}")
-            
-        chunks = []
-        async for chunk in self._stream_file(path):
-            chunks.append(chunk.tobytes().decode('utf-8', errors='replace'))
-            
+
         return AsyncCrawlResponse(
-            html=''.join(chunks),
+            html=await asyncio.to_thread(decode_file, path),
             response_headers={},
-            status_code=200
+            status_code=200,
+            body_size=0,
         )
 
     async def _handle_raw(self, content: str, base_url: str = None) -> AsyncCrawlResponse:
@@ -2597,7 +2899,8 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
             response_headers={},
             status_code=200,
             # For raw: URLs, use base_url if provided; don't fall back to the raw content
-            redirected_url=base_url
+            redirected_url=base_url,
+            body_size=0,
         )
 
 
@@ -2676,11 +2979,137 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
         ext = ext_map.get(content_type, '')
         return f"download_{hashlib.md5(url.encode()).hexdigest()[:10]}{ext}"
 
+    async def _read_body(self, chunks: AsyncIterator[bytes], url: str, content_length: Optional[str]) -> bytearray:
+        """Read a streamed body into one buffer, enforcing HTTPCrawlerConfig.max_body_size."""
+        limit = self.browser_config.max_body_size
+        if limit is not None and content_length and content_length.isdigit() and int(content_length) > limit:
+            raise ResponseTooLargeError(f"Response body of {url} is {content_length} bytes, over max_body_size={limit}")
+        body = bytearray()
+        async for chunk in chunks:
+            body += chunk
+            if limit is not None and len(body) > limit:
+                raise ResponseTooLargeError(f"Response body of {url} exceeds max_body_size={limit}")
+        return body
+
+    async def _decode(self, body: bytearray, declared_charset: Optional[str]) -> str:
+        """Decode a body: BOM, header or meta charset first, chardet on a prefix as the fallback."""
+        encoding, bom_length = sniff_charset(body, declared_charset)
+        if encoding is None:
+            encoding = await asyncio.to_thread(detect_charset, body)
+        return decode_body(body, encoding, bom_length)
+
+    def _content_info(self, response_headers: Dict[str, str], content_type: Optional[str]) -> Tuple[str, str]:
+        """The bare, lowercased content type and the Content-Disposition header of a response."""
+        content_type = (content_type or 'text/html').split(';')[0].strip().lower()
+        # HTTP/2 header names are lowercase
+        content_disposition = next(
+            (v for k, v in response_headers.items() if k.lower() == 'content-disposition'), ''
+        )
+        return content_type, content_disposition
+
+    async def _build_response(
+        self,
+        url: str,
+        final_url: str,
+        status: int,
+        response_headers: Dict[str, str],
+        charset: Optional[str],
+        body: bytearray,
+    ) -> AsyncCrawlResponse:
+        """Turn a successful page body into an AsyncCrawlResponse."""
+        return AsyncCrawlResponse(
+            html=await self._decode(body, charset),
+            response_headers=response_headers,
+            status_code=status,
+            redirected_url=final_url,
+            body_size=len(body),
+        )
+
+    async def _save_download(
+        self,
+        chunks: AsyncIterator[bytes],
+        url: str,
+        final_url: str,
+        status: int,
+        response_headers: Dict[str, str],
+        content_type: str,
+        content_disposition: str,
+        charset: Optional[str],
+        content_length: Optional[str],
+    ) -> AsyncCrawlResponse:
+        """
+        Stream a file download to downloads_path chunk by chunk.
+
+        Memory use is one chunk plus the text preview, whatever the file size.
+        The sha256 is computed while writing; max_download_size is enforced
+        from Content-Length up front and on the bytes actually received, and
+        a download that fails part way is removed. Text downloads have their
+        first download_preview_size bytes decoded into ``html``.
+        """
+        limit = self.browser_config.max_download_size
+        if limit is not None and content_length and content_length.isdigit() and int(content_length) > limit:
+            raise ResponseTooLargeError(f"Download {url} is {content_length} bytes, over max_download_size={limit}")
+
+        downloads_path = self.browser_config.downloads_path or os.path.join(
+            os.path.expanduser("~"), ".crawl4ai", "downloads"
+        )
+        os.makedirs(downloads_path, exist_ok=True)
+        filename = self._extract_filename(content_disposition, url, content_type)
+        filepath = _safe_download_filepath(downloads_path, filename)
+
+        is_text = self._is_text_content(content_type)
+        preview_size = self.browser_config.download_preview_size if is_text else 0
+        preview = bytearray()
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            async with aiofiles.open(filepath, 'wb', opener=_nofollow_opener) as f:
+                async for chunk in chunks:
+                    size += len(chunk)
+                    if limit is not None and size > limit:
+                        raise ResponseTooLargeError(f"Download {url} exceeds max_download_size={limit}")
+                    digest.update(chunk)
+                    if preview_size is None:
+                        preview += chunk
+                    elif len(preview) < preview_size:
+                        preview += chunk[:preview_size - len(preview)]
+                    await f.write(chunk)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(filepath)
+            raise
+
+        return AsyncCrawlResponse(
+            # For text-based files, also decode (a prefix) into html (backward compatible)
+            html=await self._decode(preview, charset) if is_text else "",
+            response_headers=response_headers,
+            status_code=status,
+            redirected_url=final_url,
+            downloaded_files=[filepath],
+            downloaded_file_hashes={filepath: digest.hexdigest()},
+            # The file itself is accounted for through downloaded_files
+            body_size=0,
+        )
+
+    def _not_modified(self, url: str, headers: Dict[str, str]) -> AsyncCrawlResponse:
+        """The response to a conditional request the server answered with 304."""
+        return AsyncCrawlResponse(
+            html="",
+            response_headers=headers,
+            status_code=304,
+            redirected_url=url,
+            body_size=0,
+        )
+
     async def _handle_http(
         self,
         url: str,
-        config: CrawlerRunConfig
+        config: CrawlerRunConfig,
+        conditional_headers: Optional[Dict[str, str]] = None,
     ) -> AsyncCrawlResponse:
+        if self.browser_config.http2:
+            return await self._handle_http2(url, config, conditional_headers)
+
         async with self._session_context() as session:
             # page_timeout is in ms (Playwright convention), but aiohttp expects seconds
             timeout_sec = (config.page_timeout / 1000) if config.page_timeout else self.DEFAULT_TIMEOUT
@@ -2693,6 +3122,8 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
             headers = dict(self._BASE_HEADERS)
             if self.browser_config.headers:
                 headers.update(self.browser_config.headers)
+            if conditional_headers:
+                headers.update(conditional_headers)
 
             request_kwargs = {
                 'timeout': timeout,
@@ -2717,8 +3148,10 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
 
             try:
                 async with session.request(self.browser_config.method, url, **request_kwargs) as response:
-                    raw_bytes = await response.read()
-                    content = memoryview(raw_bytes)
+                    if response.status == 304 and conditional_headers:
+                        result = self._not_modified(str(response.url), dict(response.headers))
+                        await self.hooks['after_request'](result)
+                        return result
 
                     if not (200 <= response.status < 300):
                         raise HTTPStatusError(
@@ -2727,49 +3160,50 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
                         )
 
                     response_headers = dict(response.headers)
-                    content_type = response.content_type or 'text/html'
-                    content_type = content_type.split(';')[0].strip().lower()
-                    content_disposition = response_headers.get('Content-Disposition', '')
-
-                    downloaded_files = None
-                    html = ""
-
+                    content_type, content_disposition = self._content_info(
+                        response_headers, response.content_type
+                    )
                     if self._is_file_download(content_type, content_disposition):
-                        # Save file to disk
-                        downloads_path = self.browser_config.downloads_path or os.path.join(
-                            os.path.expanduser("~"), ".crawl4ai", "downloads"
+                        # Streamed to disk, never held in memory (nor archived)
+                        result = await self._save_download(
+                            response.content.iter_chunked(self.chunk_size),
+                            url,
+                            str(response.url),
+                            response.status,
+                            response_headers,
+                            content_type,
+                            content_disposition,
+                            response.charset,
+                            response.headers.get('Content-Length'),
                         )
-                        os.makedirs(downloads_path, exist_ok=True)
+                        await self.hooks['after_request'](result)
+                        return result
 
-                        filename = self._extract_filename(content_disposition, url, content_type)
-                        filepath = _safe_download_filepath(downloads_path, filename)
-
-                        async with aiofiles.open(filepath, 'wb', opener=_nofollow_opener) as f:
-                            await f.write(raw_bytes)
+                    body = await self._read_body(
+                        response.content.iter_chunked(self.chunk_size),
+                        url,
+                        response.headers.get('Content-Length'),
+                    )
 
-                        downloaded_files = [filepath]
+                    if self.warc_writer is not None:
+                        for hop in (*response.history, response):
+                            await self.warc_writer.write_exchange(
+                                str(hop.url),
+                                hop.status,
+                                dict(hop.headers),
+                                body if hop is response else b"",
+                                dict(hop.request_info.headers),
+                                hop.method,
+                                hop.reason,
+                            )
 
-                        # For text-based files, also decode into html (backward compatible)
-                        if self._is_text_content(content_type):
-                            encoding = response.charset
-                            if not encoding:
-                                detection_result = await asyncio.to_thread(chardet.detect, raw_bytes)
-                                encoding = detection_result['encoding'] or 'utf-8'
-                            html = raw_bytes.decode(encoding, errors='replace')
-                    else:
-                        # Standard HTML response — existing behavior
-                        encoding = response.charset
-                        if not encoding:
-                            detection_result = await asyncio.to_thread(chardet.detect, content.tobytes())
-                            encoding = detection_result['encoding'] or 'utf-8'
-                        html = content.tobytes().decode(encoding, errors='replace')
-
-                    result = AsyncCrawlResponse(
-                        html=html,
-                        response_headers=response_headers,
-                        status_code=response.status,
-                        redirected_url=str(response.url),
-                        downloaded_files=downloaded_files,
+                    result = await self._build_response(
+                        url,
+                        str(response.url),
+                        response.status,
+                        response_headers,
+                        response.charset,
+                        body,
                     )
 
                     await self.hooks['after_request'](result)
@@ -2791,10 +3225,144 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
                 await self.hooks['on_error'](e)
                 raise ConnectionTimeoutError(f"Request timed out: {str(e)}")
             
+            except HTTPCrawlerError as e:
+                # Already specific (status, size); keep the type for callers
+                await self.hooks['on_error'](e)
+                raise
+
             except Exception as e:
                 await self.hooks['on_error'](e)
                 raise HTTPCrawlerError(f"HTTP request failed: {str(e)}")
 
+    async def _handle_http2(
+        self,
+        url: str,
+        config: CrawlerRunConfig,
+        conditional_headers: Optional[Dict[str, str]] = None,
+    ) -> AsyncCrawlResponse:
+        """_handle_http over the HTTP/2-capable httpx transport."""
+        timeout_sec = (config.page_timeout / 1000) if config.page_timeout else self.DEFAULT_TIMEOUT
+
+        # Connection-specific headers are not allowed in HTTP/2
+        headers = {k: v for k, v in self._BASE_HEADERS.items() if k != 'Connection'}
+        if self.browser_config.headers:
+            headers.update(self.browser_config.headers)
+        if conditional_headers:
+            headers.update(conditional_headers)
+
+        request_kwargs = {
+            'timeout': httpx.Timeout(timeout_sec, connect=10, read=30),
+            'follow_redirects': self.browser_config.follow_redirects,
+            'headers': headers,
+        }
+
+        proxy_url = None
+        if config.proxy_config:
+            proxy_url = self._format_proxy_url(config.proxy_config)
+
+        if self.browser_config.method == "POST":
+            if self.browser_config.data:
+                request_kwargs['data'] = self.browser_config.data
+            if self.browser_config.json:
+                request_kwargs['json'] = self.browser_config.json
+
+        await self.hooks['before_request'](url, request_kwargs)
+
+        async def fetch():
+            async with self._httpx_client(url, proxy_url) as client:
+                async with client.stream(
+                    self.browser_config.method, url,
+                    extensions={"trace": self._on_httpx_trace},
+                    **request_kwargs,
+                ) as response:
+                    if response.status_code == 304 and conditional_headers:
+                        return response, None
+                    if not (200 <= response.status_code < 300):
+                        raise HTTPStatusError(
+                            response.status_code,
+                            f"Unexpected status code for {url}"
+                        )
+                    content_type, content_disposition = self._content_info(
+                        dict(response.headers), response.headers.get('content-type')
+                    )
+                    if self._is_file_download(content_type, content_disposition):
+                        # Streamed to disk, never held in memory (nor archived)
+                        return response, await self._save_download(
+                            response.aiter_bytes(self.chunk_size),
+                            url,
+                            str(response.url),
+                            response.status_code,
+                            dict(response.headers),
+                            content_type,
+                            content_disposition,
+                            response.charset_encoding,
+                            response.headers.get('content-length'),
+                        )
+                    body = await self._read_body(
+                        response.aiter_bytes(self.chunk_size),
+                        url,
+                        response.headers.get('content-length'),
+                    )
+                    return response, body
+
+        try:
+            # httpx timeouts are per phase; bound the whole request like aiohttp's total
+            response, body = await asyncio.wait_for(fetch(), timeout_sec)
+
+            if body is None:
+                result = self._not_modified(str(response.url), dict(response.headers))
+                await self.hooks['after_request'](result)
+                return result
+
+            if isinstance(body, AsyncCrawlResponse):
+                await self.hooks['after_request'](body)
+                return body
+
+            if self.warc_writer is not None:
+                for hop in (*response.history, response):
+                    await self.warc_writer.write_exchange(
+                        str(hop.url),
+                        hop.status_code,
+                        dict(hop.headers),
+                        body if hop is response else b"",
+                        dict(hop.request.headers),
+                        hop.request.method,
+                        hop.reason_phrase,
+                    )
+
+            result = await self._build_response(
+                url,
+                str(response.url),
+                response.status_code,
+                dict(response.headers),
+                response.charset_encoding,
+                body,
+            )
+
+            await self.hooks['after_request'](result)
+            return result
+
+        except (httpx.TimeoutException, asyncio.exceptions.TimeoutError) as e:
+            await self.hooks['on_error'](e)
+            raise ConnectionTimeoutError(f"Request timed out: {str(e)}")
+
+        except httpx.ConnectError as e:
+            await self.hooks['on_error'](e)
+            raise ConnectionError(f"Connection failed: {str(e)}")
+
+        except httpx.HTTPError as e:
+            await self.hooks['on_error'](e)
+            raise HTTPCrawlerError(f"HTTP client error: {str(e)}")
+
+        except HTTPCrawlerError as e:
+            # Already specific (status, size); keep the type for callers
+            await self.hooks['on_error'](e)
+            raise
+
+        except Exception as e:
+            await self.hooks['on_error'](e)
+            raise HTTPCrawlerError(f"HTTP request failed: {str(e)}")
+
     async def crawl(
         self, 
         url: str, 
@@ -2818,7 +3386,7 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
                 raw_content = url[6:] if url.startswith("raw://") else url[4:]
                 return await self._handle_raw(raw_content, base_url=config.base_url)
             else:  # http or https
-                return await self._handle_http(url, config)
+                return await self._handle_http(url, config, kwargs.get("conditional_headers"))
                 
         except Exception as e:
             if self.logger:
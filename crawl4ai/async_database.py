@@ -61,10 +61,13 @@ class AsyncDatabaseManager:
                     if not result:
                         raise Exception("crawled_data table was not created")
 
+            # Add columns introduced since the table was created; a cheap
+            # PRAGMA when there is nothing to add
+            await self.update_db_schema()
+
             # If version changed or fresh install, run updates
             if needs_update:
                 self.logger.info("New version detected, running updates", tag="INIT")
-                await self.update_db_schema()
                 from .migrations import (
                     run_migration,
                 )  # Import here to avoid circular imports
@@ -242,7 +245,8 @@ class AsyncDatabaseManager:
                     metadata TEXT DEFAULT "{}",
                     screenshot TEXT DEFAULT "",
                     response_headers TEXT DEFAULT "{}",
-                    downloaded_files TEXT DEFAULT "{}"  -- New column added
+                    downloaded_files TEXT DEFAULT "{}",  -- New column added
+                    screenshot_path TEXT DEFAULT ""
                 )
             """
             )
@@ -268,6 +272,8 @@ class AsyncDatabaseManager:
                 "last_modified",
                 "head_fingerprint",
                 "cached_at",
+                # File sink screenshots (CrawlerRunConfig.screenshot_dir)
+                "screenshot_path",
             ]
 
             for column in new_columns:
@@ -371,6 +377,7 @@ class AsyncDatabaseManager:
                     )
                 except json.JSONDecodeError:
                     row_dict["downloaded_files"] = []
+                row_dict["screenshot_path"] = row_dict.get("screenshot_path") or None
 
                 # Remove any fields not in CrawlResult model
                 valid_fields = CrawlResult.__annotations__.keys()
@@ -437,10 +444,13 @@ class AsyncDatabaseManager:
         etag: Optional[str] = None,
         last_modified: Optional[str] = None,
         head_fingerprint: Optional[str] = None,
+        response_headers: Optional[Dict] = None,
+        cached_at: Optional[float] = None,
     ):
         """
         Update only the cache validation metadata for a URL.
-        Used to update etag/last_modified after a successful validation.
+        Used to update etag/last_modified after a successful validation,
+        and headers / cached_at after a 304 Not Modified.
         """
         async def _update(db):
             updates = []
@@ -455,6 +465,12 @@ class AsyncDatabaseManager:
             if head_fingerprint is not None:
                 updates.append("head_fingerprint = ?")
                 values.append(head_fingerprint)
+            if response_headers is not None:
+                updates.append("response_headers = ?")
+                values.append(json.dumps(response_headers))
+            if cached_at is not None:
+                updates.append("cached_at = ?")
+                values.append(cached_at)
 
             if not updates:
                 return
@@ -523,9 +539,10 @@ class AsyncDatabaseManager:
             content_hashes[field] = await self._store_content(content, content_type)
 
         # Extract cache validation headers from response
-        response_headers = result.response_headers or {}
-        etag = response_headers.get("etag") or response_headers.get("ETag") or ""
-        last_modified = response_headers.get("last-modified") or response_headers.get("Last-Modified") or ""
+        # (header name case varies by server and client: ETag, Etag, etag)
+        response_headers = {k.lower(): v for k, v in (result.response_headers or {}).items()}
+        etag = response_headers.get("etag") or ""
+        last_modified = response_headers.get("last-modified") or ""
         # head_fingerprint is set by caller via result attribute (if available)
         head_fingerprint = getattr(result, "head_fingerprint", None) or ""
         cached_at = time.time()
@@ -537,9 +554,10 @@ class AsyncDatabaseManager:
                     url, html, cleaned_html, markdown,
                     extracted_content, success, media, links, metadata,
                     screenshot, response_headers, downloaded_files,
-                    etag, last_modified, head_fingerprint, cached_at
+                    etag, last_modified, head_fingerprint, cached_at,
+                    screenshot_path
                 )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 ON CONFLICT(url) DO UPDATE SET
                     html = excluded.html,
                     cleaned_html = excluded.cleaned_html,
@@ -555,7 +573,8 @@ class AsyncDatabaseManager:
                     etag = excluded.etag,
                     last_modified = excluded.last_modified,
                     head_fingerprint = excluded.head_fingerprint,
-                    cached_at = excluded.cached_at
+                    cached_at = excluded.cached_at,
+                    screenshot_path = excluded.screenshot_path
             """,
                 (
                     result.url,
@@ -574,6 +593,7 @@ class AsyncDatabaseManager:
                     last_modified,
                     head_fingerprint,
                     cached_at,
+                    result.screenshot_path or "",
                 ),
             )
 
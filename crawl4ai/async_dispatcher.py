@@ -1,9 +1,11 @@
-from typing import Dict, Optional, List, Tuple, Union
-from .async_configs import CrawlerRunConfig
+from typing import Callable, Dict, Optional, List, Tuple, Union, TYPE_CHECKING
+from .async_configs import BrowserConfig, CrawlerRunConfig
 from .models import (
     CrawlResult,
+    CrawlResultContainer,
     CrawlerTaskResult,
     CrawlStatus,
+    DeadLetterEntry,
     DomainState,
 )
 
@@ -11,18 +13,32 @@ from .components.crawler_monitor import CrawlerMonitor
 
 from .types import AsyncWebCrawler
 
+from collections import Counter
 from collections.abc import AsyncGenerator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
 
 import time
-import psutil
 import asyncio
+import contextlib
+import email.utils
+import heapq
+import itertools
+import json
+import multiprocessing
+import os
 import uuid
+import zlib
 
 from urllib.parse import urlparse
 import random
 from abc import ABC, abstractmethod
 
-from .utils import get_true_memory_usage_percent
+from .resource_sampler import ResourceSampler
+
+if TYPE_CHECKING:
+    from .async_crawler_strategy import AsyncCrawlerStrategy
+    from .frontier import CrawlFrontier, FrontierItem
 
 
 class RateLimiter:
@@ -85,18 +101,356 @@ class RateLimiter:
         return True
 
 
+class RetryPolicy:
+    """
+    Dispatcher-level retry rules for transient crawl failures.
+
+    A failed result is mapped to an error class ("timeout", "connection",
+    "server_error", "rate_limited", ...) and retried with exponential backoff
+    until the per-class attempt limit is reached; a ``Retry-After`` header
+    on the response replaces the backoff. Classes missing from
+    ``max_attempts`` are never retried. A 5xx or 429 that runs out of
+    attempts is returned as failed even if the page itself loaded.
+
+    Args:
+        max_attempts: Total attempts allowed per error class (first try included).
+        base_delay: Delay in seconds before the first retry.
+        max_delay: Upper bound for the backoff delay.
+        jitter: Randomize each delay by +/-25% to avoid retry bursts.
+    """
+
+    DEFAULT_MAX_ATTEMPTS = {
+        "timeout": 3, "connection": 3, "server_error": 3, "rate_limited": 3, "browser_crash": 3,
+    }
+
+    ERROR_PATTERNS = {
+        # First: a crash message can mention a timeout ("CDP ping timed out")
+        "browser_crash": (
+            "browser crashed",  # BrowserCrashedError
+            "target crashed",
+        ),
+        "timeout": (
+            "timeout",
+            "timed out",
+            "err_timed_out",
+        ),
+        "connection": (
+            "err_connection",
+            "connection reset",
+            "connection refused",
+            "connection closed",
+            "connection aborted",
+            "econnreset",
+            "err_empty_response",
+            "err_network_changed",
+            "err_http2_protocol_error",
+            "serverdisconnected",
+            "clientconnectorerror",
+            "clientoserror",
+        ),
+    }
+
+    def __init__(
+        self,
+        max_attempts: Optional[Dict[str, int]] = None,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+        jitter: bool = True,
+    ):
+        self.max_attempts = (
+            dict(self.DEFAULT_MAX_ATTEMPTS) if max_attempts is None else dict(max_attempts)
+        )
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+    def classify(self, result: CrawlResult) -> Optional[str]:
+        """Return the error class of a result, or None if it is not a transient failure."""
+        status_code = getattr(result, "status_code", None)
+        if status_code:
+            if 500 <= status_code < 600:
+                return "server_error"
+            if status_code == 429:
+                return "rate_limited"
+
+        if result.success:
+            return None
+
+        message = (result.error_message or "").lower()
+        for error_class, patterns in self.ERROR_PATTERNS.items():
+            if any(p in message for p in patterns):
+                return error_class
+        return None
+
+    def should_retry(self, error_class: Optional[str], attempts: int) -> bool:
+        """Whether another attempt is allowed after ``attempts`` tries failed with ``error_class``."""
+        if not error_class:
+            return False
+        return attempts < self.max_attempts.get(error_class, 0)
+
+    @staticmethod
+    def retry_after(result: CrawlResult) -> Optional[float]:
+        """Seconds from the result's Retry-After header (delta or HTTP date), if any."""
+        headers = {k.lower(): v for k, v in (result.response_headers or {}).items()}
+        value = str(headers.get("retry-after") or "").strip()
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def get_delay(self, attempts: int, result: Optional[CrawlResult] = None) -> float:
+        """Backoff delay before the next attempt, given the number of failed attempts so far.
+
+        The server's Retry-After on ``result`` is used instead when present,
+        still capped at ``max_delay``.
+        """
+        retry_after = self.retry_after(result) if result is not None else None
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+        delay = self.base_delay * (2 ** max(0, attempts - 1))
+        if self.jitter:
+            delay *= random.uniform(0.75, 1.25)
+        return min(delay, self.max_delay)
+
+
+class DeadLetterSink:
+    """
+    Collects URLs that failed permanently, with the reason of the last failure.
+
+    Entries are kept in memory and, when ``path`` is given, appended to that
+    file as JSON lines as soon as they are recorded.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.entries: List[DeadLetterEntry] = []
+
+    def add(self, entry: DeadLetterEntry) -> None:
+        self.entries.append(entry)
+        if self.path:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(asdict(entry), ensure_ascii=False) + "\n")
+
+    def urls(self) -> List[str]:
+        return [entry.url for entry in self.entries]
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+class CrawlBudget:
+    """
+    Global limits for one dispatcher run: wall-clock time, fetched bytes,
+    finished pages and LLM tokens.
+
+    The dispatcher consults the budget before starting each URL. Admission
+    stops once the crawls already running are expected to use up what is
+    left, so in-flight work can finish inside the limit instead of being
+    cancelled. URLs that never started are returned as failed results with
+    ``metadata["status"] == "budget_exhausted"``, and ``exhausted_reason``
+    tells which limit was hit.
+
+    Args:
+        max_seconds: Wall-clock limit, measured from the start of the run.
+        max_bytes: Limit on the bytes fetched, in bytes: page bodies plus
+            downloaded files. Cache hits fetch nothing and are not counted.
+        max_pages: Limit on the number of finished crawls.
+        max_llm_tokens: Limit on the tokens reported by the LLM extraction
+            strategies of the run config(s).
+    """
+
+    def __init__(
+        self,
+        max_seconds: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        max_llm_tokens: Optional[int] = None,
+    ):
+        self.max_seconds = max_seconds
+        self.max_bytes = max_bytes
+        self.max_pages = max_pages
+        self.max_llm_tokens = max_llm_tokens
+        self.started_at: Optional[float] = None
+        self.pages = 0
+        self.bytes = 0
+        self.exhausted_reason: Optional[str] = None
+        self._busy_seconds = 0.0
+        self._token_sources: list = []
+        self._token_baseline = 0
+
+    def start(self, config: Union[CrawlerRunConfig, List[CrawlerRunConfig]]) -> None:
+        """Reset the counters at the beginning of a run."""
+        self.started_at = time.time()
+        self.pages = self.bytes = 0
+        self.exhausted_reason = None
+        self._busy_seconds = 0.0
+        configs = config if isinstance(config, list) else [config]
+        strategies = {id(c.extraction_strategy): c.extraction_strategy for c in configs if c}
+        self._token_sources = [s for s in strategies.values() if hasattr(s, "total_usage")]
+        # Strategies accumulate usage over their lifetime; only count this run.
+        self._token_baseline = self._total_tokens()
+
+    def _total_tokens(self) -> int:
+        return sum(s.total_usage.total_tokens for s in self._token_sources)
+
+    @property
+    def llm_tokens(self) -> int:
+        return self._total_tokens() - self._token_baseline
+
+    @property
+    def elapsed(self) -> float:
+        return time.time() - self.started_at if self.started_at else 0.0
+
+    def record(self, task_result: CrawlerTaskResult) -> None:
+        """Account for a finished crawl."""
+        self.pages += 1
+        self.bytes += self._fetched_bytes(task_result.result)
+        self._busy_seconds += max(0.0, task_result.end_time - task_result.start_time)
+
+    @staticmethod
+    def _fetched_bytes(result: CrawlResult) -> int:
+        if (result.cache_status or "").startswith("hit"):
+            return 0
+        # Strategies that don't report the body size: the HTML length is close
+        # enough, and doesn't re-encode every page to measure it
+        size = result.body_size if result.body_size is not None else len(result.html or "")
+        for path in result.downloaded_files or []:
+            with contextlib.suppress(OSError):
+                size += os.path.getsize(path)
+        return size
+
+    def _projected_overrun(self, used: float, limit: float, in_flight: int) -> bool:
+        # Running crawls, plus the one asking to start, will each add about
+        # the average of what finished crawls used.
+        average = used / self.pages if self.pages else 0
+        return used >= limit or used + average * (in_flight + 1) > limit
+
+    def can_admit(self, in_flight: int) -> bool:
+        """Whether a new URL may start while ``in_flight`` crawls are running."""
+        if self.exhausted_reason is None:
+            self.exhausted_reason = self._check(in_flight)
+        return self.exhausted_reason is None
+
+    def _check(self, in_flight: int) -> Optional[str]:
+        if self.max_pages is not None and self.pages + in_flight >= self.max_pages:
+            return "pages"
+        if self.max_seconds is not None:
+            average = self._busy_seconds / self.pages if self.pages else 0
+            if self.elapsed + average >= self.max_seconds:
+                return "wall_clock"
+        if self.max_bytes is not None and self._projected_overrun(self.bytes, self.max_bytes, in_flight):
+            return "bytes"
+        if self.max_llm_tokens is not None and self._projected_overrun(
+            self.llm_tokens, self.max_llm_tokens, in_flight
+        ):
+            return "llm_tokens"
+        return None
+
 
 class BaseDispatcher(ABC):
     def __init__(
         self,
         rate_limiter: Optional[RateLimiter] = None,
         monitor: Optional[CrawlerMonitor] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        dead_letter_sink: Optional[DeadLetterSink] = None,
+        budget: Optional[CrawlBudget] = None,
+        sampler: Optional[ResourceSampler] = None,
     ):
         self.crawler = None
         self._domain_last_hit: Dict[str, float] = {}
         self.concurrent_sessions = 0
         self.rate_limiter = rate_limiter
         self.monitor = monitor
+        self.retry_policy = retry_policy
+        self.dead_letter_sink = dead_letter_sink
+        self.budget = budget
+        self.sampler = sampler or ResourceSampler.shared()
+        self._failed_attempts: Dict[str, int] = {}
+
+    def _memory_delta(self, start_rss: float, since: float) -> Tuple[float, float]:
+        """Growth of the sampled process RSS (MB) since ``since``, and its peak growth.
+
+        Concurrent tasks share one process, so this is the change observed
+        while the task ran rather than memory owned by the task.
+        """
+        latest = self.sampler.latest
+        peak = self.sampler.peak(since)
+        peak_rss = max(latest.rss_mb, peak.rss_mb if peak else 0.0)
+        return latest.rss_mb - start_rss, peak_rss - start_rss
+
+    def _next_retry_delay(self, url: str, task_id: str, result: CrawlResult) -> Optional[float]:
+        """Decide what happens to a finished crawl.
+
+        Returns the backoff delay if the task should be retried, otherwise None.
+        Permanently failed tasks are recorded in the dead-letter sink, and a
+        result that loaded but carries a retryable status (5xx, 429) is
+        marked failed so the caller and the sink agree.
+        """
+        error_class = self.retry_policy.classify(result) if self.retry_policy else None
+        if result.success and not error_class:
+            self._failed_attempts.pop(task_id, None)
+            return None
+
+        attempts = self._failed_attempts.get(task_id, 0) + 1
+        self._failed_attempts[task_id] = attempts
+        if self.retry_policy and self.retry_policy.should_retry(error_class, attempts):
+            return self.retry_policy.get_delay(attempts, result)
+
+        self._failed_attempts.pop(task_id, None)
+        if result.success:
+            result.success = False
+            result.error_message = (
+                f"HTTP {result.status_code} after {attempts} attempt{'s' if attempts > 1 else ''}"
+            )
+        if self.dead_letter_sink is not None:
+            self.dead_letter_sink.add(
+                DeadLetterEntry(
+                    url=url,
+                    task_id=task_id,
+                    error_class=error_class,
+                    reason=result.error_message or f"HTTP {result.status_code}",
+                    attempts=attempts,
+                    status_code=result.status_code,
+                    failed_at=time.time(),
+                )
+            )
+        return None
+
+    def _budget_skipped(self, url: str, task_id: str, retry_count: int = 0) -> CrawlerTaskResult:
+        """Result for a URL that was never started because the budget ran out."""
+        now = time.time()
+        message = f"Crawl budget exhausted ({self.budget.exhausted_reason}) before this URL started"
+        if self.monitor:
+            self.monitor.update_task(
+                task_id, status=CrawlStatus.FAILED, end_time=now, error_message=message
+            )
+        return CrawlerTaskResult(
+            task_id=task_id,
+            url=url,
+            result=CrawlResult(
+                url=url, html="", metadata={"status": "budget_exhausted"},
+                success=False, error_message=message
+            ),
+            memory_usage=0,
+            peak_memory=0,
+            start_time=now,
+            end_time=now,
+            error_message=message,
+            retry_count=retry_count
+        )
+
+    @staticmethod
+    def _is_placeholder(task_result: CrawlerTaskResult) -> bool:
+        """True for results that only signal a requeue and must not reach the caller."""
+        metadata = task_result.result.metadata or {}
+        return metadata.get("status") in ("requeued", "retry_scheduled")
 
     def select_config(self, url: str, configs: Union[CrawlerRunConfig, List[CrawlerRunConfig]]) -> Optional[CrawlerRunConfig]:
         """Select the appropriate config for a given URL.
@@ -157,8 +511,12 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
         memory_wait_timeout: Optional[float] = 600.0,
         rate_limiter: Optional[RateLimiter] = None,
         monitor: Optional[CrawlerMonitor] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        dead_letter_sink: Optional[DeadLetterSink] = None,
+        budget: Optional[CrawlBudget] = None,
+        sampler: Optional[ResourceSampler] = None,
     ):
-        super().__init__(rate_limiter, monitor)
+        super().__init__(rate_limiter, monitor, retry_policy, dead_letter_sink, budget, sampler)
         self.memory_threshold_percent = memory_threshold_percent
         self.critical_threshold_percent = critical_threshold_percent
         self.recovery_threshold_percent = recovery_threshold_percent
@@ -171,11 +529,14 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
         self.memory_pressure_mode = False  # Flag to indicate when we're in memory pressure mode
         self.current_memory_percent = 0.0  # Track current memory usage
         self._high_memory_start_time: Optional[float] = None
+        # Retries waiting for their backoff to expire: (ready_at, seq, (url, task_id, retry_count))
+        self._retry_heap: List[Tuple[float, int, Tuple[str, str, int]]] = []
+        self._retry_seq = itertools.count()
         
     async def _memory_monitor_task(self):
         """Background task to continuously monitor memory usage and update state"""
         while True:
-            self.current_memory_percent = get_true_memory_usage_percent()
+            self.current_memory_percent = self.sampler.latest.memory_percent
 
             # Enter memory pressure mode if we cross the threshold
             if self.current_memory_percent >= self.memory_threshold_percent:
@@ -224,6 +585,42 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
             return -wait_time
         # Standard priority based on retries
         return retry_count
+
+    def _schedule_retry(self, url: str, task_id: str, retry_count: int, delay: float) -> None:
+        """Park a failed task until its backoff expires; the run loop moves it back to the queue."""
+        heapq.heappush(
+            self._retry_heap,
+            (time.time() + delay, next(self._retry_seq), (url, task_id, retry_count)),
+        )
+
+    async def _release_due_retries(self) -> None:
+        """Move retries whose backoff has expired into the task queue."""
+        now = time.time()
+        while self._retry_heap and self._retry_heap[0][0] <= now:
+            ready_at, _, (url, task_id, retry_count) = heapq.heappop(self._retry_heap)
+            priority = self._get_priority_score(0, retry_count)
+            await self.task_queue.put((priority, (url, task_id, retry_count, ready_at)))
+
+    def _skip_unstarted(self) -> List[CrawlerTaskResult]:
+        """Empty the queue and the pending retries once the budget refuses new work."""
+        skipped = []
+        while True:
+            try:
+                _, (url, task_id, retry_count, _) = self.task_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            skipped.append(self._budget_skipped(url, task_id, retry_count))
+        while self._retry_heap:
+            _, _, (url, task_id, retry_count) = heapq.heappop(self._retry_heap)
+            skipped.append(self._budget_skipped(url, task_id, retry_count))
+        return skipped
+
+    def _idle_wait(self) -> float:
+        """How long the run loop may sleep when nothing is running."""
+        wait = self.check_interval / 2
+        if self._retry_heap:
+            wait = min(wait, max(0.0, self._retry_heap[0][0] - time.time()))
+        return wait
     
     async def crawl_url(
         self,
@@ -267,9 +664,7 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
                 retry_count=retry_count
             )
         
-        # Get starting memory for accurate measurement
-        process = psutil.Process()
-        start_memory = process.memory_info().rss / (1024 * 1024)
+        start_memory = self.sampler.latest.rss_mb
         
         try:
             if self.monitor:
@@ -319,9 +714,7 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
             # Execute the crawl with selected config
             result = await self.crawler.arun(url, config=selected_config, session_id=task_id)
             
-            # Measure memory usage
-            end_memory = process.memory_info().rss / (1024 * 1024)
-            memory_usage = peak_memory = end_memory - start_memory
+            memory_usage, peak_memory = self._memory_delta(start_memory, start_time)
             
             # Handle rate limiting
             if self.rate_limiter and result.status_code:
@@ -358,6 +751,35 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
                     retry_count=retry_count
                 )
             self.concurrent_sessions -= 1
+
+        retry_delay = self._next_retry_delay(url, task_id, result)
+        if retry_delay is None and not result.success and not error_message:
+            error_message = result.error_message
+            if self.monitor:
+                self.monitor.update_task(task_id, status=CrawlStatus.FAILED, error_message=error_message)
+        if retry_delay is not None:
+            self._schedule_retry(url, task_id, retry_count + 1, retry_delay)
+            message = f"Retry scheduled in {retry_delay:.1f}s: {error_message or result.status_code}"
+            if self.monitor:
+                self.monitor.update_task(
+                    task_id,
+                    status=CrawlStatus.QUEUED,
+                    error_message=message,
+                )
+            return CrawlerTaskResult(
+                task_id=task_id,
+                url=url,
+                result=CrawlResult(
+                    url=url, html="", metadata={"status": "retry_scheduled"},
+                    success=False, error_message=message
+                ),
+                memory_usage=memory_usage,
+                peak_memory=peak_memory,
+                start_time=start_time,
+                end_time=end_time,
+                error_message=message,
+                retry_count=retry_count + 1
+            )
             
         return CrawlerTaskResult(
             task_id=task_id,
@@ -380,10 +802,13 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
         self.crawler = crawler
         
         # Start the memory monitor task
+        self.sampler.acquire()
         memory_monitor = asyncio.create_task(self._memory_monitor_task())
         
         if self.monitor:
             self.monitor.start()
+        if self.budget:
+            self.budget.start(config)
             
         results = []
 
@@ -398,8 +823,11 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
 
             active_tasks = []
 
-            # Process until both queues are empty
-            while not self.task_queue.empty() or active_tasks:
+            # Process until both queues are empty and no retry is pending
+            while not self.task_queue.empty() or active_tasks or self._retry_heap:
+                await self._release_due_retries()
+                if self.budget and not self.budget.can_admit(len(active_tasks)):
+                    results.extend(self._skip_unstarted())
                 if memory_monitor.done():
                     exc = memory_monitor.exception()
                     if exc:
@@ -411,6 +839,8 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
                 if not self.memory_pressure_mode:
                     slots = self.max_session_permit - len(active_tasks)
                     while slots > 0:
+                        if self.budget and not self.budget.can_admit(len(active_tasks)):
+                            break
                         try:
                             # Use get_nowait() to immediately get tasks without blocking
                             priority, (url, task_id, retry_count, enqueue_time) = self.task_queue.get_nowait()
@@ -445,13 +875,16 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
                     # Process completed tasks
                     for completed_task in done:
                         result = await completed_task
-                        results.append(result)
+                        if not self._is_placeholder(result):
+                            if self.budget:
+                                self.budget.record(result)
+                            results.append(result)
                         
                     # Update active tasks list
                     active_tasks = list(pending)
                 else:
                     # If no active tasks but still waiting, sleep briefly
-                    await asyncio.sleep(self.check_interval / 2)
+                    await asyncio.sleep(self._idle_wait())
                     
                 # Update priorities for waiting tasks if needed
                 await self._update_queue_priorities()
@@ -464,6 +897,7 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
         finally:
             # Clean up
             memory_monitor.cancel()
+            self.sampler.release()
             if self.monitor:
                 self.monitor.stop()
         return results
@@ -537,10 +971,13 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
         active_tasks = []
         
         # Start the memory monitor task
+        self.sampler.acquire()
         memory_monitor = asyncio.create_task(self._memory_monitor_task())
         
         if self.monitor:
             self.monitor.start()
+        if self.budget:
+            self.budget.start(config)
             
         try:
             # Initialize task queue
@@ -555,6 +992,11 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
             total_urls = len(urls)
 
             while completed_count < total_urls:
+                await self._release_due_retries()
+                if self.budget and not self.budget.can_admit(len(active_tasks)):
+                    for skipped in self._skip_unstarted():
+                        completed_count += 1
+                        yield skipped
                 if memory_monitor.done():
                     exc = memory_monitor.exception()
                     if exc:
@@ -565,6 +1007,8 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
                 if not self.memory_pressure_mode:
                     slots = self.max_session_permit - len(active_tasks)
                     while slots > 0:
+                        if self.budget and not self.budget.can_admit(len(active_tasks)):
+                            break
                         try:
                             # Use get_nowait() to immediately get tasks without blocking
                             priority, (url, task_id, retry_count, enqueue_time) = self.task_queue.get_nowait()
@@ -600,7 +1044,9 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
                         result = await completed_task
                         
                         # Only count as completed if it wasn't requeued
-                        if "requeued" not in result.error_message:
+                        if not self._is_placeholder(result):
+                            if self.budget:
+                                self.budget.record(result)
                             completed_count += 1
                             yield result
                         
@@ -608,7 +1054,7 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
                     active_tasks = list(pending)
                 else:
                     # If no active tasks but still waiting, sleep briefly
-                    await asyncio.sleep(self.check_interval / 2)
+                    await asyncio.sleep(self._idle_wait())
                 
                 # Update priorities for waiting tasks if needed
                 await self._update_queue_priorities()
@@ -629,8 +1075,10 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
                     self.task_queue.get_nowait()
                 except asyncio.QueueEmpty:
                     break
+            self._retry_heap.clear()
 
             memory_monitor.cancel()
+            self.sampler.release()
             await asyncio.gather(memory_monitor, return_exceptions=True)
             if self.monitor:
                 self.monitor.stop()
@@ -643,10 +1091,15 @@ class SemaphoreDispatcher(BaseDispatcher):
         max_session_permit: int = 20,
         rate_limiter: Optional[RateLimiter] = None,
         monitor: Optional[CrawlerMonitor] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        dead_letter_sink: Optional[DeadLetterSink] = None,
+        budget: Optional[CrawlBudget] = None,
+        sampler: Optional[ResourceSampler] = None,
     ):
-        super().__init__(rate_limiter, monitor)
+        super().__init__(rate_limiter, monitor, retry_policy, dead_letter_sink, budget, sampler)
         self.semaphore_count = semaphore_count
         self.max_session_permit = max_session_permit
+        self._in_flight = 0
 
     async def crawl_url(
         self,
@@ -658,6 +1111,7 @@ class SemaphoreDispatcher(BaseDispatcher):
         start_time = time.time()
         error_message = ""
         memory_usage = peak_memory = 0.0
+        admitted = False
 
         # Select appropriate config for this URL
         selected_config = self.select_config(url, config)
@@ -699,12 +1153,18 @@ class SemaphoreDispatcher(BaseDispatcher):
                 await self.rate_limiter.wait_if_needed(url)
 
             async with semaphore:
-                process = psutil.Process()
-                start_memory = process.memory_info().rss / (1024 * 1024)
-                result = await self.crawler.arun(url, config=selected_config, session_id=task_id)
-                end_memory = process.memory_info().rss / (1024 * 1024)
+                if self.budget:
+                    if not self.budget.can_admit(self._in_flight):
+                        skipped = self._budget_skipped(url, task_id)
+                        error_message = skipped.error_message
+                        return skipped
+                    self._in_flight += 1
+                    admitted = True
 
-                memory_usage = peak_memory = end_memory - start_memory
+                crawl_start = time.time()
+                start_memory = self.sampler.latest.rss_mb
+                result = await self.crawler.arun(url, config=selected_config, session_id=task_id)
+                memory_usage, peak_memory = self._memory_delta(start_memory, crawl_start)
 
                 if self.rate_limiter and result.status_code:
                     if not self.rate_limiter.update_delay(url, result.status_code):
@@ -738,6 +1198,8 @@ class SemaphoreDispatcher(BaseDispatcher):
             )
 
         finally:
+            if admitted:
+                self._in_flight -= 1
             end_time = time.time()
             if self.monitor:
                 self.monitor.update_task(
@@ -759,6 +1221,41 @@ class SemaphoreDispatcher(BaseDispatcher):
             error_message=error_message,
         )
 
+    async def _crawl_with_retry(
+        self,
+        url: str,
+        config: Union[CrawlerRunConfig, List[CrawlerRunConfig]],
+        task_id: str,
+        semaphore: asyncio.Semaphore,
+    ) -> CrawlerTaskResult:
+        """Run crawl_url, backing off between transient failures without holding the semaphore."""
+        retry_count = 0
+        while True:
+            task_result = await self.crawl_url(url, config, task_id, semaphore)
+            task_result.retry_count = retry_count
+            if self.budget:
+                if (task_result.result.metadata or {}).get("status") == "budget_exhausted":
+                    return task_result
+                self.budget.record(task_result)
+            retry_delay = self._next_retry_delay(url, task_id, task_result.result)
+            if retry_delay is None:
+                if not task_result.result.success and not task_result.error_message:
+                    task_result.error_message = task_result.result.error_message
+                    if self.monitor:
+                        self.monitor.update_task(
+                            task_id, status=CrawlStatus.FAILED, error_message=task_result.error_message
+                        )
+                return task_result
+            retry_count += 1
+            if self.monitor:
+                self.monitor.update_task(
+                    task_id,
+                    status=CrawlStatus.QUEUED,
+                    error_message=f"Retry scheduled in {retry_delay:.1f}s",
+                    retry_count=retry_count,
+                )
+            await asyncio.sleep(retry_delay)
+
     async def run_urls(
         self,
         crawler: AsyncWebCrawler,  # noqa: F821
@@ -768,6 +1265,9 @@ class SemaphoreDispatcher(BaseDispatcher):
         self.crawler = crawler
         if self.monitor:
             self.monitor.start()
+        if self.budget:
+            self.budget.start(config)
+        self.sampler.acquire()
 
         try:
             semaphore = asyncio.Semaphore(self.semaphore_count)
@@ -778,11 +1278,447 @@ class SemaphoreDispatcher(BaseDispatcher):
                 if self.monitor:
                     self.monitor.add_task(task_id, url)
                 task = asyncio.create_task(
-                    self.crawl_url(url, config, task_id, semaphore)
+                    self._crawl_with_retry(url, config, task_id, semaphore)
                 )
                 tasks.append(task)
 
             return await asyncio.gather(*tasks, return_exceptions=True)
         finally:
+            self.sampler.release()
             if self.monitor:
                 self.monitor.stop()
+
+
+def _fleet_worker_main(
+    conn,
+    urls: List[str],
+    config_data: Union[dict, List[dict]],
+    browser_config_data: dict,
+    crawler_strategy_factory: Optional[Callable[[], "AsyncCrawlerStrategy"]],
+    max_session_permit: int,
+    rate_limiter: Optional[RateLimiter],
+    retry_policy: Optional[RetryPolicy],
+    collect_dead_letters: bool,
+) -> None:
+    """Entry point of a ProcessFleetDispatcher worker process."""
+    try:
+        asyncio.run(
+            _fleet_worker(
+                conn, urls, config_data, browser_config_data, crawler_strategy_factory,
+                max_session_permit, rate_limiter, retry_policy, collect_dead_letters,
+            )
+        )
+    finally:
+        conn.close()
+
+
+async def _fleet_worker(
+    conn,
+    urls: List[str],
+    config_data: Union[dict, List[dict]],
+    browser_config_data: dict,
+    crawler_strategy_factory: Optional[Callable[[], "AsyncCrawlerStrategy"]],
+    max_session_permit: int,
+    rate_limiter: Optional[RateLimiter],
+    retry_policy: Optional[RetryPolicy],
+    collect_dead_letters: bool,
+) -> None:
+    # Imported here: async_webcrawler imports this module.
+    from .async_webcrawler import AsyncWebCrawler
+
+    loop = asyncio.get_running_loop()
+    # Pipe writes block once the OS buffer is full; keep them off the loop,
+    # on a thread of their own so a slow parent does not hold up to_thread users.
+    sender = ThreadPoolExecutor(max_workers=1, thread_name_prefix="crawl4ai-fleet-send")
+
+    async def send(kind: str, payload) -> None:
+        await loop.run_in_executor(sender, conn.send, (kind, payload))
+
+    try:
+        if isinstance(config_data, list):
+            config = [CrawlerRunConfig.load(c) for c in config_data]
+        else:
+            config = CrawlerRunConfig.load(config_data)
+        browser_config = BrowserConfig.load(browser_config_data)
+        dead_letter_sink = DeadLetterSink() if collect_dead_letters else None
+        dispatcher = MemoryAdaptiveDispatcher(
+            max_session_permit=max_session_permit,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            dead_letter_sink=dead_letter_sink,
+        )
+        crawler_strategy = crawler_strategy_factory() if crawler_strategy_factory else None
+
+        async with AsyncWebCrawler(crawler_strategy=crawler_strategy, config=browser_config) as crawler:
+            async for task_result in dispatcher.run_urls_stream(urls=urls, crawler=crawler, config=config):
+                result = task_result.result
+                if isinstance(result, CrawlResultContainer):
+                    result = result[0]
+                # CrawlResult does not pickle; ship its dump and rebuild it in the parent.
+                task_result.result = result.model_dump()
+                await send("result", task_result)
+
+        if dead_letter_sink is not None:
+            await send("dead_letters", dead_letter_sink.entries)
+        await send("done", None)
+    except Exception as e:
+        await send("error", f"{type(e).__name__}: {e}")
+    finally:
+        sender.shutdown(wait=False)
+
+
+class ProcessFleetDispatcher(BaseDispatcher):
+    """
+    Spreads a batch over several worker processes, each running its own
+    AsyncWebCrawler and browser, so scraping and markdown generation use more
+    than one CPU core.
+
+    URLs are sharded by host, so every URL of a host lands in the same worker
+    and that worker's rate limiter sees all of the host's traffic. Inside a
+    worker the shard is crawled by a MemoryAdaptiveDispatcher; results are
+    streamed back to the parent over a pipe as soon as they finish.
+
+    Configs cross the process boundary through ``dump()``/``load()``, so they
+    must be serializable (e.g. no callable ``url_matcher`` or hooks).
+
+    Args:
+        num_workers: Number of worker processes. Defaults to the CPU count.
+        max_session_permit: Concurrent crawls per worker.
+        crawler_strategy_factory: Picklable zero-argument callable returning the
+            crawler strategy for each worker (e.g. ``AsyncHTTPCrawlerStrategy``).
+            Defaults to a Playwright strategy built from the crawler's BrowserConfig.
+        rate_limiter: Copied into every worker.
+        retry_policy: Copied into every worker.
+        dead_letter_sink: Collects the permanently failed URLs of all workers.
+        start_method: multiprocessing start method for the workers.
+    """
+
+    def __init__(
+        self,
+        num_workers: Optional[int] = None,
+        max_session_permit: int = 10,
+        crawler_strategy_factory: Optional[Callable[[], "AsyncCrawlerStrategy"]] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        dead_letter_sink: Optional[DeadLetterSink] = None,
+        start_method: str = "spawn",
+    ):
+        super().__init__(rate_limiter, None, retry_policy, dead_letter_sink)
+        self.num_workers = max(1, num_workers or os.cpu_count() or 1)
+        self.max_session_permit = max_session_permit
+        self.crawler_strategy_factory = crawler_strategy_factory
+        self.start_method = start_method
+
+    def shard_for(self, url: str) -> int:
+        """Stable worker index for a URL, based on its host."""
+        host = urlparse(url).netloc.lower()
+        # file:// and raw: URLs have no host; spread them by the whole URL
+        return zlib.crc32((host or url).encode("utf-8")) % self.num_workers
+
+    def _shard(self, urls: List[str]) -> Dict[int, List[str]]:
+        shards: Dict[int, List[str]] = {}
+        for url in urls:
+            shards.setdefault(self.shard_for(url), []).append(url)
+        return shards
+
+    async def crawl_url(
+        self,
+        url: str,
+        config: Union[CrawlerRunConfig, List[CrawlerRunConfig]],
+        task_id: str,
+        monitor: Optional[CrawlerMonitor] = None,
+    ) -> CrawlerTaskResult:
+        async with contextlib.aclosing(self.run_urls_stream([url], self.crawler, config)) as results:
+            async for task_result in results:
+                return task_result
+
+    async def run_urls(
+        self,
+        urls: List[str],
+        crawler: AsyncWebCrawler,
+        config: Union[CrawlerRunConfig, List[CrawlerRunConfig]],
+    ) -> List[CrawlerTaskResult]:
+        return [r async for r in self.run_urls_stream(urls, crawler, config)]
+
+    async def run_urls_stream(
+        self,
+        urls: List[str],
+        crawler: AsyncWebCrawler,
+        config: Union[CrawlerRunConfig, List[CrawlerRunConfig]],
+    ) -> AsyncGenerator[CrawlerTaskResult, None]:
+        self.crawler = crawler
+        if not urls:
+            return
+
+        ctx = multiprocessing.get_context(self.start_method)
+        config_data = [c.dump() for c in config] if isinstance(config, list) else config.dump()
+        browser_config_data = crawler.browser_config.dump()
+        results: asyncio.Queue = asyncio.Queue()
+        processes = []
+        readers = []
+        shards = self._shard(urls)
+        # Each reader blocks in conn.recv() for the whole run: give them their
+        # own threads instead of tying up the default executor.
+        reader_pool = ThreadPoolExecutor(max_workers=len(shards), thread_name_prefix="crawl4ai-fleet-read")
+
+        for shard_urls in shards.values():
+            parent_conn, child_conn = ctx.Pipe(duplex=False)
+            process = ctx.Process(
+                target=_fleet_worker_main,
+                args=(
+                    child_conn, shard_urls, config_data, browser_config_data,
+                    self.crawler_strategy_factory, self.max_session_permit,
+                    self.rate_limiter, self.retry_policy,
+                    self.dead_letter_sink is not None,
+                ),
+                daemon=True,
+            )
+            process.start()
+            child_conn.close()
+            processes.append(process)
+            readers.append(
+                asyncio.create_task(
+                    self._read_worker(parent_conn, process, shard_urls, results, reader_pool)
+                )
+            )
+
+        try:
+            remaining = len(readers)
+            while remaining:
+                task_result = await results.get()
+                if task_result is None:
+                    remaining -= 1
+                    continue
+                yield task_result
+        finally:
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+            await asyncio.gather(*readers, return_exceptions=True)
+            reader_pool.shutdown(wait=False)
+
+    async def _read_worker(
+        self,
+        conn,
+        process,
+        shard_urls: List[str],
+        results: asyncio.Queue,
+        executor: Optional[ThreadPoolExecutor] = None,
+    ) -> None:
+        """Forward one worker's messages to ``results``; ends with a None sentinel."""
+        loop = asyncio.get_running_loop()
+        pending = Counter(shard_urls)
+        error_message = ""
+        try:
+            while True:
+                try:
+                    kind, payload = await loop.run_in_executor(executor, conn.recv)
+                except (EOFError, OSError):
+                    error_message = error_message or f"Worker process exited (code {process.exitcode})"
+                    break
+                if kind == "result":
+                    payload.result = CrawlResult(**payload.result)
+                    pending[payload.url] -= 1
+                    await results.put(payload)
+                elif kind == "dead_letters":
+                    for entry in payload:
+                        self.dead_letter_sink.add(entry)
+                elif kind == "error":
+                    error_message = payload
+                elif kind == "done":
+                    break
+
+            # URLs the worker never reported back (crash, startup failure) still
+            # get a failed result so callers see every input URL exactly once.
+            for url, count in pending.items():
+                for _ in range(count):
+                    now = time.time()
+                    await results.put(
+                        CrawlerTaskResult(
+                            task_id=str(uuid.uuid4()),
+                            url=url,
+                            result=CrawlResult(
+                                url=url, html="", success=False, error_message=error_message
+                            ),
+                            memory_usage=0,
+                            peak_memory=0,
+                            start_time=now,
+                            end_time=now,
+                            error_message=error_message,
+                        )
+                    )
+        finally:
+            conn.close()
+            await loop.run_in_executor(executor, process.join, 5)
+            await results.put(None)
+
+
+class FrontierDispatcher(BaseDispatcher):
+    """
+    Dispatcher backed by a shared CrawlFrontier.
+
+    URLs are enqueued into the frontier (duplicates of any URL ever seen are
+    dropped), then leased, crawled and acked until the frontier is drained.
+    Several crawlers, in other processes or on other machines, can run against
+    the same RedisFrontier: each one crawls whatever it leases, so work, dedup
+    and per-host politeness are shared.
+
+    Args:
+        frontier: Frontier backend. Defaults to an InMemoryFrontier.
+        max_session_permit: Concurrent crawls in this process.
+        min_host_interval: Minimum seconds between two requests to the same
+            host, enforced across all workers of the frontier. 0 disables it.
+        visibility_timeout: Lease duration; must exceed the longest crawl.
+        poll_interval: How often to poll the frontier while it has no work for us.
+    """
+
+    def __init__(
+        self,
+        frontier: Optional["CrawlFrontier"] = None,
+        max_session_permit: int = 20,
+        min_host_interval: float = 0.0,
+        visibility_timeout: Optional[float] = None,
+        poll_interval: float = 0.5,
+        rate_limiter: Optional[RateLimiter] = None,
+        monitor: Optional[CrawlerMonitor] = None,
+    ):
+        super().__init__(rate_limiter, monitor)
+        if frontier is None:
+            from .frontier import InMemoryFrontier
+            frontier = InMemoryFrontier()
+        self.frontier = frontier
+        self.max_session_permit = max_session_permit
+        self.min_host_interval = min_host_interval
+        self.visibility_timeout = visibility_timeout
+        self.poll_interval = poll_interval
+
+    async def crawl_url(
+        self,
+        url: str,
+        config: Union[CrawlerRunConfig, List[CrawlerRunConfig]],
+        task_id: str,
+        monitor: Optional[CrawlerMonitor] = None,
+    ) -> CrawlerTaskResult:
+        start_time = time.time()
+        error_message = ""
+        selected_config = self.select_config(url, config)
+        if self.monitor:
+            self.monitor.update_task(task_id, status=CrawlStatus.IN_PROGRESS, start_time=start_time)
+
+        try:
+            if selected_config is None:
+                raise ValueError(f"No matching configuration found for URL: {url}")
+            await self.frontier.wait_for_host(url, self.min_host_interval)
+            if self.rate_limiter:
+                await self.rate_limiter.wait_if_needed(url)
+            result = await self.crawler.arun(url, config=selected_config, session_id=task_id)
+            if isinstance(result, CrawlResultContainer):
+                result = result[0]
+            if self.rate_limiter and result.status_code:
+                self.rate_limiter.update_delay(url, result.status_code)
+            if not result.success:
+                error_message = result.error_message
+        except Exception as e:
+            error_message = str(e)
+            result = CrawlResult(url=url, html="", metadata={}, success=False, error_message=error_message)
+
+        end_time = time.time()
+        if self.monitor:
+            self.monitor.update_task(
+                task_id,
+                status=CrawlStatus.COMPLETED if result.success else CrawlStatus.FAILED,
+                end_time=end_time,
+                error_message=error_message,
+            )
+        return CrawlerTaskResult(
+            task_id=task_id,
+            url=url,
+            result=result,
+            memory_usage=0,
+            peak_memory=0,
+            start_time=start_time,
+            end_time=end_time,
+            error_message=error_message,
+        )
+
+    async def drain(
+        self,
+        crawler: AsyncWebCrawler,
+        config: Union[CrawlerRunConfig, List[CrawlerRunConfig]],
+    ) -> AsyncGenerator[Tuple["FrontierItem", CrawlerTaskResult], None]:
+        """
+        Lease, crawl and ack frontier URLs until the frontier is drained.
+
+        Yields ``(item, task_result)`` pairs. URLs enqueued by the consumer
+        while iterating are picked up as well. Leases still running when the
+        generator is closed are handed back to the frontier.
+        """
+        self.crawler = crawler
+        active: Dict[asyncio.Task, "FrontierItem"] = {}
+        try:
+            while True:
+                free_slots = self.max_session_permit - len(active)
+                if free_slots > 0:
+                    for item in await self.frontier.lease(free_slots, self.visibility_timeout):
+                        task_id = str(uuid.uuid4())
+                        if self.monitor:
+                            self.monitor.add_task(task_id, item.url)
+                        task = asyncio.create_task(self.crawl_url(item.url, config, task_id))
+                        active[task] = item
+
+                if not active:
+                    if await self.frontier.is_drained():
+                        break
+                    # Other workers still hold leases that may expire back to us.
+                    await asyncio.sleep(self.poll_interval)
+                    continue
+
+                done, _ = await asyncio.wait(
+                    active, timeout=self.poll_interval, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    item = active.pop(task)
+                    task_result = task.result()
+                    result = task_result.result
+                    await self.frontier.ack(
+                        item.url,
+                        {
+                            "success": result.success,
+                            "status_code": result.status_code,
+                            "error_message": result.error_message or "",
+                        },
+                    )
+                    yield item, task_result
+        finally:
+            for task in active:
+                task.cancel()
+            if active:
+                await asyncio.gather(*active, return_exceptions=True)
+            for item in active.values():
+                await self.frontier.nack(item.url)
+
+    async def run_urls_stream(
+        self,
+        urls: List[str],
+        crawler: AsyncWebCrawler,
+        config: Union[CrawlerRunConfig, List[CrawlerRunConfig]],
+    ) -> AsyncGenerator[CrawlerTaskResult, None]:
+        for url in urls:
+            await self.frontier.enqueue(url)
+        if self.monitor:
+            self.monitor.start()
+        try:
+            async with contextlib.aclosing(self.drain(crawler, config)) as results:
+                async for _, task_result in results:
+                    yield task_result
+        finally:
+            if self.monitor:
+                self.monitor.stop()
+
+    async def run_urls(
+        self,
+        urls: List[str],
+        crawler: AsyncWebCrawler,
+        config: Union[CrawlerRunConfig, List[CrawlerRunConfig]],
+    ) -> List[CrawlerTaskResult]:
+        return [r async for r in self.run_urls_stream(urls, crawler, config)]
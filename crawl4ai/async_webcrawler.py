@@ -4,7 +4,7 @@ import re
 import sys
 import time
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, Optional, List
 import json
 import asyncio
 
@@ -53,6 +53,7 @@ from .utils import (
 )
 from .cache_validator import CacheValidator, CacheValidationResult
 from .antibot_detector import is_blocked
+from .single_flight import SingleFlight, fetch_key
 
 
 class AsyncWebCrawler:
@@ -155,6 +156,8 @@ class AsyncWebCrawler:
 
         # Thread safety setup
         self._lock = asyncio.Lock() if thread_safe else None
+        # Identical fetches in flight, shared between concurrent arun() calls
+        self._in_flight = SingleFlight()
 
         # Initialize directories
         self.crawl4ai_folder = os.path.join(base_directory, ".crawl4ai")
@@ -276,7 +279,8 @@ class AsyncWebCrawler:
                     cached_result = await async_db_manager.aget_cached_url(url)
 
                 # Smart Cache: Validate cache freshness if enabled
-                if cached_result and config.check_cache_freshness:
+                # (CacheMode.REVALIDATE validates with the fetch itself instead)
+                if cached_result and config.check_cache_freshness and not cache_context.should_revalidate():
                     cache_metadata = await async_db_manager.aget_cache_metadata(url)
                     if cache_metadata:
                         async with CacheValidator(timeout=config.cache_validation_timeout) as validator:
@@ -333,8 +337,11 @@ class AsyncWebCrawler:
                     # If screenshot is requested but its not in cache, then set cache_result to None
                     screenshot_data = cached_result.screenshot
                     pdf_data = cached_result.pdf
+                    # A file sink screenshot counts while its file is still there
+                    if cached_result.screenshot_path and not os.path.isfile(cached_result.screenshot_path):
+                        cached_result.screenshot_path = None
                     # if config.screenshot and not screenshot or config.pdf and not pdf:
-                    if config.screenshot and not screenshot_data:
+                    if config.screenshot and not (screenshot_data or cached_result.screenshot_path):
                         cached_result = None
 
                     if config.pdf and not pdf_data:
@@ -347,6 +354,19 @@ class AsyncWebCrawler:
                         tag="FETCH",
                     )
 
+                # Conditional recrawl: fetch with the cached validators, and
+                # serve the cached copy if the server answers 304.
+                revalidating = None
+                crawl_kwargs = {}
+                if cached_result and cache_context.should_revalidate():
+                    conditional_headers = await self._conditional_headers(url)
+                    if conditional_headers:
+                        revalidating = cached_result
+                        crawl_kwargs["conditional_headers"] = conditional_headers
+                    # Without validators there is nothing to confirm: recrawl
+                    cached_result = None
+                    extracted_content = None
+
                 # Update proxy configuration from rotation strategy if available
                 if config and config.proxy_rotation_strategy:
                     # Handle sticky sessions - use same proxy for all requests with same session_id
@@ -397,10 +417,13 @@ class AsyncWebCrawler:
                             )
 
                     # --- Anti-bot retry setup ---
-                    # raw: URLs contain caller-provided HTML (e.g. from cache),
-                    # not content fetched from a web server.  Anti-bot detection,
-                    # proxy retries, and fallback fetching are meaningless here.
-                    _is_raw_url = url.startswith("raw:") or url.startswith("raw://")
+                    # raw: URLs and local files contain caller-provided HTML (e.g.
+                    # from cache, or a saved corpus), not content fetched from a
+                    # web server.  Anti-bot detection, proxy retries, and fallback
+                    # fetching are meaningless here.
+                    _is_local_content = url.startswith(("raw:", "file://")) or getattr(
+                        self.crawler_strategy, "serves_local_content", False
+                    )
 
                     _max_attempts = 1 + getattr(config, "max_retries", 0)
                     _proxy_list = config._get_proxy_list()
@@ -408,6 +431,7 @@ class AsyncWebCrawler:
                     _block_reason = ""
                     _done = False
                     crawl_result = None
+                    not_modified = None
                     _crawl_stats = {
                         "attempts": 0,
                         "retries": 0,
@@ -456,8 +480,12 @@ class AsyncWebCrawler:
                                     self.crawler_strategy.update_user_agent(
                                         config.user_agent)
 
-                                async_response = await self.crawler_strategy.crawl(
-                                    url, config=config)
+                                async_response = await self._fetch(url, config, crawl_kwargs)
+
+                                if revalidating is not None and async_response.status_code == 304:
+                                    not_modified = async_response
+                                    _done = True
+                                    break
 
                                 html = sanitize_input_encode(async_response.html)
                                 screenshot_data = async_response.screenshot
@@ -490,11 +518,17 @@ class AsyncWebCrawler:
                                 crawl_result.redirected_status_code = async_response.redirected_status_code
                                 crawl_result.response_headers = async_response.response_headers
                                 crawl_result.downloaded_files = async_response.downloaded_files
+                                crawl_result.downloaded_file_hashes = async_response.downloaded_file_hashes
                                 crawl_result.js_execution_result = js_execution_result
                                 crawl_result.mhtml = async_response.mhtml_data
                                 crawl_result.ssl_certificate = async_response.ssl_certificate
                                 crawl_result.network_requests = async_response.network_requests
                                 crawl_result.console_messages = async_response.console_messages
+                                crawl_result.wait_timings = async_response.wait_timings
+                                crawl_result.screenshot_path = async_response.screenshot_path
+                                crawl_result.capture_stats = async_response.capture_stats
+                                crawl_result.network_capture_path = async_response.network_capture_path
+                                crawl_result.body_size = async_response.body_size
                                 # Success when html is non-empty OR a binary
                                 # download was retrieved (PDFs, archives etc.
                                 # have empty html by design — file content is
@@ -503,9 +537,9 @@ class AsyncWebCrawler:
                                 crawl_result.session_id = getattr(config, "session_id", None)
                                 crawl_result.cache_status = "miss"
 
-                                # Check if blocked (skip for raw: URLs —
-                                # caller-provided content, anti-bot N/A)
-                                if _is_raw_url:
+                                # Check if blocked (skip for raw: URLs and local
+                                # files — caller-provided content, anti-bot N/A)
+                                if _is_local_content:
                                     _blocked = False
                                     _block_reason = ""
                                 else:
@@ -546,12 +580,17 @@ class AsyncWebCrawler:
                     # Restore original proxy_config
                     config.proxy_config = _original_proxy_config
 
+                    if not_modified is not None:
+                        return await self._serve_not_modified(
+                            url, revalidating, not_modified, cache_context, config, start_time
+                        )
+
                     # --- Fallback fetch function (last resort after all retries+proxies exhausted) ---
                     # Invoke fallback when: (a) crawl_result exists but is blocked, OR
                     # (b) crawl_result is None because all proxies threw exceptions (browser crash, timeout).
                     # Skip for raw: URLs — fallback expects a real URL, not raw HTML content.
                     _fallback_fn = getattr(config, "fallback_fetch_function", None)
-                    if _fallback_fn and not _done and not _is_raw_url:
+                    if _fallback_fn and not _done and not _is_local_content:
                         _needs_fallback = (
                             crawl_result is None  # All proxies threw exceptions
                             or is_blocked(crawl_result.status_code, crawl_result.html or "")[0]
@@ -625,7 +664,7 @@ class AsyncWebCrawler:
                         # empty by design, and is_blocked() would misread "0 bytes
                         # html" as a block.
                         _has_download = bool(getattr(crawl_result, "downloaded_files", None))
-                        if not _fallback_succeeded and not _is_raw_url and not _has_download:
+                        if not _fallback_succeeded and not _is_local_content and not _has_download:
                             _blocked, _block_reason = is_blocked(
                                 crawl_result.status_code, crawl_result.html or "")
                             if _blocked:
@@ -712,6 +751,76 @@ class AsyncWebCrawler:
                     )
                 )
 
+    async def _fetch(self, url: str, config: CrawlerRunConfig, crawl_kwargs: Dict) -> AsyncCrawlResponse:
+        """crawler_strategy.crawl(), joined with an identical fetch already in flight if any."""
+        if (
+            not config.coalesce_requests
+            or config.session_id  # session pages carry state between crawls
+            or not url.startswith(("http://", "https://"))
+        ):
+            return await self.crawler_strategy.crawl(url, config=config, **crawl_kwargs)
+        return await self._in_flight.do(
+            fetch_key(url, config, crawl_kwargs),
+            lambda: self.crawler_strategy.crawl(url, config=config, **crawl_kwargs),
+            # Each caller post-processes its own copy
+            share=lambda response: response.model_copy(deep=True),
+        )
+
+    async def _conditional_headers(self, url: str) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since for the cached copy of ``url``."""
+        metadata = await async_db_manager.aget_cache_metadata(url) or {}
+        headers = {}
+        if metadata.get("etag"):
+            headers["If-None-Match"] = metadata["etag"]
+        if metadata.get("last_modified"):
+            headers["If-Modified-Since"] = metadata["last_modified"]
+        return headers
+
+    async def _serve_not_modified(
+        self,
+        url: str,
+        cached_result: CrawlResult,
+        response: AsyncCrawlResponse,
+        cache_context: CacheContext,
+        config: CrawlerRunConfig,
+        start_time: float,
+    ) -> CrawlResultContainer:
+        """Serve the cached result for a 304, with the headers the server sent refreshed."""
+        fresh = {k.lower(): v for k, v in (response.response_headers or {}).items()}
+        headers = {
+            k: v for k, v in (cached_result.response_headers or {}).items()
+            if k.lower() not in fresh
+        }
+        headers.update(fresh)
+
+        cached_result.response_headers = headers
+        cached_result.cache_status = "hit_validated"
+        cached_result.success = bool(cached_result.html) or bool(getattr(cached_result, "downloaded_files", None))
+        cached_result.session_id = getattr(config, "session_id", None)
+        cached_result.redirected_url = cached_result.redirected_url or url
+
+        if cache_context.should_write():
+            await async_db_manager.aupdate_cache_metadata(
+                url=url,
+                etag=fresh.get("etag"),
+                last_modified=fresh.get("last-modified"),
+                response_headers=headers,
+                cached_at=time.time(),
+            )
+
+        self.logger.info(
+            message="Not modified, serving cached copy: {url}",
+            tag="CACHE",
+            params={"url": cache_context.display_url},
+        )
+        self.logger.url_status(
+            url=cache_context.display_url,
+            success=True,
+            timing=time.perf_counter() - start_time,
+            tag="COMPLETE",
+        )
+        return CrawlResultContainer(cached_result)
+
     async def aprocess_html(
         self,
         url: str,
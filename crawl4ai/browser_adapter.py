@@ -9,6 +9,8 @@ from typing import List, Dict, Any, Optional, Callable
 import time
 import json
 
+from .page_listeners import listen, unlisten
+
 # Import both, but use conditionally
 try:
     from playwright.async_api import Page
@@ -95,7 +97,7 @@ class PlaywrightAdapter(BrowserAdapter):
                     "timestamp": time.time()
                 })
         
-        page.on("console", handle_console_capture)
+        listen(page, "console", handle_console_capture)
         return handle_console_capture
     
     async def setup_error_capture(self, page: Page, captured_console: List[Dict]) -> Optional[Callable]:
@@ -127,7 +129,7 @@ class PlaywrightAdapter(BrowserAdapter):
                     "timestamp": time.time()
                 })
         
-        page.on("pageerror", handle_pageerror_capture)
+        listen(page, "pageerror", handle_pageerror_capture)
         return handle_pageerror_capture
     
     async def retrieve_console_messages(self, page: Page) -> List[Dict]:
@@ -137,9 +139,9 @@ class PlaywrightAdapter(BrowserAdapter):
     async def cleanup_console_capture(self, page: Page, handle_console: Optional[Callable], handle_error: Optional[Callable]):
         """Remove event listeners"""
         if handle_console:
-            page.remove_listener("console", handle_console)
+            unlisten(page, "console", handle_console)
         if handle_error:
-            page.remove_listener("pageerror", handle_error)
+            unlisten(page, "pageerror", handle_error)
     
     def get_imports(self) -> tuple:
         """Return Playwright imports"""
@@ -215,7 +217,7 @@ class StealthAdapter(BrowserAdapter):
                     "timestamp": time.time()
                 })
 
-        page.on("console", handle_console_capture)
+        listen(page, "console", handle_console_capture)
         return handle_console_capture
 
     async def setup_error_capture(self, page: Page, captured_console: List[Dict]) -> Optional[Callable]:
@@ -247,7 +249,7 @@ class StealthAdapter(BrowserAdapter):
                     "timestamp": time.time()
                 })
 
-        page.on("pageerror", handle_pageerror_capture)
+        listen(page, "pageerror", handle_pageerror_capture)
         return handle_pageerror_capture
 
     async def retrieve_console_messages(self, page: Page) -> List[Dict]:
@@ -257,9 +259,9 @@ class StealthAdapter(BrowserAdapter):
     async def cleanup_console_capture(self, page: Page, handle_console: Optional[Callable], handle_error: Optional[Callable]):
         """Remove event listeners"""
         if handle_console:
-            page.remove_listener("console", handle_console)
+            unlisten(page, "console", handle_console)
         if handle_error:
-            page.remove_listener("pageerror", handle_error)
+            unlisten(page, "pageerror", handle_error)
 
     def get_imports(self) -> tuple:
         """Return Playwright imports"""
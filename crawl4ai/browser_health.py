@@ -0,0 +1,202 @@
+"""
+Health checks for browser processes, with automatic relaunch.
+
+A BrowserHealthMonitor watches the browser of one BrowserManager:
+
+- ``disconnected`` events (the process died or the CDP connection dropped),
+- renderer crashes (``crash`` events of its pages),
+- with BrowserConfig(health_check_interval=...), a periodic CDP ping that
+  must answer within ``health_ping_timeout`` seconds, and the resident
+  memory of the browser's processes against ``max_browser_rss_mb``.
+
+When the browser is found dead or unhealthy, the monitor calls its
+``on_unhealthy(reason)`` callback once: BrowserManager relaunches the
+browser, ShardedBrowserManager replaces just that shard. Crawls that were
+running on the old browser fail with BrowserCrashedError, which the
+dispatcher's RetryPolicy treats as retryable ("browser_crash").
+"""
+
+import asyncio
+import time
+from typing import Callable, Optional
+
+import psutil
+
+
+class BrowserCrashedError(RuntimeError):
+    """Raised for a crawl whose browser (or renderer) crashed underneath it. Safe to retry."""
+
+
+def crash_reason(page) -> Optional[str]:
+    """Why the browser or renderer behind ``page`` was found dead, or None."""
+    if page is None:
+        return None
+    reason = getattr(page, "_crawl4ai_crashed", None)
+    if reason:
+        return reason
+    monitor = getattr(page, "_crawl4ai_health", None)
+    return monitor.reason if monitor is not None else None
+
+
+class BrowserHealthMonitor:
+    """
+    Detects a dead or unhealthy browser and reports it once.
+
+    Args:
+        browser: The Playwright Browser to watch.
+        on_unhealthy: Called with the reason when the browser is found unhealthy.
+        interval: Seconds between active checks. 0 = only react to events.
+        ping_timeout: Seconds a CDP ping may take before the browser counts as unresponsive.
+        max_rss_mb: Resident memory ceiling for the browser's processes, in MB.
+        pid: PID of the browser process, if known (managed browsers). Otherwise
+            the process list is asked from the browser over CDP (Chromium only).
+        logger: Optional logger.
+    """
+
+    def __init__(
+        self,
+        browser,
+        on_unhealthy: Callable[[str], None],
+        interval: float = 0.0,
+        ping_timeout: float = 5.0,
+        max_rss_mb: Optional[float] = None,
+        pid: Optional[int] = None,
+        logger=None,
+    ):
+        self.browser = browser
+        self.on_unhealthy = on_unhealthy
+        self.interval = interval
+        self.ping_timeout = ping_timeout
+        self.max_rss_mb = max_rss_mb
+        self.pid = pid
+        self.logger = logger
+        self.reason: Optional[str] = None
+        self.stats = {"checks": 0, "last_ping_ms": None, "rss_mb": None, "renderer_crashes": 0}
+        self._session = None
+        self._cdp_supported = True
+        self._task: Optional[asyncio.Task] = None
+        self._check_task: Optional[asyncio.Task] = None
+        self._stopped = False
+
+    def start(self) -> None:
+        self.browser.on("disconnected", self._on_disconnected)
+        if self.interval > 0:
+            self._task = asyncio.ensure_future(self._run())
+
+    def stop(self) -> None:
+        """Stop checking. Events that arrive afterwards (e.g. from close()) are ignored."""
+        self._stopped = True
+        for task in (self._task, self._check_task):
+            if task is not None and not task.done() and task is not asyncio.current_task():
+                task.cancel()
+        try:
+            self.browser.remove_listener("disconnected", self._on_disconnected)
+        except Exception:
+            pass
+
+    def watch_page(self, page) -> None:
+        """Tie ``page`` to this browser, so its crawl can tell it died. Idempotent."""
+        if getattr(page, "_crawl4ai_health", None) is self:
+            return
+        page._crawl4ai_health = self
+        page.on("crash", self._on_page_crash)
+
+    def mark_unhealthy(self, reason: str) -> None:
+        if self._stopped or self.reason is not None:
+            return
+        self.reason = reason
+        self.stop()
+        if self.logger:
+            self.logger.warning(
+                message="Browser unhealthy: {reason}",
+                tag="BROWSER",
+                params={"reason": reason},
+            )
+        self.on_unhealthy(reason)
+
+    def _on_disconnected(self, _browser) -> None:
+        self.mark_unhealthy("browser disconnected")
+
+    def _on_page_crash(self, page) -> None:
+        # One tab running out of memory does not mean the browser is gone:
+        # fail that crawl, and check the browser right away.
+        page._crawl4ai_crashed = "renderer crashed"
+        self.stats["renderer_crashes"] += 1
+        if self._stopped or (self._check_task is not None and not self._check_task.done()):
+            return
+        self._check_task = asyncio.ensure_future(self._check_and_report())
+        self._check_task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+    async def _cdp(self):
+        if self._session is None and self._cdp_supported:
+            try:
+                self._session = await self.browser.new_browser_cdp_session()
+            except Exception:
+                self._cdp_supported = False  # Firefox / WebKit
+        return self._session
+
+    async def _rss_mb(self, session) -> Optional[float]:
+        pids = set()
+        if self.pid:
+            try:
+                root = psutil.Process(self.pid)
+                pids = {root.pid} | {p.pid for p in root.children(recursive=True)}
+            except psutil.Error:
+                return None
+        elif session is not None:
+            info = await session.send("SystemInfo.getProcessInfo")
+            pids = {p["id"] for p in info.get("processInfo", [])}
+        if not pids:
+            return None
+        total = 0
+        for pid in pids:
+            try:
+                total += psutil.Process(pid).memory_info().rss
+            except psutil.Error:
+                continue  # exited between listing and measuring
+        return total / (1024 * 1024)
+
+    async def check(self) -> Optional[str]:
+        """Run the active checks once. Returns the reason the browser is unhealthy, or None."""
+        self.stats["checks"] += 1
+        if not self.browser.is_connected():
+            return "browser disconnected"
+
+        session = await self._cdp()
+        if session is not None:
+            started = time.perf_counter()
+            try:
+                await asyncio.wait_for(session.send("Browser.getVersion"), self.ping_timeout)
+            except asyncio.TimeoutError:
+                return f"CDP ping timed out after {self.ping_timeout}s"
+            except Exception as e:
+                return f"CDP ping failed: {e}"
+            self.stats["last_ping_ms"] = (time.perf_counter() - started) * 1000
+
+        if self.max_rss_mb:
+            try:
+                rss = await self._rss_mb(session)
+            except Exception:
+                rss = None
+            self.stats["rss_mb"] = rss
+            if rss is not None and rss > self.max_rss_mb:
+                return f"browser RSS {rss:.0f} MB over the {self.max_rss_mb:.0f} MB limit"
+        return None
+
+    async def _check_and_report(self) -> None:
+        reason = await self.check()
+        if reason:
+            self.mark_unhealthy(reason)
+
+    async def _run(self) -> None:
+        while not self._stopped:
+            await asyncio.sleep(self.interval)
+            try:
+                await self._check_and_report()
+            except Exception as e:
+                if self.logger:
+                    self.logger.debug(
+                        message="Browser health check error: {error}",
+                        tag="BROWSER",
+                        params={"error": str(e)},
+                    )
@@ -15,6 +15,10 @@ from .js_snippet import load_js_script
 from .config import DOWNLOAD_PAGE_TIMEOUT
 from .async_configs import BrowserConfig, CrawlerRunConfig
 from .utils import get_chromium_path
+from .request_blocker import RequestBlocker
+from .subresource_cache import SubresourceCache
+from .browser_health import BrowserHealthMonitor
+from .page_listeners import attached_listeners
 import warnings
 
 
@@ -667,6 +671,123 @@ class _CDPConnectionCache:
             cls._cache.clear()
 
 
+class _PagePool:
+    """
+    Pre-created pages of one browser context.
+
+    Enabled via BrowserConfig(page_pool_size=N). The pool owns up to
+    ``target_size`` pages, idle or in use. A background task creates and
+    stealths missing pages ahead of time, so a crawl does not pay for
+    new_page() + init scripts. Released pages are reset to about:blank and
+    reused until they have served ``max_uses`` crawls. Pages beyond the
+    target, pages that cannot be reset cleanly and pages the caller marks
+    as not reusable (e.g. changed by user hooks) are closed instead.
+    """
+
+    def __init__(self, create_page, target_size: int, max_uses: int, viewport: Optional[dict] = None):
+        self._create_page = create_page  # async () -> Page, already stealthed
+        self.target_size = target_size
+        self.max_uses = max(1, max_uses)
+        self.viewport = viewport
+        self._idle: List = []
+        self._in_use: set = set()
+        self._uses: Dict = {}                # page -> crawls served
+        self._creating = 0
+        self._refill_task: Optional[asyncio.Task] = None
+        self._closed = False
+
+    def _owned(self) -> int:
+        return len(self._idle) + len(self._in_use) + self._creating
+
+    async def _new_page(self):
+        page = await self._create_page()
+        self._uses[page] = 0
+        return page
+
+    def forget(self, page) -> None:
+        """Stop tracking a page that leaves the pool for good."""
+        self._in_use.discard(page)
+        self._uses.pop(page, None)
+
+    def owns(self, page) -> bool:
+        return page in self._uses
+
+    async def acquire(self):
+        """Take an idle page, or create one if none is ready."""
+        page = None
+        while self._idle:
+            candidate = self._idle.pop()
+            if not candidate.is_closed():
+                page = candidate
+                break
+            self.forget(candidate)
+        if page is None:
+            page = await self._new_page()
+        self._uses[page] += 1
+        self._in_use.add(page)
+        self._schedule_refill()
+        return page
+
+    async def release(self, page, reusable: bool = True) -> bool:
+        """Reset a page and keep it for reuse. Returns False if the caller should close it."""
+        self._in_use.discard(page)
+        keep = (
+            reusable
+            and not self._closed
+            and self.owns(page)
+            and not page.is_closed()
+            and self._uses[page] < self.max_uses
+            and self._owned() < self.target_size
+        )
+        if keep:
+            try:
+                await self._reset(page)
+            except Exception:
+                keep = False
+        if not keep:
+            self.forget(page)
+            self._schedule_refill()
+            return False
+        self._idle.append(page)
+        return True
+
+    async def _reset(self, page) -> None:
+        if attached_listeners(page):
+            raise RuntimeError("page still has crawl event handlers attached")
+        await page.goto("about:blank")
+        await page.unroute_all()
+        await page.set_extra_http_headers({})
+        if self.viewport and page.viewport_size != self.viewport:
+            await page.set_viewport_size(self.viewport)
+
+    def _schedule_refill(self) -> None:
+        if self._closed or (self._refill_task and not self._refill_task.done()):
+            return
+        self._refill_task = asyncio.create_task(self._refill())
+
+    async def _refill(self) -> None:
+        while not self._closed and self._owned() < self.target_size:
+            self._creating += 1
+            try:
+                page = await self._new_page()
+            except Exception:
+                return  # context gone or browser busy; the next acquire retries
+            finally:
+                self._creating -= 1
+            if self._closed:
+                await page.close()
+                return
+            self._idle.append(page)
+
+    def discard(self) -> None:
+        """Stop refilling. Idle pages are closed together with their context."""
+        self._closed = True
+        if self._refill_task and not self._refill_task.done():
+            self._refill_task.cancel()
+        self._idle.clear()
+        self._in_use.clear()
+
+
 class BrowserManager:
     """
     Manages the browser instance and context.
@@ -734,6 +855,9 @@ class BrowserManager:
         # Keep track of contexts by a "config signature," so each unique config reuses a single context
         self.contexts_by_config = {}
         self._contexts_lock = asyncio.Lock()
+        # sig -> Future resolved when the context being built for sig is ready.
+        # Lets context creation run outside _contexts_lock (single-flight per sig).
+        self._contexts_in_flight: Dict[str, asyncio.Future] = {}
 
         # Context lifecycle tracking for LRU eviction
         self._context_refcounts = {}    # sig -> int  (active crawls using this context)
@@ -741,6 +865,20 @@ class BrowserManager:
         self._page_to_sig = {}          # page -> sig  (for decrement lookup on release)
         self._max_contexts = 20         # LRU eviction threshold
 
+        # Subresource blocking rules shared by all contexts, with counters
+        self.request_blocker = RequestBlocker.from_browser_config(self.config)
+
+        # On-disk cache of static subresources, shared across contexts and runs
+        self.subresource_cache = (
+            SubresourceCache.for_directory(self.config.subresource_cache_dir)
+            if self.config.subresource_cache_dir
+            else None
+        )
+
+        # Pre-warmed pages per context signature (BrowserConfig.page_pool_size)
+        self._page_pools: Dict[str, _PagePool] = {}
+        self._pooled_pages: Dict = {}   # page -> _PagePool it came from
+
         # Serialize context.new_page() across concurrent tasks to avoid races
         # when using a shared persistent context (context.pages may be empty
         # for all racers). Prevents 'Target page/context closed' errors.
@@ -764,17 +902,27 @@ class BrowserManager:
             from .browser_adapter import StealthAdapter
             self._stealth_adapter = StealthAdapter()
 
+        # Crash detection and relaunch (see browser_health.py).
+        # on_unhealthy overrides the relaunch, e.g. to replace a browser shard.
+        self.health_monitor: Optional[BrowserHealthMonitor] = None
+        self.on_unhealthy = None
+        self._relaunch_task: Optional[asyncio.Task] = None
+        self.relaunches = 0
+
         # Initialize ManagedBrowser if needed
         if self.config.use_managed_browser:
-            self.managed_browser = ManagedBrowser(
-                browser_type=self.config.browser_type,
-                user_data_dir=self.config.user_data_dir,
-                headless=self.config.headless,
-                logger=self.logger,
-                debugging_port=self.config.debugging_port,
-                cdp_url=self.config.cdp_url,
-                browser_config=self.config,
-            )
+            self.managed_browser = self._new_managed_browser()
+
+    def _new_managed_browser(self) -> "ManagedBrowser":
+        return ManagedBrowser(
+            browser_type=self.config.browser_type,
+            user_data_dir=self.config.user_data_dir,
+            headless=self.config.headless,
+            logger=self.logger,
+            debugging_port=self.config.debugging_port,
+            cdp_url=self.config.cdp_url,
+            browser_config=self.config,
+        )
 
     async def start(self):
         """
@@ -945,6 +1093,81 @@ class BrowserManager:
         if self._browser_endpoint_key not in BrowserManager._global_pages_in_use:
             BrowserManager._global_pages_in_use[self._browser_endpoint_key] = set()
 
+        self._start_health_monitor()
+
+    def _start_health_monitor(self) -> None:
+        if self.browser is None:
+            return
+        pid = None
+        if self.managed_browser and self.managed_browser.browser_process:
+            pid = self.managed_browser.browser_process.pid
+        self.health_monitor = BrowserHealthMonitor(
+            self.browser,
+            self._on_unhealthy,
+            interval=self.config.health_check_interval,
+            ping_timeout=self.config.health_ping_timeout,
+            max_rss_mb=self.config.max_browser_rss_mb,
+            pid=pid,
+            logger=self.logger,
+        )
+        self.health_monitor.start()
+
+    def _owns_browser(self) -> bool:
+        """True if this manager launched the browser, so it may relaunch it."""
+        return not (self.config.cdp_url or self._using_cached_cdp or self._launched_persistent)
+
+    def _on_unhealthy(self, reason: str) -> None:
+        if self.on_unhealthy is not None:
+            self.on_unhealthy(reason)
+            return
+        if not self._owns_browser():
+            return  # an external browser; crawls on it fail with BrowserCrashedError
+        if self._relaunch_task is None or self._relaunch_task.done():
+            self._relaunch_task = asyncio.ensure_future(self.relaunch(reason))
+            self._relaunch_task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+    async def relaunch(self, reason: str = "requested") -> None:
+        """
+        Replace the browser with a freshly launched one.
+
+        Contexts, page pools and sessions of the old browser are dropped
+        without closing them one by one (their browser is gone or about to
+        be); get_page() calls made meanwhile wait for the new browser.
+        """
+        if self.logger:
+            self.logger.warning(
+                message="Relaunching browser: {reason}",
+                tag="BROWSER",
+                params={"reason": reason},
+            )
+        if self.health_monitor is not None:
+            self.health_monitor.stop()
+        for sig in list(self._page_pools):
+            self._discard_page_pool(sig)
+        self._pooled_pages.clear()
+        self.sessions.clear()
+        self.contexts_by_config.clear()
+        self._context_refcounts.clear()
+        self._context_last_used.clear()
+        self._page_to_sig.clear()
+        self._pending_cleanup.clear()
+        self._cleanup_slot_available.set()
+        try:
+            await self.close()
+        except Exception:
+            # The old browser may not close cleanly after a crash
+            if self.playwright is not None:
+                try:
+                    await self.playwright.stop()
+                except Exception:
+                    pass
+        self.browser = None
+        self.playwright = None
+        if self.config.use_managed_browser and self.managed_browser is None:
+            self.managed_browser = self._new_managed_browser()
+        await self.start()
+        self.relaunches += 1
+
     def _compute_browser_endpoint_key(self) -> str:
         """
         Compute a unique key identifying this browser connection.
@@ -1278,49 +1501,6 @@ class BrowserManager:
         }
         proxy_settings = {"server": self.config.proxy} if self.config.proxy else None
 
-        # CSS extensions (blocked separately via avoid_css flag)
-        css_extensions = ["css", "less", "scss", "sass"]
-
-        # Static resource extensions (blocked when text_mode is enabled)
-        static_extensions = [
-            # Images
-            "jpg", "jpeg", "png", "gif", "webp", "svg", "ico", "bmp", "tiff", "psd",
-            # Fonts
-            "woff", "woff2", "ttf", "otf", "eot",
-            # Media
-            "mp4", "webm", "ogg", "avi", "mov", "wmv", "flv", "m4v",
-            "mp3", "wav", "aac", "m4a", "opus", "flac",
-            # Documents
-            "pdf", "doc", "docx", "xls", "xlsx", "ppt", "pptx",
-            # Archives
-            "zip", "rar", "7z", "tar", "gz",
-            # Scripts and data
-            "xml", "swf", "wasm",
-        ]
-
-        # Ad and tracker domain patterns (curated from uBlock/EasyList sources)
-        ad_tracker_patterns = [
-            "**/google-analytics.com/**",
-            "**/googletagmanager.com/**",
-            "**/googlesyndication.com/**",
-            "**/doubleclick.net/**",
-            "**/adservice.google.com/**",
-            "**/adsystem.com/**",
-            "**/adzerk.net/**",
-            "**/adnxs.com/**",
-            "**/ads.linkedin.com/**",
-            "**/facebook.net/**",
-            "**/analytics.twitter.com/**",
-            "**/ads-twitter.com/**",
-            "**/hotjar.com/**",
-            "**/clarity.ms/**",
-            "**/scorecardresearch.com/**",
-            "**/pixel.wp.com/**",
-            "**/amazon-adsystem.com/**",
-            "**/mixpanel.com/**",
-            "**/segment.com/**",
-        ]
-
         # Common context settings
         context_settings = {
             "user_agent": user_agent,
@@ -1372,20 +1552,13 @@ class BrowserManager:
         # Create and return the context with all settings
         context = await self.browser.new_context(**context_settings)
 
-        # Build dynamic blocking list based on config flags
-        to_block = []
-        if self.config.avoid_css:
-            to_block.extend(css_extensions)
-        if self.config.text_mode:
-            to_block.extend(static_extensions)
-
-        if to_block:
-            for ext in to_block:
-                await context.route(f"**/*.{ext}", lambda route: route.abort())
+        # Routes run last-registered first: the cache only sees requests the blocker lets through
+        if self.subresource_cache:
+            await self.subresource_cache.attach(context)
 
-        if self.config.avoid_ads:
-            for pattern in ad_tracker_patterns:
-                await context.route(pattern, lambda route: route.abort())
+        # One compiled blocking layer per context (text_mode / avoid_css / avoid_ads)
+        if self.request_blocker:
+            await self.request_blocker.attach(context)
 
         return context
 
@@ -1459,6 +1632,7 @@ class BrowserManager:
                 ctx = self.contexts_by_config.pop(evict_sig, None)
                 self._context_refcounts.pop(evict_sig, None)
                 self._context_last_used.pop(evict_sig, None)
+                self._discard_page_pool(evict_sig)
                 # Clean up stale page->sig mappings for evicted context
                 stale_pages = [
                     p for p, s in self._page_to_sig.items() if s == evict_sig
@@ -1470,6 +1644,122 @@ class BrowserManager:
         # All contexts are in active use — cannot evict
         return None
 
+    async def _acquire_context(self, crawlerRunConfig: CrawlerRunConfig, config_signature: str) -> BrowserContext:
+        """
+        Return the context cached for ``config_signature``, creating it on a miss,
+        with its refcount already incremented.
+
+        Creation (create_browser_context + setup_context) runs outside
+        _contexts_lock, so a slow context does not block crawls that use other
+        contexts. Concurrent misses for the same signature wait for the one
+        context being built instead of building their own.
+        """
+        while True:
+            async with self._contexts_lock:
+                context = self.contexts_by_config.get(config_signature)
+                if context is not None:
+                    # Increment refcount INSIDE lock before releasing
+                    self._context_refcounts[config_signature] = (
+                        self._context_refcounts.get(config_signature, 0) + 1
+                    )
+                    self._context_last_used[config_signature] = time.monotonic()
+                    return context
+                pending = self._contexts_in_flight.get(config_signature)
+                building = pending is None
+                if building:
+                    pending = asyncio.get_running_loop().create_future()
+                    self._contexts_in_flight[config_signature] = pending
+
+            if not building:
+                # Raises if the build failed; loops to take a refcount otherwise.
+                # shield: a cancelled waiter must not cancel the shared future.
+                await asyncio.shield(pending)
+                continue
+
+            try:
+                context = await self.create_browser_context(crawlerRunConfig)
+                await self.setup_context(context, crawlerRunConfig)
+            except BaseException as e:
+                async with self._contexts_lock:
+                    self._contexts_in_flight.pop(config_signature, None)
+                if isinstance(e, Exception):
+                    pending.set_exception(e)
+                    pending.exception()  # waiters re-raise it; no "never retrieved" warning
+                else:
+                    pending.set_result(None)  # builder cancelled: a waiter builds instead
+                raise
+
+            async with self._contexts_lock:
+                self._contexts_in_flight.pop(config_signature, None)
+                self.contexts_by_config[config_signature] = context
+                self._context_refcounts[config_signature] = 1
+                self._context_last_used[config_signature] = time.monotonic()
+                to_close = self._evict_lru_context_locked()
+            pending.set_result(None)
+
+            # Close evicted context OUTSIDE lock
+            if to_close is not None:
+                try:
+                    await to_close.close()
+                except Exception:
+                    pass
+            return context
+
+    async def _new_page_for_context(self, context: BrowserContext, config_signature: str):
+        """
+        Return a fresh page of a signature-cached context, from its page pool
+        when BrowserConfig.page_pool_size is set.
+        """
+        if self.config.page_pool_size <= 0:
+            page = await context.new_page()
+            await self._apply_stealth_to_page(page)
+            return page
+
+        pool = self._page_pools.get(config_signature)
+        if pool is None:
+            async def create_page():
+                new_page = await context.new_page()
+                await self._apply_stealth_to_page(new_page)
+                if self.health_monitor is not None:
+                    self.health_monitor.watch_page(new_page)
+                return new_page
+
+            viewport = None
+            if self.config.viewport_width and self.config.viewport_height:
+                viewport = {
+                    "width": self.config.viewport_width,
+                    "height": self.config.viewport_height,
+                }
+            pool = _PagePool(
+                create_page,
+                target_size=self.config.page_pool_size,
+                max_uses=self.config.page_pool_max_uses,
+                viewport=viewport,
+            )
+            self._page_pools[config_signature] = pool
+        page = await pool.acquire()
+        self._pooled_pages[page] = pool
+        return page
+
+    async def recycle_page(self, page, reusable: bool = True) -> bool:
+        """
+        Hand a finished non-session page back to its page pool.
+
+        Returns True if the page was reset and kept for reuse; False means
+        the caller should close it as usual. With ``reusable=False`` the
+        pool forgets the page and creates a replacement.
+        """
+        pool = self._pooled_pages.pop(page, None)
+        if pool is None:
+            return False
+        return await pool.release(page, reusable)
+
+    def _discard_page_pool(self, config_signature: str) -> None:
+        """Stop the page pool of a context that is going away."""
+        pool = self._page_pools.pop(config_signature, None)
+        if pool is not None:
+            pool.discard()
+
     async def _apply_stealth_to_page(self, page):
         """Apply stealth to a page if stealth mode is enabled"""
         if self._stealth_adapter:
@@ -1549,6 +1839,9 @@ class BrowserManager:
         Returns:
             (page, context): The Page and its BrowserContext
         """
+        if self._relaunch_task is not None and not self._relaunch_task.done():
+            await asyncio.shield(self._relaunch_task)
+
         self._cleanup_expired_sessions()
 
         # If a session_id is provided and we already have it, reuse that page + context
@@ -1566,34 +1859,11 @@ class BrowserManager:
             # context reuse for multiple URLs with the same config (e.g., batch/deep crawls).
             if self.config.create_isolated_context:
                 config_signature = self._make_config_signature(crawlerRunConfig)
-                to_close = None
-
-                async with self._contexts_lock:
-                    if config_signature in self.contexts_by_config:
-                        context = self.contexts_by_config[config_signature]
-                    else:
-                        context = await self.create_browser_context(crawlerRunConfig)
-                        await self.setup_context(context, crawlerRunConfig)
-                        self.contexts_by_config[config_signature] = context
-                        self._context_refcounts[config_signature] = 0
-                        to_close = self._evict_lru_context_locked()
-
-                    # Increment refcount INSIDE lock before releasing
-                    self._context_refcounts[config_signature] = (
-                        self._context_refcounts.get(config_signature, 0) + 1
-                    )
-                    self._context_last_used[config_signature] = time.monotonic()
+                context = await self._acquire_context(crawlerRunConfig, config_signature)
 
-                # Close evicted context OUTSIDE lock
-                if to_close is not None:
-                    try:
-                        await to_close.close()
-                    except Exception:
-                        pass
-
-                # Always create a new page for each crawl (isolation for navigation)
+                # Always use a separate page for each crawl (isolation for navigation)
                 try:
-                    page = await context.new_page()
+                    page = await self._new_page_for_context(context, config_signature)
                 except Exception:
                     async with self._contexts_lock:
                         if config_signature in self._context_refcounts:
@@ -1601,7 +1871,6 @@ class BrowserManager:
                                 0, self._context_refcounts[config_signature] - 1
                             )
                     raise
-                await self._apply_stealth_to_page(page)
                 self._page_to_sig[page] = config_signature
             elif self.config.storage_state:
                 tmp_context = await self.create_browser_context(crawlerRunConfig)
@@ -1665,35 +1934,11 @@ class BrowserManager:
         else:
             # Otherwise, check if we have an existing context for this config
             config_signature = self._make_config_signature(crawlerRunConfig)
-            to_close = None
-
-            async with self._contexts_lock:
-                if config_signature in self.contexts_by_config:
-                    context = self.contexts_by_config[config_signature]
-                else:
-                    # Create and setup a new context
-                    context = await self.create_browser_context(crawlerRunConfig)
-                    await self.setup_context(context, crawlerRunConfig)
-                    self.contexts_by_config[config_signature] = context
-                    self._context_refcounts[config_signature] = 0
-                    to_close = self._evict_lru_context_locked()
-
-                # Increment refcount INSIDE lock before releasing
-                self._context_refcounts[config_signature] = (
-                    self._context_refcounts.get(config_signature, 0) + 1
-                )
-                self._context_last_used[config_signature] = time.monotonic()
-
-            # Close evicted context OUTSIDE lock
-            if to_close is not None:
-                try:
-                    await to_close.close()
-                except Exception:
-                    pass
+            context = await self._acquire_context(crawlerRunConfig, config_signature)
 
-            # Create a new page from the chosen context
+            # Get a fresh page of the chosen context
             try:
-                page = await context.new_page()
+                page = await self._new_page_for_context(context, config_signature)
             except Exception:
                 async with self._contexts_lock:
                     if config_signature in self._context_refcounts:
@@ -1701,13 +1946,18 @@ class BrowserManager:
                             0, self._context_refcounts[config_signature] - 1
                         )
                 raise
-            await self._apply_stealth_to_page(page)
             self._page_to_sig[page] = config_signature
 
         # If a session_id is specified, store this session so we can reuse later
         if crawlerRunConfig.session_id:
             self.sessions[crawlerRunConfig.session_id] = (context, page, time.time())
 
+        if self.request_blocker:
+            await self.request_blocker.ready(page)
+
+        if self.health_monitor is not None:
+            self.health_monitor.watch_page(page)
+
         self._pages_served += 1
 
         # Check if browser recycle threshold is hit — bump version for next requests
@@ -1726,6 +1976,9 @@ class BrowserManager:
         if session_id in self.sessions:
             context, page, _ = self.sessions[session_id]
             self._release_page_from_use(page)
+            pool = self._pooled_pages.pop(page, None)
+            if pool is not None:
+                pool.forget(page)
             # Decrement context refcount for the session's page
             should_close_context = False
             async with self._contexts_lock:
@@ -1741,6 +1994,7 @@ class BrowserManager:
                             self.contexts_by_config.pop(sig, None)
                             self._context_refcounts.pop(sig, None)
                             self._context_last_used.pop(sig, None)
+                            self._discard_page_pool(sig)
                             should_close_context = True
             await page.close()
             if should_close_context:
@@ -1881,6 +2135,7 @@ class BrowserManager:
                                 context = self.contexts_by_config.pop(sig, None)
                                 self._context_refcounts.pop(sig, None)
                                 self._context_last_used.pop(sig, None)
+                                self._discard_page_pool(sig)
                             if context is not None:
                                 try:
                                     await context.close()
@@ -1895,6 +2150,7 @@ class BrowserManager:
                 context = self.contexts_by_config.pop(sig, None)
                 self._context_refcounts.pop(sig, None)
                 self._context_last_used.pop(sig, None)
+                self._discard_page_pool(sig)
             if context is not None:
                 try:
                     await context.close()
@@ -1928,6 +2184,7 @@ class BrowserManager:
                 context = self.contexts_by_config.pop(sig, None)
                 self._context_refcounts.pop(sig, None)
                 self._context_last_used.pop(sig, None)
+                self._discard_page_pool(sig)
 
             # Close context outside locks
             if context is not None:
@@ -1967,6 +2224,13 @@ class BrowserManager:
 
     async def close(self):
         """Close all browser resources and clean up."""
+        if self.health_monitor is not None:
+            self.health_monitor.stop()  # a deliberate close is not a crash
+            self.health_monitor = None
+        for sig in list(self._page_pools):
+            self._discard_page_pool(sig)
+        self._pooled_pages.clear()
+
         # Cached CDP path: only clean up this instance's sessions/contexts,
         # then release the shared connection reference.
         if self._using_cached_cdp:
@@ -2094,3 +2358,256 @@ class BrowserManager:
         if self.playwright:
             await self.playwright.stop()
             self.playwright = None
+
+
+class ShardedBrowserManager:
+    """
+    Several browser processes behind the BrowserManager interface.
+
+    Used by AsyncPlaywrightCrawlerStrategy when BrowserConfig.browser_shards > 1.
+    Each shard is a regular BrowserManager with its own browser process, so
+    context caching, page pools and the ``_browser_version`` recycle
+    machinery (max_pages_before_recycle) work per shard. Pages are assigned
+    to the shard with the fewest pages in flight ("least_loaded") or by a
+    hash of the URL's host ("host_affinity"); sessions stay on the shard that
+    created them.
+
+    A shard whose browser disconnects (crash, OOM kill) or fails a health
+    check is replaced by a fresh one; crawls running on other shards are not
+    affected. ``restart_shard``
+    does the same on demand: the replacement takes new pages right away and
+    the old browser is closed once its in-flight pages are released.
+
+    Attributes:
+        shards (List[BrowserManager]): The current shard of each slot.
+    """
+
+    ASSIGNMENTS = ("least_loaded", "host_affinity")
+
+    def __init__(self, browser_config: BrowserConfig, logger=None, use_undetected: bool = False):
+        if (
+            browser_config.cdp_url
+            or browser_config.use_managed_browser
+            or browser_config.use_persistent_context
+        ):
+            raise ValueError(
+                "browser_shards > 1 requires a dedicated browser; it cannot be combined "
+                "with cdp_url, managed browsers or use_persistent_context."
+            )
+        if browser_config.shard_assignment not in self.ASSIGNMENTS:
+            raise ValueError(
+                f"shard_assignment must be one of {self.ASSIGNMENTS}, "
+                f"got {browser_config.shard_assignment!r}"
+            )
+        self.config: BrowserConfig = browser_config
+        self.logger = logger
+        self.use_undetected = use_undetected
+        self._using_cached_cdp = False
+        self._closing = False
+
+        self.shards: List[BrowserManager] = []
+        self._in_flight: Dict[BrowserManager, int] = {}
+        self._ready: Dict[BrowserManager, asyncio.Future] = {}  # shard -> start task
+        self._draining: List[BrowserManager] = []  # retired shards with pages in flight
+        self._restarts: List[int] = [0] * browser_config.browser_shards
+        self._restart_tasks: Dict[int, asyncio.Task] = {}
+        self._page_to_shard: Dict = {}       # page -> shard that created it
+        self._counted_pages: set = set()     # pages included in _in_flight
+        self._session_to_shard: Dict[str, BrowserManager] = {}
+        for _ in range(browser_config.browser_shards):
+            self.shards.append(self._new_shard())
+
+    def _new_shard(self) -> BrowserManager:
+        shard = BrowserManager(
+            browser_config=self.config.clone(browser_shards=1),
+            logger=self.logger,
+            use_undetected=self.use_undetected,
+        )
+        # Health failures replace the shard instead of relaunching in place
+        shard.on_unhealthy = lambda reason: self._on_unhealthy(shard, reason)
+        self._in_flight[shard] = 0
+        return shard
+
+    # The first shard stands in for "the browser" (e.g. on_browser_created hooks)
+    @property
+    def browser(self):
+        return self.shards[0].browser
+
+    @property
+    def default_context(self):
+        return self.shards[0].default_context
+
+    async def start(self):
+        """Launch every shard in parallel."""
+        self._closing = False
+        for shard in self.shards:
+            self._ready[shard] = asyncio.ensure_future(self._start_shard(shard))
+        await asyncio.gather(*(self._ready[s] for s in self.shards))
+
+    async def _start_shard(self, shard: BrowserManager) -> None:
+        await shard.start()
+        if shard.browser is not None:
+            shard.browser.on("disconnected", lambda _: self._on_unhealthy(shard, "browser disconnected"))
+
+    def _on_unhealthy(self, shard: BrowserManager, reason: str) -> None:
+        if self._closing or shard not in self.shards:
+            return  # closed on purpose, or already replaced
+        index = self.shards.index(shard)
+        if self.logger:
+            self.logger.warning(
+                message="Browser shard {index} unhealthy ({reason}), restarting it",
+                tag="BROWSER",
+                params={"index": index, "reason": reason},
+            )
+        task = self._restart_tasks.get(index)
+        if task is None or task.done():
+            # A dead browser lets its crawls fail by themselves; a live but
+            # unhealthy one (unresponsive, over its memory limit) is closed now.
+            drain = reason == "browser disconnected"
+            task = asyncio.ensure_future(self.restart_shard(index, drain=drain))
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._restart_tasks[index] = task
+
+    async def restart_shard(self, index: int, drain: bool = True) -> None:
+        """
+        Replace shard ``index`` with a new browser.
+
+        The old browser is closed once its in-flight pages are released, or
+        right away with ``drain=False``.
+        """
+        old = self.shards[index]
+        new = self._new_shard()
+        self.shards[index] = new
+        self._restarts[index] += 1
+        for session_id, shard in list(self._session_to_shard.items()):
+            if shard is old:
+                del self._session_to_shard[session_id]
+
+        self._ready[new] = asyncio.ensure_future(self._start_shard(new))
+        if drain and self._in_flight.get(old, 0) > 0:
+            self._draining.append(old)
+        else:
+            await self._close_shard(old)
+        await self._ready[new]
+
+    async def _close_shard(self, shard: BrowserManager) -> None:
+        self._in_flight.pop(shard, None)
+        ready = self._ready.pop(shard, None)
+        if ready is not None and not ready.done():
+            ready.cancel()
+        try:
+            await shard.close()
+        except Exception as e:
+            # A crashed browser can fail to close cleanly; the process is gone anyway
+            if self.logger:
+                self.logger.debug(
+                    message="Error closing browser shard: {error}",
+                    tag="BROWSER",
+                    params={"error": str(e)},
+                )
+
+    def _pick(self, crawlerRunConfig: CrawlerRunConfig) -> BrowserManager:
+        session_id = crawlerRunConfig.session_id
+        if session_id and session_id in self._session_to_shard:
+            return self._session_to_shard[session_id]
+
+        if self.config.shard_assignment == "host_affinity" and crawlerRunConfig.url:
+            from urllib.parse import urlsplit
+            import zlib
+
+            try:
+                host = urlsplit(crawlerRunConfig.url).hostname or ""
+            except ValueError:
+                host = ""
+            if host:
+                return self.shards[zlib.crc32(host.encode("utf-8")) % len(self.shards)]
+
+        def load(shard):
+            ready = self._ready.get(shard)
+            starting = ready is not None and not ready.done()
+            return (starting, self._in_flight.get(shard, 0))
+
+        return min(self.shards, key=load)
+
+    async def get_page(self, crawlerRunConfig: CrawlerRunConfig):
+        """Get a page from the chosen shard. Same contract as BrowserManager.get_page."""
+        shard = self._pick(crawlerRunConfig)
+        ready = self._ready.get(shard)
+        if ready is not None:
+            await ready
+
+        counted = not crawlerRunConfig.session_id  # session pages are not released per crawl
+        if counted:
+            self._in_flight[shard] = self._in_flight.get(shard, 0) + 1
+        try:
+            page, context = await shard.get_page(crawlerRunConfig)
+        except BaseException:
+            if counted:
+                self._in_flight[shard] = max(0, self._in_flight.get(shard, 1) - 1)
+            raise
+
+        self._page_to_shard[page] = shard
+        if counted:
+            self._counted_pages.add(page)
+        if crawlerRunConfig.session_id:
+            self._session_to_shard[crawlerRunConfig.session_id] = shard
+        return page, context
+
+    def release_page(self, page):
+        shard = self._page_to_shard.get(page)
+        if shard is not None:
+            shard.release_page(page)
+
+    async def release_page_with_context(self, page):
+        shard = self._page_to_shard.get(page)
+        if shard is None:
+            return
+        await shard.release_page_with_context(page)
+        if page in self._counted_pages:
+            self._counted_pages.discard(page)
+            if shard in self._in_flight:
+                self._in_flight[shard] = max(0, self._in_flight[shard] - 1)
+        if shard in self._draining and self._in_flight.get(shard, 0) == 0:
+            self._draining.remove(shard)
+            await self._close_shard(shard)
+
+    async def recycle_page(self, page, reusable: bool = True) -> bool:
+        shard = self._page_to_shard.pop(page, None)
+        self._counted_pages.discard(page)
+        if shard is None or shard not in self._in_flight:
+            return False
+        return await shard.recycle_page(page, reusable)
+
+    async def kill_session(self, session_id: str):
+        shard = self._session_to_shard.pop(session_id, None)
+        for candidate in [shard] if shard is not None else list(self.shards):
+            if session_id in candidate.sessions:
+                _, page, _ = candidate.sessions[session_id]
+                self._page_to_shard.pop(page, None)
+                await candidate.kill_session(session_id)
+
+    def shard_stats(self) -> List[dict]:
+        """Per-slot load and recycle counters."""
+        return [
+            {
+                "index": index,
+                "in_flight": self._in_flight.get(shard, 0),
+                "pages_served": shard._pages_served,
+                "browser_version": shard._browser_version,
+                "restarts": self._restarts[index],
+            }
+            for index, shard in enumerate(self.shards)
+        ]
+
+    async def close(self):
+        """Close every shard, including retired ones still draining."""
+        self._closing = True
+        for task in self._restart_tasks.values():
+            if not task.done():
+                task.cancel()
+        self._restart_tasks.clear()
+        shards, self._draining = self.shards + self._draining, []
+        await asyncio.gather(*(self._close_shard(s) for s in shards))
+        self._page_to_shard.clear()
+        self._counted_pages.clear()
+        self._session_to_shard.clear()
@@ -18,6 +18,7 @@ from dataclasses import dataclass
 from typing import Optional, Tuple
 from enum import Enum
 
+from .dns_cache import cached_httpx_transport
 from .utils import compute_head_fingerprint
 
 
@@ -73,7 +74,7 @@ class CacheValidator:
         """Get or create the httpx client."""
         if self._client is None:
             self._client = httpx.AsyncClient(
-                http2=True,
+                transport=cached_httpx_transport(http2=True),
                 timeout=self.timeout,
                 follow_redirects=True,
                 headers={"User-Agent": self.user_agent}
@@ -0,0 +1,110 @@
+"""
+Character encoding resolution for fetched HTML, without scanning whole bodies.
+
+Follows the order browsers use (WHATWG encoding sniffing):
+
+1. a byte order mark,
+2. the charset of the Content-Type header,
+3. a ``<meta charset>`` / ``<meta http-equiv="Content-Type">`` declaration in
+   the first ``SNIFF_BYTES`` of the body,
+
+and only when none is found, chardet over the first ``DETECT_BYTES``.
+Statistical detection over a multi-MB page is slow and rarely more accurate
+than over its first few tens of KB.
+"""
+
+import codecs
+import mmap
+import os
+import re
+from typing import Optional, Tuple, Union
+
+import chardet
+
+SNIFF_BYTES = 4096
+DETECT_BYTES = 64 * 1024
+
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8"),
+    (codecs.BOM_UTF16_LE, "utf-16-le"),
+    (codecs.BOM_UTF16_BE, "utf-16-be"),
+)
+
+# Covers <meta charset="x"> and <meta http-equiv=... content="text/html; charset=x">
+_META_CHARSET = re.compile(rb"<meta[^>]+?charset\s*=\s*[\"']?\s*([a-zA-Z0-9_.:-]+)", re.IGNORECASE)
+
+# Labels browsers decode as a superset encoding
+_SUPERSETS = {
+    "ascii": "utf-8",
+    "us-ascii": "utf-8",
+    "iso-8859-1": "windows-1252",
+    "latin-1": "windows-1252",
+    "latin1": "windows-1252",
+}
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+def normalize_charset(label: Optional[str]) -> Optional[str]:
+    """A Python codec name for a charset label, or None if it is unknown."""
+    if not label:
+        return None
+    label = label.strip().strip("\"'").lower()
+    label = _SUPERSETS.get(label, label)
+    try:
+        return codecs.lookup(label).name
+    except LookupError:
+        return None
+
+
+def sniff_charset(body: Buffer, declared: Optional[str] = None) -> Tuple[Optional[str], int]:
+    """
+    Resolve the encoding from the BOM, the declared charset or a meta tag.
+
+    Returns (encoding, bom_length); encoding is None when nothing conclusive
+    was found and detect_charset should be used.
+    """
+    head = bytes(body[:SNIFF_BYTES])
+    for bom, encoding in _BOMS:
+        if head.startswith(bom):
+            return encoding, len(bom)
+    encoding = normalize_charset(declared)
+    if encoding:
+        return encoding, 0
+    match = _META_CHARSET.search(head)
+    if match:
+        encoding = normalize_charset(match.group(1).decode("ascii", errors="ignore"))
+        if encoding:
+            # A meta tag we could read as ASCII cannot be UTF-16
+            return ("utf-8" if encoding.startswith("utf-16") else encoding), 0
+    return None, 0
+
+
+def detect_charset(body: Buffer) -> str:
+    """chardet over the first DETECT_BYTES of ``body``. Slow; run it off the event loop."""
+    result = chardet.detect(bytes(body[:DETECT_BYTES]))
+    return normalize_charset(result.get("encoding")) or "utf-8"
+
+
+def decode_body(body: Buffer, encoding: str, bom_length: int = 0) -> str:
+    """Decode ``body`` without copying it first."""
+    return str(memoryview(body)[bom_length:], encoding, "replace")
+
+
+def decode_file(path: str, declared: Optional[str] = None) -> str:
+    """
+    Decode a saved page the way a fetched body is decoded.
+
+    The file is memory-mapped and decoded in one pass, so it is never read
+    into an intermediate bytes object and multibyte characters are never
+    split. Blocking; run it off the event loop.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""  # empty files cannot be mapped
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            encoding, bom_length = sniff_charset(buffer, declared)
+            if encoding is None:
+                encoding = detect_charset(buffer)
+            with memoryview(buffer) as view:
+                return str(view[bom_length:], encoding, "replace")
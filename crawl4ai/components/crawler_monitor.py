@@ -1,7 +1,6 @@
 import time
 import uuid
 import threading
-import psutil
 from datetime import datetime, timedelta
 from typing import Dict, Optional, List
 import threading
@@ -13,6 +12,7 @@ from rich.text import Text
 from rich.live import Live
 from rich import box
 from ..models import CrawlStatus
+from ..resource_sampler import ResourceSample, ResourceSampler
 
 class TerminalUI:
     """Terminal user interface for CrawlerMonitor using rich library."""
@@ -158,8 +158,8 @@ class TerminalUI:
             memory_icon = "🔴"
         
         # Get current memory usage
-        current_memory = psutil.Process().memory_info().rss / (1024 * 1024)  # MB
-        memory_percent = (current_memory / psutil.virtual_memory().total) * 100
+        sample = self.monitor.sampler.latest
+        memory_percent = (sample.rss_mb / sample.memory_limit_mb) * 100
         
         # Format runtime
         runtime = self.monitor._format_time(time.time() - self.monitor.start_time if self.monitor.start_time else 0)
@@ -431,6 +431,10 @@ class CrawlerMonitor:
         
         # Thread-safety
         self._lock = threading.RLock()
+
+        # Memory figures come from the process-wide sampler
+        self.sampler = ResourceSampler.shared()
+        self._unsubscribe = None
         
         # Terminal UI
         self.enable_ui = enable_ui
@@ -450,6 +454,9 @@ class CrawlerMonitor:
         with self._lock:
             self.start_time = time.time()
             self.is_running = True
+            if self._unsubscribe is None:
+                self.sampler.acquire()
+                self._unsubscribe = self.sampler.subscribe(self._on_sample)
             
             # Start the terminal UI
             if self.enable_ui and self.terminal_ui:
@@ -467,10 +474,24 @@ class CrawlerMonitor:
         with self._lock:
             self.end_time = time.time()
             self.is_running = False
+            unsubscribe, self._unsubscribe = self._unsubscribe, None
             
             # Stop the terminal UI
             if self.enable_ui and self.terminal_ui:
                 self.terminal_ui.stop()
+
+        # Outside the lock: release() joins the sampler thread, which may be
+        # waiting for the lock in _on_sample.
+        if unsubscribe is not None:
+            unsubscribe()
+            self.sampler.release()
+    
+    def _on_sample(self, sample: ResourceSample):
+        """Track the peak memory usage seen by the resource sampler."""
+        with self._lock:
+            if sample.memory_percent > self.peak_memory_percent:
+                self.peak_memory_percent = sample.memory_percent
+                self.peak_memory_time = sample.timestamp - (self.start_time or sample.timestamp)
     
     def add_task(self, task_id: str, url: str):
         """
@@ -571,12 +592,6 @@ class CrawlerMonitor:
             if memory_usage is not None:
                 task_stats["memory_usage"] = memory_usage
                 
-                # Update peak memory if necessary
-                current_percent = (memory_usage / psutil.virtual_memory().total) * 100
-                if current_percent > self.peak_memory_percent:
-                    self.peak_memory_percent = current_percent
-                    self.peak_memory_time = time.time()
-                
             if peak_memory is not None:
                 task_stats["peak_memory"] = peak_memory
             if error_message is not None:
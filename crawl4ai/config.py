@@ -102,6 +102,7 @@ SHOW_DEPRECATION_WARNINGS = True
 SCREENSHOT_HEIGHT_TRESHOLD = 10000
 PAGE_TIMEOUT = 60000
 DOWNLOAD_PAGE_TIMEOUT = 60000
+DEFAULT_DOWNLOAD_PREVIEW_SIZE = 1024 * 1024  # bytes of a text download decoded into html
 
 # Delimiter for concatenating multiple HTML examples in schema generation
 HTML_EXAMPLE_DELIMITER = "=== HTML EXAMPLE {index} ==="
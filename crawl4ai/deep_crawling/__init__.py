@@ -3,6 +3,7 @@ from .base_strategy import DeepCrawlDecorator, DeepCrawlStrategy
 from .bfs_strategy import BFSDeepCrawlStrategy
 from .bff_strategy import BestFirstCrawlingStrategy
 from .dfs_strategy import DFSDeepCrawlStrategy
+from .frontier_strategy import FrontierCrawlingStrategy
 from .filters import (
     FilterChain,
     ContentTypeFilter,
@@ -29,6 +30,7 @@ __all__ = [
     "BFSDeepCrawlStrategy",
     "BestFirstCrawlingStrategy",
     "DFSDeepCrawlStrategy",
+    "FrontierCrawlingStrategy",
     "FilterChain",
     "ContentTypeFilter",
     "DomainFilter",
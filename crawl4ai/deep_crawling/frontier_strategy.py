@@ -0,0 +1,108 @@
+# frontier_crawling_strategy.py
+import contextlib
+import logging
+from typing import AsyncGenerator, Dict, List, Optional, Set, Tuple
+
+from .filters import FilterChain
+from .scorers import URLScorer
+from .bff_strategy import BestFirstCrawlingStrategy
+from ..frontier import CrawlFrontier, InMemoryFrontier
+from ..types import AsyncWebCrawler, CrawlerRunConfig, CrawlResult
+
+from math import inf as infinity
+
+
+class FrontierCrawlingStrategy(BestFirstCrawlingStrategy):
+    """
+    Best-first deep crawl whose queue, visited set and host politeness live in a CrawlFrontier.
+
+    With a RedisFrontier, several crawlers (processes or machines) can run the
+    same deep crawl: each one leases URLs from the shared frontier, and links
+    discovered by any of them are deduplicated globally. The crawl ends once
+    the frontier has nothing queued or leased.
+
+    URL validation, filtering and scoring behave like BestFirstCrawlingStrategy.
+    ``max_pages`` counts the pages crawled by this crawler only.
+    """
+    def __init__(
+        self,
+        max_depth: int,
+        frontier: Optional[CrawlFrontier] = None,
+        filter_chain: FilterChain = FilterChain(),
+        url_scorer: Optional[URLScorer] = None,
+        include_external: bool = False,
+        score_threshold: float = -infinity,
+        max_pages: int = infinity,
+        max_session_permit: int = 10,
+        min_host_interval: float = 0.0,
+        logger: Optional[logging.Logger] = None,
+    ):
+        super().__init__(
+            max_depth=max_depth,
+            filter_chain=filter_chain,
+            url_scorer=url_scorer,
+            include_external=include_external,
+            score_threshold=score_threshold,
+            max_pages=max_pages,
+            logger=logger,
+        )
+        self.frontier = frontier or InMemoryFrontier()
+        self.max_session_permit = max_session_permit
+        self.min_host_interval = min_host_interval
+
+    async def _arun_best_first(
+        self,
+        start_url: str,
+        crawler: AsyncWebCrawler,
+        config: CrawlerRunConfig,
+    ) -> AsyncGenerator[CrawlResult, None]:
+        """Lease, crawl and expand frontier URLs until the frontier is drained."""
+        from ..async_dispatcher import FrontierDispatcher
+
+        self._cancel_event.clear()
+        initial_score = self.url_scorer.score(start_url) if self.url_scorer else 0
+        # A no-op when another crawler already seeded the same crawl.
+        await self.frontier.enqueue(start_url, priority=-initial_score, depth=0)
+
+        dispatcher = FrontierDispatcher(
+            self.frontier,
+            max_session_permit=self.max_session_permit,
+            min_host_interval=self.min_host_interval,
+        )
+        crawl_config = config.clone(deep_crawl_strategy=None, stream=False)
+        visited: Set[str] = set()
+        depths: Dict[str, int] = {start_url: 0}
+
+        async with contextlib.aclosing(dispatcher.drain(crawler, crawl_config)) as leased:
+            async for item, task_result in leased:
+                result = task_result.result
+                result.metadata = result.metadata or {}
+                result.metadata["depth"] = item.depth
+                result.metadata["parent_url"] = item.parent_url
+                result.metadata["score"] = -item.priority
+                if result.success:
+                    self._pages_crawled += 1
+                yield result
+
+                if self._pages_crawled >= self.max_pages:
+                    self.logger.info(f"Max pages limit ({self.max_pages}) reached, stopping crawl")
+                    break
+                if await self._check_cancellation():
+                    self.logger.info("Crawl cancelled by user")
+                    break
+                if not result.success:
+                    continue
+
+                new_links: List[Tuple[str, Optional[str]]] = []
+                await self.link_discovery(result, item.url, item.depth, visited, new_links, depths)
+                for new_url, parent_url in new_links:
+                    new_score = self.url_scorer.score(new_url) if self.url_scorer else 0
+                    if new_score < self.score_threshold:
+                        self.stats.urls_skipped += 1
+                        continue
+                    await self.frontier.enqueue(
+                        new_url,
+                        priority=-new_score,
+                        depth=depths.get(new_url, item.depth + 1),
+                        parent_url=parent_url,
+                    )
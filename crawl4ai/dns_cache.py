@@ -0,0 +1,396 @@
+"""
+Process-wide DNS cache shared by everything in crawl4ai that resolves hosts.
+
+Without it the same hostname is resolved separately by every aiohttp
+connector, every httpx client (seeder, HeadPeekr, cache validator, HTTP/2
+transport) and, in the Docker server, synchronously on the event loop by
+the egress policy check. DNSCache resolves once and shares the answer:
+
+- answers are kept for ``ttl`` seconds (getaddrinfo does not expose record
+  TTLs, so this is an upper bound rather than the record's own TTL),
+- names that do not exist (EAI_NONAME, EAI_NODATA) are remembered for
+  ``negative_ttl`` seconds; transient failures such as EAI_AGAIN are not,
+- concurrent lookups of the same host share one getaddrinfo call,
+- resolution runs in the default executor, never on the event loop.
+
+Answers are cached per (host, family) and the caller's port is filled in,
+so ``example.com:80`` and ``example.com:443`` share an entry. IP literals
+are never cached.
+
+CachedResolver plugs the cache into aiohttp connectors and
+cached_httpx_transport() into httpx clients; resolve_blocking() serves
+synchronous callers from the same entries.
+"""
+
+import asyncio
+import contextlib
+import ipaddress
+import socket
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Iterator, List, Optional, Tuple
+
+import httpcore
+import httpx
+from aiohttp.abc import AbstractResolver
+
+from .single_flight import SingleFlight
+
+AddrInfo = Tuple[Any, Any, int, str, tuple]
+
+DEFAULT_DNS_TTL = 300.0
+DEFAULT_NEGATIVE_TTL = 30.0
+
+# getaddrinfo errors that mean the name has no address; anything else
+# (EAI_AGAIN, EAI_FAIL, ...) may succeed on the next try
+_NEGATIVE_ERRORS = frozenset(
+    code for code in (socket.EAI_NONAME, getattr(socket, "EAI_NODATA", None)) if code is not None
+)
+
+
+def _is_ip(host: str) -> bool:
+    try:
+        ipaddress.ip_address(host.strip("[]"))
+        return True
+    except ValueError:
+        return False
+
+
+def _with_port(answers: List[AddrInfo], port: int) -> List[AddrInfo]:
+    return [(f, t, p, c, (sa[0], port) + tuple(sa[2:])) for f, t, p, c, sa in answers]
+
+
+class DNSCache:
+    """
+    TTL cache in front of getaddrinfo, with negative caching and in-flight dedup.
+
+    Args:
+        ttl: Seconds an answer is reused.
+        negative_ttl: Seconds a name that does not exist keeps failing without a new query.
+        max_entries: Least recently used hosts are evicted beyond this.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_DNS_TTL,
+        negative_ttl: float = DEFAULT_NEGATIVE_TTL,
+        max_entries: int = 4096,
+    ):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        # (host, family) -> (resolved_at, answers or a gaierror for a missing name)
+        self._entries: "OrderedDict[Tuple[str, int], Tuple[float, Any]]" = OrderedDict()
+        # Shared with resolve_blocking() callers on other threads
+        self._lock = threading.Lock()
+        self._flights: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, SingleFlight]" = weakref.WeakKeyDictionary()
+        self.stats = {"hits": 0, "misses": 0, "negative_hits": 0}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _lookup(self, key: Tuple[str, int], max_age: Optional[float]) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            resolved_at, answer = entry
+            age = time.monotonic() - resolved_at
+            if isinstance(answer, socket.gaierror):
+                fresh = age < self.negative_ttl
+            else:
+                fresh = age < (self.ttl if max_age is None else min(max_age, self.ttl))
+            if not fresh:
+                return None
+            self._entries.move_to_end(key)
+        if isinstance(answer, socket.gaierror):
+            self.stats["negative_hits"] += 1
+        else:
+            self.stats["hits"] += 1
+        return answer
+
+    def _store(self, key: Tuple[str, int], answer: Any) -> None:
+        if isinstance(answer, socket.gaierror) and answer.errno not in _NEGATIVE_ERRORS:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), answer)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    @staticmethod
+    def _query(host: str, family: int) -> Any:
+        try:
+            return socket.getaddrinfo(host, 0, family, socket.SOCK_STREAM, socket.IPPROTO_TCP)
+        except socket.gaierror as e:
+            return e
+
+    @staticmethod
+    def _answer(answer: Any, port: int) -> List[AddrInfo]:
+        if isinstance(answer, socket.gaierror):
+            raise socket.gaierror(*answer.args)
+        return _with_port(answer, port)
+
+    async def resolve(
+        self,
+        host: str,
+        port: int = 0,
+        family: int = socket.AF_UNSPEC,
+        max_age: Optional[float] = None,
+    ) -> List[AddrInfo]:
+        """getaddrinfo(host, port, family, SOCK_STREAM) answers, cached. Raises socket.gaierror."""
+        if _is_ip(host):
+            return socket.getaddrinfo(host.strip("[]"), port, family, socket.SOCK_STREAM)
+        key = (host.lower().rstrip("."), int(family))
+        answer = self._lookup(key, max_age)
+        if answer is None:
+            loop = asyncio.get_running_loop()
+            # One flight table per loop: futures cannot cross event loops
+            flights = self._flights.get(loop)
+            if flights is None:
+                flights = self._flights[loop] = SingleFlight()
+
+            async def query():
+                self.stats["misses"] += 1
+                result = await loop.run_in_executor(None, self._query, key[0], key[1])
+                self._store(key, result)
+                return result
+
+            answer = await flights.do(key, query)
+        return self._answer(answer, port)
+
+    def resolve_blocking(
+        self,
+        host: str,
+        port: int = 0,
+        family: int = socket.AF_UNSPEC,
+        max_age: Optional[float] = None,
+    ) -> List[AddrInfo]:
+        """resolve() for synchronous callers (blocks on a miss). Raises socket.gaierror."""
+        if _is_ip(host):
+            return socket.getaddrinfo(host.strip("[]"), port, family, socket.SOCK_STREAM)
+        key = (host.lower().rstrip("."), int(family))
+        answer = self._lookup(key, max_age)
+        if answer is None:
+            self.stats["misses"] += 1
+            answer = self._query(key[0], key[1])
+            self._store(key, answer)
+        return self._answer(answer, port)
+
+
+_default_cache = DNSCache()
+
+
+def get_dns_cache() -> DNSCache:
+    """The DNS cache shared by the whole process."""
+    return _default_cache
+
+
+class CachedResolver(AbstractResolver):
+    """aiohttp resolver backed by a DNSCache (the shared one by default)."""
+
+    def __init__(self, cache: Optional[DNSCache] = None, max_age: Optional[float] = None):
+        self.cache = cache or get_dns_cache()
+        self.max_age = max_age
+
+    async def resolve(self, host: str, port: int = 0, family: int = socket.AF_INET) -> List[dict]:
+        answers = await self.cache.resolve(host, port, family, max_age=self.max_age)
+        hosts = []
+        for answer_family, _, proto, _, address in answers:
+            if answer_family == socket.AF_INET6 and len(address) < 3:
+                continue  # IPv6 not supported by this Python build
+            hosts.append(
+                {
+                    "hostname": host,
+                    "host": address[0],
+                    "port": address[1],
+                    "family": answer_family,
+                    "proto": proto,
+                    "flags": socket.AI_NUMERICHOST | socket.AI_NUMERICSERV,
+                }
+            )
+        return hosts
+
+    async def close(self) -> None:
+        pass
+
+
+class CachedNetworkBackend(httpcore.AsyncNetworkBackend):
+    """httpcore backend that dials addresses from a DNSCache; TLS still verifies the hostname."""
+
+    def __init__(self, backend: httpcore.AsyncNetworkBackend, cache: Optional[DNSCache] = None):
+        self.cache = cache or get_dns_cache()
+        self._backend = backend
+
+    async def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        try:
+            answers = await self.cache.resolve(host, port)
+        except socket.gaierror as e:
+            raise httpcore.ConnectError(str(e)) from e
+        error = None
+        for address in dict.fromkeys(answer[4][0] for answer in answers):
+            try:
+                return await self._backend.connect_tcp(
+                    address, port, timeout=timeout, local_address=local_address, socket_options=socket_options
+                )
+            except httpcore.ConnectError as e:
+                error = e
+        raise error or httpcore.ConnectError(f"No address for {host}")
+
+    async def connect_unix_socket(self, path, timeout=None, socket_options=None):
+        return await self._backend.connect_unix_socket(path, timeout=timeout, socket_options=socket_options)
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+# httpcore exceptions and the httpx ones AsyncHTTPTransport raises for them
+_HTTPX_ERRORS = {
+    httpcore.TimeoutException: httpx.TimeoutException,
+    httpcore.ConnectTimeout: httpx.ConnectTimeout,
+    httpcore.ReadTimeout: httpx.ReadTimeout,
+    httpcore.WriteTimeout: httpx.WriteTimeout,
+    httpcore.PoolTimeout: httpx.PoolTimeout,
+    httpcore.NetworkError: httpx.NetworkError,
+    httpcore.ConnectError: httpx.ConnectError,
+    httpcore.ReadError: httpx.ReadError,
+    httpcore.WriteError: httpx.WriteError,
+    httpcore.ProxyError: httpx.ProxyError,
+    httpcore.UnsupportedProtocol: httpx.UnsupportedProtocol,
+    httpcore.ProtocolError: httpx.ProtocolError,
+    httpcore.LocalProtocolError: httpx.LocalProtocolError,
+    httpcore.RemoteProtocolError: httpx.RemoteProtocolError,
+}
+
+
+@contextlib.contextmanager
+def _httpx_errors() -> Iterator[None]:
+    try:
+        yield
+    except Exception as e:
+        for cls in type(e).__mro__:  # most specific first
+            if cls in _HTTPX_ERRORS:
+                raise _HTTPX_ERRORS[cls](str(e)) from e
+        raise
+
+
+class _ResponseStream(httpx.AsyncByteStream):
+    def __init__(self, stream):
+        self._stream = stream
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        with _httpx_errors():
+            async for part in self._stream:
+                yield part
+
+    async def aclose(self) -> None:
+        if hasattr(self._stream, "aclose"):
+            await self._stream.aclose()
+
+
+class CachedHTTPTransport(httpx.AsyncBaseTransport):
+    """
+    httpx transport whose httpcore pool resolves hosts through a DNSCache.
+
+    Takes the httpx.AsyncHTTPTransport arguments crawl4ai uses. The pool is
+    built with httpcore's ``network_backend`` option, which httpx does not
+    expose; responses and errors are what AsyncHTTPTransport returns.
+
+    Args:
+        cache: DNS cache to resolve through. Defaults to the shared one.
+        verify: Verify TLS certificates (bool, CA bundle path or SSLContext).
+        cert: Client certificate.
+        trust_env: Read SSL_CERT_FILE / SSL_CERT_DIR from the environment.
+        http1: Allow HTTP/1.1.
+        http2: Allow HTTP/2.
+        limits: Connection pool limits.
+        proxy: HTTP(S) or SOCKS5 proxy URL or httpx.Proxy.
+        retries: Connection attempts retried by httpcore.
+    """
+
+    def __init__(
+        self,
+        cache: Optional[DNSCache] = None,
+        verify: Any = True,
+        cert: Any = None,
+        trust_env: bool = True,
+        http1: bool = True,
+        http2: bool = False,
+        limits: Optional[httpx.Limits] = None,
+        proxy: Any = None,
+        retries: int = 0,
+    ):
+        limits = limits or httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        proxy = httpx.Proxy(url=proxy) if isinstance(proxy, (str, httpx.URL)) else proxy
+        options = dict(
+            ssl_context=httpx.create_ssl_context(verify=verify, cert=cert, trust_env=trust_env),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            http1=http1,
+            http2=http2,
+            retries=retries,
+            network_backend=CachedNetworkBackend(httpcore.AnyIOBackend(), cache),
+        )
+        if proxy is None:
+            self._pool = httpcore.AsyncConnectionPool(**options)
+            return
+        proxy_url = httpcore.URL(
+            scheme=proxy.url.raw_scheme,
+            host=proxy.url.raw_host,
+            port=proxy.url.port,
+            target=proxy.url.raw_path,
+        )
+        if proxy.url.scheme in ("http", "https"):
+            self._pool = httpcore.AsyncHTTPProxy(
+                proxy_url=proxy_url,
+                proxy_auth=proxy.raw_auth,
+                proxy_headers=proxy.headers.raw,
+                proxy_ssl_context=proxy.ssl_context,
+                **options,
+            )
+        elif proxy.url.scheme in ("socks5", "socks5h"):
+            self._pool = httpcore.AsyncSOCKSProxy(proxy_url=proxy_url, proxy_auth=proxy.raw_auth, **options)
+        else:
+            raise ValueError(f"Unsupported proxy scheme {proxy.url.scheme!r}; use http, https, socks5 or socks5h")
+
+    async def __aenter__(self) -> "CachedHTTPTransport":
+        await self._pool.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type=None, exc_value=None, traceback=None) -> None:
+        with _httpx_errors():
+            await self._pool.__aexit__(exc_type, exc_value, traceback)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        core_request = httpcore.Request(
+            method=request.method,
+            url=httpcore.URL(
+                scheme=request.url.raw_scheme,
+                host=request.url.raw_host,
+                port=request.url.port,
+                target=request.url.raw_path,
+            ),
+            headers=request.headers.raw,
+            content=request.stream,
+            extensions=request.extensions,
+        )
+        with _httpx_errors():
+            response = await self._pool.handle_async_request(core_request)
+        return httpx.Response(
+            status_code=response.status,
+            headers=response.headers,
+            stream=_ResponseStream(response.stream),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._pool.aclose()
+
+
+def cached_httpx_transport(cache: Optional[DNSCache] = None, **kwargs) -> CachedHTTPTransport:
+    """An httpx transport, configured like httpx.AsyncHTTPTransport(**kwargs), resolving hosts through ``cache``."""
+    return CachedHTTPTransport(cache, **kwargs)
@@ -45,6 +45,7 @@ except ImportError:
 
 from .async_logger import AsyncLoggerBase, AsyncLogger
 from .async_url_seeder import AsyncUrlSeeder, _parse_head
+from .dns_cache import cached_httpx_transport, get_dns_cache
 from .utils import (
     normalize_url,
     get_base_domain,
@@ -144,7 +145,7 @@ class DomainMapper:
     ):
         self._owns_client = client is None
         self.client = client or httpx.AsyncClient(
-            http2=True,
+            transport=cached_httpx_transport(http2=True),
             timeout=15,
             headers={
                 "User-Agent": (
@@ -453,9 +454,8 @@ class DomainMapper:
         async def check(prefix: str):
             fqdn = f"{prefix}.{base_domain}"
             try:
-                loop = asyncio.get_event_loop()
                 await asyncio.wait_for(
-                    loop.getaddrinfo(fqdn, None),
+                    get_dns_cache().resolve(fqdn),
                     timeout=config.dns_timeout,
                 )
                 return fqdn
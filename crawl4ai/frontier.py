@@ -0,0 +1,412 @@
+"""
+Crawl frontier backends.
+
+A frontier holds the crawl queue, the set of URLs ever seen, per-host
+politeness state and the outcome of finished URLs. Keeping that state behind
+one interface lets several processes or machines work on the same crawl:
+each worker leases URLs, crawls them and acks them, and a URL whose worker
+died becomes visible again once its lease expires.
+
+Two backends are provided:
+  - InMemoryFrontier: single process, no dependencies.
+  - RedisFrontier: shared through a Redis server (requires ``pip install redis``).
+"""
+
+import asyncio
+import heapq
+import itertools
+import json
+import time
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlparse
+
+
+@dataclass
+class FrontierItem:
+    """A URL waiting in (or leased from) a frontier. Lower priority is served first."""
+
+    url: str
+    priority: float = 0.0
+    depth: int = 0
+    parent_url: Optional[str] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    attempts: int = 0
+    lease_expires_at: float = 0.0
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), ensure_ascii=False)
+
+    @classmethod
+    def from_json(cls, data: str) -> "FrontierItem":
+        return cls(**json.loads(data))
+
+
+class CrawlFrontier(ABC):
+    """
+    Abstract crawl frontier.
+
+    Core functions:
+      - enqueue: Add a URL unless it was ever seen before (global dedup).
+      - lease: Take URLs out of the queue for ``visibility_timeout`` seconds.
+      - ack / nack: Finish a leased URL, or hand it back to the queue.
+      - acquire_host: Per-host politeness token shared by all workers.
+    """
+
+    def __init__(self, visibility_timeout: float = 300.0):
+        self.visibility_timeout = visibility_timeout
+
+    @abstractmethod
+    async def enqueue(
+        self,
+        url: str,
+        priority: float = 0.0,
+        depth: int = 0,
+        parent_url: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """Queue a URL. Returns False if the URL was already seen."""
+
+    async def enqueue_many(self, items: Iterable[FrontierItem]) -> int:
+        """Queue several items; returns how many were new."""
+        added = 0
+        for item in items:
+            if await self.enqueue(
+                item.url, item.priority, item.depth, item.parent_url, item.metadata
+            ):
+                added += 1
+        return added
+
+    @abstractmethod
+    async def lease(
+        self, count: int = 1, visibility_timeout: Optional[float] = None
+    ) -> List[FrontierItem]:
+        """Lease up to ``count`` URLs. Expired leases are returned to the queue first."""
+
+    @abstractmethod
+    async def ack(self, url: str, result: Optional[Dict[str, Any]] = None) -> None:
+        """Mark a leased URL as finished and store a small result summary."""
+
+    @abstractmethod
+    async def nack(self, url: str) -> None:
+        """Give a leased URL back to the queue without finishing it."""
+
+    @abstractmethod
+    async def acquire_host(self, host: str, min_interval: float) -> float:
+        """
+        Try to take the politeness token of ``host``.
+
+        Returns 0 when the token was taken (no other request to the host may
+        start for ``min_interval`` seconds), otherwise the seconds to wait.
+        """
+
+    async def wait_for_host(self, url: str, min_interval: float) -> None:
+        """Sleep until the politeness token of the URL's host is taken."""
+        if min_interval <= 0:
+            return
+        host = urlparse(url).netloc.lower()
+        while True:
+            wait = await self.acquire_host(host, min_interval)
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    @abstractmethod
+    async def get_result(self, url: str) -> Optional[Dict[str, Any]]:
+        """Result summary stored by ``ack``, or None."""
+
+    @abstractmethod
+    async def stats(self) -> Dict[str, int]:
+        """Counts of queued, leased, done and seen URLs."""
+
+    async def is_drained(self) -> bool:
+        """True when nothing is queued or leased by any worker."""
+        stats = await self.stats()
+        return stats["queued"] == 0 and stats["leased"] == 0
+
+    async def close(self) -> None:
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+
+class InMemoryFrontier(CrawlFrontier):
+    """Frontier kept in the memory of a single process."""
+
+    def __init__(self, visibility_timeout: float = 300.0):
+        super().__init__(visibility_timeout)
+        self._queue: List[Tuple[float, int, str]] = []
+        self._seq = itertools.count()
+        self._items: Dict[str, FrontierItem] = {}
+        self._leased: Dict[str, FrontierItem] = {}
+        self._seen: set = set()
+        self._done: Dict[str, Dict[str, Any]] = {}
+        self._host_free_at: Dict[str, float] = {}
+
+    def _push(self, item: FrontierItem) -> None:
+        self._items[item.url] = item
+        heapq.heappush(self._queue, (item.priority, next(self._seq), item.url))
+
+    async def enqueue(
+        self,
+        url: str,
+        priority: float = 0.0,
+        depth: int = 0,
+        parent_url: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        if url in self._seen:
+            return False
+        self._seen.add(url)
+        self._push(FrontierItem(url, priority, depth, parent_url, metadata or {}))
+        return True
+
+    def _reclaim_expired(self, now: float) -> None:
+        expired = [url for url, item in self._leased.items() if item.lease_expires_at <= now]
+        for url in expired:
+            self._push(self._leased.pop(url))
+
+    async def lease(
+        self, count: int = 1, visibility_timeout: Optional[float] = None
+    ) -> List[FrontierItem]:
+        now = time.time()
+        self._reclaim_expired(now)
+        timeout = visibility_timeout or self.visibility_timeout
+        leased = []
+        while self._queue and len(leased) < count:
+            _, _, url = heapq.heappop(self._queue)
+            item = self._items.pop(url, None)
+            if item is None:
+                continue  # acked after its lease expired; see ack()
+            item.attempts += 1
+            item.lease_expires_at = now + timeout
+            self._leased[url] = item
+            leased.append(item)
+        return leased
+
+    async def ack(self, url: str, result: Optional[Dict[str, Any]] = None) -> None:
+        if self._leased.pop(url, None) is None:
+            # The lease expired and the URL went back to the queue. It is done
+            # now, so it must not be crawled again; its heap entry is skipped.
+            self._items.pop(url, None)
+        self._done[url] = result or {}
+
+    async def nack(self, url: str) -> None:
+        item = self._leased.pop(url, None)
+        if item is not None:
+            self._push(item)
+
+    async def acquire_host(self, host: str, min_interval: float) -> float:
+        now = time.time()
+        free_at = self._host_free_at.get(host, 0.0)
+        if free_at > now:
+            return free_at - now
+        self._host_free_at[host] = now + min_interval
+        return 0.0
+
+    async def get_result(self, url: str) -> Optional[Dict[str, Any]]:
+        return self._done.get(url)
+
+    async def stats(self) -> Dict[str, int]:
+        return {
+            "queued": len(self._items),
+            "leased": len(self._leased),
+            "done": len(self._done),
+            "seen": len(self._seen),
+        }
+
+
+# Multi-key updates of RedisFrontier run as Lua scripts, so a worker dying
+# between two commands cannot leave a URL in no structure at all.
+
+# KEYS: seen, items, queue  ARGV: url, priority, item JSON
+_ENQUEUE_SCRIPT = """
+if redis.call('SADD', KEYS[1], ARGV[1]) == 0 then
+    return 0
+end
+redis.call('HSET', KEYS[2], ARGV[1], ARGV[3])
+redis.call('ZADD', KEYS[3], ARGV[2], ARGV[1])
+return 1
+"""
+
+# Requeue expired leases, then move up to ``count`` URLs from the queue to
+# the leases. KEYS: queue, leases, items  ARGV: now, count, lease expiry
+# Returns url, score, item JSON (or false) for every leased URL.
+_LEASE_SCRIPT = """
+local expired = redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', ARGV[1])
+for _, url in ipairs(expired) do
+    redis.call('ZREM', KEYS[2], url)
+    local raw = redis.call('HGET', KEYS[3], url)
+    local priority = 0
+    if raw then
+        priority = cjson.decode(raw)['priority']
+    end
+    redis.call('ZADD', KEYS[1], priority, url)
+end
+local popped = redis.call('ZPOPMIN', KEYS[1], ARGV[2])
+local leased = {}
+for i = 1, #popped, 2 do
+    redis.call('ZADD', KEYS[2], ARGV[3], popped[i])
+    table.insert(leased, popped[i])
+    table.insert(leased, popped[i + 1])
+    table.insert(leased, redis.call('HGET', KEYS[3], popped[i]))
+end
+return leased
+"""
+
+# KEYS: leases, queue, items, done  ARGV: url, result JSON
+_ACK_SCRIPT = """
+if redis.call('ZREM', KEYS[1], ARGV[1]) == 0 then
+    -- The lease expired and the URL was requeued: it is done, do not crawl it again
+    redis.call('ZREM', KEYS[2], ARGV[1])
+end
+redis.call('HDEL', KEYS[3], ARGV[1])
+redis.call('HSET', KEYS[4], ARGV[1], ARGV[2])
+return 1
+"""
+
+# KEYS: leases, queue, items  ARGV: url
+_NACK_SCRIPT = """
+if redis.call('ZREM', KEYS[1], ARGV[1]) == 0 then
+    return 0
+end
+local raw = redis.call('HGET', KEYS[3], ARGV[1])
+local priority = 0
+if raw then
+    priority = cjson.decode(raw)['priority']
+end
+redis.call('ZADD', KEYS[2], priority, ARGV[1])
+return 1
+"""
+
+
+class RedisFrontier(CrawlFrontier):
+    """
+    Frontier shared through Redis, for crawls spread over several processes or machines.
+
+    Keys (all prefixed with ``namespace``):
+      - ``:seen``   SET of every URL ever enqueued (dedup).
+      - ``:queue``  ZSET url -> priority.
+      - ``:leases`` ZSET url -> lease expiry timestamp.
+      - ``:items``  HASH url -> FrontierItem JSON.
+      - ``:done``   HASH url -> result summary JSON.
+      - ``:host:<host>`` politeness token, a key set with NX and a PX expiry.
+
+    Enqueue, lease, ack and nack each run as one Lua script, so a worker that
+    dies mid-call never leaves a URL outside both the queue and the leases.
+
+    Args:
+        client: An existing ``redis.asyncio`` compatible client created with
+            ``decode_responses=True``. Takes precedence over ``url``.
+        url: Redis URL used when no client is given.
+        namespace: Key prefix, so several crawls can share one server.
+        visibility_timeout: Default lease duration in seconds.
+    """
+
+    def __init__(
+        self,
+        client: Any = None,
+        url: str = "redis://localhost:6379/0",
+        namespace: str = "crawl4ai:frontier",
+        visibility_timeout: float = 300.0,
+    ):
+        super().__init__(visibility_timeout)
+        self._owns_client = client is None
+        if client is None:
+            try:
+                import redis.asyncio as aioredis
+            except ImportError:
+                raise ImportError(
+                    "RedisFrontier requires the 'redis' package. Install it with: pip install redis"
+                )
+            client = aioredis.from_url(url, decode_responses=True)
+        self.client = client
+        self.namespace = namespace
+        self._seen_key = f"{namespace}:seen"
+        self._queue_key = f"{namespace}:queue"
+        self._leases_key = f"{namespace}:leases"
+        self._items_key = f"{namespace}:items"
+        self._done_key = f"{namespace}:done"
+        self._enqueue_script = client.register_script(_ENQUEUE_SCRIPT)
+        self._lease_script = client.register_script(_LEASE_SCRIPT)
+        self._ack_script = client.register_script(_ACK_SCRIPT)
+        self._nack_script = client.register_script(_NACK_SCRIPT)
+
+    async def enqueue(
+        self,
+        url: str,
+        priority: float = 0.0,
+        depth: int = 0,
+        parent_url: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        # SADD is the dedup point: only one worker ever sees 1 for a URL.
+        item = FrontierItem(url, priority, depth, parent_url, metadata or {})
+        added = await self._enqueue_script(
+            keys=[self._seen_key, self._items_key, self._queue_key],
+            args=[url, priority, item.to_json()],
+        )
+        return bool(added)
+
+    async def lease(
+        self, count: int = 1, visibility_timeout: Optional[float] = None
+    ) -> List[FrontierItem]:
+        now = time.time()
+        expires_at = now + (visibility_timeout or self.visibility_timeout)
+        reply = await self._lease_script(
+            keys=[self._queue_key, self._leases_key, self._items_key],
+            args=[now, count, expires_at],
+        )
+
+        leased = []
+        for i in range(0, len(reply), 3):
+            url, score, raw = reply[i:i + 3]
+            item = FrontierItem.from_json(raw) if raw else FrontierItem(url, float(score))
+            item.attempts += 1
+            item.lease_expires_at = expires_at
+            leased.append(item)
+        if leased:
+            await self.client.hset(
+                self._items_key, mapping={item.url: item.to_json() for item in leased}
+            )
+        return leased
+
+    async def ack(self, url: str, result: Optional[Dict[str, Any]] = None) -> None:
+        await self._ack_script(
+            keys=[self._leases_key, self._queue_key, self._items_key, self._done_key],
+            args=[url, json.dumps(result or {}, default=str)],
+        )
+
+    async def nack(self, url: str) -> None:
+        await self._nack_script(
+            keys=[self._leases_key, self._queue_key, self._items_key], args=[url]
+        )
+
+    async def acquire_host(self, host: str, min_interval: float) -> float:
+        key = f"{self.namespace}:host:{host}"
+        if await self.client.set(key, "1", nx=True, px=max(1, int(min_interval * 1000))):
+            return 0.0
+        ttl_ms = await self.client.pttl(key)
+        # -2: key expired meanwhile, -1: no expiry (should not happen); retry soon.
+        return max(ttl_ms, 1) / 1000
+
+    async def get_result(self, url: str) -> Optional[Dict[str, Any]]:
+        raw = await self.client.hget(self._done_key, url)
+        return json.loads(raw) if raw else None
+
+    async def stats(self) -> Dict[str, int]:
+        return {
+            "queued": await self.client.zcard(self._queue_key),
+            "leased": await self.client.zcard(self._leases_key),
+            "done": await self.client.hlen(self._done_key),
+            "seen": await self.client.scard(self._seen_key),
+        }
+
+    async def close(self) -> None:
+        if self._owns_client:
+            await self.client.aclose()
@@ -0,0 +1,242 @@
+"""
+HTTP-first crawler strategy that escalates to a browser only when needed.
+
+Most pages render server-side: a plain HTTP fetch returns the same content a
+browser would, at a fraction of the cost. HybridCrawlerStrategy fetches every
+URL with AsyncHTTPCrawlerStrategy first and re-crawls it with
+AsyncPlaywrightCrawlerStrategy when the HTTP result:
+
+- failed (HTTP error status, connection error),
+- looks blocked (antibot_detector.is_blocked),
+- is an empty shell whose content is rendered by JavaScript: an empty SPA
+  mount point (``<div id="root"></div>``, ``<app-root>``), a ``<noscript>``
+  asking to enable JavaScript, or almost no visible text next to scripts.
+
+Configs that need a page (screenshot, pdf, js_code, wait_for, ...) go to the
+browser directly. Decisions are remembered per host: after
+``escalate_after`` consecutive escalations, later URLs of that host skip the
+HTTP attempt. The browser is only launched on the first escalation.
+"""
+
+import asyncio
+import re
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from .antibot_detector import is_blocked
+from .async_configs import BrowserConfig, CrawlerRunConfig, HTTPCrawlerConfig
+from .async_crawler_strategy import (
+    AsyncCrawlerStrategy,
+    AsyncHTTPCrawlerStrategy,
+    AsyncPlaywrightCrawlerStrategy,
+    HTTPStatusError,
+)
+from .async_logger import AsyncLogger
+from .models import AsyncCrawlResponse
+
+_SCRIPT_BLOCK_RE = re.compile(r"<script\b[\s\S]*?</script>", re.IGNORECASE)
+_STYLE_BLOCK_RE = re.compile(r"<style\b[\s\S]*?</style>", re.IGNORECASE)
+_NOSCRIPT_BLOCK_RE = re.compile(r"<noscript\b[^>]*>([\s\S]*?)</noscript>", re.IGNORECASE)
+_TAG_RE = re.compile(r"<[^>]+>")
+_BODY_RE = re.compile(r"<body\b[^>]*>([\s\S]*)</body>", re.IGNORECASE)
+_SCRIPT_TAG_RE = re.compile(r"<script\b", re.IGNORECASE)
+
+# Mount points left empty in the HTML of client-rendered apps
+# (React / Vue / Next / Nuxt / Gatsby / Svelte, Angular, Ember)
+_EMPTY_APP_ROOT_RE = re.compile(
+    r"<div\b[^>]*\bid=[\"'](?:root|app|__next|__nuxt|___gatsby|svelte)[\"'][^>]*>\s*</div>"
+    r"|<app-root\b[^>]*>\s*</app-root>"
+    r"|<body\b[^>]*\bclass=[\"'][^\"']*\bember-application\b",
+    re.IGNORECASE,
+)
+_ENABLE_JS_RE = re.compile(r"enable\s+javascript|javascript\s+(?:is\s+)?(?:required|disabled)|requires?\s+javascript", re.IGNORECASE)
+
+# Statuses a browser would get too; escalating them only wastes a page
+_FINAL_STATUSES = {404, 405, 410, 451}
+
+# Below this much visible text, a page with scripts is treated as a JS shell
+MIN_VISIBLE_TEXT = 200
+
+
+def _visible_text_length(html: str) -> int:
+    match = _BODY_RE.search(html)
+    body = match.group(1) if match else html
+    body = _SCRIPT_BLOCK_RE.sub("", body)
+    body = _STYLE_BLOCK_RE.sub("", body)
+    body = _NOSCRIPT_BLOCK_RE.sub("", body)
+    return len(" ".join(_TAG_RE.sub(" ", body).split()))
+
+
+def js_render_reason(html: str) -> Optional[str]:
+    """Why ``html`` (as fetched over HTTP) needs a browser to render, or None."""
+    if not html:
+        return "empty body"
+    if _EMPTY_APP_ROOT_RE.search(html):
+        return "empty app root"
+    visible = _visible_text_length(html)
+    for noscript in _NOSCRIPT_BLOCK_RE.findall(html):
+        if _ENABLE_JS_RE.search(noscript) and visible < 10 * MIN_VISIBLE_TEXT:
+            return "noscript asks for JavaScript"
+    if visible < MIN_VISIBLE_TEXT and _SCRIPT_TAG_RE.search(html):
+        return f"script shell ({visible} chars of text)"
+    return None
+
+
+def escalation_reason(response: AsyncCrawlResponse) -> Optional[str]:
+    """Why an HTTP response is not good enough and the browser should be tried, or None."""
+    if response.downloaded_files:
+        return None  # a file download is the same either way
+    content_type = next(
+        (v for k, v in (response.response_headers or {}).items() if k.lower() == "content-type"), ""
+    )
+    if content_type and "html" not in content_type.lower():
+        return None  # JSON, XML, CSV... nothing to render
+    blocked, reason = is_blocked(response.status_code, response.html or "")
+    if blocked:
+        return f"blocked: {reason}"
+    return js_render_reason(response.html or "")
+
+
+def requires_browser(config: CrawlerRunConfig) -> bool:
+    """True if ``config`` asks for something only a page can do."""
+    return bool(
+        config.process_in_browser
+        or config.screenshot
+        or config.pdf
+        or config.capture_mhtml
+        or config.js_code
+        or config.js_code_before_wait
+        or config.c4a_script
+        or config.wait_for
+        or config.session_id
+        or config.scan_full_page
+        or config.simulate_user
+        or config.magic
+        or config.remove_overlay_elements
+        or config.remove_consent_popups
+        or config.process_iframes
+        or config.virtual_scroll_config
+        or config.capture_console_messages
+        or config.capture_network_requests
+    )
+
+
+class HybridCrawlerStrategy(AsyncCrawlerStrategy):
+    """
+    Fetch over HTTP first, escalate to the browser when the page needs it.
+
+    Args:
+        browser_config: Config of the browser used for escalations.
+        http_config: Config of the HTTP fetches.
+        logger: Logger shared by both strategies.
+        escalate_after: Consecutive escalations after which a host is crawled
+            with the browser only. 0 = never remember.
+        http_strategy: Use this HTTP strategy instead of building one.
+        browser_strategy: Use this browser strategy instead of building one.
+    """
+
+    def __init__(
+        self,
+        browser_config: Optional[BrowserConfig] = None,
+        http_config: Optional[HTTPCrawlerConfig] = None,
+        logger: Optional[AsyncLogger] = None,
+        escalate_after: int = 2,
+        http_strategy: Optional[AsyncHTTPCrawlerStrategy] = None,
+        browser_strategy: Optional[AsyncPlaywrightCrawlerStrategy] = None,
+    ):
+        self.logger = logger
+        self.escalate_after = escalate_after
+        self.http_strategy = http_strategy or AsyncHTTPCrawlerStrategy(
+            browser_config=http_config, logger=logger
+        )
+        self.browser_strategy = browser_strategy or AsyncPlaywrightCrawlerStrategy(
+            browser_config=browser_config, logger=logger
+        )
+        # host -> "browser" once HTTP kept losing there
+        self.host_decisions: Dict[str, str] = {}
+        self.stats = {"http": 0, "browser": 0, "escalations": 0}
+        self._streaks: Dict[str, int] = {}
+        self._browser_started = False
+        self._browser_lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def start(self):
+        # The browser is launched on the first escalation
+        await self.http_strategy.start()
+
+    async def close(self):
+        await self.http_strategy.close()
+        if self._browser_started:
+            await self.browser_strategy.close()
+            self._browser_started = False
+
+    def set_hook(self, hook_type: str, hook):
+        """Set a hook on whichever strategy supports it (browser hooks go to the browser)."""
+        if hook_type in self.http_strategy.hooks:
+            self.http_strategy.set_hook(hook_type, hook)
+        else:
+            self.browser_strategy.set_hook(hook_type, hook)
+
+    def update_user_agent(self, user_agent: str):
+        self.browser_strategy.update_user_agent(user_agent)
+
+    async def _browser(self) -> AsyncPlaywrightCrawlerStrategy:
+        async with self._browser_lock:
+            if not self._browser_started:
+                await self.browser_strategy.start()
+                self._browser_started = True
+        return self.browser_strategy
+
+    def _log(self, message: str, params: dict) -> None:
+        if self.logger:
+            self.logger.info(message=message, tag="HYBRID", params=params)
+
+    def _record(self, host: str, escalated: bool) -> None:
+        if not escalated:
+            self._streaks[host] = 0
+            return
+        self._streaks[host] = self._streaks.get(host, 0) + 1
+        if self.escalate_after and self._streaks[host] >= self.escalate_after:
+            if self.host_decisions.get(host) != "browser":
+                self.host_decisions[host] = "browser"
+                self._log("Crawling {host} with the browser from now on", {"host": host})
+
+    async def _crawl_browser(self, url: str, config: CrawlerRunConfig, **kwargs) -> AsyncCrawlResponse:
+        self.stats["browser"] += 1
+        browser = await self._browser()
+        return await browser.crawl(url, config=config, **kwargs)
+
+    async def crawl(self, url: str, config: Optional[CrawlerRunConfig] = None, **kwargs) -> AsyncCrawlResponse:
+        config = config or CrawlerRunConfig.from_kwargs(kwargs)
+        host = urlparse(url).netloc
+        if requires_browser(config) or self.host_decisions.get(host) == "browser":
+            return await self._crawl_browser(url, config, **kwargs)
+
+        self.stats["http"] += 1
+        try:
+            response = await self.http_strategy.crawl(url, config=config, **kwargs)
+        except Exception as e:
+            if not url.startswith(("http://", "https://")):
+                raise
+            if isinstance(e, HTTPStatusError) and e.status_code in _FINAL_STATUSES:
+                self._record(host, escalated=False)
+                raise
+            reason = f"HTTP fetch failed: {e}"
+        else:
+            if response.status_code == 304:
+                return response  # conditional recrawl: nothing to render
+            reason = escalation_reason(response)
+            if reason is None:
+                self._record(host, escalated=False)
+                return response
+
+        self.stats["escalations"] += 1
+        self._record(host, escalated=True)
+        self._log("Escalating {url} to the browser: {reason}", {"url": url, "reason": reason})
+        return await self._crawl_browser(url, config, **kwargs)
@@ -0,0 +1,69 @@
+async (cfg) => {
+    // Scrolls the window to the bottom, waiting on DOM activity instead of
+    // fixed sleeps. Steps grow (up to cfg.maxStepFactor viewports) while the
+    // page settles quickly, and the scan stops once the bottom is reached and
+    // the document no longer grows.
+    // cfg: {viewport, maxSteps, delayMs, quietMs, maxStepFactor}
+    const root = document.scrollingElement || document.documentElement;
+    const height = () => Math.max(root.scrollHeight, document.body ? document.body.scrollHeight : 0);
+    const sleep = (ms) => new Promise(resolve => setTimeout(resolve, ms));
+
+    let lastMutation = performance.now();
+    const observer = new MutationObserver(() => { lastMutation = performance.now(); });
+    observer.observe(document.documentElement, {
+        childList: true, subtree: true, attributes: true, characterData: true,
+    });
+
+    // Resolves once the DOM has been quiet for quietMs (or after capMs); returns ms taken
+    const settle = async (capMs) => {
+        const start = performance.now();
+        lastMutation = start;
+        while (performance.now() - start < capMs) {
+            await sleep(Math.min(cfg.quietMs, 25));
+            if (performance.now() - lastMutation >= cfg.quietMs) break;
+        }
+        return performance.now() - start;
+    };
+
+    // Resolves true as soon as the document grows past `from`, false after capMs
+    const waitForGrowth = async (from, capMs) => {
+        const start = performance.now();
+        while (performance.now() - start < capMs) {
+            if (height() > from) return true;
+            await sleep(25);
+        }
+        return height() > from;
+    };
+
+    let total = height();
+    let step = cfg.viewport;
+    let pos = 0;
+    let steps = 0;
+    let stopped = 'max_steps';
+    try {
+        if (total <= cfg.viewport) {
+            return { steps, height: total, stopped: 'short_page' };
+        }
+        while (steps < cfg.maxSteps) {
+            pos = Math.min(pos + step, total);
+            window.scrollTo(0, pos);
+            steps++;
+            const took = await settle(cfg.delayMs);
+            total = Math.max(total, height());
+            step = took < cfg.delayMs / 2
+                ? Math.min(step * 2, cfg.viewport * cfg.maxStepFactor)
+                : cfg.viewport;
+
+            if (pos + cfg.viewport >= total) {
+                if (!(await waitForGrowth(total, cfg.delayMs))) {
+                    stopped = 'no_growth';
+                    break;
+                }
+                total = height();
+            }
+        }
+        return { steps, height: total, stopped };
+    } finally {
+        observer.disconnect();
+    }
+}
@@ -0,0 +1,87 @@
+(opts) => {
+    // Serializes the whole document in one pass, for a single HTML capture.
+    // opts.shadow: inline open shadow roots (slots resolved against the
+    //              host's light DOM, shadow-scoped <style> dropped).
+    // opts.frames: {index: bodyHTML} collected from child frames; each
+    //              <iframe data-crawl4ai-frame="index"> is replaced by
+    //              <div class="extracted-iframe-content-index">bodyHTML</div>.
+    // opts.selectors: CSS selectors; when given, the outerHTML of their matches
+    //              in the serialized document is returned, one string per
+    //              selector, so they also match inside inlined frames.
+    const shadow = !!opts.shadow;
+    const frames = opts.frames || {};
+    const VOID = new Set([
+        'area','base','br','col','embed','hr','img','input',
+        'link','meta','param','source','track','wbr'
+    ]);
+    const RAW_TEXT = new Set(['script', 'style', 'textarea', 'title', 'noscript', 'xmp']);
+    const parts = [];
+
+    const escapeText = (s) => s.replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;');
+    const escapeAttr = (s) => s.replace(/&/g, '&amp;').replace(/"/g, '&quot;');
+
+    const attrs = (node) => {
+        let s = '';
+        for (const a of node.attributes || []) s += ` ${a.name}="${escapeAttr(a.value)}"`;
+        return s;
+    };
+
+    // inShadow: node lives in a shadow root, so <style> is skipped and <slot> resolved
+    const serialize = (node, inShadow, rawParent) => {
+        if (node.nodeType === Node.TEXT_NODE) {
+            parts.push(rawParent ? node.textContent : escapeText(node.textContent));
+            return;
+        }
+        if (node.nodeType === Node.COMMENT_NODE) {
+            if (!shadow) parts.push(`<!--${node.textContent}-->`);
+            return;
+        }
+        if (node.nodeType !== Node.ELEMENT_NODE) return;
+
+        const tag = node.tagName.toLowerCase();
+        if (inShadow && tag === 'style') return;
+        if (inShadow && tag === 'slot') {
+            const assigned = node.assignedNodes({ flatten: true });
+            if (assigned.length) {
+                for (const a of assigned) serialize(a, false, false);
+            } else {
+                for (const child of node.childNodes) serialize(child, true, false);
+            }
+            return;
+        }
+
+        const frame = tag === 'iframe' ? node.getAttribute('data-crawl4ai-frame') : null;
+        if (frame !== null && Object.prototype.hasOwnProperty.call(frames, frame)) {
+            parts.push(`<div class="extracted-iframe-content-${frame}">${frames[frame]}</div>`);
+            return;
+        }
+
+        parts.push(`<${tag}${attrs(node)}>`);
+        if (VOID.has(tag)) return;
+        if (shadow && node.shadowRoot) {
+            for (const child of node.shadowRoot.childNodes) serialize(child, true, false);
+        } else {
+            // <template> keeps its children in .content
+            const children = tag === 'template' ? node.content.childNodes : node.childNodes;
+            const raw = RAW_TEXT.has(tag);
+            for (const child of children) serialize(child, inShadow, raw);
+        }
+        parts.push(`</${tag}>`);
+    };
+
+    const doctype = document.doctype ? `<!DOCTYPE ${document.doctype.name}>` : '';
+    serialize(document.documentElement, false, false);
+    const html = doctype + parts.join('');
+    if (!opts.selectors) return html;
+
+    const parsed = new DOMParser().parseFromString(html, 'text/html');
+    return opts.selectors.map(selector => {
+        try {
+            return Array.from(parsed.querySelectorAll(selector))
+                .map(el => el.outerHTML)
+                .join('');
+        } catch (e) {
+            return '';  // invalid selector
+        }
+    });
+}
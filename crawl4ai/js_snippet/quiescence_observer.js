@@ -0,0 +1,18 @@
+(() => {
+    // Installs a MutationObserver once per document and returns the
+    // milliseconds since the DOM last changed.
+    let state = window.__crawl4aiQuiescence;
+    if (!state) {
+        state = window.__crawl4aiQuiescence = { lastMutation: performance.now() };
+        const observer = new MutationObserver(() => {
+            state.lastMutation = performance.now();
+        });
+        observer.observe(document.documentElement || document, {
+            childList: true,
+            subtree: true,
+            attributes: true,
+            characterData: true,
+        });
+    }
+    return performance.now() - state.lastMutation;
+})()
@@ -0,0 +1,81 @@
+async (cfg) => {
+    // One step of virtual-scroll capture: optionally scroll the container,
+    // wait for it to change (or cfg.wait_after_scroll), and return only the
+    // items not seen in earlier steps. Items are deduplicated in the page by
+    // a hash of their normalized text, so re-rendered rows are not shipped twice.
+    const container = document.querySelector(cfg.container_selector);
+    if (!container) {
+        throw new Error(`Container not found: ${cfg.container_selector}`);
+    }
+    if (cfg.reset || !window.__crawl4aiVirtualScroll) {
+        window.__crawl4aiVirtualScroll = { seen: new Set(), replaced: false };
+    }
+    const state = window.__crawl4aiVirtualScroll;
+
+    const hashOf = (el) => {
+        let text = (el.innerText || '').toLowerCase().replace(/[\s\W]/g, '');
+        if (!text) text = el.outerHTML;
+        let h = 0x811c9dc5;  // FNV-1a
+        for (let i = 0; i < text.length; i++) {
+            h ^= text.charCodeAt(i);
+            h = Math.imul(h, 0x01000193);
+        }
+        return (h >>> 0).toString(36) + ':' + text.length;
+    };
+
+    // Resolves true once a burst of mutations settles, false if nothing changes within capMs
+    const waitForChange = (capMs) => new Promise(resolve => {
+        let quietTimer = null;
+        const finish = (changed) => {
+            observer.disconnect();
+            clearTimeout(quietTimer);
+            clearTimeout(capTimer);
+            resolve(changed);
+        };
+        const observer = new MutationObserver(() => {
+            clearTimeout(quietTimer);
+            quietTimer = setTimeout(() => finish(true), 50);
+        });
+        observer.observe(container, { childList: true, subtree: true, characterData: true });
+        const capTimer = setTimeout(() => finish(quietTimer !== null), capMs);
+    });
+
+    if (cfg.scroll) {
+        let amount;
+        if (typeof cfg.scroll_by === 'number') {
+            amount = cfg.scroll_by;
+        } else if (cfg.scroll_by === 'page_height') {
+            amount = window.innerHeight;
+        } else {  // container_height
+            amount = container.offsetHeight;
+        }
+        const changed = waitForChange(cfg.wait_after_scroll * 1000);
+        container.scrollTop += amount;
+        await changed;
+    }
+
+    const current = new Set();
+    const newItems = [];
+    for (const el of container.children) {
+        const h = hashOf(el);
+        current.add(h);
+        if (!state.seen.has(h)) {
+            state.seen.add(h);
+            newItems.push(el.outerHTML);
+        }
+    }
+    // Items seen earlier but gone from the DOM: the list recycles its nodes
+    if (!state.replaced) {
+        for (const h of state.seen) {
+            if (!current.has(h)) {
+                state.replaced = true;
+                break;
+            }
+        }
+    }
+    return {
+        new_items: newItems,
+        replaced: state.replaced,
+        at_end: container.scrollTop + container.clientHeight >= container.scrollHeight - 10,
+    };
+}
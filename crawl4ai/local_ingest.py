@@ -0,0 +1,210 @@
+"""
+Bulk ingestion of saved pages from local disk.
+
+Runs the usual scraping, markdown and extraction pipeline over a corpus of
+HTML files, with no browser and no network:
+
+    async for result in ingest_local("corpus/", config=run_config):
+        ...
+
+The source is one of
+
+- a directory, searched recursively for ``pattern`` (``**/*.htm*``),
+- a glob (``"dumps/2024-*/**/*.html"``),
+- a manifest: a text file with one entry per line, either a file path or a
+  JSON object ``{"path": "...", "url": "..."}``. Relative paths are relative
+  to the manifest. With a ``url`` the page is processed under its original
+  address, so links and the result's ``url`` point at the web, not the disk.
+
+Files are memory-mapped and decoded in one pass with the same charset
+sniffing as fetched pages (BOM, ``<meta charset>``, chardet fallback).
+ingest_local spreads the files over a ProcessFleetDispatcher, one worker
+process per CPU by default, since processing is CPU-bound; each worker
+serves its files through LocalFileCrawlerStrategy. Files are listed and
+handed to the dispatcher ``batch_size`` at a time, so the size of a corpus
+is not bounded by memory.
+"""
+
+import asyncio
+import glob
+import itertools
+import json
+import os
+from functools import partial
+from typing import AsyncGenerator, Dict, Iterator, Optional, Tuple
+
+from .async_configs import BrowserConfig, CrawlerRunConfig
+from .async_crawler_strategy import AsyncCrawlerStrategy
+from .async_dispatcher import MemoryAdaptiveDispatcher, ProcessFleetDispatcher
+from .async_logger import AsyncLogger
+from .async_webcrawler import AsyncWebCrawler
+from .cache_context import CacheMode
+from .charset import decode_file
+from .models import AsyncCrawlResponse, CrawlResult
+
+DEFAULT_PATTERN = "**/*.htm*"
+
+
+def _file_url(path: str) -> str:
+    return "file://" + os.path.abspath(path)
+
+
+def _read_manifest(manifest: str) -> Iterator[Tuple[str, str]]:
+    root = os.path.dirname(os.path.abspath(manifest))
+    with open(manifest, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if line.startswith("{"):
+                entry = json.loads(line)
+                path = os.path.join(root, entry["path"])
+                yield entry.get("url") or _file_url(path), path
+            else:
+                path = os.path.join(root, line)
+                yield _file_url(path), path
+
+
+def is_manifest(source: str) -> bool:
+    """Whether ``source`` is a manifest file rather than a directory or a glob."""
+    return os.path.isfile(source) and not glob.has_magic(source)
+
+
+def local_sources(source: str, pattern: str = DEFAULT_PATTERN) -> Iterator[Tuple[str, str]]:
+    """
+    ``(url, path)`` of every file in a directory, glob or manifest.
+
+    ``url`` is the ``file://`` URL of the path, or the original URL a
+    manifest gives for it. Files are listed lazily, in no particular order.
+    """
+    if os.path.isdir(source):
+        matches = glob.iglob(os.path.join(glob.escape(source), pattern), recursive=True)
+    elif glob.has_magic(source):
+        matches = glob.iglob(source, recursive=True)
+    elif os.path.isfile(source):
+        yield from _read_manifest(source)
+        return
+    else:
+        raise FileNotFoundError(f"No directory, glob or manifest at {source}")
+    for path in matches:
+        if os.path.isfile(path):
+            yield _file_url(path), path
+
+
+class LocalFileCrawlerStrategy(AsyncCrawlerStrategy):
+    """
+    Serve crawls from local files.
+
+    ``file://`` URLs are read from disk. With a manifest, the URLs it lists
+    are served from their files too.
+
+    Args:
+        manifest: Optional manifest mapping URLs to saved files (see local_sources).
+        logger: Logger instance for recording events and errors.
+    """
+
+    # Saved pages are not re-checked for anti-bot blocks by AsyncWebCrawler
+    serves_local_content = True
+
+    def __init__(self, manifest: Optional[str] = None, logger: Optional[AsyncLogger] = None):
+        self.manifest = manifest
+        self.logger = logger
+        # url -> path, for manifest entries that carry their original URL
+        self._paths: Optional[Dict[str, str]] = None
+        self._load_lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def start(self):
+        pass  # the manifest is loaded on first use; a dispatching parent never needs it
+
+    async def close(self):
+        self._paths = None
+
+    def set_hook(self, hook_type: str, hook):
+        pass  # nothing is fetched, so there is nothing to hook
+
+    def update_user_agent(self, user_agent: str):
+        pass
+
+    async def _path_for(self, url: str) -> Optional[str]:
+        if self.manifest is not None:
+            async with self._load_lock:
+                if self._paths is None:
+                    entries = await asyncio.to_thread(lambda: list(_read_manifest(self.manifest)))
+                    self._paths = {u: p for u, p in entries if not u.startswith("file://")}
+            if url in self._paths:
+                return self._paths[url]
+        if url.startswith("file://"):
+            return url[7:]  # Remove 'file://' prefix
+        return None
+
+    async def crawl(self, url: str, config: Optional[CrawlerRunConfig] = None, **kwargs) -> AsyncCrawlResponse:
+        path = await self._path_for(url)
+        if path is None:
+            raise FileNotFoundError(f"{url} is neither a file:// URL nor in the manifest")
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f"Local file not found: {path}")
+
+        return AsyncCrawlResponse(
+            html=await asyncio.to_thread(decode_file, path),
+            response_headers={},
+            status_code=200,
+            # file:// URLs keep the crawler's own fallback (base_url or the URL)
+            redirected_url=None if url.startswith("file://") else url,
+        )
+
+
+async def ingest_local(
+    source: str,
+    config: Optional[CrawlerRunConfig] = None,
+    pattern: str = DEFAULT_PATTERN,
+    num_workers: Optional[int] = None,
+    max_session_permit: int = 20,
+    batch_size: int = 50_000,
+) -> AsyncGenerator[CrawlResult, None]:
+    """
+    Process every file of a directory, glob or manifest and yield the results
+    as they finish.
+
+    Args:
+        source: Directory, glob or manifest (see the module docstring).
+        config: Run config for every file. Defaults to one without caching;
+            results are always streamed.
+        pattern: Files matched inside a directory source.
+        num_workers: Worker processes. Defaults to the CPU count; 1 processes
+            the files in this process.
+        max_session_permit: Files processed concurrently per worker.
+        batch_size: Files listed and dispatched at a time; each batch starts
+            its own worker processes.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be positive")
+    config = (config or CrawlerRunConfig(cache_mode=CacheMode.BYPASS)).clone(stream=True)
+    sources = local_sources(source, pattern)
+    urls = [url for url, _ in itertools.islice(sources, batch_size)]
+    if not urls:
+        return
+
+    manifest = os.path.abspath(source) if is_manifest(source) else None
+    strategy_factory = partial(LocalFileCrawlerStrategy, manifest=manifest)
+    if num_workers == 1:
+        dispatcher = MemoryAdaptiveDispatcher(max_session_permit=max_session_permit)
+    else:
+        dispatcher = ProcessFleetDispatcher(
+            num_workers=num_workers,
+            max_session_permit=max_session_permit,
+            crawler_strategy_factory=strategy_factory,
+        )
+
+    browser_config = BrowserConfig(verbose=config.verbose)
+    async with AsyncWebCrawler(crawler_strategy=strategy_factory(), config=browser_config) as crawler:
+        while urls:
+            async for result in await crawler.arun_many(urls, config=config, dispatcher=dispatcher):
+                yield result
+            urls = [url for url, _ in itertools.islice(sources, batch_size)]
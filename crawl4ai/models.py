@@ -20,6 +20,17 @@ class DomainState:
     fail_count: int = 0
 
 
+@dataclass
+class DeadLetterEntry:
+    url: str
+    task_id: str
+    error_class: Optional[str]
+    reason: str
+    attempts: int
+    status_code: Optional[int] = None
+    failed_at: float = 0.0
+
+
 @dataclass
 class CrawlerTaskResult:
     task_id: str
@@ -136,8 +147,12 @@ class CrawlResult(BaseModel):
     media: Dict[str, List[Dict]] = {}
     links: Dict[str, List[Dict]] = {}
     downloaded_files: Optional[List[str]] = None
+    # sha256 hex digest of each downloaded file, by path
+    downloaded_file_hashes: Optional[Dict[str, str]] = None
     js_execution_result: Optional[Dict[str, Any]] = None
     screenshot: Optional[str] = None
+    # Set instead of screenshot when CrawlerRunConfig.screenshot_dir is used
+    screenshot_path: Optional[str] = None
     pdf: Optional[bytes] = None
     mhtml: Optional[str] = None
     _markdown: Optional[MarkdownGenerationResult] = PrivateAttr(default=None)
@@ -158,8 +173,17 @@ class CrawlResult(BaseModel):
     head_fingerprint: Optional[str] = None
     cached_at: Optional[float] = None
     cache_status: Optional[str] = None  # "hit", "hit_validated", "hit_fallback", "miss"
+    # Bytes of page body received from the network, excluding downloaded_files;
+    # None when the crawler strategy does not report it
+    body_size: Optional[int] = None
     # Anti-bot retry/proxy usage stats
     crawl_stats: Optional[Dict[str, Any]] = None
+    # Seconds spent in smart waits (wait_until="quiescent")
+    wait_timings: Optional[Dict[str, Any]] = None
+    # How the HTML was captured: method, duration (s), chars, frames inlined
+    capture_stats: Optional[Dict[str, Any]] = None
+    # File the network events were streamed to (NetworkCaptureConfig.output_dir)
+    network_capture_path: Optional[str] = None
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -334,15 +358,21 @@ class AsyncCrawlResponse(BaseModel):
     js_execution_result: Optional[Dict[str, Any]] = None
     status_code: int
     screenshot: Optional[str] = None
+    screenshot_path: Optional[str] = None
     pdf_data: Optional[bytes] = None
     mhtml_data: Optional[str] = None
     get_delayed_content: Optional[Callable[[Optional[float]], Awaitable[str]]] = None
     downloaded_files: Optional[List[str]] = None
+    downloaded_file_hashes: Optional[Dict[str, str]] = None
     ssl_certificate: Optional[SSLCertificate] = None
     redirected_url: Optional[str] = None
     redirected_status_code: Optional[int] = None
     network_requests: Optional[List[Dict[str, Any]]] = None
     console_messages: Optional[List[Dict[str, Any]]] = None
+    wait_timings: Optional[Dict[str, Any]] = None
+    capture_stats: Optional[Dict[str, Any]] = None
+    network_capture_path: Optional[str] = None
+    body_size: Optional[int] = None
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -0,0 +1,354 @@
+"""
+Network capture for CrawlerRunConfig(capture_network_requests=True).
+
+A NetworkCapture listens to one page for the duration of one crawl and
+records ``request``, ``response`` and ``request_failed`` events, subject to
+NetworkCaptureConfig:
+
+- filters by resource type, URL glob and response status,
+- response bodies are read only where wanted, up to ``max_body_size`` bytes
+  (a Content-Length above the limit skips the read entirely),
+- events are kept in a ring buffer of ``max_entries``, or, with
+  ``output_dir``, streamed to a JSONL or HAR 1.2 file as they arrive so
+  nothing accumulates in memory.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+from collections import deque
+from datetime import datetime, timezone
+from fnmatch import fnmatch
+from typing import Any, Dict, List, Optional
+
+import aiofiles
+
+from .__version__ import __version__
+from .async_configs import NetworkCaptureConfig
+from .page_listeners import listen, unlisten
+
+_HAR_HEADER = (
+    '{"log": {"version": "1.2", '
+    '"creator": {"name": "crawl4ai", "version": "%s"}, '
+    '"pages": [], "entries": [\n'
+)
+_HAR_FOOTER = "\n]}}\n"
+
+
+def _har_headers(headers: Dict[str, str]) -> List[Dict[str, str]]:
+    return [{"name": name, "value": value} for name, value in headers.items()]
+
+
+def _iso(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def har_entry(event: Dict[str, Any], request=None) -> Optional[Dict[str, Any]]:
+    """
+    Convert a ``response`` or ``request_failed`` event into a HAR 1.2 entry.
+
+    ``request`` is the Playwright Request, for the method, request headers
+    and post data. Other events (including bare requests, which are part of
+    their response's entry) return None.
+    """
+    event_type = event.get("event_type")
+    if event_type not in ("response", "request_failed"):
+        return None
+
+    har_request = {
+        "method": event.get("method") or getattr(request, "method", "GET"),
+        "url": event["url"],
+        "httpVersion": "HTTP/1.1",
+        "cookies": [],
+        "headers": [],
+        "queryString": [],
+        "headersSize": -1,
+        "bodySize": -1,
+    }
+    if request is not None:
+        try:
+            har_request["headers"] = _har_headers(dict(request.headers))
+            post_data = request.post_data
+            if post_data:
+                har_request["postData"] = {
+                    "mimeType": request.headers.get("content-type", ""),
+                    "text": post_data,
+                }
+        except Exception:
+            pass
+
+    # Playwright timings are ms offsets from startTime, -1 when not available
+    timing = event.get("request_timing") or {}
+
+    def span(start: str, end: str) -> float:
+        a, b = timing.get(start, -1), timing.get(end, -1)
+        return max(b - a, 0) if a >= 0 and b >= 0 else -1
+
+    timings = {
+        "blocked": -1,
+        "dns": span("domainLookupStart", "domainLookupEnd"),
+        "connect": span("connectStart", "connectEnd"),
+        "ssl": span("secureConnectionStart", "connectEnd"),
+        "send": 0,
+        "wait": span("requestStart", "responseStart"),
+        "receive": span("responseStart", "responseEnd"),
+    }
+    total = timing.get("responseEnd", -1)
+
+    if event_type == "response":
+        headers = event.get("headers") or {}
+        body = event.get("body") or {}
+        content = {
+            "size": int(headers.get("content-length", -1)) if str(headers.get("content-length", "")).isdigit() else -1,
+            "mimeType": headers.get("content-type", ""),
+        }
+        if body.get("text") is not None:
+            content["text"] = body["text"]
+        if body.get("truncated"):
+            content["comment"] = "truncated"
+        har_response = {
+            "status": event["status"],
+            "statusText": event.get("status_text", ""),
+            "httpVersion": "HTTP/1.1",
+            "cookies": [],
+            "headers": _har_headers(headers),
+            "content": content,
+            "redirectURL": headers.get("location", ""),
+            "headersSize": -1,
+            "bodySize": -1,
+        }
+    else:
+        har_response = {
+            "status": 0,
+            "statusText": "",
+            "httpVersion": "",
+            "cookies": [],
+            "headers": [],
+            "content": {"size": 0, "mimeType": ""},
+            "redirectURL": "",
+            "headersSize": -1,
+            "bodySize": -1,
+            "_failureText": event.get("failure_text"),
+        }
+
+    started = timing.get("startTime")
+    entry = {
+        "startedDateTime": _iso(started / 1000 if started and started > 0 else event["timestamp"]),
+        "time": total if total >= 0 else 0,
+        "request": har_request,
+        "response": har_response,
+        "cache": {},
+        "timings": timings,
+    }
+    if event.get("resource_type"):
+        entry["_resourceType"] = event["resource_type"]
+    return entry
+
+
+class NetworkCapture:
+    """
+    Records the network events of one page for one crawl.
+
+    Usage::
+
+        capture = NetworkCapture(config.network_capture_config, url, logger)
+        await capture.open()        # creates the output file, if streaming
+        capture.attach(page)
+        ...
+        capture.detach(page)
+        await capture.close()
+        capture.entries             # list, or None when streamed to capture.path
+
+    Args:
+        config: Filters and limits. None = capture everything, in memory.
+        url: The crawled URL, used to name the output file.
+        logger: Optional logger.
+    """
+
+    def __init__(self, config: Optional[NetworkCaptureConfig], url: str, logger=None):
+        self.config = config or NetworkCaptureConfig()
+        self.url = url
+        self.logger = logger
+        self.path: Optional[str] = None
+        self.dropped = 0  # events rejected by the filters
+        self._buffer = deque(maxlen=self.config.max_entries)
+        self._file = None
+        self._written = 0
+        self._lock = asyncio.Lock()
+        self._closed = False
+
+    # ------------------------------------------------------------------ output
+
+    @property
+    def streaming(self) -> bool:
+        return self.config.output_dir is not None
+
+    @property
+    def entries(self) -> Optional[List[Dict[str, Any]]]:
+        """Captured events, oldest first. None when they were streamed to a file."""
+        return None if self.streaming else list(self._buffer)
+
+    async def open(self) -> None:
+        if not self.streaming:
+            return
+        os.makedirs(self.config.output_dir, exist_ok=True)
+        name = "{}-{}.{}".format(
+            hashlib.sha256(self.url.encode("utf-8")).hexdigest()[:16],
+            int(time.time() * 1000),
+            self.config.output_format,
+        )
+        self.path = os.path.join(self.config.output_dir, name)
+        self._file = await aiofiles.open(self.path, "w", encoding="utf-8")
+        if self.config.output_format == "har":
+            await self._file.write(_HAR_HEADER % __version__)
+
+    async def close(self) -> None:
+        """Finish the output file. Events that arrive afterwards are ignored."""
+        async with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            if self._file is not None:
+                if self.config.output_format == "har":
+                    await self._file.write(_HAR_FOOTER)
+                await self._file.close()
+
+    async def _emit(self, event: Dict[str, Any], request=None) -> None:
+        if self._closed:
+            return
+        if not self.streaming:
+            self._buffer.append(event)
+            return
+        if self.config.output_format == "har":
+            entry = har_entry(event, request)
+            if entry is None:
+                return
+            line = ("" if self._written == 0 else ",\n") + json.dumps(entry, default=str)
+        else:
+            line = json.dumps(event, default=str) + "\n"
+        # Handlers run concurrently; keep lines (and HAR commas) whole
+        async with self._lock:
+            if self._closed:
+                return
+            await self._file.write(line)
+            self._written += 1
+
+    # ----------------------------------------------------------------- filters
+
+    def _wanted(self, url: str, resource_type: Optional[str], status: Optional[int] = None) -> bool:
+        config = self.config
+        if config.resource_types is not None and resource_type not in config.resource_types:
+            return False
+        if config.url_patterns is not None and not any(fnmatch(url, p) for p in config.url_patterns):
+            return False
+        if status is not None and config.status_ranges is not None:
+            if not any(low <= status <= high for low, high in config.status_ranges):
+                return False
+        return True
+
+    async def _read_body(self, response, resource_type: Optional[str], headers: Dict[str, str]) -> Dict[str, Any]:
+        limit = self.config.max_body_size
+        body_types = self.config.body_resource_types
+        if limit == 0 or (body_types is not None and resource_type not in body_types):
+            return {"text": None, "truncated": False}
+        length = headers.get("content-length", "")
+        if limit is not None and length.isdigit() and int(length) > limit:
+            # Not worth pulling a large body over CDP just to cut it
+            return {"text": None, "truncated": True, "size": int(length)}
+        try:
+            data = await response.body()
+        except Exception:
+            return {"text": None, "truncated": False}
+        truncated = limit is not None and len(data) > limit
+        if truncated:
+            data = data[:limit]
+        return {"text": data.decode("utf-8", errors="replace"), "truncated": truncated}
+
+    # ---------------------------------------------------------------- handlers
+
+    def _warn(self, what: str, url: str, error: Exception) -> None:
+        if self.logger:
+            self.logger.warning(f"Error capturing {what} for {url}: {error}", tag="CAPTURE")
+
+    async def on_request(self, request) -> None:
+        try:
+            if not self._wanted(request.url, request.resource_type):
+                self.dropped += 1
+                return
+            post_data_str = None
+            try:
+                # Be cautious with large post data
+                post_data = request.post_data_buffer
+                if post_data:
+                    post_data_str = post_data.decode("utf-8", errors="replace")
+            except Exception:
+                post_data_str = "[Error retrieving post data]"
+
+            await self._emit({
+                "event_type": "request",
+                "url": request.url,
+                "method": request.method,
+                "headers": dict(request.headers),
+                "post_data": post_data_str,
+                "resource_type": request.resource_type,
+                "is_navigation_request": request.is_navigation_request(),
+                "timestamp": time.time(),
+            })
+        except Exception as e:
+            self._warn("request details", request.url, e)
+            await self._emit({"event_type": "request_capture_error", "url": request.url, "error": str(e), "timestamp": time.time()})
+
+    async def on_response(self, response) -> None:
+        try:
+            request = response.request
+            resource_type = request.resource_type
+            if not self._wanted(response.url, resource_type, response.status):
+                self.dropped += 1
+                return
+            headers = dict(response.headers)
+            body = await self._read_body(response, resource_type, headers)
+            await self._emit({
+                "event_type": "response",
+                "url": response.url,
+                "status": response.status,
+                "status_text": response.status_text,
+                "headers": headers,
+                "from_service_worker": response.from_service_worker,
+                "request_timing": request.timing,  # Detailed timing info
+                "resource_type": resource_type,
+                "timestamp": time.time(),
+                "body": body,
+            }, request)
+        except Exception as e:
+            self._warn("response details", response.url, e)
+            await self._emit({"event_type": "response_capture_error", "url": response.url, "error": str(e), "timestamp": time.time()})
+
+    async def on_request_failed(self, request) -> None:
+        try:
+            if not self._wanted(request.url, request.resource_type):
+                self.dropped += 1
+                return
+            await self._emit({
+                "event_type": "request_failed",
+                "url": request.url,
+                "method": request.method,
+                "resource_type": request.resource_type,
+                "failure_text": str(request.failure) if request.failure else "Unknown failure",
+                "timestamp": time.time(),
+            }, request)
+        except Exception as e:
+            self._warn("request failed details", request.url, e)
+            await self._emit({"event_type": "request_failed_capture_error", "url": request.url, "error": str(e), "timestamp": time.time()})
+
+    def attach(self, page) -> "NetworkCapture":
+        listen(page, "request", self.on_request)
+        listen(page, "response", self.on_response)
+        listen(page, "requestfailed", self.on_request_failed)
+        return self
+
+    def detach(self, page) -> None:
+        unlisten(page, "request", self.on_request)
+        unlisten(page, "response", self.on_response)
+        unlisten(page, "requestfailed", self.on_request_failed)
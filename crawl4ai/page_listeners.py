@@ -0,0 +1,30 @@
+"""
+Bookkeeping of the event handlers crawl4ai attaches to Playwright pages.
+
+A pooled page is only reused once every handler a crawl attached has been
+removed again. Playwright has no public way to list a page's listeners, so
+code that attaches handlers goes through listen()/unlisten(), which record
+them here.
+"""
+
+import weakref
+from typing import Callable, Set, Tuple
+
+_attached: "weakref.WeakKeyDictionary[object, Set[Tuple[str, Callable]]]" = weakref.WeakKeyDictionary()
+
+
+def listen(page, event: str, handler: Callable) -> None:
+    """``page.on(event, handler)``, recorded until unlisten()."""
+    page.on(event, handler)
+    _attached.setdefault(page, set()).add((event, handler))
+
+
+def unlisten(page, event: str, handler: Callable) -> None:
+    """``page.remove_listener(event, handler)`` for a handler added with listen()."""
+    page.remove_listener(event, handler)
+    _attached.get(page, set()).discard((event, handler))
+
+
+def attached_listeners(page) -> int:
+    """Handlers added to ``page`` with listen() and not removed yet."""
+    return len(_attached.get(page, ()))
@@ -0,0 +1,263 @@
+"""
+Request blocking for browser contexts.
+
+BrowserConfig(text_mode / avoid_css / avoid_ads) decide which subresources a
+crawl does not need. Instead of registering one ``context.route`` glob per
+extension and tracker (Playwright tests every request against every route),
+the rules are compiled once into a RequestBlocker:
+
+- resource types (image, media, font, stylesheet) as a set,
+- file extensions as a set, looked up on the URL path,
+- tracker domains as a suffix trie, so subdomains match too.
+
+Two backends apply the rules to a context:
+
+- ``"route"`` (default): a single ``context.route("**/*")`` handler.
+- ``"cdp"`` (Chromium only): ``Network.setBlockedURLs`` on each page, so
+  blocked requests fail inside the browser and never reach Python. Resource
+  types cannot be expressed as URL patterns and are not blocked there.
+
+Counters of blocked requests and an estimate of the bytes saved are kept
+in ``RequestBlocker.stats``.
+"""
+
+import asyncio
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlsplit
+
+# CSS extensions (blocked via avoid_css)
+CSS_EXTENSIONS = ("css", "less", "scss", "sass")
+
+# Static resource extensions (blocked when text_mode is enabled)
+STATIC_EXTENSIONS = (
+    # Images
+    "jpg", "jpeg", "png", "gif", "webp", "svg", "ico", "bmp", "tiff", "psd",
+    # Fonts
+    "woff", "woff2", "ttf", "otf", "eot",
+    # Media
+    "mp4", "webm", "ogg", "avi", "mov", "wmv", "flv", "m4v",
+    "mp3", "wav", "aac", "m4a", "opus", "flac",
+    # Documents
+    "pdf", "doc", "docx", "xls", "xlsx", "ppt", "pptx",
+    # Archives
+    "zip", "rar", "7z", "tar", "gz",
+    # Scripts and data
+    "xml", "swf", "wasm",
+)
+
+# Ad and tracker domains (curated from uBlock/EasyList sources). Subdomains match.
+AD_TRACKER_DOMAINS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googlesyndication.com",
+    "doubleclick.net",
+    "adservice.google.com",
+    "adsystem.com",
+    "adzerk.net",
+    "adnxs.com",
+    "ads.linkedin.com",
+    "facebook.net",
+    "analytics.twitter.com",
+    "ads-twitter.com",
+    "hotjar.com",
+    "clarity.ms",
+    "scorecardresearch.com",
+    "pixel.wp.com",
+    "amazon-adsystem.com",
+    "mixpanel.com",
+    "segment.com",
+)
+
+TEXT_MODE_RESOURCE_TYPES = ("image", "media", "font")
+CSS_RESOURCE_TYPES = ("stylesheet",)
+
+# Typical transfer size per resource type (HTTP Archive medians, rounded).
+# Blocked requests are never fetched, so bytes saved can only be estimated.
+TYPICAL_SIZES = {
+    "image": 15_000,
+    "media": 250_000,
+    "font": 30_000,
+    "stylesheet": 10_000,
+    "script": 20_000,
+    "xhr": 2_000,
+    "fetch": 2_000,
+    "document": 30_000,
+}
+DEFAULT_TYPICAL_SIZE = 5_000
+
+
+class _DomainSuffixTrie:
+    """Matches a host against a set of domains, including their subdomains."""
+
+    _END = object()
+
+    def __init__(self, domains: Iterable[str] = ()):
+        self._root: Dict = {}
+        self.domains = []
+        for domain in domains:
+            self.add(domain)
+
+    def add(self, domain: str) -> None:
+        domain = domain.strip(".").lower()
+        node = self._root
+        for label in reversed(domain.split(".")):
+            node = node.setdefault(label, {})
+        node[self._END] = True
+        self.domains.append(domain)
+
+    def matches(self, host: str) -> bool:
+        node = self._root
+        for label in reversed(host.strip(".").lower().split(".")):
+            node = node.get(label)
+            if node is None:
+                return False
+            if self._END in node:
+                return True
+        return False
+
+    def __bool__(self) -> bool:
+        return bool(self._root)
+
+
+class RequestBlocker:
+    """
+    Compiled request-blocking rules plus counters, shared by all contexts of a browser.
+
+    Args:
+        resource_types: Playwright resource types to block (e.g. "image").
+        extensions: File extensions to block, without the dot.
+        domains: Domains to block, subdomains included.
+        backend: "route" (Playwright routing) or "cdp" (Network.setBlockedURLs,
+            Chromium only).
+    """
+
+    BACKENDS = ("route", "cdp")
+
+    def __init__(
+        self,
+        resource_types: Iterable[str] = (),
+        extensions: Iterable[str] = (),
+        domains: Iterable[str] = (),
+        backend: str = "route",
+    ):
+        if backend not in self.BACKENDS:
+            raise ValueError(f"backend must be one of {self.BACKENDS}, got {backend!r}")
+        self.resource_types = frozenset(resource_types)
+        self.extensions = frozenset(e.lower().lstrip(".") for e in extensions)
+        self.domains = _DomainSuffixTrie(domains)
+        self.backend = backend
+        self.stats = {"blocked": 0, "estimated_bytes_saved": 0, "by_reason": {}}
+        self._page_tasks: Dict = {}  # page -> pending CDP setup task
+
+    @classmethod
+    def from_browser_config(cls, config) -> Optional["RequestBlocker"]:
+        """Rules implied by text_mode / avoid_css / avoid_ads, or None if nothing is blocked."""
+        resource_types, extensions, domains = [], [], []
+        if config.avoid_css:
+            resource_types += CSS_RESOURCE_TYPES
+            extensions += CSS_EXTENSIONS
+        if config.text_mode:
+            resource_types += TEXT_MODE_RESOURCE_TYPES
+            extensions += STATIC_EXTENSIONS
+        if config.avoid_ads:
+            domains += AD_TRACKER_DOMAINS
+        if not (resource_types or extensions or domains):
+            return None
+        backend = getattr(config, "request_blocking_backend", "route")
+        if backend == "cdp" and config.browser_type != "chromium":
+            backend = "route"
+        return cls(resource_types, extensions, domains, backend=backend)
+
+    def match(self, url: str, resource_type: Optional[str] = None) -> Optional[str]:
+        """The reason ("resource_type", "extension", "domain") to block a request, or None."""
+        if resource_type and resource_type in self.resource_types:
+            return "resource_type"
+        try:
+            parts = urlsplit(url)
+        except ValueError:
+            return None
+        if parts.scheme not in ("http", "https"):
+            return None
+        if self.domains and parts.hostname and self.domains.matches(parts.hostname):
+            return "domain"
+        if self.extensions:
+            last = parts.path.rsplit("/", 1)[-1]
+            if "." in last and last.rsplit(".", 1)[-1].lower() in self.extensions:
+                return "extension"
+        return None
+
+    def record(self, reason: str, resource_type: Optional[str] = None) -> None:
+        self.stats["blocked"] += 1
+        self.stats["estimated_bytes_saved"] += TYPICAL_SIZES.get(resource_type, DEFAULT_TYPICAL_SIZE)
+        by_reason = self.stats["by_reason"]
+        by_reason[reason] = by_reason.get(reason, 0) + 1
+
+    # Route backend
+
+    async def _handle_route(self, route) -> None:
+        request = route.request
+        reason = self.match(request.url, request.resource_type)
+        if reason is None:
+            # fallback, not continue_: routes registered later (user hooks) still apply
+            await route.fallback()
+            return
+        self.record(reason, request.resource_type)
+        await route.abort("blockedbyclient")
+
+    # CDP backend
+
+    def url_patterns(self):
+        """Network.setBlockedURLs patterns equivalent to the extension and domain rules."""
+        patterns = []
+        for ext in sorted(self.extensions):
+            patterns += [f"*.{ext}", f"*.{ext}?*", f"*.{ext}#*"]
+        for domain in self.domains.domains:
+            patterns += [f"*://{domain}/*", f"*://*.{domain}/*"]
+        return patterns
+
+    async def _block_in_page(self, context, page) -> None:
+        session = await context.new_cdp_session(page)
+        resource_types = {}
+
+        def on_request(params):
+            resource_types[params["requestId"]] = params.get("type", "").lower()
+
+        def on_failed(params):
+            rtype = resource_types.pop(params.get("requestId"), None)
+            if params.get("blockedReason"):
+                self.record("cdp", rtype)
+
+        def on_finished(params):
+            resource_types.pop(params.get("requestId"), None)
+
+        session.on("Network.requestWillBeSent", on_request)
+        session.on("Network.loadingFailed", on_failed)
+        session.on("Network.loadingFinished", on_finished)
+        await session.send("Network.enable")
+        await session.send("Network.setBlockedURLs", {"urls": self.url_patterns()})
+
+    def _on_page(self, context, page) -> None:
+        task = asyncio.ensure_future(self._block_in_page(context, page))
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        self._page_tasks[page] = task
+        page.once("close", lambda _: self._page_tasks.pop(page, None))
+
+    async def ready(self, page) -> None:
+        """Wait until a page's CDP blocking is in place (no-op for the route backend)."""
+        task = self._page_tasks.get(page)
+        if task is not None:
+            try:
+                await task
+            except Exception:
+                pass  # page closed while attaching; nothing to block
+
+    # Attach
+
+    async def attach(self, context) -> None:
+        """Apply the rules to every current and future page of ``context``."""
+        if self.backend == "route":
+            await context.route("**/*", self._handle_route)
+            return
+        context.on("page", lambda page: self._on_page(context, page))
+        for page in context.pages:
+            self._on_page(context, page)
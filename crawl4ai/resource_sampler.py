@@ -0,0 +1,291 @@
+"""
+Process-wide resource sampling.
+
+A single ResourceSampler thread reads memory (and CPU) figures at a fixed
+cadence and keeps a bounded history. Dispatchers, the CrawlerMonitor and any
+other component read the latest sample or subscribe to new ones instead of
+issuing their own psutil calls for every task.
+
+Memory is read from the cgroup files when the process runs under a memory
+limit (containers), since that limit is what triggers the OOM killer; the
+host-wide figures from psutil are used otherwise.
+
+For debugging, ``trace_allocations=True`` turns on tracemalloc and
+attributes live Python allocations to crawl stages (fetch, scraping,
+markdown, extraction, ...) by the module that made them.
+"""
+
+import os
+import threading
+import time
+import tracemalloc
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+import psutil
+
+from .utils import get_true_memory_usage_percent
+
+MB = 1024 * 1024
+
+
+@dataclass
+class ResourceSample:
+    """One reading of the resources used by this process and its container."""
+
+    timestamp: float
+    memory_percent: float
+    memory_used_mb: float
+    memory_limit_mb: float
+    rss_mb: float
+    cpu_percent: float
+    source: str  # "cgroup" or "host"
+
+
+class _CgroupMemory:
+    """Reads memory usage and limit from cgroup v2 or v1 files."""
+
+    V2_FILES = ("memory.current", "memory.max", "memory.stat", "inactive_file")
+    V1_FILES = (
+        "memory/memory.usage_in_bytes",
+        "memory/memory.limit_in_bytes",
+        "memory/memory.stat",
+        "total_inactive_file",
+    )
+
+    def __init__(self, root: str = "/sys/fs/cgroup"):
+        self.files = None
+        for current, limit, stat, inactive_key in (self.V2_FILES, self.V1_FILES):
+            if os.path.exists(os.path.join(root, current)):
+                self.files = (
+                    os.path.join(root, current),
+                    os.path.join(root, limit),
+                    os.path.join(root, stat),
+                    inactive_key,
+                )
+                break
+
+    @staticmethod
+    def _read(path: str) -> Optional[str]:
+        try:
+            with open(path, "r") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def read(self, host_total: int) -> Optional[Tuple[int, int]]:
+        """(used, limit) in bytes, or None when no memory limit applies."""
+        if self.files is None:
+            return None
+        current_path, limit_path, stat_path, inactive_key = self.files
+        limit_raw = (self._read(limit_path) or "").strip()
+        # v2 writes "max" and v1 a huge number when there is no limit.
+        if not limit_raw.isdigit() or int(limit_raw) >= host_total:
+            return None
+        current_raw = (self._read(current_path) or "").strip()
+        if not current_raw.isdigit():
+            return None
+
+        used = int(current_raw)
+        # Like `docker stats`, reclaimable page cache does not count as used.
+        for line in (self._read(stat_path) or "").splitlines():
+            key, _, value = line.partition(" ")
+            if key == inactive_key and value.strip().isdigit():
+                used = max(0, used - int(value))
+                break
+        return used, int(limit_raw)
+
+
+class ResourceSampler:
+    """
+    Samples process and container resources on a background thread.
+
+    Components call ``acquire()`` when they start and ``release()`` when they
+    stop; the thread runs while at least one component holds the sampler.
+    ``latest`` returns the newest sample without any system call once the
+    thread is running. Subscribers receive every new sample on the sampler
+    thread, so callbacks must be quick and thread-safe.
+
+    Most code should use the process-wide instance from ``ResourceSampler.shared()``.
+
+    Args:
+        interval: Seconds between samples.
+        history_size: Number of samples kept in the ring buffer.
+        trace_allocations: Start tracemalloc and record allocations per
+            crawl stage with every ``trace_every``-th sample. Slows the
+            process down noticeably; meant for debugging.
+        trace_every: Sample count between tracemalloc snapshots.
+        cgroup_root: Mount point of the cgroup filesystem.
+    """
+
+    # Module name fragment -> crawl stage, for allocation attribution.
+    STAGES = {
+        "async_crawler_strategy": "fetch",
+        "browser_manager": "browser",
+        "playwright": "browser",
+        "content_scraping_strategy": "scraping",
+        "lxml": "scraping",
+        "markdown_generation_strategy": "markdown",
+        "html2text": "markdown",
+        "content_filter_strategy": "filtering",
+        "extraction_strategy": "extraction",
+        "chunking_strategy": "extraction",
+        "async_database": "cache",
+        "cache_context": "cache",
+        "async_dispatcher": "dispatch",
+        "async_webcrawler": "pipeline",
+    }
+
+    _shared: Optional["ResourceSampler"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        interval: float = 1.0,
+        history_size: int = 600,
+        trace_allocations: bool = False,
+        trace_every: int = 10,
+        cgroup_root: str = "/sys/fs/cgroup",
+    ):
+        self.interval = interval
+        self.history: Deque[ResourceSample] = deque(maxlen=history_size)
+        self.trace_allocations = trace_allocations
+        self.trace_every = max(1, trace_every)
+        self.stage_allocations: Dict[str, int] = {}
+        self._cgroup = _CgroupMemory(cgroup_root)
+        self._process = psutil.Process()
+        self._process.cpu_percent(None)  # prime the CPU counter
+        self._subscribers: List[Callable[[ResourceSample], None]] = []
+        self._lock = threading.Lock()
+        self._refs = 0
+        self._ticks = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._latest: Optional[ResourceSample] = None
+        self._owns_tracing = False
+
+    @classmethod
+    def shared(cls) -> "ResourceSampler":
+        """The process-wide sampler, created on first use."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def sample_now(self) -> ResourceSample:
+        """Take a sample immediately, without recording it in the history."""
+        host = psutil.virtual_memory()
+        cgroup = self._cgroup.read(host.total)
+        if cgroup:
+            used, limit = cgroup
+            percent, source = 100.0 * used / limit, "cgroup"
+        else:
+            used, limit = host.total - host.available, host.total
+            percent, source = get_true_memory_usage_percent(), "host"
+        return ResourceSample(
+            timestamp=time.time(),
+            memory_percent=percent,
+            memory_used_mb=used / MB,
+            memory_limit_mb=limit / MB,
+            rss_mb=self._process.memory_info().rss / MB,
+            cpu_percent=self._process.cpu_percent(None),
+            source=source,
+        )
+
+    @property
+    def latest(self) -> ResourceSample:
+        """The newest sample; taken on the spot if the thread has not produced one yet."""
+        sample = self._latest
+        if sample is None or not self.running:
+            sample = self._latest = self.sample_now()
+        return sample
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def peak(self, since: float) -> Optional[ResourceSample]:
+        """The sample with the highest RSS taken at or after ``since``."""
+        samples = [s for s in list(self.history) if s.timestamp >= since]
+        return max(samples, key=lambda s: s.rss_mb) if samples else None
+
+    def subscribe(self, callback: Callable[[ResourceSample], None]) -> Callable[[], None]:
+        """Call ``callback`` with every new sample. Returns a function that unsubscribes."""
+        with self._lock:
+            self._subscribers.append(callback)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    def acquire(self) -> "ResourceSampler":
+        """Register a user of the sampler, starting the thread if needed."""
+        with self._lock:
+            self._refs += 1
+            if not self.running:
+                self._stop.clear()
+                if self.trace_allocations and not tracemalloc.is_tracing():
+                    tracemalloc.start()
+                    self._owns_tracing = True
+                self._tick()
+                self._thread = threading.Thread(
+                    target=self._run, name="crawl4ai-resource-sampler", daemon=True
+                )
+                self._thread.start()
+        return self
+
+    def release(self) -> None:
+        """Unregister a user; the thread stops when the last one leaves."""
+        with self._lock:
+            self._refs = max(0, self._refs - 1)
+            if self._refs or self._thread is None:
+                return
+            self._stop.set()
+            thread, self._thread = self._thread, None
+        thread.join(timeout=self.interval + 1)
+        if self._owns_tracing:
+            tracemalloc.stop()
+            self._owns_tracing = False
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._tick()
+
+    def _tick(self) -> None:
+        try:
+            sample = self.sample_now()
+        except Exception:
+            return
+        self._latest = sample
+        self.history.append(sample)
+        self._ticks += 1
+        if self.trace_allocations and self._ticks % self.trace_every == 0:
+            self.stage_allocations = self.allocations_by_stage()
+        for callback in list(self._subscribers):
+            try:
+                callback(sample)
+            except Exception:
+                pass
+
+    def allocations_by_stage(self) -> Dict[str, int]:
+        """
+        Bytes of live Python allocations per crawl stage, from a tracemalloc snapshot.
+
+        Allocations are attributed to the stage of the innermost crawl4ai (or
+        known dependency) frame; everything else is reported as "other".
+        Returns an empty dict when tracemalloc is not tracing.
+        """
+        if not tracemalloc.is_tracing():
+            return {}
+        totals: Dict[str, int] = {}
+        for stat in tracemalloc.take_snapshot().statistics("filename"):
+            filename = stat.traceback[0].filename
+            stage = next(
+                (name for key, name in self.STAGES.items() if key in filename), "other"
+            )
+            totals[stage] = totals.get(stage, 0) + stat.size
+        return dict(sorted(totals.items(), key=lambda kv: kv[1], reverse=True))
@@ -0,0 +1,127 @@
+"""
+CPU-side screenshot processing: stitching, downscaling, encoding, file sink.
+
+The crawler strategy captures raw image bytes with Playwright and hands them
+to these functions through ``asyncio.to_thread``, so decoding and encoding
+multi-megabyte images never blocks the event loop. PIL releases the GIL for
+most of this work, so a thread is enough.
+"""
+
+import base64
+import hashlib
+import os
+from io import BytesIO
+from typing import List, Optional
+
+from PIL import Image, ImageDraw, ImageFont
+
+FORMATS = {"png": "PNG", "jpeg": "JPEG", "webp": "WEBP"}
+EXTENSIONS = {"png": "png", "jpeg": "jpg", "webp": "webp"}
+
+
+def normalize_format(fmt: Optional[str]) -> str:
+    fmt = (fmt or "png").lower()
+    if fmt == "jpg":
+        fmt = "jpeg"
+    if fmt not in FORMATS:
+        raise ValueError(f"screenshot_format must be one of {sorted(FORMATS)}, got {fmt!r}")
+    return fmt
+
+
+def _fit(img: Image.Image, max_width: Optional[int], max_height: Optional[int]) -> Image.Image:
+    """Downscale ``img`` (keeping its aspect ratio) to fit within the given bounds."""
+    scale = 1.0
+    if max_width and img.width > max_width:
+        scale = min(scale, max_width / img.width)
+    if max_height and img.height > max_height:
+        scale = min(scale, max_height / img.height)
+    if scale >= 1.0:
+        return img
+    size = (max(1, int(img.width * scale)), max(1, int(img.height * scale)))
+    return img.resize(size, Image.LANCZOS)
+
+
+def encode_image(
+    img: Image.Image,
+    fmt: str = "png",
+    quality: int = 85,
+    max_width: Optional[int] = None,
+    max_height: Optional[int] = None,
+) -> bytes:
+    """Encode a PIL image, downscaled to the bounds, as PNG, JPEG or WebP bytes."""
+    fmt = normalize_format(fmt)
+    img = _fit(img, max_width, max_height)
+    if fmt != "png" and img.mode not in ("RGB", "L"):
+        img = img.convert("RGB")
+    buffered = BytesIO()
+    if fmt == "png":
+        img.save(buffered, format="PNG", optimize=False)
+    else:
+        img.save(buffered, format=FORMATS[fmt], quality=quality)
+    return buffered.getvalue()
+
+
+def reencode(
+    data: bytes,
+    fmt: str = "png",
+    quality: int = 85,
+    max_width: Optional[int] = None,
+    max_height: Optional[int] = None,
+) -> bytes:
+    """Re-encode captured image bytes into the requested format and bounds."""
+    with Image.open(BytesIO(data)) as img:
+        img.load()
+        return encode_image(img, fmt, quality, max_width, max_height)
+
+
+def stitch(
+    segments: List[bytes],
+    fmt: str = "png",
+    quality: int = 85,
+    max_width: Optional[int] = None,
+    max_height: Optional[int] = None,
+) -> bytes:
+    """Stack captured viewport segments vertically and encode the result."""
+    images = [Image.open(BytesIO(seg)).convert("RGB") for seg in segments]
+    try:
+        stitched = Image.new("RGB", (images[0].width, sum(img.height for img in images)))
+        offset = 0
+        for img in images:
+            stitched.paste(img, (0, offset))
+            offset += img.height
+        return encode_image(stitched, fmt, quality, max_width, max_height)
+    finally:
+        for img in images:
+            img.close()
+
+
+def error_image(message: str, fmt: str = "jpeg") -> bytes:
+    """A black image carrying ``message`` (JPEG unless ``fmt`` says otherwise), returned when a capture fails."""
+    img = Image.new("RGB", (800, 600), color="black")
+    draw = ImageDraw.Draw(img)
+    font = ImageFont.load_default()
+    draw.text((10, 10), message, fill=(255, 255, 255), font=font)
+    return encode_image(img, fmt)
+
+
+def to_base64(data: bytes) -> str:
+    return base64.b64encode(data).decode("utf-8")
+
+
+def write_to_sink(data: bytes, directory: str, fmt: str = "png") -> str:
+    """
+    Write screenshot bytes to ``directory`` and return the file path.
+
+    Files are named by content hash, so repeated captures of an unchanged
+    page are stored once.
+    """
+    directory = os.path.abspath(os.path.expanduser(directory))
+    os.makedirs(directory, exist_ok=True)
+    name = f"{hashlib.sha256(data).hexdigest()}.{EXTENSIONS[normalize_format(fmt)]}"
+    path = os.path.join(directory, name)
+    if not os.path.exists(path):
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    return path
@@ -0,0 +1,153 @@
+"""
+In-flight request coalescing ("single flight") for AsyncWebCrawler.
+
+When several tasks crawl the same URL at the same time (duplicates in
+``arun_many``, deep-crawl seeds converging on a page, concurrent API
+requests), only the first performs the fetch; the others wait for it and
+receive a copy of its AsyncCrawlResponse. Scraping, markdown and extraction
+still run per caller, with each caller's own config.
+
+Two crawls share a fetch when their keys match: the URL (scheme and host
+case, default port and fragment ignored) plus every CrawlerRunConfig field
+that can change what the crawler strategy returns. Fields listed in
+POST_FETCH_PARAMS only affect processing after the fetch and are left out,
+so configs differing only there still share. Anything not listed counts,
+which errs on the side of fetching twice.
+"""
+
+import asyncio
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+# CrawlerRunConfig fields that play no part in the fetch itself
+POST_FETCH_PARAMS = frozenset({
+    # scraping / cleaning
+    "word_count_threshold", "only_text", "css_selector", "target_elements",
+    "excluded_tags", "excluded_selector", "keep_data_attributes", "keep_attrs",
+    "remove_forms", "prettiify", "parser_type", "scraping_strategy",
+    # extraction / markdown
+    "extraction_strategy", "chunking_strategy", "markdown_generator",
+    "table_extraction", "table_score_threshold",
+    # media and links in the result
+    "image_description_min_word_threshold", "image_score_threshold",
+    "exclude_external_images", "exclude_all_images", "exclude_social_media_domains",
+    "exclude_external_links", "exclude_social_media_links", "exclude_domains",
+    "exclude_internal_links", "preserve_https_for_internal_links", "score_links",
+    "link_preview_config",
+    # cache and orchestration, resolved before the fetch
+    "cache_mode", "bypass_cache", "disable_cache", "no_cache_read", "no_cache_write",
+    "check_cache_freshness", "cache_validation_timeout", "coalesce_requests",
+    "check_robots_txt", "max_retries", "fallback_fetch_function",
+    "proxy_rotation_strategy", "proxy_session_id", "proxy_session_ttl",
+    "proxy_session_auto_release", "deep_crawl_strategy", "stream", "url",
+    "url_matcher", "match_mode", "semaphore_count", "mean_delay", "max_range",
+    "verbose", "shared_data",
+})
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+class _LeaderCancelled(Exception):
+    """The task performing a shared fetch was cancelled; followers fetch themselves"""
+    pass
+
+
+def coalesce_url(url: str) -> str:
+    """``url`` with the differences that cannot change the response removed."""
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+    if parts.scheme not in _DEFAULT_PORTS:
+        return url
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != _DEFAULT_PORTS[parts.scheme]:
+        host = f"{host}:{parts.port}"
+    if parts.username or parts.password:
+        return url  # credentials are part of the request
+    return urlunsplit((parts.scheme.lower(), host, parts.path or "/", parts.query, ""))
+
+
+def _freeze(value: Any, depth: int = 0) -> Hashable:
+    if value is None or isinstance(value, (str, bytes, int, float, bool)):
+        return value
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _freeze(v, depth + 1)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = tuple(_freeze(v, depth + 1) for v in value)
+        return tuple(sorted(items, key=repr)) if isinstance(value, (set, frozenset)) else items
+    if isinstance(value, Enum):
+        return value.value
+    if depth < 3 and hasattr(value, "__dict__") and not callable(value):
+        # Small config objects (ProxyConfig, GeolocationConfig, ...) compare by content
+        return (type(value).__name__, _freeze(vars(value), depth + 1))
+    return (type(value).__name__, id(value))
+
+
+def fetch_key(url: str, config, extra: Optional[Dict[str, Any]] = None) -> Hashable:
+    """The single-flight key of fetching ``url`` with ``config`` (and strategy kwargs ``extra``)."""
+    fields = tuple(
+        (name, _freeze(value))
+        for name, value in sorted(vars(config).items())
+        if name not in POST_FETCH_PARAMS
+    )
+    return coalesce_url(url), fields, _freeze(extra or {})
+
+
+class SingleFlight:
+    """
+    Table of in-flight calls; concurrent calls with the same key share one.
+
+    ``stats`` counts the calls that ran ("leaders") and the calls that were
+    served by another call's result ("followers").
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        self.stats = {"leaders": 0, "followers": 0}
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    async def do(
+        self,
+        key: Hashable,
+        fn: Callable[[], Awaitable[Any]],
+        share: Callable[[Any], Any] = lambda result: result,
+    ) -> Any:
+        """
+        Return ``await fn()``, or the result of the identical call already in
+        flight (passed through ``share``, e.g. to copy it). Exceptions are
+        shared too; a cancelled leader makes its followers call ``fn`` themselves.
+        """
+        while True:
+            future = self._calls.get(key)
+            if future is None:
+                break
+            try:
+                result = await asyncio.shield(future)
+            except _LeaderCancelled:
+                continue
+            self.stats["followers"] += 1
+            return share(result)
+
+        future = asyncio.get_running_loop().create_future()
+        # Nobody may be waiting; do not warn about an unretrieved exception
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._calls[key] = future
+        self.stats["leaders"] += 1
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.set_exception(_LeaderCancelled())
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
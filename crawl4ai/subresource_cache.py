@@ -0,0 +1,226 @@
+"""
+Shared on-disk cache for page subresources (scripts, stylesheets, fonts, images).
+
+Browser contexts start with an empty HTTP cache and are recycled often
+(LRU eviction, max_pages_before_recycle), so a deep crawl re-downloads the
+same bundles on nearly every page. With BrowserConfig(subresource_cache_dir=...)
+every context routes static subresource requests through a SubresourceCache:
+
+- a fresh cached response is served straight from disk,
+- otherwise the request is fetched, and stored if its Cache-Control /
+  Expires headers allow a shared cache to keep it.
+
+Bodies are content-addressed (``blobs/<sha256>``), so identical files served
+under different URLs are stored once. Per-URL metadata lives in
+``index/<sha256(url)>.json``. The directory can be shared by contexts,
+browser shards and separate runs.
+"""
+
+import hashlib
+import json
+import os
+import re
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+import aiofiles
+
+# Resource types worth caching across pages of a site
+CACHEABLE_RESOURCE_TYPES = frozenset({"script", "stylesheet", "font", "image"})
+
+# Headers that describe the transfer, not the body Playwright hands us (already decoded)
+_DROP_HEADERS = frozenset({
+    "content-encoding", "content-length", "transfer-encoding", "connection",
+    "keep-alive", "set-cookie", "date", "age",
+})
+
+_MAX_AGE = re.compile(r"(?:^|,)\s*(s-maxage|max-age)\s*=\s*\"?(\d+)", re.IGNORECASE)
+
+
+def freshness_lifetime(headers: Dict[str, str], now: Optional[float] = None) -> Optional[float]:
+    """
+    Seconds a shared cache may reuse a response, or None if it must not store it.
+
+    Follows RFC 9111 for shared caches, without heuristic freshness: only
+    explicit s-maxage / max-age / Expires make a response cacheable.
+    """
+    headers = {k.lower(): v for k, v in headers.items()}
+    cache_control = headers.get("cache-control", "").lower()
+    directives = {d.strip().split("=", 1)[0] for d in cache_control.split(",")}
+    if directives & {"no-store", "private", "no-cache"}:
+        return None
+    vary = headers.get("vary", "").strip().lower()
+    if vary and vary != "accept-encoding":
+        return None
+
+    ages = dict((name.lower(), int(value)) for name, value in _MAX_AGE.findall(cache_control))
+    if "s-maxage" in ages or "max-age" in ages:
+        lifetime = ages.get("s-maxage", ages.get("max-age"))
+        return lifetime if lifetime > 0 else None
+
+    if "expires" in headers:
+        try:
+            expires = parsedate_to_datetime(headers["expires"]).timestamp()
+        except (TypeError, ValueError):
+            return None
+        lifetime = expires - (now if now is not None else time.time())
+        return lifetime if lifetime > 0 else None
+    return None
+
+
+class SubresourceCache:
+    """
+    Content-addressed disk cache for static subresources, with hit metrics.
+
+    Use ``SubresourceCache.for_directory(path)`` so all browser managers of a
+    process share one instance (and one set of counters) per directory.
+
+    Args:
+        directory: Cache root. Created if missing.
+        max_entry_bytes: Responses larger than this are not stored.
+    """
+
+    _instances: Dict[str, "SubresourceCache"] = {}
+
+    def __init__(self, directory: str, max_entry_bytes: int = 10 * 1024 * 1024):
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+        self.max_entry_bytes = max_entry_bytes
+        self.index_dir = os.path.join(self.directory, "index")
+        self.blob_dir = os.path.join(self.directory, "blobs")
+        os.makedirs(self.index_dir, exist_ok=True)
+        os.makedirs(self.blob_dir, exist_ok=True)
+        self.stats = {"hits": 0, "misses": 0, "stored": 0, "bytes_saved": 0}
+
+    @classmethod
+    def for_directory(cls, directory: str) -> "SubresourceCache":
+        key = os.path.abspath(os.path.expanduser(directory))
+        if key not in cls._instances:
+            cls._instances[key] = cls(key)
+        return cls._instances[key]
+
+    @staticmethod
+    def _hash(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+    def _index_path(self, url: str) -> str:
+        return os.path.join(self.index_dir, self._hash(url.encode("utf-8")) + ".json")
+
+    def _blob_path(self, body_hash: str) -> str:
+        return os.path.join(self.blob_dir, body_hash)
+
+    @staticmethod
+    async def _write_atomic(path: str, data, mode: str) -> None:
+        # Write then rename, so concurrent readers never see a partial file
+        tmp = f"{path}.{os.getpid()}.{id(data)}.tmp"
+        async with aiofiles.open(tmp, mode) as f:
+            await f.write(data)
+        os.replace(tmp, path)
+
+    async def get(self, url: str) -> Optional[dict]:
+        """The fresh cached entry for ``url`` with its body, or None."""
+        try:
+            async with aiofiles.open(self._index_path(url), "r", encoding="utf-8") as f:
+                entry = json.loads(await f.read())
+            if entry.get("url") != url or entry["expires_at"] <= time.time():
+                return None
+            async with aiofiles.open(self._blob_path(entry["body_hash"]), "rb") as f:
+                entry["body"] = await f.read()
+        except (OSError, ValueError, KeyError):
+            return None
+        return entry
+
+    async def put(self, url: str, status: int, headers: Dict[str, str], body: bytes) -> bool:
+        """Store a response if it is cacheable. Returns True if stored."""
+        lifetime = freshness_lifetime(headers)
+        if lifetime is None or status != 200 or len(body) > self.max_entry_bytes:
+            return False
+        body_hash = self._hash(body)
+        blob_path = self._blob_path(body_hash)
+        if not os.path.exists(blob_path):
+            await self._write_atomic(blob_path, body, "wb")
+        entry = {
+            "url": url,
+            "status": status,
+            "headers": {k: v for k, v in headers.items() if k.lower() not in _DROP_HEADERS},
+            "body_hash": body_hash,
+            "stored_at": time.time(),
+            "expires_at": time.time() + lifetime,
+        }
+        await self._write_atomic(self._index_path(url), json.dumps(entry), "w")
+        self.stats["stored"] += 1
+        return True
+
+    async def handle_route(self, route) -> None:
+        """Playwright route handler: serve from disk, or fetch and store."""
+        request = route.request
+        if (
+            request.method != "GET"
+            or request.resource_type not in CACHEABLE_RESOURCE_TYPES
+            or not request.url.startswith(("http://", "https://"))
+            or "authorization" in request.headers
+        ):
+            await route.fallback()
+            return
+
+        entry = await self.get(request.url)
+        if entry is not None:
+            self.stats["hits"] += 1
+            self.stats["bytes_saved"] += len(entry["body"])
+            await route.fulfill(status=entry["status"], headers=entry["headers"], body=entry["body"])
+            return
+
+        self.stats["misses"] += 1
+        try:
+            response = await route.fetch()
+        except Exception:
+            await route.fallback()  # let the browser fetch (and report) it
+            return
+        try:
+            body = await response.body()
+            await self.put(request.url, response.status, response.headers, body)
+        except Exception:
+            pass  # caching is best-effort; the page still gets the response
+        await route.fulfill(response=response)
+
+    async def attach(self, context) -> None:
+        """Route the static subresources of ``context`` through the cache."""
+        await context.route("**/*", self.handle_route)
+
+    def prune(self, max_bytes: int) -> int:
+        """Delete least recently stored entries until blobs fit in ``max_bytes``. Returns bytes freed."""
+        entries = []
+        for name in os.listdir(self.index_dir):
+            path = os.path.join(self.index_dir, name)
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    entry = json.load(f)
+                entries.append((entry["stored_at"], path, entry["body_hash"]))
+            except (OSError, ValueError, KeyError):
+                continue
+        blob_sizes = {}
+        for name in os.listdir(self.blob_dir):
+            try:
+                blob_sizes[name] = os.path.getsize(os.path.join(self.blob_dir, name))
+            except OSError:
+                continue
+        total = sum(blob_sizes.values())
+        freed = 0
+        users = {}
+        for _, _, body_hash in entries:
+            users[body_hash] = users.get(body_hash, 0) + 1
+        for _, path, body_hash in sorted(entries):
+            if total - freed <= max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            users[body_hash] -= 1
+            if users[body_hash] == 0 and body_hash in blob_sizes:
+                try:
+                    os.remove(self._blob_path(body_hash))
+                    freed += blob_sizes[body_hash]
+                except OSError:
+                    pass
+        return freed
@@ -13,6 +13,7 @@ from array import array
 from .html2text import html2text, CustomHTML2Text
 # from .config import *
 from .config import MIN_WORD_THRESHOLD, IMAGE_DESCRIPTION_MIN_WORD_THRESHOLD, IMAGE_SCORE_THRESHOLD, DEFAULT_PROVIDER, PROVIDER_MODELS
+from .dns_cache import cached_httpx_transport
 import httpx
 from socket import gaierror
 from pathlib import Path
@@ -3033,7 +3034,7 @@ class HeadPeekr:
             "Connection": "close"  # Force close after response
         }
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
+            async with httpx.AsyncClient(timeout=timeout, transport=cached_httpx_transport()) as client:
                 response = await client.get(url, headers=headers, follow_redirects=True)
                 
                 # Handle redirects explicitly by using the final URL
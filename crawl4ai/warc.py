@@ -0,0 +1,311 @@
+"""
+WARC (ISO 28500, version 1.1) archives of crawled pages.
+
+WARCWriter records request/response pairs as they are fetched; the HTTP and
+browser strategies write to one when given ``warc_writer=``. Every record
+is its own gzip member, so a record can be read without decompressing the
+records before it, and each response record is listed in a JSONL sidecar
+index (``<file>.idx``: url, offset, length, status, date).
+
+Bodies are stored as the crawler received them, i.e. already decoded from
+any Content-Encoding; the stored headers drop Content-Encoding and
+Transfer-Encoding and carry the real Content-Length so each record is self
+consistent. Redirect hops are stored as their own 3xx records.
+
+read_index() and read_record() are the read side, used by
+WARCReplayCrawlerStrategy; archives from other tools (no sidecar, or one
+plain uncompressed file) are indexed by a single scan.
+"""
+
+import asyncio
+import base64
+import gzip
+import hashlib
+import json
+import mmap
+import os
+import uuid
+import zlib
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+import aiofiles
+
+from .__version__ import __version__
+
+_CRLF = b"\r\n"
+_END_OF_HEADERS = b"\r\n\r\n"
+_GZIP_MAGIC = b"\x1f\x8b"
+_SCAN_CHUNK = 64 * 1024
+_HOP_BY_HOP = {"content-encoding", "transfer-encoding", "content-length", "connection", "keep-alive"}
+
+
+class IndexEntry(NamedTuple):
+    url: str
+    offset: int
+    length: int
+    status: int
+    date: str
+
+
+class WARCRecord(NamedTuple):
+    headers: Dict[str, str]
+    status: int
+    http_headers: Dict[str, str]
+    payload: bytes
+
+
+def _warc_date() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _record_id() -> str:
+    return f"<urn:uuid:{uuid.uuid4()}>"
+
+
+def _header_block(lines: List[str]) -> bytes:
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("utf-8", "replace")
+
+
+def _record(warc_headers: Dict[str, str], block: bytes) -> bytes:
+    head = ["WARC/1.1"] + [f"{name}: {value}" for name, value in warc_headers.items()]
+    head.append(f"Content-Length: {len(block)}")
+    return _header_block(head) + block + _CRLF + _CRLF
+
+
+def _http_response_block(status: int, reason: Optional[str], headers: Dict[str, str], body: bytes) -> bytes:
+    lines = [f"HTTP/1.1 {status} {reason or ''}".rstrip()]
+    lines += [f"{name}: {value}" for name, value in headers.items() if name.lower() not in _HOP_BY_HOP]
+    lines.append(f"Content-Length: {len(body)}")
+    return _header_block(lines) + body
+
+
+def _http_request_block(method: str, url: str, headers: Dict[str, str]) -> bytes:
+    path = url.split("://", 1)[-1]
+    path = "/" + path.split("/", 1)[1] if "/" in path else "/"
+    host = url.split("://", 1)[-1].split("/", 1)[0]
+    lines = [f"{method} {path} HTTP/1.1"]
+    if not any(name.lower() == "host" for name in headers):
+        lines.append(f"Host: {host}")
+    lines += [f"{name}: {value}" for name, value in headers.items()]
+    return _header_block(lines)
+
+
+def _payload_digest(body: bytes) -> str:
+    return "sha1:" + base64.b32encode(hashlib.sha1(body).digest()).decode("ascii")
+
+
+class WARCWriter:
+    """
+    Append request/response records to a WARC file, one gzip member each.
+
+    Safe to share between concurrent crawls and between strategies; records
+    are written whole, in the order they complete.
+
+    Args:
+        path: The .warc.gz file. Appended to if it exists.
+        index: Maintain the ``<path>.idx`` sidecar for fast replay.
+    """
+
+    def __init__(self, path: str, index: bool = True):
+        self.path = path
+        self.index_path = path + ".idx" if index else None
+        self.records = 0
+        self._file = None
+        self._index = None
+        self._offset = 0
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def open(self) -> None:
+        if self._file is not None:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._file = await aiofiles.open(self.path, "ab")
+        self._offset = await self._file.tell()
+        if self.index_path:
+            self._index = await aiofiles.open(self.index_path, "a", encoding="utf-8")
+        if self._offset == 0:
+            info = f"software: crawl4ai/{__version__}\r\nformat: WARC File Format 1.1\r\n".encode("utf-8")
+            await self._append(
+                {
+                    "WARC-Type": "warcinfo",
+                    "WARC-Record-ID": _record_id(),
+                    "WARC-Date": _warc_date(),
+                    "WARC-Filename": os.path.basename(self.path),
+                    "Content-Type": "application/warc-fields",
+                },
+                info,
+            )
+
+    async def close(self) -> None:
+        async with self._lock:
+            if self._file is not None:
+                await self._file.close()
+                self._file = None
+            if self._index is not None:
+                await self._index.close()
+                self._index = None
+
+    async def _append(self, warc_headers: Dict[str, str], block: bytes) -> Tuple[int, int]:
+        # Caller holds the lock (or is open())
+        member = await asyncio.to_thread(gzip.compress, _record(warc_headers, block))
+        offset = self._offset
+        await self._file.write(member)
+        self._offset += len(member)
+        return offset, len(member)
+
+    async def write_exchange(
+        self,
+        url: str,
+        status: int,
+        response_headers: Dict[str, str],
+        body: bytes = b"",
+        request_headers: Optional[Dict[str, str]] = None,
+        method: str = "GET",
+        reason: Optional[str] = None,
+    ) -> None:
+        """Record one fetch: a ``response`` record and its ``request`` record."""
+        body = bytes(body)
+        response_id = _record_id()
+        date = _warc_date()
+        response_block = _http_response_block(status, reason, response_headers or {}, body)
+        request_block = _http_request_block(method, url, request_headers or {})
+
+        async with self._lock:
+            if self._file is None:
+                await self.open()
+            offset, length = await self._append(
+                {
+                    "WARC-Type": "response",
+                    "WARC-Record-ID": response_id,
+                    "WARC-Date": date,
+                    "WARC-Target-URI": url,
+                    "WARC-Payload-Digest": _payload_digest(body),
+                    "Content-Type": "application/http;msgtype=response",
+                },
+                response_block,
+            )
+            await self._append(
+                {
+                    "WARC-Type": "request",
+                    "WARC-Record-ID": _record_id(),
+                    "WARC-Date": date,
+                    "WARC-Target-URI": url,
+                    "WARC-Concurrent-To": response_id,
+                    "Content-Type": "application/http;msgtype=request",
+                },
+                request_block,
+            )
+            if self._index is not None:
+                entry = IndexEntry(url, offset, length, status, date)
+                await self._index.write(json.dumps(entry._asdict()) + "\n")
+            self.records += 1
+
+
+# ---------------------------------------------------------------- reading
+
+
+def _parse_headers(block: bytes) -> Tuple[str, Dict[str, str]]:
+    lines = block.decode("utf-8", "replace").split("\r\n")
+    headers = {}
+    for line in lines[1:]:
+        name, sep, value = line.partition(":")
+        if sep:
+            headers[name.strip()] = value.strip()
+    return lines[0], headers
+
+
+def parse_record(data: bytes) -> WARCRecord:
+    """Parse one uncompressed WARC record (response records carry the HTTP status and headers)."""
+    head_end = data.index(_END_OF_HEADERS)
+    _, headers = _parse_headers(data[:head_end])
+    length = int(headers.get("Content-Length", 0))
+    block = data[head_end + 4 : head_end + 4 + length]
+
+    status, http_headers, payload = 0, {}, block
+    if headers.get("WARC-Type") == "response" and block.startswith(b"HTTP/"):
+        http_end = block.find(_END_OF_HEADERS)
+        if http_end == -1:
+            http_end = len(block)
+        status_line, http_headers = _parse_headers(block[:http_end])
+        parts = status_line.split(" ", 2)
+        status = int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else 0
+        payload = block[http_end + 4 :]
+    return WARCRecord(headers, status, http_headers, payload)
+
+
+def _gzip_members(buffer) -> Iterator[Tuple[int, int, bytes]]:
+    offset, size = 0, len(buffer)
+    while offset < size:
+        decompressor = zlib.decompressobj(wbits=31)
+        chunks, position = [], offset
+        while not decompressor.eof and position < size:
+            chunk = buffer[position : position + _SCAN_CHUNK]
+            chunks.append(decompressor.decompress(chunk))
+            position += len(chunk)
+        if not decompressor.eof:
+            return  # truncated tail, e.g. a crawl still writing
+        end = position - len(decompressor.unused_data)
+        yield offset, end - offset, b"".join(chunks)
+        offset = end
+
+
+def _plain_records(buffer) -> Iterator[Tuple[int, int, bytes]]:
+    offset, size = 0, len(buffer)
+    while offset < size:
+        head_end = buffer.find(_END_OF_HEADERS, offset)
+        if head_end == -1:
+            return
+        _, headers = _parse_headers(bytes(buffer[offset:head_end]))
+        end = head_end + 4 + int(headers.get("Content-Length", 0)) + 4
+        if end > size:
+            return
+        yield offset, end - offset, bytes(buffer[offset:end])
+        offset = end
+
+
+def build_index(path: str) -> List[IndexEntry]:
+    """Index the response records of a WARC file by scanning it once."""
+    entries = []
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return entries
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            records = _gzip_members if buffer[:2] == _GZIP_MAGIC else _plain_records
+            for offset, length, data in records(buffer):
+                record = parse_record(data)
+                if record.headers.get("WARC-Type") == "response":
+                    entries.append(
+                        IndexEntry(
+                            record.headers.get("WARC-Target-URI", "").strip("<>"),
+                            offset,
+                            length,
+                            record.status,
+                            record.headers.get("WARC-Date", ""),
+                        )
+                    )
+    return entries
+
+
+def read_index(path: str) -> List[IndexEntry]:
+    """The response records of ``path``, from its sidecar index when there is one."""
+    index_path = path + ".idx"
+    if os.path.exists(index_path) and os.path.getmtime(index_path) >= os.path.getmtime(path):
+        with open(index_path, encoding="utf-8") as f:
+            return [IndexEntry(**json.loads(line)) for line in f if line.strip()]
+    return build_index(path)
+
+
+def read_record(buffer, offset: int, length: int) -> WARCRecord:
+    """Read the record at ``offset`` from a (memory-mapped) WARC file."""
+    data = buffer[offset : offset + length]
+    if data[:2] == _GZIP_MAGIC:
+        data = zlib.decompress(data, wbits=31)
+    return parse_record(bytes(data))
@@ -0,0 +1,149 @@
+"""
+Crawler strategy that serves pages from WARC archives instead of the web.
+
+Point WARCReplayCrawlerStrategy at the files a WARCWriter produced (or any
+WARC 1.0/1.1 archive) and ``arun`` / ``arun_many`` run the usual scraping,
+markdown and extraction pipeline over the archived responses, which makes
+re-extracting a crawl with a new schema a CPU-only job.
+
+Files are memory-mapped and indexed by URL on start (from the ``.idx``
+sidecar when present); each crawl decompresses only its own record. When a
+URL was archived more than once, the latest record wins. Redirect records
+are followed to the archived target.
+"""
+
+import asyncio
+import glob
+import mmap
+from typing import Dict, List, Optional, Tuple, Union
+from urllib.parse import urljoin
+
+from .async_configs import CrawlerRunConfig
+from .async_crawler_strategy import AsyncCrawlerStrategy
+from .async_logger import AsyncLogger
+from .charset import decode_body, detect_charset, sniff_charset
+from .models import AsyncCrawlResponse
+from .warc import read_index, read_record
+
+
+class WARCRecordNotFound(KeyError):
+    """Raised when a URL is not in any of the replayed archives"""
+    pass
+
+
+class WARCReplayCrawlerStrategy(AsyncCrawlerStrategy):
+    """
+    Serve crawls from WARC files.
+
+    Args:
+        paths: WARC files or glob patterns (``"crawl/*.warc.gz"``).
+        logger: Logger instance for recording events and errors.
+        max_redirects: Redirect records followed before giving up.
+    """
+
+    def __init__(
+        self,
+        paths: Union[str, List[str]],
+        logger: Optional[AsyncLogger] = None,
+        max_redirects: int = 10,
+    ):
+        patterns = [paths] if isinstance(paths, str) else list(paths)
+        self.paths = [path for pattern in patterns for path in (sorted(glob.glob(pattern)) or [pattern])]
+        self.logger = logger
+        self.max_redirects = max_redirects
+        # url -> (file number, offset, length)
+        self._index: Dict[str, Tuple[int, int, int]] = {}
+        self._files = []
+        self._buffers = []
+        self._started = False
+        self._start_lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._index
+
+    async def start(self):
+        async with self._start_lock:
+            if self._started:
+                return
+            for path in self.paths:
+                entries = await asyncio.to_thread(read_index, path)
+                if not entries:
+                    continue  # also keeps empty files away from mmap
+                number = len(self._buffers)
+                f = open(path, "rb")
+                self._files.append(f)
+                self._buffers.append(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+                for entry in entries:
+                    self._index[entry.url] = (number, entry.offset, entry.length)
+            self._started = True
+            if self.logger:
+                self.logger.info(
+                    message="Replaying {count} URLs from {files} WARC file(s)",
+                    tag="WARC",
+                    params={"count": len(self._index), "files": len(self.paths)},
+                )
+
+    async def close(self):
+        for buffer in self._buffers:
+            buffer.close()
+        for f in self._files:
+            f.close()
+        self._buffers, self._files = [], []
+        self._index = {}
+        self._started = False
+
+    def set_hook(self, hook_type: str, hook):
+        pass  # nothing is fetched, so there is nothing to hook
+
+    def update_user_agent(self, user_agent: str):
+        pass
+
+    def _lookup(self, url: str) -> Optional[Tuple[int, int, int]]:
+        location = self._index.get(url)
+        if location is None and "#" in url:
+            location = self._index.get(url.split("#", 1)[0])
+        if location is None and not url.split("://", 1)[-1].count("/"):
+            location = self._index.get(url + "/")
+        return location
+
+    async def crawl(self, url: str, config: Optional[CrawlerRunConfig] = None, **kwargs) -> AsyncCrawlResponse:
+        if not self._started:
+            await self.start()
+
+        target = url
+        for _ in range(self.max_redirects + 1):
+            location = self._lookup(target)
+            if location is None:
+                raise WARCRecordNotFound(f"{target} is not in the replayed WARC files")
+            number, offset, length = location
+            record = read_record(self._buffers[number], offset, length)
+            headers = {k.lower(): v for k, v in record.http_headers.items()}
+            if 300 <= record.status < 400 and headers.get("location"):
+                target = urljoin(target, headers["location"])
+                continue
+            break
+        else:
+            raise WARCRecordNotFound(f"Too many redirects replaying {url}")
+
+        content_type = headers.get("content-type", "")
+        declared = None
+        if "charset=" in content_type:
+            declared = content_type.split("charset=", 1)[1].split(";")[0]
+        encoding, bom_length = sniff_charset(record.payload, declared)
+        if encoding is None:
+            encoding = detect_charset(record.payload)
+
+        return AsyncCrawlResponse(
+            html=decode_body(record.payload, encoding, bom_length),
+            response_headers=record.http_headers,
+            status_code=record.status,
+            redirected_url=target,
+        )
+
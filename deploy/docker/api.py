@@ -23,6 +23,7 @@ from crawl4ai import (
     BrowserConfig,
     MemoryAdaptiveDispatcher,
     RateLimiter, 
+    CrawlBudget,
     LLMConfig
 )
 from crawl4ai.async_configs import Provenance, UntrustedConfigError
@@ -85,6 +86,7 @@ from utils import (
     get_llm_base_url,
     get_redis_task_ttl,
     validate_url_destination,
+    avalidate_url_destination,
 )
 from webhook import WebhookDeliveryService
 
@@ -130,7 +132,7 @@ async def handle_llm_qa(
     try:
         if not url.startswith(('http://', 'https://')) and not url.startswith(("raw:", "raw://")):
             url = 'https://' + url
-        validate_url_destination(url)
+        await avalidate_url_destination(url)
         # Extract base URL by finding last '?q=' occurrence
         last_q_index = url.rfind('?q=')
         if last_q_index != -1:
@@ -246,7 +248,7 @@ async def process_llm_extraction(
         # Re-validate the destination at fetch time (the enqueue-time check is a
         # TOCTOU seed-only guard) and pin egress so the background fetch cannot
         # be rebound/redirected to an internal target.
-        validate_url_destination(url)
+        await avalidate_url_destination(url)
         from utils import load_config as _load_config
         _wcfg = _load_config()
         worker_browser_cfg = BrowserConfig(
@@ -345,7 +347,7 @@ async def handle_markdown_request(
         decoded_url = unquote(url)
         if not decoded_url.startswith(('http://', 'https://')) and not decoded_url.startswith(("raw:", "raw://")):
             decoded_url = 'https://' + decoded_url
-        validate_url_destination(decoded_url)
+        await avalidate_url_destination(decoded_url)
 
         if filter_type == FilterType.RAW:
             md_generator = DefaultMarkdownGenerator()
@@ -536,7 +538,7 @@ async def create_new_task(
     decoded_url = unquote(input_path)
     if not decoded_url.startswith(('http://', 'https://')) and not decoded_url.startswith(("raw:", "raw://")):
         decoded_url = 'https://' + decoded_url
-    validate_url_destination(decoded_url)
+    await avalidate_url_destination(decoded_url)
 
     from datetime import datetime
     task_id = f"llm_{int(datetime.now().timestamp())}_{id(background_tasks)}"
@@ -725,7 +727,14 @@ async def handle_crawl_request(
         # Optional per-crawl wall-clock deadline (config limits.wall_clock_s; 0 = none).
         from governor import wall_clock_seconds
         _deadline = wall_clock_seconds(config)
-        if _deadline and _deadline > 0:
+        if _deadline and _deadline > 0 and len(urls) > 1:
+            # Stop admitting URLs near the deadline and keep the finished ones;
+            # the hard timeout only guards against crawls that overrun it.
+            dispatcher.budget = CrawlBudget(max_seconds=_deadline)
+            _configs = effective_config if isinstance(effective_config, list) else [effective_config]
+            _grace = max(c.page_timeout for c in _configs) / 1000
+            results = await asyncio.wait_for(partial_func(), timeout=_deadline + _grace)
+        elif _deadline and _deadline > 0:
             results = await asyncio.wait_for(partial_func(), timeout=_deadline)
         else:
             results = await partial_func()
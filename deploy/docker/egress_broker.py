@@ -18,6 +18,11 @@ that hands back the pinned IP to dial. `resolve_and_pin()` resolves once and
 returns the exact IP to connect to; callers must dial that IP (Host/SNI
 preserved) so a second, attacker-controlled resolution is never used.
 
+Lookups go through crawl4ai's process-wide DNS cache, so repeated checks of
+a host cost nothing; async callers `await warm_dns(url)` first so a cache
+miss is resolved off the event loop. Cached answers are validated like
+fresh ones, and the pinned IP is still the one that was checked.
+
 Errors are opaque (`EgressBlocked.reason == "URL blocked"`) so the API never
 leaks a resolved internal IP, hostname, or traceback (the old DNS oracle).
 """
@@ -31,6 +36,8 @@ from dataclasses import dataclass
 from typing import List, Optional
 from urllib.parse import urlparse
 
+from crawl4ai.dns_cache import get_dns_cache
+
 # Operator escape hatch for trusted internal deployments (off by default).
 ALLOW_INTERNAL = os.environ.get("CRAWL4AI_ALLOW_INTERNAL_URLS", "false").lower() == "true"
 
@@ -91,11 +98,31 @@ def is_forbidden_ip(ip_str: str) -> bool:
 
 def _resolve(host: str, port: int):
     try:
-        return socket.getaddrinfo(host, port, proto=socket.IPPROTO_TCP)
+        return get_dns_cache().resolve_blocking(host, port)
     except socket.gaierror:
         raise EgressBlocked()
 
 
+async def warm_dns(url: str) -> None:
+    """Resolve the host of `url` into the DNS cache without blocking the loop.
+
+    Call before resolve_and_pin()/assert_host_allowed() in async code: they
+    are then served from the cache. Never raises; the policy check decides.
+    """
+    try:
+        parsed = urlparse(str(url))
+        host = parsed.hostname
+        port = parsed.port or 0
+    except ValueError:
+        return
+    if not host:
+        return
+    try:
+        await get_dns_cache().resolve(host, port)
+    except (socket.gaierror, UnicodeError):
+        pass
+
+
 def assert_host_allowed(host: str, port: int = 0) -> None:
     """Resolve `host` and reject if ANY answer is non-global. Opaque on failure."""
     if ALLOW_INTERNAL:
@@ -21,7 +21,7 @@ import asyncio
 import logging
 from urllib.parse import urlsplit
 
-from egress_broker import EgressBlocked, resolve_and_pin
+from egress_broker import EgressBlocked, resolve_and_pin, warm_dns
 
 logger = logging.getLogger("crawl4ai.egress")
 
@@ -91,6 +91,7 @@ class PinningProxy:
         if not host or not port_s.isdigit():
             await self._reply(client_writer, _BAD)
             return
+        await warm_dns(f"https://{host}:{port_s}")
         try:
             pin = resolve_and_pin(f"https://{host}:{port_s}")
         except EgressBlocked:
@@ -119,6 +120,7 @@ class PinningProxy:
             await self._reply(client_writer, _BAD)
             return
         port = sp.port or 80
+        await warm_dns(f"http://{sp.hostname}:{port}")
         try:
             pin = resolve_and_pin(f"http://{sp.hostname}:{port}")
         except EgressBlocked:
@@ -74,9 +74,9 @@ async def llm_job_enqueue(
 ):
     webhook_config = None
     if payload.webhook_config:
-        from utils import validate_webhook_url
+        from utils import avalidate_webhook_url
         try:
-            validate_webhook_url(str(payload.webhook_config.webhook_url))
+            await avalidate_webhook_url(str(payload.webhook_config.webhook_url))
         except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e))
         webhook_config = payload.webhook_config.model_dump(mode='json')
@@ -119,9 +119,9 @@ async def crawl_job_enqueue(
 ):
     webhook_config = None
     if payload.webhook_config:
-        from utils import validate_webhook_url
+        from utils import avalidate_webhook_url
         try:
-            validate_webhook_url(str(payload.webhook_config.webhook_url))
+            await avalidate_webhook_url(str(payload.webhook_config.webhook_url))
         except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e))
         webhook_config = payload.webhook_config.model_dump(mode='json')
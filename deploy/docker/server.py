@@ -41,7 +41,7 @@ from schemas import (
 
 from utils import (
     FilterType, load_config, setup_logging, verify_email_domain,
-    validate_webhook_url, validate_url_destination,
+    validate_webhook_url, avalidate_webhook_url, validate_url_destination,
 )
 import os
 import sys
@@ -787,7 +787,7 @@ async def execute_js(
     validate_url_scheme(body.url)
     # Block SSRF: reject internal/private IPs
     try:
-        validate_webhook_url(body.url)  # reuse SSRF blocklist
+        await avalidate_webhook_url(body.url)  # reuse SSRF blocklist
     except ValueError as e:
         raise HTTPException(400, str(e))
     crawler = None
@@ -97,6 +97,16 @@ def effective_redis_url(server_module):
 # These let SSRF/egress tests run without touching the network and let us
 # model DNS rebinding precisely.
 
+@pytest.fixture(autouse=True)
+def _fresh_dns_cache():
+    """Lookups are cached process-wide; start every test from an empty cache
+    so one test's resolver answers never leak into the next."""
+    from crawl4ai.dns_cache import get_dns_cache
+    get_dns_cache().clear()
+    yield
+    get_dns_cache().clear()
+
+
 class _FakeResolver:
     """Drop-in for socket.getaddrinfo with a controllable host->IP map.
 
@@ -155,6 +155,17 @@ class TestUntrustedClampAndDrop:
         c = CrawlerRunConfig.load({"wait_for_timeout": 500000}, provenance=U)
         assert c.wait_for_timeout == 60_000
 
+    def test_quiescence_wait_clamped(self):
+        c = CrawlerRunConfig.load(
+            {"wait_until": "quiescent", "quiescence_window": 1e9, "quiescence_timeout": 1e9},
+            provenance=U,
+        )
+        assert c.quiescence_window == 60 and c.quiescence_timeout == 60
+        c = CrawlerRunConfig.load({"quiescence_timeout": 0}, provenance=U)
+        assert c.quiescence_timeout == 60  # never unbounded
+        c = CrawlerRunConfig.load({"quiescence_window": 0.2, "quiescence_timeout": 5}, provenance=U)
+        assert (c.quiescence_window, c.quiescence_timeout) == (0.2, 5)
+
     def test_unknown_field_dropped_not_raised(self):
         c = CrawlerRunConfig.load(
             {"css_selector": ".x", "totally_unknown_field": 1}, provenance=U
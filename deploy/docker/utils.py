@@ -366,6 +366,15 @@ def validate_url_destination(url: str) -> None:
         raise HTTPException(status_code=400, detail=f"URL blocked (SSRF protection): {e}")
 
 
+async def avalidate_url_destination(url: str) -> None:
+    """validate_url_destination for async handlers: the DNS lookup runs off the event loop."""
+    if ALLOW_INTERNAL_URLS or str(url).startswith(("raw:", "raw://")):
+        return
+    from egress_broker import warm_dns
+    await warm_dns(url)
+    validate_url_destination(url)
+
+
 def _expand_ip_candidates(ip):
     """Return [ip] plus any IPv4 form wrapped inside the IPv6 address.
     SSRF guards must check the unwrapped form because ::ffff:127.0.0.1 and
@@ -399,6 +408,13 @@ def validate_webhook_url(url: str) -> None:
         raise ValueError("URL blocked")
 
 
+async def avalidate_webhook_url(url: str) -> None:
+    """validate_webhook_url for async handlers: the DNS lookup runs off the event loop."""
+    from egress_broker import warm_dns
+    await warm_dns(url)
+    validate_webhook_url(url)
+
+
 def verify_email_domain(email: str) -> bool:
     try:
         domain = email.split('@')[1]
@@ -149,10 +149,11 @@ class WebhookDeliveryService:
     async def _deliver(self, url: str, payload: Dict, headers: Dict[str, str]) -> int:
         """POST with the connection pinned to the validated IP, following (and
         re-validating) redirects manually. Returns the final status code."""
-        from egress_broker import resolve_and_pin, check_redirect, EgressBlocked, ALLOW_INSECURE_TLS
+        from egress_broker import resolve_and_pin, check_redirect, warm_dns, EgressBlocked, ALLOW_INSECURE_TLS
 
         current = url
         for _hop in range(_MAX_WEBHOOK_REDIRECTS + 1):
+            await warm_dns(current)
             try:
                 pin = resolve_and_pin(current)
             except EgressBlocked as e:
@@ -171,6 +172,7 @@ class WebhookDeliveryService:
                         if not loc:
                             return resp.status
                         # Re-validate every redirect hop before following it.
+                        await warm_dns(loc)
                         try:
                             check_redirect(loc)
                         except EgressBlocked as e:
@@ -0,0 +1,31 @@
+"""Shared fixtures for the unit tests."""
+
+import pytest_asyncio
+from aiohttp import web
+
+
+@pytest_asyncio.fixture
+async def serve():
+    """
+    Start local aiohttp servers on a free port of 127.0.0.1.
+
+    ``base = await serve({"/page": handler, "/{name}": other})`` registers
+    one GET handler per path, in order, and returns ``http://127.0.0.1:<port>``.
+    The servers are stopped when the test ends.
+    """
+    runners = []
+
+    async def start(routes) -> str:
+        app = web.Application()
+        for path, handler in routes.items():
+            app.router.add_get(path, handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        runners.append(runner)
+        await web.TCPSite(runner, "127.0.0.1", 0).start()
+        host, port = runner.addresses[0][:2]
+        return f"http://{host}:{port}"
+
+    yield start
+    for runner in runners:
+        await runner.cleanup()
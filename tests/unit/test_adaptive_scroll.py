@@ -0,0 +1,93 @@
+"""Unit tests for the adaptive full-page scan and virtual scroll drivers.
+
+The in-page scripts are replaced by a fake page that answers each evaluate
+call; no browser required.
+"""
+
+import pytest
+
+from crawl4ai.async_configs import VirtualScrollConfig
+from crawl4ai.async_crawler_strategy import AsyncPlaywrightCrawlerStrategy
+
+
+class FakeVirtualList:
+    """A feed that renders 3 rows at a time and recycles them while scrolling."""
+
+    def __init__(self, total=7, page_size=3):
+        self.total = total
+        self.page_size = page_size
+        self.start = 0
+        self.seen = set()
+        self.calls = []
+        self.merged = None
+        self.viewport_size = {"width": 800, "height": 600}
+
+    async def evaluate(self, script, arg=None):
+        if "innerHTML = html" in script:
+            self.merged = arg[1]
+            return None
+        self.calls.append(arg)
+        if arg["reset"]:
+            self.seen = set()
+        if arg["scroll"]:
+            self.start = min(self.start + self.page_size, self.total - self.page_size)
+        rows = [f"<div>row {i}</div>" for i in range(self.start, self.start + self.page_size)]
+        new = [r for r in rows if r not in self.seen]
+        replaced = bool(self.seen - set(rows))
+        self.seen.update(rows)
+        return {"new_items": new, "replaced": replaced,
+                "at_end": self.start + self.page_size >= self.total}
+
+
+@pytest.fixture
+def strategy():
+    return AsyncPlaywrightCrawlerStrategy()
+
+
+@pytest.mark.asyncio
+async def test_virtual_scroll_ships_new_items_and_stops_without_growth(strategy):
+    page = FakeVirtualList()
+    await strategy._handle_virtual_scroll(
+        page, VirtualScrollConfig(container_selector="#feed", scroll_count=20)
+    )
+    # 0-2, 3-5, 4-6 (end with new row 6), then one more step with nothing new
+    assert len(page.calls) == 4
+    assert page.merged == "\n".join(f"<div>row {i}</div>" for i in range(7))
+
+
+@pytest.mark.asyncio
+async def test_virtual_scroll_appended_content_is_left_alone(strategy):
+    page = FakeVirtualList(total=3)
+    await strategy._handle_virtual_scroll(page, {"container_selector": "#feed", "scroll_count": 5})
+    assert page.merged is None
+    assert len(page.calls) == 2
+
+
+class FakeScanPage:
+    viewport_size = {"width": 800, "height": 600}
+
+    def __init__(self):
+        self.scan_args = None
+        self.scrolled_to = []
+
+    async def evaluate(self, script, arg=None):
+        if arg is not None and "maxSteps" in arg:
+            self.scan_args = arg
+            return {"steps": 4, "height": 5000, "stopped": "no_growth"}
+        if "window.scrollTo" in script:
+            self.scrolled_to.append(script)
+            return {"success": True}
+        return None
+
+    async def wait_for_timeout(self, ms):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_full_page_scan_runs_in_page(strategy):
+    page = FakeScanPage()
+    await strategy._handle_full_page_scan(page, scroll_delay=0.3, max_scroll_steps=None)
+    assert page.scan_args == {
+        "viewport": 600, "maxSteps": 10, "delayMs": 300, "quietMs": 100, "maxStepFactor": 2,
+    }
+    assert "5000" in page.scrolled_to[-1]
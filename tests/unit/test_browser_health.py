@@ -0,0 +1,221 @@
+"""Unit tests for browser health checks and crash recovery.
+
+Browsers, CDP sessions and pages are fakes; no browser required.
+"""
+
+import asyncio
+import os
+
+import pytest
+
+from crawl4ai.async_configs import BrowserConfig, CrawlerRunConfig
+from crawl4ai.async_dispatcher import RetryPolicy
+from crawl4ai.browser_health import BrowserCrashedError, BrowserHealthMonitor, crash_reason
+from crawl4ai.browser_manager import BrowserManager, ShardedBrowserManager
+from crawl4ai.models import CrawlResult
+
+
+class FakeSession:
+    def __init__(self, delay=0.0, pids=()):
+        self.delay = delay
+        self.pids = pids
+
+    async def send(self, method, params=None):
+        if method == "Browser.getVersion":
+            await asyncio.sleep(self.delay)
+            return {"product": "HeadlessChrome"}
+        if method == "SystemInfo.getProcessInfo":
+            return {"processInfo": [{"id": pid, "type": "browser"} for pid in self.pids]}
+        raise AssertionError(method)
+
+
+class FakeBrowser:
+    def __init__(self, session=None):
+        self.session = session or FakeSession()
+        self.handlers = {}
+        self.connected = True
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+    def remove_listener(self, event, handler):
+        self.handlers.pop(event, None)
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_browser_cdp_session(self):
+        return self.session
+
+    def crash(self):
+        self.connected = False
+        handler = self.handlers.get("disconnected")
+        if handler:
+            handler(self)
+
+
+class FakePage:
+    def __init__(self):
+        self.handlers = {}
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+
+def _monitor(browser, **kwargs):
+    reasons = []
+    monitor = BrowserHealthMonitor(browser, reasons.append, **kwargs)
+    return monitor, reasons
+
+
+@pytest.mark.asyncio
+class TestHealthMonitor:
+    async def test_healthy_check_records_ping(self):
+        monitor, reasons = _monitor(FakeBrowser())
+        assert await monitor.check() is None
+        assert monitor.stats["last_ping_ms"] is not None
+
+    async def test_slow_ping_is_unhealthy(self):
+        monitor, _ = _monitor(FakeBrowser(FakeSession(delay=1.0)), ping_timeout=0.01)
+        assert "ping timed out" in await monitor.check()
+
+    async def test_rss_ceiling(self):
+        browser = FakeBrowser(FakeSession(pids=[os.getpid()]))
+        monitor, _ = _monitor(browser, max_rss_mb=1)
+        assert "over the 1 MB limit" in await monitor.check()
+        assert monitor.stats["rss_mb"] > 1
+        monitor, _ = _monitor(browser, max_rss_mb=10**6)
+        assert await monitor.check() is None
+
+    async def test_disconnect_reports_once_and_marks_pages(self):
+        browser = FakeBrowser()
+        monitor, reasons = _monitor(browser)
+        monitor.start()
+        page = FakePage()
+        monitor.watch_page(page)
+        assert crash_reason(page) is None
+
+        browser.crash()
+        browser.crash()
+        assert reasons == ["browser disconnected"]
+        assert crash_reason(page) == "browser disconnected"
+
+    async def test_stopped_monitor_ignores_close(self):
+        browser = FakeBrowser()
+        monitor, reasons = _monitor(browser)
+        monitor.start()
+        monitor.stop()
+        browser.crash()
+        assert reasons == []
+
+    async def test_renderer_crash_fails_page_and_checks_browser(self):
+        browser = FakeBrowser()
+        monitor, reasons = _monitor(browser)
+        monitor.start()
+        page = FakePage()
+        monitor.watch_page(page)
+        monitor.watch_page(page)  # idempotent
+
+        browser.connected = False  # the crash took the browser with it
+        page.handlers["crash"](page)
+        await monitor._check_task
+        assert crash_reason(page) == "renderer crashed"
+        assert reasons == ["browser disconnected"]
+        assert monitor.stats["renderer_crashes"] == 1
+
+    async def test_periodic_checks(self):
+        browser = FakeBrowser(FakeSession(delay=1.0))
+        monitor, reasons = _monitor(browser, interval=0.01, ping_timeout=0.01)
+        monitor.start()
+        for _ in range(50):
+            if reasons:
+                break
+            await asyncio.sleep(0.01)
+        assert reasons and "ping timed out" in reasons[0]
+
+
+class RelaunchingManager(BrowserManager):
+    starts = 0
+
+    async def start(self):
+        self.starts += 1
+        self.playwright = object()
+        self.browser = FakeBrowser()
+        self._start_health_monitor()
+
+    async def close(self):
+        if self.health_monitor is not None:
+            self.health_monitor.stop()
+        self.browser = None
+
+
+@pytest.mark.asyncio
+async def test_manager_relaunches_crashed_browser():
+    manager = RelaunchingManager(BrowserConfig())
+    await manager.start()
+    old_browser = manager.browser
+    manager.contexts_by_config["sig"] = object()
+    manager.sessions["s"] = (None, FakePage(), 0)
+
+    old_browser.crash()
+    await manager._relaunch_task
+    assert manager.starts == 2 and manager.relaunches == 1
+    assert manager.browser is not old_browser
+    assert manager.contexts_by_config == {} and manager.sessions == {}
+
+
+@pytest.mark.asyncio
+async def test_manager_does_not_relaunch_external_browser():
+    manager = RelaunchingManager(BrowserConfig(cdp_url="http://localhost:9222"))
+    await manager.start()
+    manager.browser.crash()
+    assert manager._relaunch_task is None
+
+
+class FakeShard:
+    def __init__(self):
+        self.browser = None
+        self.sessions = {}
+        self.closed = False
+
+    async def start(self):
+        self.browser = FakeBrowser()
+
+    async def close(self):
+        self.closed = True
+
+    async def get_page(self, config):
+        return FakePage(), None
+
+
+class FakeShardedManager(ShardedBrowserManager):
+    def _new_shard(self):
+        shard = FakeShard()
+        self._in_flight[shard] = 0
+        return shard
+
+
+@pytest.mark.asyncio
+async def test_unhealthy_live_shard_is_closed_without_draining():
+    manager = FakeShardedManager(BrowserConfig(browser_shards=2))
+    await manager.start()
+    page, _ = await manager.get_page(CrawlerRunConfig(url="https://example.com/"))
+    shard = manager._page_to_shard[page]
+
+    manager._on_unhealthy(shard, "browser RSS 900 MB over the 800 MB limit")
+    await asyncio.gather(*manager._restart_tasks.values())
+    assert shard not in manager.shards and shard.closed
+
+
+def test_retry_policy_retries_browser_crashes():
+    policy = RetryPolicy()
+    error = BrowserCrashedError("Browser crashed (CDP ping timed out after 5.0s) while crawling https://a/")
+    result = CrawlResult(url="https://a/", html="", success=False, error_message=f"Error: {error}")
+    assert policy.classify(result) == "browser_crash"
+    assert policy.should_retry("browser_crash", 1)
+
+
+def test_config_roundtrip():
+    config = BrowserConfig(health_check_interval=15, health_ping_timeout=2, max_browser_rss_mb=1500)
+    clone = BrowserConfig.load(config.dump())
+    assert (clone.health_check_interval, clone.health_ping_timeout, clone.max_browser_rss_mb) == (15, 2, 1500)
@@ -0,0 +1,149 @@
+"""Unit tests for ShardedBrowserManager.
+
+Shards are fake BrowserManagers; no browser required.
+"""
+
+import asyncio
+
+import pytest
+
+from crawl4ai.async_configs import BrowserConfig, CrawlerRunConfig
+from crawl4ai.browser_manager import ShardedBrowserManager
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.handlers = {}
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+    def crash(self):
+        self.handlers["disconnected"](self)
+
+
+class FakeShard:
+    def __init__(self, number):
+        self.number = number
+        self.browser = None
+        self.default_context = None
+        self.sessions = {}
+        self.closed = False
+        self._pages_served = 0
+        self._browser_version = 1
+
+    async def start(self):
+        self.browser = FakeBrowser()
+
+    async def close(self):
+        self.closed = True
+
+    async def get_page(self, config):
+        self._pages_served += 1
+        page = object()
+        if config.session_id:
+            self.sessions[config.session_id] = (None, page, 0)
+        return page, None
+
+    def release_page(self, page):
+        pass
+
+    async def release_page_with_context(self, page):
+        pass
+
+    async def recycle_page(self, page, reusable=True):
+        return False
+
+    async def kill_session(self, session_id):
+        self.sessions.pop(session_id, None)
+
+
+class FakeShardedManager(ShardedBrowserManager):
+    def _new_shard(self):
+        self.created = getattr(self, "created", 0) + 1
+        shard = FakeShard(self.created)
+        self._in_flight[shard] = 0
+        return shard
+
+
+def _manager(n=3, **kwargs):
+    return FakeShardedManager(BrowserConfig(browser_shards=n, **kwargs))
+
+
+def _cfg(url="https://example.com/", **kwargs):
+    return CrawlerRunConfig(url=url, **kwargs)
+
+
+def test_rejects_shared_browsers():
+    with pytest.raises(ValueError):
+        ShardedBrowserManager(BrowserConfig(browser_shards=2, cdp_url="http://localhost:9222"))
+    with pytest.raises(ValueError):
+        ShardedBrowserManager(BrowserConfig(browser_shards=2, shard_assignment="random"))
+
+
+@pytest.mark.asyncio
+async def test_least_loaded_spreads_pages():
+    manager = _manager(3)
+    await manager.start()
+    pages = [await manager.get_page(_cfg()) for _ in range(6)]
+    assert [s["in_flight"] for s in manager.shard_stats()] == [2, 2, 2]
+
+    page, _ = pages[0]
+    await manager.release_page_with_context(page)
+    await manager.recycle_page(page)
+    assert sorted(s["in_flight"] for s in manager.shard_stats()) == [1, 2, 2]
+    assert manager._page_to_shard.get(page) is None
+
+
+@pytest.mark.asyncio
+async def test_host_affinity_and_sessions_are_sticky():
+    manager = _manager(4, shard_assignment="host_affinity")
+    await manager.start()
+    first = manager._pick(_cfg("https://a.example.com/1"))
+    assert manager._pick(_cfg("https://a.example.com/2")) is first
+
+    manager.config.shard_assignment = "least_loaded"
+    await manager.get_page(_cfg(session_id="s1"))
+    shard = manager._session_to_shard["s1"]
+    for _ in range(3):
+        await manager.get_page(_cfg())
+    assert manager._pick(_cfg(session_id="s1")) is shard
+    assert all(s["in_flight"] <= 1 for s in manager.shard_stats())  # session pages not counted
+
+    await manager.kill_session("s1")
+    assert "s1" not in shard.sessions
+
+
+@pytest.mark.asyncio
+async def test_crashed_shard_is_replaced_and_drained():
+    manager = _manager(2)
+    await manager.start()
+    page, _ = await manager.get_page(_cfg())
+    crashed = manager._page_to_shard[page]
+    other = next(s for s in manager.shards if s is not crashed)
+
+    crashed.browser.crash()
+    await asyncio.gather(*manager._restart_tasks.values())
+    assert crashed not in manager.shards and other in manager.shards
+    assert not crashed.closed  # its page is still in flight
+    assert manager.shard_stats()[0 if manager.shards[0] is not other else 1]["restarts"] == 1
+
+    await manager.release_page_with_context(page)
+    assert crashed.closed and not other.closed
+
+
+@pytest.mark.asyncio
+async def test_close_ignores_disconnects():
+    manager = _manager(2)
+    await manager.start()
+    shards = list(manager.shards)
+    await manager.close()
+    shards[0].browser.crash()
+    assert manager._restart_tasks == {}
+    assert all(s.closed for s in shards)
+
+
+def test_config_roundtrip():
+    config = BrowserConfig(browser_shards=4, shard_assignment="host_affinity")
+    clone = BrowserConfig.load(config.dump())
+    assert (clone.browser_shards, clone.shard_assignment) == (4, "host_affinity")
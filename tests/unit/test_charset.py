@@ -0,0 +1,52 @@
+"""Unit tests for charset sniffing of fetched HTML."""
+
+import codecs
+
+from crawl4ai.charset import (
+    DETECT_BYTES,
+    SNIFF_BYTES,
+    decode_body,
+    detect_charset,
+    normalize_charset,
+    sniff_charset,
+)
+
+
+def test_bom_wins_over_declarations():
+    body = codecs.BOM_UTF8 + '<meta charset="iso-8859-1">é'.encode("utf-8")
+    assert sniff_charset(body, "shift_jis") == ("utf-8", 3)
+    assert decode_body(body, "utf-8", 3) == '<meta charset="iso-8859-1">é'
+
+    body = codecs.BOM_UTF16_LE + "hi".encode("utf-16-le")
+    encoding, bom = sniff_charset(body)
+    assert decode_body(body, encoding, bom) == "hi"
+
+
+def test_header_then_meta():
+    body = b'<html><head><meta charset="shift_jis"></head>'
+    assert sniff_charset(body, "utf-8") == ("utf-8", 0)
+    assert sniff_charset(body) == ("shift_jis", 0)
+    http_equiv = b'<meta http-equiv="Content-Type" content="text/html; charset=EUC-KR">'
+    assert sniff_charset(http_equiv) == ("euc_kr", 0)
+
+
+def test_meta_outside_sniff_window_is_ignored():
+    body = b" " * SNIFF_BYTES + b'<meta charset="shift_jis">'
+    assert sniff_charset(body) == (None, 0)
+
+
+def test_labels_are_normalized():
+    assert normalize_charset("ISO-8859-1") == "cp1252"
+    assert normalize_charset('"US-ASCII"') == "utf-8"
+    assert normalize_charset("no-such-charset") is None
+    # A meta tag readable as ASCII cannot really be UTF-16
+    assert sniff_charset(b'<meta charset="utf-16">') == ("utf-8", 0)
+
+
+def test_detection_only_reads_a_prefix():
+    text = "Grüße aus Köln, schöne Straße. " * 50
+    body = text.encode("utf-8") + b"\xff" * (2 * DETECT_BYTES)
+    assert detect_charset(body[:DETECT_BYTES]) == detect_charset(body)
+    assert detect_charset(text.encode("utf-8")) == "utf-8"
+    # ASCII-only prefixes decode as UTF-8, in case non-ASCII text follows
+    assert detect_charset(b"plain ascii text") == "utf-8"
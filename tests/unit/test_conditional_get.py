@@ -0,0 +1,73 @@
+"""Unit tests for conditional recrawls (CacheMode.REVALIDATE).
+
+Pages come from a local aiohttp server that honours If-None-Match.
+"""
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from crawl4ai import AsyncWebCrawler, CacheMode, CrawlerRunConfig
+from crawl4ai.async_crawler_strategy import AsyncHTTPCrawlerStrategy
+from crawl4ai.async_database import async_db_manager
+from crawl4ai.cache_context import CacheContext
+
+
+@pytest_asyncio.fixture
+async def server(serve):
+    state = {"version": 1, "full": 0, "not_modified": 0, "validators": []}
+
+    async def page(request):
+        etag = f'"v{state["version"]}"'
+        state["validators"].append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == etag:
+            state["not_modified"] += 1
+            return web.Response(status=304, headers={"ETag": etag, "Cache-Control": "max-age=60"})
+        state["full"] += 1
+        text = f"<p>Version {state['version']}</p>" + "<p>Some article text that is long enough to read.</p>" * 40
+        body = f"<html><head><title>v{state['version']}</title></head><body>{text}</body></html>"
+        return web.Response(text=body, content_type="text/html", headers={"ETag": etag})
+
+    return await serve({"/page": page}) + "/page", state
+
+
+def test_cache_context_revalidates_web_urls_only():
+    assert CacheContext("https://a/", CacheMode.REVALIDATE).should_revalidate()
+    assert CacheContext("https://a/", CacheMode.REVALIDATE).should_read()
+    assert CacheContext("https://a/", CacheMode.REVALIDATE).should_write()
+    assert not CacheContext("file:///tmp/a.html", CacheMode.REVALIDATE).should_revalidate()
+    assert not CacheContext("https://a/", CacheMode.ENABLED).should_revalidate()
+
+
+@pytest.mark.asyncio
+async def test_not_modified_serves_cache_in_one_request(server):
+    url, state = server
+    async with AsyncWebCrawler(crawler_strategy=AsyncHTTPCrawlerStrategy()) as crawler:
+        first = await crawler.arun(url, config=CrawlerRunConfig(cache_mode=CacheMode.ENABLED))
+        assert first.success and first.cache_status == "miss"
+
+        again = await crawler.arun(url, config=CrawlerRunConfig(cache_mode=CacheMode.REVALIDATE))
+        assert again.success and again.cache_status == "hit_validated"
+        assert "Version 1" in again.html
+        assert state["validators"][-1] == '"v1"'
+        assert (state["full"], state["not_modified"]) == (1, 1)
+        # Refreshed from the 304
+        assert again.response_headers["cache-control"] == "max-age=60"
+        metadata = await async_db_manager.aget_cache_metadata(url)
+        assert metadata["response_headers"]["cache-control"] == "max-age=60"
+
+        state["version"] = 2
+        changed = await crawler.arun(url, config=CrawlerRunConfig(cache_mode=CacheMode.REVALIDATE))
+        assert changed.cache_status == "miss" and "Version 2" in changed.html
+        assert (await async_db_manager.aget_cache_metadata(url))["etag"] == '"v2"'
+
+
+@pytest.mark.asyncio
+async def test_not_modified_is_not_an_error_without_validators(server):
+    url, state = server
+    strategy = AsyncHTTPCrawlerStrategy()
+    async with strategy:
+        response = await strategy.crawl(url, CrawlerRunConfig(), conditional_headers={"If-None-Match": '"v1"'})
+        assert response.status_code == 304 and response.html == ""
+        response = await strategy.crawl(url, CrawlerRunConfig())
+        assert response.status_code == 200
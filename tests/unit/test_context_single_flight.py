@@ -0,0 +1,92 @@
+"""Unit tests for single-flight browser context creation in BrowserManager.
+
+Context creation is replaced with fakes; no browser required.
+"""
+
+import asyncio
+
+import pytest
+
+from crawl4ai.async_configs import BrowserConfig, CrawlerRunConfig
+from crawl4ai.browser_manager import BrowserManager
+
+
+class FakeContext:
+    async def close(self):
+        pass
+
+
+def _manager(delays, fail=()):
+    """A BrowserManager whose contexts take ``delays[sig]`` seconds to build."""
+    manager = BrowserManager(BrowserConfig())
+    manager.built = []
+
+    async def create_browser_context(config):
+        sig = config.url
+        manager.built.append(sig)
+        await asyncio.sleep(delays.get(sig, 0))
+        if sig in fail:
+            raise RuntimeError(f"cannot build {sig}")
+        return FakeContext()
+
+    async def setup_context(context, config):
+        pass
+
+    manager.create_browser_context = create_browser_context
+    manager.setup_context = setup_context
+    return manager
+
+
+def _config(sig):
+    # The signature is passed explicitly; url only tells the fake which one it is building.
+    return CrawlerRunConfig(url=sig)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_build_one_context():
+    manager = _manager({"a": 0.05})
+    contexts = await asyncio.gather(
+        *(manager._acquire_context(_config("a"), "a") for _ in range(5))
+    )
+    assert manager.built == ["a"]
+    assert all(c is contexts[0] for c in contexts)
+    assert manager._context_refcounts["a"] == 5
+    assert manager._contexts_in_flight == {}
+
+
+@pytest.mark.asyncio
+async def test_slow_context_does_not_block_others():
+    manager = _manager({"slow": 1.0})
+    slow = asyncio.create_task(manager._acquire_context(_config("slow"), "slow"))
+    await asyncio.sleep(0.01)
+    fast = await asyncio.wait_for(manager._acquire_context(_config("fast"), "fast"), 0.2)
+    assert isinstance(fast, FakeContext) and not slow.done()
+    slow.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await slow
+
+
+@pytest.mark.asyncio
+async def test_build_failure_reaches_waiters():
+    manager = _manager({"a": 0.05}, fail={"a"})
+    results = await asyncio.gather(
+        *(manager._acquire_context(_config("a"), "a") for _ in range(3)),
+        return_exceptions=True,
+    )
+    assert manager.built == ["a"]
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert "a" not in manager.contexts_by_config and manager._contexts_in_flight == {}
+
+
+@pytest.mark.asyncio
+async def test_cancelled_builder_hands_over_to_waiter():
+    manager = _manager({"a": 0.1})
+    builder = asyncio.create_task(manager._acquire_context(_config("a"), "a"))
+    await asyncio.sleep(0.01)
+    waiter = asyncio.create_task(manager._acquire_context(_config("a"), "a"))
+    await asyncio.sleep(0.01)
+    builder.cancel()
+    context = await waiter
+    assert isinstance(context, FakeContext)
+    assert manager.built == ["a", "a"]
+    assert manager._context_refcounts["a"] == 1
@@ -0,0 +1,157 @@
+"""Unit tests for dispatcher crawl budgets.
+
+Uses a fake crawler with a fixed delay and page size, so no browser or
+network is required.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from crawl4ai.async_configs import CrawlerRunConfig
+from crawl4ai.async_dispatcher import (
+    CrawlBudget,
+    MemoryAdaptiveDispatcher,
+    SemaphoreDispatcher,
+)
+from crawl4ai.extraction_strategy import ExtractionStrategy
+from crawl4ai.models import CrawlerTaskResult, CrawlResult, TokenUsage
+
+
+class SlowCrawler:
+    def __init__(self, delay=0.0, html="<p>ok</p>"):
+        self.delay = delay
+        self.html = html
+        self.calls = []
+
+    async def arun(self, url, config=None, session_id=None):
+        self.calls.append(url)
+        await asyncio.sleep(self.delay)
+        return CrawlResult(url=url, html=self.html, success=True, status_code=200)
+
+
+class FakeLLMStrategy(ExtractionStrategy):
+    def __init__(self):
+        super().__init__()
+        self.total_usage = TokenUsage()
+
+    def extract(self, url, html, *q, **kwargs):
+        return []
+
+
+def _urls(n):
+    return [f"https://example.com/{i}" for i in range(n)]
+
+
+def _finished(html="x" * 100, seconds=0.0, **fields):
+    now = time.time()
+    return CrawlerTaskResult(
+        task_id="t", url="u", result=CrawlResult(url="u", html=html, success=True, **fields),
+        memory_usage=0, peak_memory=0, start_time=now - seconds, end_time=now,
+    )
+
+
+def _split(results):
+    skipped = [r for r in results if (r.result.metadata or {}).get("status") == "budget_exhausted"]
+    done = [r for r in results if r.result.success]
+    return done, skipped
+
+
+class TestCrawlBudget:
+    def test_page_limit_counts_in_flight_work(self):
+        budget = CrawlBudget(max_pages=3)
+        budget.start(CrawlerRunConfig())
+        assert budget.can_admit(in_flight=2)
+        assert not budget.can_admit(in_flight=3)
+        assert budget.exhausted_reason == "pages"
+
+    def test_byte_limit_projects_average_page_size(self):
+        budget = CrawlBudget(max_bytes=350)
+        budget.start(CrawlerRunConfig())
+        budget.record(_finished())
+        assert budget.can_admit(in_flight=1)  # 100 used + 2 * 100 expected
+        budget.record(_finished())
+        assert not budget.can_admit(in_flight=1)  # 200 used + 2 * 100 expected
+        assert budget.exhausted_reason == "bytes"
+
+    def test_bytes_count_fetched_bodies_and_downloads_but_not_cache_hits(self, tmp_path):
+        report = tmp_path / "report.pdf"
+        report.write_bytes(b"%" * 5000)
+        budget = CrawlBudget(max_bytes=10_000)
+        budget.start(CrawlerRunConfig())
+        budget.record(_finished(html="é" * 100, body_size=60))
+        assert budget.bytes == 60  # what came over the wire, not the decoded HTML
+        budget.record(_finished(html="", body_size=0, downloaded_files=[str(report)]))
+        assert budget.bytes == 5060
+        budget.record(_finished(body_size=4000, cache_status="hit"))
+        budget.record(_finished(body_size=4000, cache_status="hit_validated"))
+        assert budget.bytes == 5060
+        assert budget.pages == 4
+
+    def test_deadline_leaves_room_for_an_average_crawl(self):
+        budget = CrawlBudget(max_seconds=1.0)
+        budget.start(CrawlerRunConfig())
+        budget.started_at -= 0.5
+        assert budget.can_admit(in_flight=0)
+        budget.record(_finished(seconds=0.6))
+        assert not budget.can_admit(in_flight=0)
+        assert budget.exhausted_reason == "wall_clock"
+
+    def test_llm_tokens_only_count_this_run(self):
+        strategy = FakeLLMStrategy()
+        strategy.total_usage.total_tokens = 10_000
+        budget = CrawlBudget(max_llm_tokens=500)
+        budget.start(CrawlerRunConfig(extraction_strategy=strategy))
+        assert budget.llm_tokens == 0
+        strategy.total_usage.total_tokens += 600
+        assert not budget.can_admit(in_flight=0)
+        assert budget.exhausted_reason == "llm_tokens"
+
+
+@pytest.mark.asyncio
+class TestDispatcherBudgets:
+    async def test_memory_adaptive_page_budget(self):
+        crawler = SlowCrawler(delay=0.01)
+        dispatcher = MemoryAdaptiveDispatcher(
+            max_session_permit=2, check_interval=0.05, budget=CrawlBudget(max_pages=3)
+        )
+        results = await dispatcher.run_urls(urls=_urls(8), crawler=crawler, config=CrawlerRunConfig())
+        done, skipped = _split(results)
+        assert len(done) == 3 and len(crawler.calls) == 3
+        assert len(skipped) == 5
+        assert "pages" in skipped[0].error_message
+        assert {r.url for r in results} == set(_urls(8))
+
+    async def test_memory_adaptive_deadline_lets_in_flight_finish(self):
+        crawler = SlowCrawler(delay=0.2)
+        dispatcher = MemoryAdaptiveDispatcher(
+            max_session_permit=2, check_interval=0.05, budget=CrawlBudget(max_seconds=0.3)
+        )
+        results = await dispatcher.run_urls(urls=_urls(10), crawler=crawler, config=CrawlerRunConfig())
+        done, skipped = _split(results)
+        assert len(done) == len(crawler.calls) == 2
+        assert len(skipped) == 8
+        assert dispatcher.budget.exhausted_reason == "wall_clock"
+
+    async def test_memory_adaptive_stream_yields_every_url(self):
+        crawler = SlowCrawler(html="x" * 40)
+        dispatcher = MemoryAdaptiveDispatcher(
+            max_session_permit=1, check_interval=0.05, budget=CrawlBudget(max_bytes=50)
+        )
+        results = [
+            r async for r in dispatcher.run_urls_stream(
+                urls=_urls(4), crawler=crawler, config=CrawlerRunConfig()
+            )
+        ]
+        done, skipped = _split(results)
+        assert len(done) == 1 and len(skipped) == 3
+        assert dispatcher.budget.exhausted_reason == "bytes"
+
+    async def test_semaphore_page_budget(self):
+        crawler = SlowCrawler(delay=0.01)
+        dispatcher = SemaphoreDispatcher(semaphore_count=2, budget=CrawlBudget(max_pages=2))
+        results = await dispatcher.run_urls(crawler=crawler, urls=_urls(5), config=CrawlerRunConfig())
+        done, skipped = _split(results)
+        assert len(done) == len(crawler.calls) == 2
+        assert len(skipped) == 3
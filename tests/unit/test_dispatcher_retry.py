@@ -0,0 +1,193 @@
+"""Unit tests for dispatcher retry policies and the dead-letter sink.
+
+Uses a fake crawler whose arun() returns scripted results, so no browser or
+network is required.
+"""
+
+import json
+
+import pytest
+
+from crawl4ai.async_configs import CrawlerRunConfig
+from crawl4ai.async_dispatcher import (
+    DeadLetterSink,
+    MemoryAdaptiveDispatcher,
+    RetryPolicy,
+    SemaphoreDispatcher,
+)
+from crawl4ai.models import CrawlResult
+
+
+class ScriptedCrawler:
+    """arun() pops the next scripted outcome for the URL; defaults to success."""
+
+    def __init__(self, script):
+        self.script = {url: list(outcomes) for url, outcomes in script.items()}
+        self.calls = []
+
+    async def arun(self, url, config=None, session_id=None):
+        self.calls.append(url)
+        outcomes = self.script.get(url)
+        outcome = outcomes.pop(0) if outcomes else "ok"
+        if outcome == "ok":
+            return CrawlResult(url=url, html="<p>ok</p>", success=True, status_code=200)
+        if outcome == "503":
+            return CrawlResult(url=url, html="busy", success=True, status_code=503)
+        if outcome == "429":
+            return CrawlResult(
+                url=url, html="slow down", success=True, status_code=429,
+                response_headers={"Retry-After": "0"},
+            )
+        return CrawlResult(url=url, html="", success=False, error_message=outcome)
+
+
+def _fast_policy(**kwargs):
+    return RetryPolicy(base_delay=0.01, max_delay=0.05, jitter=False, **kwargs)
+
+
+class TestRetryPolicy:
+    def test_classify(self):
+        policy = RetryPolicy()
+        timeout = CrawlResult(url="u", html="", success=False,
+                              error_message="Page.goto: Timeout 30000ms exceeded")
+        reset = CrawlResult(url="u", html="", success=False,
+                            error_message="net::ERR_CONNECTION_RESET at https://x")
+        server = CrawlResult(url="u", html="x", success=True, status_code=502)
+        not_found = CrawlResult(url="u", html="x", success=False, status_code=404,
+                                error_message="Not found")
+        assert policy.classify(timeout) == "timeout"
+        assert policy.classify(reset) == "connection"
+        assert policy.classify(server) == "server_error"
+        assert policy.classify(not_found) is None
+
+    def test_should_retry_respects_per_class_limits(self):
+        policy = RetryPolicy(max_attempts={"timeout": 2})
+        assert policy.should_retry("timeout", 1)
+        assert not policy.should_retry("timeout", 2)
+        assert not policy.should_retry("connection", 1)
+        assert not policy.should_retry(None, 1)
+
+    def test_backoff_is_exponential_and_capped(self):
+        policy = RetryPolicy(base_delay=1.0, max_delay=5.0, jitter=False)
+        assert [policy.get_delay(n) for n in (1, 2, 3, 4)] == [1.0, 2.0, 4.0, 5.0]
+
+    def test_retry_after_replaces_the_backoff(self):
+        policy = RetryPolicy(base_delay=1.0, max_delay=5.0, jitter=False)
+        limited = CrawlResult(url="u", html="", success=True, status_code=429,
+                              response_headers={"retry-after": "3"})
+        assert policy.classify(limited) == "rate_limited"
+        assert policy.should_retry("rate_limited", 1)
+        assert policy.get_delay(1, limited) == 3.0
+        limited.response_headers = {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}  # in the past
+        assert policy.get_delay(2, limited) == 0.0
+        limited.response_headers = {"Retry-After": "3600"}
+        assert policy.get_delay(1, limited) == 5.0
+        limited.response_headers = {"Retry-After": "soon"}
+        assert policy.get_delay(2, limited) == 2.0
+
+
+@pytest.mark.asyncio
+class TestMemoryAdaptiveRetry:
+    async def test_transient_failure_is_retried_in_same_pass(self):
+        crawler = ScriptedCrawler({"https://a.com": ["Timeout 30000ms exceeded", "ok"]})
+        sink = DeadLetterSink()
+        dispatcher = MemoryAdaptiveDispatcher(
+            check_interval=0.05, retry_policy=_fast_policy(), dead_letter_sink=sink
+        )
+        results = await dispatcher.run_urls(
+            urls=["https://a.com", "https://b.com"], crawler=crawler, config=CrawlerRunConfig()
+        )
+        assert len(results) == 2
+        assert all(r.result.success for r in results)
+        retried = next(r for r in results if r.url == "https://a.com")
+        assert retried.retry_count == 1
+        assert crawler.calls.count("https://a.com") == 2
+        assert len(sink) == 0
+
+    async def test_exhausted_retries_go_to_dead_letter(self, tmp_path):
+        path = tmp_path / "dead.jsonl"
+        crawler = ScriptedCrawler({"https://a.com": ["503", "503", "503"]})
+        sink = DeadLetterSink(path=str(path))
+        dispatcher = MemoryAdaptiveDispatcher(
+            check_interval=0.05,
+            retry_policy=_fast_policy(max_attempts={"server_error": 3}),
+            dead_letter_sink=sink,
+        )
+        results = await dispatcher.run_urls(
+            urls=["https://a.com"], crawler=crawler, config=CrawlerRunConfig()
+        )
+        assert len(results) == 1
+        assert crawler.calls.count("https://a.com") == 3
+        # The page loaded, but the caller sees the failure the sink records
+        assert not results[0].result.success
+        assert results[0].error_message == results[0].result.error_message == "HTTP 503 after 3 attempts"
+        assert sink.urls() == ["https://a.com"]
+        entry = json.loads(path.read_text().strip())
+        assert entry["error_class"] == "server_error"
+        assert entry["attempts"] == 3
+
+    async def test_rate_limited_result_is_retried(self):
+        crawler = ScriptedCrawler({"https://a.com": ["429", "ok"]})
+        sink = DeadLetterSink()
+        dispatcher = MemoryAdaptiveDispatcher(
+            check_interval=0.05, retry_policy=_fast_policy(), dead_letter_sink=sink
+        )
+        results = await dispatcher.run_urls(
+            urls=["https://a.com"], crawler=crawler, config=CrawlerRunConfig()
+        )
+        assert results[0].result.success and results[0].result.status_code == 200
+        assert crawler.calls.count("https://a.com") == 2
+        assert len(sink) == 0
+
+    async def test_non_retryable_failure_is_dead_lettered_once(self):
+        crawler = ScriptedCrawler({"https://a.com": ["Invalid selector"]})
+        sink = DeadLetterSink()
+        dispatcher = MemoryAdaptiveDispatcher(
+            check_interval=0.05, retry_policy=_fast_policy(), dead_letter_sink=sink
+        )
+        results = await dispatcher.run_urls(
+            urls=["https://a.com"], crawler=crawler, config=CrawlerRunConfig()
+        )
+        assert len(results) == 1
+        assert crawler.calls == ["https://a.com"]
+        assert sink.entries[0].error_class is None
+        assert sink.entries[0].reason == "Invalid selector"
+
+    async def test_stream_yields_only_final_results(self):
+        crawler = ScriptedCrawler({"https://a.com": ["net::ERR_CONNECTION_RESET", "ok"]})
+        dispatcher = MemoryAdaptiveDispatcher(check_interval=0.05, retry_policy=_fast_policy())
+        results = [
+            r async for r in dispatcher.run_urls_stream(
+                urls=["https://a.com"], crawler=crawler, config=CrawlerRunConfig()
+            )
+        ]
+        assert len(results) == 1
+        assert results[0].result.success
+
+
+@pytest.mark.asyncio
+async def test_semaphore_dispatcher_retries():
+    crawler = ScriptedCrawler({"https://a.com": ["Timeout exceeded", "ok"]})
+    dispatcher = SemaphoreDispatcher(retry_policy=_fast_policy())
+    results = await dispatcher.run_urls(
+        crawler=crawler, urls=["https://a.com"], config=CrawlerRunConfig()
+    )
+    assert results[0].result.success
+    assert results[0].retry_count == 1
+
+
+@pytest.mark.asyncio
+async def test_semaphore_dispatcher_fails_exhausted_server_errors():
+    crawler = ScriptedCrawler({"https://a.com": ["429", "503", "ok"]})
+    sink = DeadLetterSink()
+    dispatcher = SemaphoreDispatcher(
+        retry_policy=_fast_policy(max_attempts={"server_error": 2, "rate_limited": 3}),
+        dead_letter_sink=sink,
+    )
+    results = await dispatcher.run_urls(
+        crawler=crawler, urls=["https://a.com"], config=CrawlerRunConfig()
+    )
+    # Attempts count across error classes: the 503 is the second and last
+    assert not results[0].result.success and results[0].error_message == "HTTP 503 after 2 attempts"
+    assert crawler.calls.count("https://a.com") == 2
+    assert sink.entries[0].error_class == "server_error"
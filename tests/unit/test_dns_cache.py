@@ -0,0 +1,94 @@
+"""Unit tests for the shared DNS cache and its aiohttp / httpx adapters.
+
+Name resolution is replaced with a counting fake; connections go to a local
+aiohttp server.
+"""
+
+import asyncio
+import socket
+
+import httpx
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from crawl4ai.async_configs import CrawlerRunConfig, HTTPCrawlerConfig
+from crawl4ai.async_crawler_strategy import AsyncHTTPCrawlerStrategy
+from crawl4ai.dns_cache import DNSCache, cached_httpx_transport, get_dns_cache
+
+
+@pytest.fixture
+def fake_dns(monkeypatch):
+    lookups = []
+
+    def getaddrinfo(host, port, *args, **kwargs):
+        lookups.append(host)
+        if host.endswith(".invalid"):
+            raise socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+        if host.endswith(".flaky"):
+            raise socket.gaierror(socket.EAI_AGAIN, "Temporary failure in name resolution")
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("127.0.0.1", port))]
+
+    monkeypatch.setattr(socket, "getaddrinfo", getaddrinfo)
+    get_dns_cache().clear()
+    yield lookups
+    get_dns_cache().clear()
+
+
+@pytest_asyncio.fixture
+async def port(serve):
+    async def page(request):
+        return web.Response(text=f"<html><body>{request.host}</body></html>", content_type="text/html")
+
+    base = await serve({"/": page})
+    return int(base.rsplit(":", 1)[1])
+
+
+@pytest.mark.asyncio
+async def test_answers_are_shared_across_ports_and_callers(fake_dns):
+    cache = DNSCache()
+    answers = await asyncio.gather(*(cache.resolve("Example.COM", 443) for _ in range(5)))
+    assert fake_dns == ["example.com"]
+    assert answers[0][0][4] == ("127.0.0.1", 443)
+    assert (await cache.resolve("example.com", 80))[0][4] == ("127.0.0.1", 80)
+    assert cache.resolve_blocking("example.com", 8080)[0][4] == ("127.0.0.1", 8080)
+    assert fake_dns == ["example.com"]
+    # IP literals bypass the cache
+    await cache.resolve("10.1.2.3", 80)
+    assert cache.stats["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failures_and_expiry(fake_dns):
+    cache = DNSCache(ttl=60, negative_ttl=60)
+    for _ in range(3):
+        with pytest.raises(socket.gaierror):
+            await cache.resolve("nope.invalid")
+    assert fake_dns == ["nope.invalid"] and cache.stats["negative_hits"] == 2
+
+    # Transient failures are retried on the next lookup
+    for _ in range(2):
+        with pytest.raises(socket.gaierror):
+            await cache.resolve("ns.flaky")
+    assert fake_dns.count("ns.flaky") == 2
+
+    await cache.resolve("example.com")
+    await cache.resolve("example.com", max_age=0)  # caller wants a fresh answer
+    assert fake_dns.count("example.com") == 2
+
+
+@pytest.mark.asyncio
+async def test_http_strategy_and_httpx_resolve_through_the_shared_cache(fake_dns, port):
+    url = f"http://crawl.test:{port}/"
+    for http2 in (False, True):
+        config = HTTPCrawlerConfig(http2=http2)
+        async with AsyncHTTPCrawlerStrategy(browser_config=config) as strategy:
+            response = await strategy.crawl(url, CrawlerRunConfig())
+            assert f"crawl.test:{port}" in response.html  # Host header kept
+
+    async with httpx.AsyncClient(transport=cached_httpx_transport()) as client:
+        assert (await client.get(url)).status_code == 200
+        # httpcore errors surface as the usual httpx ones
+        with pytest.raises(httpx.ConnectError):
+            await client.get("http://nope.invalid/")
+    assert fake_dns == ["crawl.test", "nope.invalid"]
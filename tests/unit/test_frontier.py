@@ -0,0 +1,288 @@
+"""Unit tests for crawl frontiers, FrontierDispatcher and FrontierCrawlingStrategy.
+
+RedisFrontier runs against a small in-process stand-in that implements the
+Redis commands the frontier uses, so no server is required.
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from crawl4ai.async_configs import CrawlerRunConfig
+from crawl4ai.async_dispatcher import FrontierDispatcher
+from crawl4ai.deep_crawling import FrontierCrawlingStrategy
+from crawl4ai import frontier as frontier_module
+from crawl4ai.frontier import InMemoryFrontier, RedisFrontier
+from crawl4ai.models import CrawlResult
+
+
+class FakeRedis:
+    """
+    Minimal async stand-in for redis.asyncio with decode_responses=True.
+
+    Lua cannot run here, so each frontier script is mirrored by a Python
+    function; like the script it runs without yielding, i.e. atomically.
+    """
+
+    def __init__(self):
+        self.sets, self.hashes, self.zsets, self.strings = {}, {}, {}, {}
+        self.scripts = {
+            frontier_module._ENQUEUE_SCRIPT: self._enqueue,
+            frontier_module._LEASE_SCRIPT: self._lease,
+            frontier_module._ACK_SCRIPT: self._ack,
+            frontier_module._NACK_SCRIPT: self._nack,
+        }
+
+    def register_script(self, script):
+        run = self.scripts[script]
+
+        async def call(keys, args):
+            return run(keys, [str(a) for a in args])
+
+        return call
+
+    def _priority(self, items, url):
+        raw = self.hashes.get(items, {}).get(url)
+        return json.loads(raw)["priority"] if raw else 0.0
+
+    def _enqueue(self, keys, args):
+        seen, items, queue = keys
+        url, priority, item = args
+        if url in self.sets.setdefault(seen, set()):
+            return 0
+        self.sets[seen].add(url)
+        self.hashes.setdefault(items, {})[url] = item
+        self.zsets.setdefault(queue, {})[url] = float(priority)
+        return 1
+
+    def _lease(self, keys, args):
+        queue, leases, items = keys
+        now, count, expires_at = float(args[0]), int(args[1]), float(args[2])
+        q, lz = self.zsets.setdefault(queue, {}), self.zsets.setdefault(leases, {})
+        for url in [u for u, s in lz.items() if s <= now]:
+            del lz[url]
+            q[url] = self._priority(items, url)
+        reply = []
+        for url, score in sorted(q.items(), key=lambda kv: (kv[1], kv[0]))[:count]:
+            del q[url]
+            lz[url] = expires_at
+            reply += [url, str(score), self.hashes.get(items, {}).get(url)]
+        return reply
+
+    def _ack(self, keys, args):
+        leases, queue, items, done = keys
+        url, result = args
+        if self.zsets.get(leases, {}).pop(url, None) is None:
+            self.zsets.get(queue, {}).pop(url, None)
+        self.hashes.get(items, {}).pop(url, None)
+        self.hashes.setdefault(done, {})[url] = result
+        return 1
+
+    def _nack(self, keys, args):
+        leases, queue, items = keys
+        (url,) = args
+        if self.zsets.get(leases, {}).pop(url, None) is None:
+            return 0
+        self.zsets.setdefault(queue, {})[url] = self._priority(items, url)
+        return 1
+
+    async def sadd(self, key, *members):
+        s = self.sets.setdefault(key, set())
+        added = len(set(members) - s)
+        s.update(members)
+        return added
+
+    async def scard(self, key):
+        return len(self.sets.get(key, ()))
+
+    async def hset(self, key, field=None, value=None, mapping=None):
+        h = self.hashes.setdefault(key, {})
+        if field is not None:
+            h[field] = value
+        h.update(mapping or {})
+        return 1
+
+    async def hget(self, key, field):
+        return self.hashes.get(key, {}).get(field)
+
+    async def hmget(self, key, fields):
+        h = self.hashes.get(key, {})
+        return [h.get(f) for f in fields]
+
+    async def hdel(self, key, *fields):
+        h = self.hashes.get(key, {})
+        return sum(1 for f in fields if h.pop(f, None) is not None)
+
+    async def hlen(self, key):
+        return len(self.hashes.get(key, {}))
+
+    async def zadd(self, key, mapping):
+        self.zsets.setdefault(key, {}).update({m: float(s) for m, s in mapping.items()})
+
+    async def zpopmin(self, key, count=1):
+        z = self.zsets.get(key, {})
+        popped = sorted(z.items(), key=lambda kv: (kv[1], kv[0]))[:count]
+        for member, _ in popped:
+            del z[member]
+        return popped
+
+    async def zrangebyscore(self, key, lo, hi):
+        lo = float(lo)
+        return [m for m, s in sorted(self.zsets.get(key, {}).items(), key=lambda kv: kv[1])
+                if lo <= s <= float(hi)]
+
+    async def zrem(self, key, *members):
+        z = self.zsets.get(key, {})
+        return sum(1 for m in members if z.pop(m, None) is not None)
+
+    async def zcard(self, key):
+        return len(self.zsets.get(key, {}))
+
+    async def set(self, key, value, nx=False, px=None):
+        current = self.strings.get(key)
+        if current and current[1] > time.time() and nx:
+            return None
+        self.strings[key] = (value, time.time() + px / 1000)
+        return True
+
+    async def pttl(self, key):
+        current = self.strings.get(key)
+        if not current:
+            return -2
+        return int((current[1] - time.time()) * 1000)
+
+
+@pytest.fixture(params=["memory", "redis"])
+def make_frontier(request):
+    shared = FakeRedis()
+
+    def factory(**kwargs):
+        if request.param == "memory":
+            return InMemoryFrontier(**kwargs)
+        return RedisFrontier(client=shared, namespace="test", **kwargs)
+
+    return factory
+
+
+@pytest.mark.asyncio
+class TestFrontierBackends:
+    async def test_enqueue_dedups(self, make_frontier):
+        frontier = make_frontier()
+        assert await frontier.enqueue("https://a.com/1")
+        assert not await frontier.enqueue("https://a.com/1")
+        assert (await frontier.stats())["seen"] == 1
+
+    async def test_lease_order_and_ack(self, make_frontier):
+        frontier = make_frontier()
+        await frontier.enqueue("https://a.com/low", priority=5)
+        await frontier.enqueue("https://a.com/high", priority=-1, depth=2, parent_url="https://a.com")
+        items = await frontier.lease(1)
+        assert [i.url for i in items] == ["https://a.com/high"]
+        assert items[0].depth == 2 and items[0].parent_url == "https://a.com"
+        await frontier.ack("https://a.com/high", {"success": True})
+        assert await frontier.get_result("https://a.com/high") == {"success": True}
+        stats = await frontier.stats()
+        assert (stats["queued"], stats["leased"], stats["done"]) == (1, 0, 1)
+        # An acked URL can never be enqueued again
+        assert not await frontier.enqueue("https://a.com/high")
+
+    async def test_expired_lease_becomes_visible_again(self, make_frontier):
+        frontier = make_frontier(visibility_timeout=0.05)
+        await frontier.enqueue("https://a.com/1")
+        assert len(await frontier.lease(1)) == 1
+        assert await frontier.lease(1) == []
+        await asyncio.sleep(0.08)
+        again = await frontier.lease(1)
+        assert [i.url for i in again] == ["https://a.com/1"]
+        assert again[0].attempts == 2
+
+    async def test_ack_after_expiry_does_not_crawl_again(self, make_frontier):
+        frontier = make_frontier(visibility_timeout=0.05)
+        await frontier.enqueue("https://a.com/slow", depth=3, parent_url="https://a.com")
+        await frontier.enqueue("https://a.com/next", priority=1, depth=1)
+        assert [i.url for i in await frontier.lease(1)] == ["https://a.com/slow"]
+        await asyncio.sleep(0.08)
+        await frontier.lease(0)  # another worker polls: the expired lease is requeued
+        assert (await frontier.stats())["queued"] == 2
+
+        # The slow worker finishes after all
+        await frontier.ack("https://a.com/slow", {"success": True})
+        items = await frontier.lease(5)
+        assert [(i.url, i.depth) for i in items] == [("https://a.com/next", 1)]
+        await frontier.ack("https://a.com/next")
+        assert await frontier.is_drained()
+        assert await frontier.get_result("https://a.com/slow") == {"success": True}
+
+    async def test_nack_requeues(self, make_frontier):
+        frontier = make_frontier()
+        await frontier.enqueue("https://a.com/1")
+        await frontier.lease(1)
+        await frontier.nack("https://a.com/1")
+        assert (await frontier.stats())["queued"] == 1
+        assert not await frontier.is_drained()
+
+    async def test_host_token(self, make_frontier):
+        frontier = make_frontier()
+        assert await frontier.acquire_host("a.com", 0.5) == 0
+        wait = await frontier.acquire_host("a.com", 0.5)
+        assert 0 < wait <= 0.5
+        assert await frontier.acquire_host("b.com", 0.5) == 0
+
+    async def test_two_workers_share_redis_state(self):
+        client = FakeRedis()
+        node_a = RedisFrontier(client=client, namespace="shared")
+        node_b = RedisFrontier(client=client, namespace="shared")
+        await node_a.enqueue("https://a.com/1")
+        assert not await node_b.enqueue("https://a.com/1")
+        assert len(await node_b.lease(5)) == 1
+        assert await node_a.lease(5) == []
+
+
+class LinkCrawler:
+    """Fake crawler: every page links to the pages listed in ``graph``."""
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.calls = []
+
+    async def arun(self, url, config=None, session_id=None):
+        self.calls.append(url)
+        links = [{"href": href} for href in self.graph.get(url, [])]
+        return CrawlResult(url=url, html="<p>x</p>", success=True, status_code=200,
+                           links={"internal": links, "external": []})
+
+
+@pytest.mark.asyncio
+async def test_frontier_dispatcher_skips_urls_already_seen():
+    frontier = InMemoryFrontier()
+    await frontier.enqueue("https://a.com/done")
+    await frontier.lease(1)
+    await frontier.ack("https://a.com/done")
+
+    crawler = LinkCrawler({})
+    dispatcher = FrontierDispatcher(frontier, poll_interval=0.01)
+    results = await dispatcher.run_urls(
+        urls=["https://a.com/1", "https://a.com/1", "https://a.com/done"],
+        crawler=crawler, config=CrawlerRunConfig(),
+    )
+    assert [r.url for r in results] == ["https://a.com/1"]
+    assert await frontier.is_drained()
+
+
+@pytest.mark.asyncio
+async def test_frontier_crawling_strategy_expands_links():
+    graph = {
+        "https://a.com/": ["/x", "/y"],
+        "https://a.com/x": ["/y", "/z"],
+        "https://a.com/y": ["/"],
+    }
+    crawler = LinkCrawler(graph)
+    strategy = FrontierCrawlingStrategy(max_depth=2, frontier=InMemoryFrontier())
+    results = await strategy.arun("https://a.com/", crawler, CrawlerRunConfig())
+    urls = sorted(r.url for r in results)
+    assert urls == ["https://a.com/", "https://a.com/x", "https://a.com/y", "https://a.com/z"]
+    assert sorted(crawler.calls) == urls
+    depth = {r.url: r.metadata["depth"] for r in results}
+    assert depth["https://a.com/z"] == 2
@@ -0,0 +1,121 @@
+"""Unit tests for the single-pass HTML capture.
+
+Pages and frames are fakes; no browser required.
+"""
+
+import pytest
+
+from crawl4ai.async_configs import CrawlerRunConfig
+from crawl4ai.async_crawler_strategy import AsyncPlaywrightCrawlerStrategy
+from crawl4ai.js_snippet import load_js_script
+
+DOC = "<html><body><p>hello</p></body></html>"
+
+
+class FakeElement:
+    def __init__(self):
+        self.attributes = {}
+
+    async def evaluate(self, script, value):
+        self.attributes["data-crawl4ai-frame"] = value
+
+
+class FakeFrame:
+    def __init__(self, body):
+        self.body = body
+        self.element = FakeElement()
+
+    async def frame_element(self):
+        return self.element
+
+    async def wait_for_load_state(self, state, timeout=None):
+        pass
+
+    async def evaluate(self, script):
+        return self.body
+
+
+class FakeMainFrame:
+    def __init__(self, frames):
+        self.child_frames = frames
+
+
+class FakePage:
+    def __init__(self, serialized=DOC, frames=()):
+        self.serialized = serialized
+        self.main_frame = FakeMainFrame(list(frames))
+        self.evaluations = []
+        self.content_calls = 0
+
+    async def content(self):
+        self.content_calls += 1
+        return DOC
+
+    async def evaluate(self, script, arg=None):
+        self.evaluations.append((script, arg))
+        if isinstance(arg, list):  # css_selector path
+            return [f"<p>{selector}</p>" for selector in arg]
+        if arg.get("selectors"):  # serializer with css_selector
+            return [f"<section>{selector}</section>" for selector in arg["selectors"]]
+        return self.serialized
+
+
+@pytest.fixture
+def strategy():
+    return AsyncPlaywrightCrawlerStrategy()
+
+
+@pytest.mark.asyncio
+async def test_default_capture_uses_page_content_once(strategy):
+    page = FakePage()
+    html, stats = await strategy.capture_html(page, CrawlerRunConfig())
+    assert html == DOC and page.content_calls == 1 and page.evaluations == []
+    assert stats["method"] == "content" and stats["chars"] == len(DOC)
+    assert stats["duration"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_shadow_dom_and_frames_are_serialized_in_one_call(strategy):
+    page = FakePage(frames=[FakeFrame("<p>one</p>"), FakeFrame("<p>two</p>")])
+    frames = await strategy.collect_frame_html(page)
+    assert frames == {"0": "<p>one</p>", "1": "<p>two</p>"}
+    assert page.main_frame.child_frames[1].element.attributes == {"data-crawl4ai-frame": "1"}
+
+    config = CrawlerRunConfig(flatten_shadow_dom=True, process_iframes=True)
+    html, stats = await strategy.capture_html(page, config, frames)
+    assert html == DOC and page.content_calls == 0
+    assert page.evaluations == [
+        (load_js_script("capture_document"), {"shadow": True, "frames": frames})
+    ]
+    assert stats["method"] == "serializer" and stats["frames"] == 2
+
+
+@pytest.mark.asyncio
+async def test_serializer_falls_back_to_page_content(strategy):
+    page = FakePage(serialized=None)
+    html, stats = await strategy.capture_html(page, CrawlerRunConfig(flatten_shadow_dom=True))
+    assert html == DOC and page.content_calls == 1
+    assert stats["method"] == "content"
+
+
+@pytest.mark.asyncio
+async def test_css_selectors_are_read_in_one_call(strategy):
+    page = FakePage()
+    html, stats = await strategy.capture_html(page, CrawlerRunConfig(css_selector="main, .title"))
+    assert len(page.evaluations) == 1 and page.evaluations[0][1] == ["main", ".title"]
+    assert html == "<div class='crawl4ai-result'>\n<p>main</p>\n<p>.title</p>\n</div>"
+    assert stats["method"] == "selector"
+
+
+@pytest.mark.asyncio
+async def test_css_selector_applies_to_serialized_frames(strategy):
+    page = FakePage(frames=[FakeFrame("<p>one</p>")])
+    frames = await strategy.collect_frame_html(page)
+    config = CrawlerRunConfig(process_iframes=True, css_selector="main, .title")
+    html, stats = await strategy.capture_html(page, config, frames)
+    assert page.evaluations[-1] == (
+        load_js_script("capture_document"),
+        {"shadow": False, "frames": frames, "selectors": ["main", ".title"]},
+    )
+    assert html == "<div class='crawl4ai-result'>\n<section>main</section>\n<section>.title</section>\n</div>"
+    assert stats["method"] == "serializer" and page.content_calls == 0
@@ -0,0 +1,128 @@
+"""Unit tests for streamed HTTP file downloads and the browser download limit.
+
+A local aiohttp server sends CSV files in chunks, with and without a
+Content-Length, to the HTTP strategy on both transports. Browser downloads
+are fakes of Playwright's Download.
+"""
+
+import hashlib
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from playwright.async_api import Error
+
+from crawl4ai.async_configs import BrowserConfig, CrawlerRunConfig, HTTPCrawlerConfig
+from crawl4ai.async_crawler_strategy import (
+    AsyncHTTPCrawlerStrategy,
+    AsyncPlaywrightCrawlerStrategy,
+    ResponseTooLargeError,
+)
+
+ROW = b"1,alpha,100,some longer text column\n"
+CSV = b"id,name,value,notes\n" + ROW * 80_000  # ~3 MB
+
+
+@pytest_asyncio.fixture
+async def server(serve):
+    async def csv(request):
+        headers = {"Content-Type": "text/csv", "Content-Disposition": 'attachment; filename="big.csv"'}
+        if "sized" in request.query:
+            headers["Content-Length"] = str(len(CSV))
+        response = web.StreamResponse(headers=headers)
+        await response.prepare(request)
+        for i in range(0, len(CSV), 256 * 1024):
+            await response.write(CSV[i:i + 256 * 1024])
+        await response.write_eof()
+        return response
+
+    return await serve({"/big.csv": csv}) + "/big.csv"
+
+
+async def fetch(url, **config):
+    async with AsyncHTTPCrawlerStrategy(browser_config=HTTPCrawlerConfig(**config)) as strategy:
+        return await strategy.crawl(url, CrawlerRunConfig())
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("http2", [False, True])
+async def test_download_is_streamed_hashed_and_previewed(server, tmp_path, http2):
+    # max_body_size bounds buffered pages, not streamed downloads
+    response = await fetch(
+        server, http2=http2, downloads_path=str(tmp_path), max_body_size=1024, download_preview_size=100
+    )
+    path = response.downloaded_files[0]
+    assert open(path, "rb").read() == CSV
+    assert response.downloaded_file_hashes == {path: hashlib.sha256(CSV).hexdigest()}
+    assert response.html == CSV[:100].decode()
+
+    response = await fetch(server, downloads_path=str(tmp_path), download_preview_size=None)
+    assert response.html == CSV.decode()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("query", ["?sized", ""])
+async def test_oversized_download_fails_and_is_removed(server, tmp_path, query):
+    with pytest.raises(ResponseTooLargeError):
+        await fetch(server + query, downloads_path=str(tmp_path), max_download_size=len(CSV) - 1)
+    assert list(tmp_path.iterdir()) == []
+
+    response = await fetch(server + query, downloads_path=str(tmp_path), max_download_size=len(CSV))
+    assert response.downloaded_files == [str(tmp_path / "big.csv")]
+
+
+def test_download_limits_are_validated():
+    with pytest.raises(ValueError):
+        HTTPCrawlerConfig(max_download_size=0)
+    with pytest.raises(ValueError):
+        HTTPCrawlerConfig(download_preview_size=-1)
+    config = HTTPCrawlerConfig.from_kwargs({"max_download_size": 10})
+    assert config.to_dict()["max_download_size"] == 10
+    assert config.download_preview_size == 1024 * 1024
+
+
+class FakeDownload:
+    suggested_filename = "big.csv"
+
+    def __init__(self, path, remote=False):
+        self._path = path
+        self.remote = remote
+        self.saved = self.deleted = False
+
+    async def path(self):
+        if self.remote:
+            raise Error("Path is not available when connecting remotely")
+        return self._path
+
+    async def save_as(self, target):
+        self.saved = True
+        with open(target, "wb") as f:
+            f.write(self._path.read_bytes())
+
+    async def delete(self):
+        self.deleted = True
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("remote", [False, True])
+async def test_oversized_browser_download_is_deleted_not_saved(tmp_path, remote):
+    source = tmp_path / "browser-copy"
+    source.write_bytes(CSV[:1000])
+    downloads = tmp_path / "downloads"
+    downloads.mkdir()
+    strategy = AsyncPlaywrightCrawlerStrategy(
+        browser_config=BrowserConfig(downloads_path=str(downloads), max_download_size=999)
+    )
+    warnings = []
+    strategy.logger.warning = lambda **kwargs: warnings.append(kwargs)
+
+    download = FakeDownload(source, remote)
+    await strategy._handle_download(download)
+    assert download.deleted and download.saved == remote  # no copy when the size is known
+    assert list(downloads.iterdir()) == [] and strategy._downloaded_files == []
+    assert warnings[0]["params"]["size"] == 1000
+
+    strategy.browser_config.max_download_size = 1000
+    await strategy._handle_download(FakeDownload(source, remote))
+    assert strategy._downloaded_files == [str(downloads / "big.csv")]
@@ -0,0 +1,130 @@
+"""Unit tests for the HTTP/2-capable transport and connection reuse stats.
+
+Requests go to a local aiohttp server; no network access required.
+"""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from crawl4ai.async_configs import CrawlerRunConfig, HTTPCrawlerConfig
+from crawl4ai.async_crawler_strategy import AsyncHTTPCrawlerStrategy, HTTPCrawlerError
+
+
+@pytest_asyncio.fixture
+async def server(serve):
+    state = {"in_flight": 0, "peak": 0}
+
+    async def page(request):
+        state["in_flight"] += 1
+        state["peak"] = max(state["peak"], state["in_flight"])
+        await asyncio.sleep(0.02)
+        state["in_flight"] -= 1
+        return web.Response(text="<html><body>hi</body></html>", content_type="text/html")
+
+    async def report(request):
+        return web.Response(
+            body=b"a,b\n1,2\n",
+            headers={"Content-Type": "text/csv", "Content-Disposition": 'attachment; filename="report.csv"'},
+        )
+
+    async def latin1(request):
+        body = '<html><head><meta charset="iso-8859-1"></head><body>Café</body></html>'
+        return web.Response(body=body.encode("latin-1"), headers={"Content-Type": "text/html"})
+
+    async def large(request):
+        response = web.StreamResponse(headers={"Content-Type": "text/html"})
+        await response.prepare(request)
+        for _ in range(64):
+            await response.write(b"x" * 1024)
+        return response
+
+    base = await serve({"/page/{n}": page, "/report": report, "/latin1": latin1, "/large": large})
+    return base, state
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("http2", [False, True])
+async def test_connections_are_reused_and_capped_per_host(server, http2):
+    base, state = server
+    config = HTTPCrawlerConfig(http2=http2, max_connections_per_host=2)
+    async with AsyncHTTPCrawlerStrategy(browser_config=config) as strategy:
+        results = await asyncio.gather(
+            *(strategy.crawl(f"{base}/page/{i}", CrawlerRunConfig()) for i in range(10))
+        )
+        stats = strategy.connection_stats()
+
+    assert all(r.status_code == 200 and "hi" in r.html for r in results)
+    assert state["peak"] <= 2
+    assert stats["requests"] == 10
+    assert stats["connections_opened"] <= 2
+    assert stats["connections_reused"] >= 8
+    assert stats["tls_handshakes"] == 0
+
+
+@pytest.mark.asyncio
+async def test_http2_clients_are_per_origin_and_evicted_when_idle(server, monkeypatch):
+    base, _ = server
+    monkeypatch.setattr(AsyncHTTPCrawlerStrategy, "MAX_HTTPX_CLIENTS", 1)
+    config = HTTPCrawlerConfig(http2=True, max_connections_per_host=2)
+    async with AsyncHTTPCrawlerStrategy(browser_config=config) as strategy:
+        first = await strategy.crawl(f"{base}/page/1", CrawlerRunConfig())
+        (client,) = strategy._clients.values()
+        assert client._transport._pool._max_connections == 2
+
+        other = base.replace("127.0.0.1", "localhost")
+        second = await strategy.crawl(f"{other}/page/2", CrawlerRunConfig())
+        assert list(strategy._clients) == [(None, other)]
+        assert client.is_closed
+
+    assert first.status_code == second.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_http2_transport_saves_downloads(server, tmp_path):
+    base, _ = server
+    config = HTTPCrawlerConfig(http2=True, downloads_path=str(tmp_path))
+    async with AsyncHTTPCrawlerStrategy(browser_config=config) as strategy:
+        result = await strategy.crawl(f"{base}/report", CrawlerRunConfig())
+    # Lowercase header names still trigger the download path
+    assert result.downloaded_files == [str(tmp_path / "report.csv")]
+    assert result.html == "a,b\n1,2\n"
+    assert result.body_size == 0  # the file is reported through downloaded_files
+
+
+@pytest.mark.asyncio
+async def test_httpx_trace_counts_http2_requests():
+    strategy = AsyncHTTPCrawlerStrategy()
+    for event in (
+        "connection.connect_tcp.complete", "connection.start_tls.complete",
+        "http2.send_request_headers.started", "http2.send_request_headers.started",
+    ):
+        await strategy._on_httpx_trace(event, {})
+    assert strategy.connection_stats() == {
+        "requests": 2, "connections_opened": 1, "tls_handshakes": 1,
+        "http2_requests": 2, "connections_reused": 1,
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("http2", [False, True])
+async def test_meta_charset_and_body_size_cap(server, http2):
+    base, _ = server
+    config = HTTPCrawlerConfig(http2=http2, max_body_size=16 * 1024)
+    async with AsyncHTTPCrawlerStrategy(browser_config=config) as strategy:
+        result = await strategy.crawl(f"{base}/latin1", CrawlerRunConfig())
+        assert "Café" in result.html
+        assert result.body_size == len(result.html.encode("latin-1"))  # bytes received, not re-encoded
+        with pytest.raises(HTTPCrawlerError, match="max_body_size"):
+            await strategy.crawl(f"{base}/large", CrawlerRunConfig())
+
+
+def test_config_roundtrip():
+    config = HTTPCrawlerConfig(http2=True, max_connections_per_host=4, keepalive_expiry=30, max_body_size=1024)
+    clone = HTTPCrawlerConfig.load(config.dump())
+    assert (clone.http2, clone.max_connections_per_host, clone.keepalive_expiry) == (True, 4, 30)
+    assert clone.max_body_size == 1024
+    with pytest.raises(ValueError):
+        HTTPCrawlerConfig(max_connections_per_host=0)
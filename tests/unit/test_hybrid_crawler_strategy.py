@@ -0,0 +1,127 @@
+"""Unit tests for the HTTP-first hybrid crawler strategy.
+
+HTTP fetches go to a local aiohttp server; the browser leg is a stub that
+records the URLs it was asked to render.
+"""
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from crawl4ai.async_configs import CrawlerRunConfig
+from crawl4ai.hybrid_crawler_strategy import HybridCrawlerStrategy, js_render_reason
+from crawl4ai.models import AsyncCrawlResponse
+
+ARTICLE = "<p>Server-rendered article text, readable without any script.</p>" * 30
+
+
+class StubBrowser:
+    def __init__(self):
+        self.urls = []
+        self.started = self.closed = False
+
+    async def start(self):
+        self.started = True
+
+    async def close(self):
+        self.closed = True
+
+    async def crawl(self, url, config=None, **kwargs):
+        self.urls.append(url)
+        return AsyncCrawlResponse(html="<html><body>rendered</body></html>", response_headers={}, status_code=200)
+
+
+@pytest_asyncio.fixture
+async def server(serve):
+    pages = {
+        "static": f"<html><body>{ARTICLE}</body></html>",
+        "spa": '<html><body><div id="root"></div><script src="/app.js"></script></body></html>',
+        "noscript": (
+            "<html><body><noscript>You need to enable JavaScript to run this app.</noscript>"
+            "<nav>Home About</nav><script>boot()</script></body></html>"
+        ),
+    }
+
+    async def page(request):
+        name = request.match_info["name"]
+        if name not in pages:
+            return web.Response(status=404, text="missing")
+        return web.Response(text=pages[name], content_type="text/html")
+
+    async def data(request):
+        return web.json_response({"ok": True})
+
+    return await serve({"/data.json": data, "/{name}": page})
+
+
+@pytest_asyncio.fixture
+async def hybrid():
+    browser = StubBrowser()
+    strategy = HybridCrawlerStrategy(browser_strategy=browser, escalate_after=2)
+    async with strategy:
+        yield strategy, browser
+    assert browser.closed == browser.started
+
+
+def test_js_render_reason():
+    assert js_render_reason(f"<html><body>{ARTICLE}<script>x()</script></body></html>") is None
+    assert js_render_reason("<html><body><app-root></app-root></body></html>") == "empty app root"
+    assert js_render_reason('<div id="__next"> </div>') == "empty app root"
+    assert js_render_reason("<body><h1>Hi</h1><script src=a.js></script></body>").startswith("script shell")
+    # Short pages without scripts are just short
+    assert js_render_reason("<body><h1>Hi</h1></body>") is None
+
+
+@pytest.mark.asyncio
+async def test_static_pages_stay_on_http(server, hybrid):
+    strategy, browser = hybrid
+    response = await strategy.crawl(f"{server}/static", CrawlerRunConfig())
+    assert "Server-rendered" in response.html
+    response = await strategy.crawl(f"{server}/data.json", CrawlerRunConfig())
+    assert '"ok"' in response.html
+    assert browser.urls == [] and not browser.started
+    assert strategy.stats == {"http": 2, "browser": 0, "escalations": 0}
+
+
+@pytest.mark.asyncio
+async def test_js_shells_escalate_and_host_is_remembered(server, hybrid):
+    strategy, browser = hybrid
+    for name in ("spa", "noscript"):
+        response = await strategy.crawl(f"{server}/{name}", CrawlerRunConfig())
+        assert response.html == "<html><body>rendered</body></html>"
+    assert browser.urls == [f"{server}/spa", f"{server}/noscript"]
+    assert strategy.host_decisions == {server.split("//")[1]: "browser"}
+
+    # Even a static page of that host now skips the HTTP attempt
+    await strategy.crawl(f"{server}/static", CrawlerRunConfig())
+    assert strategy.stats == {"http": 2, "browser": 3, "escalations": 2}
+
+
+@pytest.mark.asyncio
+async def test_http_success_resets_the_streak(server, hybrid):
+    strategy, browser = hybrid
+    for name in ("spa", "static", "spa"):
+        await strategy.crawl(f"{server}/{name}", CrawlerRunConfig())
+    assert strategy.host_decisions == {}
+    assert len(browser.urls) == 2
+
+
+@pytest.mark.asyncio
+async def test_browser_only_configs_and_final_statuses(server, hybrid):
+    strategy, browser = hybrid
+    await strategy.crawl(f"{server}/static", CrawlerRunConfig(screenshot=True))
+    assert browser.urls == [f"{server}/static"]
+    assert strategy.stats["http"] == 0
+
+    # A 404 is a 404 in the browser too
+    with pytest.raises(Exception, match="404"):
+        await strategy.crawl(f"{server}/missing", CrawlerRunConfig())
+    assert len(browser.urls) == 1
+
+
+@pytest.mark.asyncio
+async def test_connection_errors_escalate(hybrid):
+    strategy, browser = hybrid
+    await strategy.crawl("http://127.0.0.1:1/", CrawlerRunConfig(page_timeout=2000))
+    assert browser.urls == ["http://127.0.0.1:1/"]
+    assert strategy.stats["escalations"] == 1
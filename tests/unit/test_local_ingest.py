@@ -0,0 +1,96 @@
+"""Unit tests for bulk local ingestion.
+
+Pages are written to a temporary directory and processed without a browser;
+the fleet test spawns real worker processes.
+"""
+
+import json
+
+import pytest
+
+from crawl4ai import CacheMode, CrawlerRunConfig
+from crawl4ai.async_crawler_strategy import AsyncHTTPCrawlerStrategy
+from crawl4ai.charset import decode_file
+from crawl4ai.local_ingest import LocalFileCrawlerStrategy, ingest_local, local_sources
+
+CONFIG = CrawlerRunConfig(cache_mode=CacheMode.BYPASS, verbose=False)
+
+
+def page(title: str) -> str:
+    return f"<html><head><title>{title}</title></head><body><h1>{title}</h1><a href='/next'>next</a></body></html>"
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    (tmp_path / "a").mkdir()
+    for i in range(6):
+        (tmp_path / "a" / f"p{i}.html").write_text(page(f"Page {i}"), encoding="utf-8")
+    (tmp_path / "a" / "notes.txt").write_text("not a page")
+    return tmp_path
+
+
+def test_decode_file_keeps_multibyte_characters_whole(tmp_path):
+    text = "<html><body>" + "ü€😀" * 40_000 + "</body></html>"  # spans many 64 KB chunks
+    path = tmp_path / "u.html"
+    path.write_bytes(text.encode("utf-8"))
+    assert decode_file(str(path)) == text
+
+    path.write_bytes(b'<meta charset="iso-8859-1"><p>Caf\xe9</p>')
+    assert decode_file(str(path)).endswith("<p>Café</p>")
+    path.write_bytes(b"")
+    assert decode_file(str(path)) == ""
+
+
+def test_sources_from_directory_glob_and_manifest(corpus):
+    from_dir = sorted(path for _, path in local_sources(str(corpus)))
+    assert len(from_dir) == 6 and all(p.endswith(".html") for p in from_dir)
+    assert sorted(p for _, p in local_sources(str(corpus / "a" / "p[0-2].html"))) == from_dir[:3]
+
+    manifest = corpus / "manifest.jsonl"
+    manifest.write_text(
+        "a/p0.html\n"
+        + json.dumps({"path": "a/p1.html", "url": "https://example.com/one"}) + "\n"
+    )
+    assert list(local_sources(str(manifest))) == [
+        (f"file://{corpus}/a/p0.html", f"{corpus}/a/p0.html"),
+        ("https://example.com/one", f"{corpus}/a/p1.html"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_manifest_urls_are_served_under_their_original_address(corpus):
+    manifest = corpus / "manifest.jsonl"
+    manifest.write_text(json.dumps({"path": "a/p1.html", "url": "https://example.com/one"}) + "\n")
+    results = [r async for r in ingest_local(str(manifest), config=CONFIG, num_workers=1)]
+    assert len(results) == 1 and results[0].success
+    assert results[0].url == "https://example.com/one"
+    assert results[0].links["internal"][0]["href"] == "https://example.com/next"
+
+    with pytest.raises(FileNotFoundError):
+        await LocalFileCrawlerStrategy(str(manifest)).crawl("https://example.com/unknown")
+
+
+@pytest.mark.asyncio
+async def test_files_are_dispatched_in_batches(corpus):
+    results = [r async for r in ingest_local(str(corpus), config=CONFIG, num_workers=1, batch_size=4)]
+    assert sorted(r.metadata["title"] for r in results) == [f"Page {i}" for i in range(6)]
+
+    with pytest.raises(ValueError):
+        await ingest_local(str(corpus), batch_size=0).__anext__()
+
+
+@pytest.mark.asyncio
+async def test_http_strategy_file_urls_decode_whole_file(tmp_path):
+    path = tmp_path / "big.html"
+    text = "<html><body>" + "日本語" * 50_000 + "</body></html>"
+    path.write_bytes(text.encode("utf-8"))
+    async with AsyncHTTPCrawlerStrategy() as strategy:
+        response = await strategy.crawl(f"file://{path}")
+    assert response.html == text
+
+
+@pytest.mark.asyncio
+async def test_directory_is_processed_across_worker_processes(corpus):
+    results = [r async for r in ingest_local(str(corpus), config=CONFIG, num_workers=2)]
+    assert sorted(r.metadata["title"] for r in results) == [f"Page {i}" for i in range(6)]
+    assert all(r.success and r.url.startswith("file://") for r in results)
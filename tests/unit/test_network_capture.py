@@ -0,0 +1,154 @@
+"""Unit tests for bounded, filterable network capture and its HAR/JSONL output.
+
+Requests and responses are fakes; no browser required.
+"""
+
+import json
+
+import pytest
+
+from crawl4ai.async_configs import CrawlerRunConfig, NetworkCaptureConfig
+from crawl4ai.network_capture import NetworkCapture, har_entry
+
+
+class FakeRequest:
+    def __init__(self, url, resource_type="document", method="GET"):
+        self.url = url
+        self.resource_type = resource_type
+        self.method = method
+        self.headers = {"accept": "*/*"}
+        self.post_data_buffer = None
+        self.post_data = None
+        self.failure = None
+        self.timing = {"startTime": 1_700_000_000_000, "requestStart": 5, "responseStart": 25, "responseEnd": 40}
+
+    def is_navigation_request(self):
+        return self.resource_type == "document"
+
+
+class FakeResponse:
+    def __init__(self, url, status=200, body=b"hello world", resource_type="document", headers=None):
+        self.url = url
+        self.status = status
+        self.status_text = "OK"
+        self.headers = headers or {"content-type": "text/html"}
+        self.from_service_worker = False
+        self.request = FakeRequest(url, resource_type)
+        self._body = body
+        self.body_reads = 0
+
+    async def body(self):
+        self.body_reads += 1
+        return self._body
+
+
+def _capture(**kwargs):
+    return NetworkCapture(NetworkCaptureConfig(**kwargs), "https://example.com/")
+
+
+@pytest.mark.asyncio
+async def test_default_captures_everything():
+    capture = NetworkCapture(None, "https://example.com/")
+    await capture.on_request(FakeRequest("https://example.com/"))
+    await capture.on_response(FakeResponse("https://example.com/"))
+    events = capture.entries
+    assert [e["event_type"] for e in events] == ["request", "response"]
+    assert events[1]["body"] == {"text": "hello world", "truncated": False}
+
+
+@pytest.mark.asyncio
+async def test_filters_by_type_pattern_and_status():
+    capture = _capture(
+        resource_types=["document", "xhr"], url_patterns=["*/api/*", "https://example.com/"],
+        status_ranges=[(200, 299)],
+    )
+    await capture.on_response(FakeResponse("https://example.com/logo.png", resource_type="image"))
+    await capture.on_response(FakeResponse("https://example.com/other", resource_type="xhr"))
+    await capture.on_response(FakeResponse("https://example.com/api/x", status=500, resource_type="xhr"))
+    await capture.on_response(FakeResponse("https://example.com/api/y", resource_type="xhr"))
+    assert [e["url"] for e in capture.entries] == ["https://example.com/api/y"]
+    assert capture.dropped == 3
+
+
+@pytest.mark.asyncio
+async def test_body_limits():
+    capture = _capture(max_body_size=5, body_resource_types=["document"])
+    truncated = FakeResponse("https://example.com/")
+    too_large = FakeResponse("https://example.com/big", headers={"content-length": "1000"})
+    script = FakeResponse("https://example.com/app.js", resource_type="script")
+    for response in (truncated, too_large, script):
+        await capture.on_response(response)
+    bodies = [e["body"] for e in capture.entries]
+    assert bodies[0] == {"text": "hello", "truncated": True}
+    assert bodies[1] == {"text": None, "truncated": True, "size": 1000}
+    assert bodies[2]["text"] is None
+    assert (too_large.body_reads, script.body_reads) == (0, 0)
+
+    no_bodies = _capture(max_body_size=0)
+    response = FakeResponse("https://example.com/")
+    await no_bodies.on_response(response)
+    assert response.body_reads == 0
+
+
+@pytest.mark.asyncio
+async def test_ring_buffer_keeps_newest():
+    capture = _capture(max_entries=2)
+    for i in range(5):
+        await capture.on_request(FakeRequest(f"https://example.com/{i}"))
+    assert [e["url"] for e in capture.entries] == ["https://example.com/3", "https://example.com/4"]
+
+
+@pytest.mark.asyncio
+async def test_streams_jsonl(tmp_path):
+    capture = _capture(output_dir=str(tmp_path))
+    await capture.open()
+    await capture.on_request(FakeRequest("https://example.com/"))
+    await capture.on_response(FakeResponse("https://example.com/"))
+    await capture.close()
+    await capture.on_request(FakeRequest("https://example.com/late"))  # ignored
+
+    assert capture.entries is None and capture.path.endswith(".jsonl")
+    with open(capture.path) as f:
+        events = [json.loads(line) for line in f]
+    assert [e["event_type"] for e in events] == ["request", "response"]
+
+
+@pytest.mark.asyncio
+async def test_streams_valid_har(tmp_path):
+    capture = _capture(output_dir=str(tmp_path), output_format="har")
+    await capture.open()
+    await capture.on_request(FakeRequest("https://example.com/"))
+    await capture.on_response(FakeResponse("https://example.com/"))
+    failed = FakeRequest("https://example.com/gone.js", "script")
+    failed.failure = "net::ERR_FAILED"
+    await capture.on_request_failed(failed)
+    await capture.close()
+
+    with open(capture.path) as f:
+        har = json.load(f)
+    entries = har["log"]["entries"]
+    assert har["log"]["version"] == "1.2" and len(entries) == 2
+    assert entries[0]["response"]["status"] == 200
+    assert entries[0]["response"]["content"]["text"] == "hello world"
+    assert entries[0]["timings"]["wait"] == 20 and entries[0]["time"] == 40
+    assert entries[0]["startedDateTime"].startswith("2023-11-14T22:13:20")
+    assert entries[1]["response"]["_failureText"] == "net::ERR_FAILED"
+
+
+def test_har_entry_skips_bare_requests():
+    assert har_entry({"event_type": "request", "url": "https://a/"}) is None
+
+
+def test_config_validation_and_roundtrip():
+    with pytest.raises(ValueError):
+        NetworkCaptureConfig(output_format="pcap")
+    with pytest.raises(ValueError):
+        NetworkCaptureConfig(max_entries=0)
+
+    config = CrawlerRunConfig(
+        capture_network_requests=True,
+        network_capture_config={"status_ranges": [[400, 599]], "max_body_size": 1024, "max_entries": 100},
+    )
+    clone = CrawlerRunConfig.load(config.dump()).network_capture_config
+    assert clone.status_ranges == [(400, 599)]
+    assert (clone.max_body_size, clone.max_entries) == (1024, 100)
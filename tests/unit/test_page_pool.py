@@ -0,0 +1,184 @@
+"""Unit tests for the pre-warmed page pool of BrowserManager.
+
+Pages and contexts are fakes; no browser required.
+"""
+
+import asyncio
+
+import pytest
+
+from crawl4ai.async_configs import BrowserConfig
+from crawl4ai.async_crawler_strategy import AsyncPlaywrightCrawlerStrategy
+from crawl4ai.browser_manager import BrowserManager, _PagePool
+from crawl4ai.page_listeners import listen, unlisten
+
+
+class FakePage:
+    def __init__(self):
+        self.handlers = []
+        self.closed = False
+        self.visited = []
+        self.viewport_size = {"width": 1080, "height": 600}
+        self.headers = None
+
+    def is_closed(self):
+        return self.closed
+
+    def on(self, event, handler):
+        self.handlers.append((event, handler))
+
+    def remove_listener(self, event, handler):
+        self.handlers.remove((event, handler))
+
+    async def close(self):
+        self.closed = True
+
+    async def goto(self, url):
+        self.visited.append(url)
+
+    async def unroute_all(self):
+        pass
+
+    async def set_extra_http_headers(self, headers):
+        self.headers = headers
+
+    async def set_viewport_size(self, size):
+        self.viewport_size = size
+
+
+class FakeContext:
+    def __init__(self):
+        self.created = 0
+        self.pages = []
+
+    async def new_page(self):
+        self.created += 1
+        page = FakePage()
+        self.pages.append(page)
+        return page
+
+
+def _pool(context, size=2, max_uses=3):
+    return _PagePool(context.new_page, target_size=size, max_uses=max_uses,
+                     viewport={"width": 800, "height": 600})
+
+
+@pytest.mark.asyncio
+class TestPagePool:
+    async def test_refills_in_background(self):
+        context = FakeContext()
+        pool = _pool(context)
+        first = await pool.acquire()
+        await asyncio.sleep(0)
+        await pool._refill_task
+        # One page in use plus one ready makes the target of two.
+        assert len(pool._idle) == 1 and context.created == 2
+        second = await pool.acquire()
+        assert second is not first and second is context.pages[1]
+
+    async def test_release_resets_and_reuses(self):
+        context = FakeContext()
+        pool = _pool(context, size=1)
+        page = await pool.acquire()
+        page.headers = {"X": "1"}
+        assert await pool.release(page)
+        assert page.visited == ["about:blank"]
+        assert page.headers == {}
+        assert page.viewport_size == {"width": 800, "height": 600}
+        assert await pool.acquire() is page
+
+    async def test_max_uses_retires_page(self):
+        context = FakeContext()
+        pool = _pool(context, size=1, max_uses=2)
+        page = await pool.acquire()
+        assert await pool.release(page)
+        assert await pool.acquire() is page
+        assert not await pool.release(page)
+        assert not pool.owns(page)
+
+    async def test_leftover_handlers_are_not_reused(self):
+        context = FakeContext()
+        pool = _pool(context)
+        page = await pool.acquire()
+        handler = lambda response: None
+        listen(page, "response", handler)
+        listen(page, "download", handler)
+        unlisten(page, "download", handler)
+        assert not await pool.release(page)
+
+        page = await pool.acquire()
+        listen(page, "download", handler)
+        unlisten(page, "download", handler)
+        assert await pool.release(page)
+
+    async def test_pages_beyond_target_are_closed(self):
+        context = FakeContext()
+        pool = _pool(context, size=1)
+        first = await pool.acquire()
+        second = await pool.acquire()
+        assert not await pool.release(first)  # second still counts toward the target
+        assert not pool.owns(first)
+        assert await pool.release(second)
+
+    async def test_closed_pages_are_skipped(self):
+        context = FakeContext()
+        pool = _pool(context, size=1)
+        page = await pool.acquire()
+        assert await pool.release(page)
+        page.closed = True
+        assert await pool.acquire() is not page
+
+
+@pytest.mark.asyncio
+async def test_browser_manager_uses_pool_per_context():
+    manager = BrowserManager(BrowserConfig(page_pool_size=2, page_pool_max_uses=5))
+    context = FakeContext()
+
+    page = await manager._new_page_for_context(context, "sig")
+    assert await manager.recycle_page(page)
+    assert await manager._new_page_for_context(context, "sig") is page
+
+    manager._discard_page_pool("sig")
+    assert not await manager.recycle_page(page)
+
+
+@pytest.mark.asyncio
+async def test_pages_handed_to_user_hooks_are_not_reused():
+    strategy = AsyncPlaywrightCrawlerStrategy(browser_config=BrowserConfig(page_pool_size=1))
+    manager = strategy.browser_manager
+    context = FakeContext()
+
+    async def recycle(page):
+        # As crawl() does when it releases a non-session page
+        return await manager.recycle_page(page, reusable=not strategy._has_page_hooks())
+
+    page = await manager._new_page_for_context(context, "sig")
+    assert await recycle(page)
+
+    async def before_goto(page, **kwargs):
+        page.on("response", lambda response: None)
+
+    strategy.set_hook("before_goto", before_goto)
+    crawled = []
+    for _ in range(2):
+        crawled.append(await manager._new_page_for_context(context, "sig"))
+        await strategy.execute_hook("before_goto", crawled[-1], context=context, url="u", config=None)
+        assert not await recycle(crawled[-1])
+    # The hooked page is not handed out again, so hook handlers never pile up
+    assert crawled[0] is page and crawled[1] is not page
+    assert [len(p.handlers) for p in crawled] == [1, 1]
+
+
+@pytest.mark.asyncio
+async def test_browser_manager_without_pool_creates_pages():
+    manager = BrowserManager(BrowserConfig())
+    context = FakeContext()
+    page = await manager._new_page_for_context(context, "sig")
+    assert not await manager.recycle_page(page)
+    assert manager._page_pools == {}
+
+
+def test_config_roundtrip():
+    config = BrowserConfig(page_pool_size=4, page_pool_max_uses=10)
+    clone = BrowserConfig.load(config.dump())
+    assert (clone.page_pool_size, clone.page_pool_max_uses) == (4, 10)
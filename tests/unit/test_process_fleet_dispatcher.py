@@ -0,0 +1,94 @@
+"""Unit tests for ProcessFleetDispatcher.
+
+Workers use AsyncHTTPCrawlerStrategy on raw: URLs, so no browser or network
+is required. Each test spawns real worker processes.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from crawl4ai import AsyncWebCrawler, CacheMode, CrawlerRunConfig
+from crawl4ai.async_crawler_strategy import AsyncHTTPCrawlerStrategy
+from crawl4ai.async_dispatcher import DeadLetterSink, ProcessFleetDispatcher
+
+
+def _broken_strategy():
+    raise RuntimeError("cannot start browser")
+
+
+def _raw_urls(n):
+    return [f"raw:<html><body><p>page {i}</p></body></html>" for i in range(n)]
+
+
+class TestSharding:
+    def test_same_host_same_worker(self):
+        dispatcher = ProcessFleetDispatcher(num_workers=4)
+        assert dispatcher.shard_for("https://a.com/x") == dispatcher.shard_for("https://A.com/y?q=1")
+
+    def test_all_urls_assigned_once(self):
+        dispatcher = ProcessFleetDispatcher(num_workers=3)
+        urls = [f"https://host{i % 7}.com/{i}" for i in range(50)]
+        shards = dispatcher._shard(urls)
+        assert sorted(u for shard in shards.values() for u in shard) == sorted(urls)
+        for shard in shards.values():
+            assert len({dispatcher.shard_for(u) for u in shard}) == 1
+
+
+@pytest.mark.asyncio
+class TestFleetRun:
+    async def test_batch_returns_every_url(self):
+        crawler = AsyncWebCrawler(crawler_strategy=AsyncHTTPCrawlerStrategy())
+        dispatcher = ProcessFleetDispatcher(
+            num_workers=2, crawler_strategy_factory=AsyncHTTPCrawlerStrategy
+        )
+        urls = _raw_urls(4)
+        results = await crawler.arun_many(
+            urls, config=CrawlerRunConfig(cache_mode=CacheMode.BYPASS, verbose=False),
+            dispatcher=dispatcher,
+        )
+        assert len(results) == 4
+        assert all(r.success for r in results)
+        assert sorted(str(r.markdown).strip() for r in results) == [f"page {i}" for i in range(4)]
+        assert all(r.dispatch_result is not None for r in results)
+
+    async def test_stream(self):
+        crawler = AsyncWebCrawler(crawler_strategy=AsyncHTTPCrawlerStrategy())
+        dispatcher = ProcessFleetDispatcher(
+            num_workers=2, crawler_strategy_factory=AsyncHTTPCrawlerStrategy
+        )
+        config = CrawlerRunConfig(cache_mode=CacheMode.BYPASS, stream=True, verbose=False)
+        results = [r async for r in await crawler.arun_many(_raw_urls(3), config=config, dispatcher=dispatcher)]
+        assert len(results) == 3
+
+    async def test_pipe_readers_leave_the_default_executor_free(self):
+        # One default thread: readers blocked in recv() must not hold it
+        executor = ThreadPoolExecutor(max_workers=1)
+        asyncio.get_running_loop().set_default_executor(executor)
+        crawler = AsyncWebCrawler(crawler_strategy=AsyncHTTPCrawlerStrategy())
+        dispatcher = ProcessFleetDispatcher(
+            num_workers=3, crawler_strategy_factory=AsyncHTTPCrawlerStrategy
+        )
+        config = CrawlerRunConfig(cache_mode=CacheMode.BYPASS, stream=True, verbose=False)
+        results = []
+        async for result in await crawler.arun_many(_raw_urls(6), config=config, dispatcher=dispatcher):
+            assert await asyncio.wait_for(asyncio.to_thread(len, "free"), timeout=1) == 4
+            results.append(result)
+        assert len(results) == 6
+        executor.shutdown()
+        assert all(r.success for r in results)
+
+    async def test_worker_failure_reports_every_url(self):
+        crawler = AsyncWebCrawler(crawler_strategy=AsyncHTTPCrawlerStrategy())
+        dispatcher = ProcessFleetDispatcher(
+            num_workers=1, crawler_strategy_factory=_broken_strategy,
+            dead_letter_sink=DeadLetterSink(),
+        )
+        results = await crawler.arun_many(
+            _raw_urls(2), config=CrawlerRunConfig(cache_mode=CacheMode.BYPASS, verbose=False),
+            dispatcher=dispatcher,
+        )
+        assert len(results) == 2
+        assert not any(r.success for r in results)
+        assert "cannot start browser" in results[0].error_message
@@ -0,0 +1,68 @@
+"""Unit tests for wait_until="quiescent".
+
+The page is a fake whose DOM "mutates" on a schedule; no browser required.
+"""
+
+import time
+
+import pytest
+
+from crawl4ai.async_configs import CrawlerRunConfig
+from crawl4ai.async_crawler_strategy import AsyncPlaywrightCrawlerStrategy, _NetworkActivity
+
+
+class FakePage:
+    def __init__(self, mutations_until=0.0):
+        # The DOM keeps changing until ``mutations_until`` seconds from now
+        self.quiet_from = time.monotonic() + mutations_until
+        self.listeners = {}
+
+    async def evaluate(self, script):
+        return max(0.0, time.monotonic() - self.quiet_from) * 1000
+
+    def on(self, event, handler):
+        self.listeners.setdefault(event, []).append(handler)
+
+    def remove_listener(self, event, handler):
+        self.listeners[event].remove(handler)
+
+
+@pytest.fixture
+def strategy():
+    return AsyncPlaywrightCrawlerStrategy()
+
+
+@pytest.mark.asyncio
+async def test_resolves_once_dom_is_stable(strategy):
+    page = FakePage(mutations_until=0.2)
+    waited, timed_out = await strategy.wait_for_quiescence(page, None, window=0.1, timeout=2)
+    assert not timed_out
+    assert 0.25 <= waited < 1.0
+
+
+@pytest.mark.asyncio
+async def test_waits_for_in_flight_requests(strategy):
+    page = FakePage()
+    network = _NetworkActivity(page).attach()
+    request = object()
+    network._started(request)
+    waited, timed_out = await strategy.wait_for_quiescence(page, network, window=0.05, timeout=0.2)
+    assert timed_out and waited >= 0.2
+
+    network._done(request)
+    waited, timed_out = await strategy.wait_for_quiescence(page, network, window=0.05, timeout=1)
+    assert not timed_out and waited < 0.5
+
+
+def test_network_activity_detaches_all_listeners():
+    page = FakePage()
+    network = _NetworkActivity(page).attach()
+    assert set(page.listeners) == {"request", "requestfinished", "requestfailed"}
+    network.detach()
+    assert all(not handlers for handlers in page.listeners.values())
+
+
+def test_config_roundtrip():
+    config = CrawlerRunConfig(wait_until="quiescent", quiescence_window=0.3, quiescence_timeout=5)
+    clone = CrawlerRunConfig.load(config.dump())
+    assert (clone.wait_until, clone.quiescence_window, clone.quiescence_timeout) == ("quiescent", 0.3, 5)
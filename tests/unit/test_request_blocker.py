@@ -0,0 +1,144 @@
+"""Unit tests for the compiled request blocker.
+
+Routes, contexts and CDP sessions are fakes; no browser required.
+"""
+
+import asyncio
+
+import pytest
+
+from crawl4ai.async_configs import BrowserConfig
+from crawl4ai.request_blocker import RequestBlocker, _DomainSuffixTrie
+
+
+class TestDomainSuffixTrie:
+    def test_matches_domain_and_subdomains(self):
+        trie = _DomainSuffixTrie(["doubleclick.net", "ads.linkedin.com"])
+        assert trie.matches("doubleclick.net")
+        assert trie.matches("stats.g.doubleclick.net")
+        assert trie.matches("ADS.LinkedIn.com")
+        assert not trie.matches("linkedin.com")
+        assert not trie.matches("notdoubleclick.net")
+
+
+class TestRequestBlocker:
+    def test_from_browser_config(self):
+        assert RequestBlocker.from_browser_config(BrowserConfig()) is None
+        blocker = RequestBlocker.from_browser_config(BrowserConfig(text_mode=True, avoid_ads=True))
+        assert "image" in blocker.resource_types and "png" in blocker.extensions
+        assert blocker.backend == "route"
+
+    def test_cdp_backend_needs_chromium(self):
+        config = BrowserConfig(browser_type="firefox", avoid_css=True, request_blocking_backend="cdp")
+        assert RequestBlocker.from_browser_config(config).backend == "route"
+
+    def test_match(self):
+        blocker = RequestBlocker(["image"], ["png", "css"], ["hotjar.com"])
+        assert blocker.match("https://example.com/a", "image") == "resource_type"
+        assert blocker.match("https://example.com/logo.PNG?v=3") == "extension"
+        assert blocker.match("https://static.hotjar.com/c.js", "script") == "domain"
+        assert blocker.match("https://example.com/png/page", "document") is None
+        assert blocker.match("data:image/png;base64,xx") is None
+
+    def test_url_patterns(self):
+        patterns = RequestBlocker([], ["png"], ["clarity.ms"], backend="cdp").url_patterns()
+        assert "*.png?*" in patterns and "*://*.clarity.ms/*" in patterns
+
+
+class FakeRequest:
+    def __init__(self, url, resource_type):
+        self.url = url
+        self.resource_type = resource_type
+
+
+class FakeRoute:
+    def __init__(self, url, resource_type="document"):
+        self.request = FakeRequest(url, resource_type)
+        self.outcome = None
+
+    async def abort(self, error_code=None):
+        self.outcome = "abort"
+
+    async def fallback(self):
+        self.outcome = "fallback"
+
+
+class FakeSession:
+    def __init__(self):
+        self.sent = []
+        self.handlers = {}
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+    async def send(self, method, params=None):
+        self.sent.append((method, params))
+
+
+class FakePage:
+    def once(self, event, handler):
+        pass
+
+
+class FakeContext:
+    def __init__(self):
+        self.routes = []
+        self.listeners = {}
+        self.pages = [FakePage()]
+        self.sessions = []
+
+    async def route(self, pattern, handler):
+        self.routes.append((pattern, handler))
+
+    def on(self, event, handler):
+        self.listeners[event] = handler
+
+    async def new_cdp_session(self, page):
+        session = FakeSession()
+        self.sessions.append(session)
+        return session
+
+
+@pytest.mark.asyncio
+async def test_route_backend_registers_one_handler_and_counts():
+    blocker = RequestBlocker(["image"], ["woff2"], ["segment.com"])
+    context = FakeContext()
+    await blocker.attach(context)
+    assert len(context.routes) == 1 and context.routes[0][0] == "**/*"
+
+    handler = context.routes[0][1]
+    routes = [
+        FakeRoute("https://example.com/", "document"),
+        FakeRoute("https://example.com/hero.jpg", "image"),
+        FakeRoute("https://example.com/font.woff2", "font"),
+        FakeRoute("https://cdn.segment.com/a.js", "script"),
+    ]
+    for route in routes:
+        await handler(route)
+    assert [r.outcome for r in routes] == ["fallback", "abort", "abort", "abort"]
+    assert blocker.stats["blocked"] == 3
+    assert blocker.stats["by_reason"] == {"resource_type": 1, "extension": 1, "domain": 1}
+    assert blocker.stats["estimated_bytes_saved"] == 15_000 + 30_000 + 20_000
+
+
+@pytest.mark.asyncio
+async def test_cdp_backend_blocks_in_browser():
+    blocker = RequestBlocker([], ["png"], ["hotjar.com"], backend="cdp")
+    context = FakeContext()
+    await blocker.attach(context)
+    page = context.pages[0]
+    await blocker.ready(page)
+
+    assert context.routes == [] and "page" in context.listeners
+    session = context.sessions[0]
+    assert session.sent[-1] == ("Network.setBlockedURLs", {"urls": blocker.url_patterns()})
+
+    session.handlers["Network.requestWillBeSent"]({"requestId": "1", "type": "Image"})
+    session.handlers["Network.loadingFailed"]({"requestId": "1", "blockedReason": "inspector"})
+    session.handlers["Network.loadingFailed"]({"requestId": "2", "errorText": "net::ERR_FAILED"})
+    assert blocker.stats["blocked"] == 1
+    assert blocker.stats["estimated_bytes_saved"] == 15_000
+
+    context.listeners["page"](FakePage())
+    await asyncio.sleep(0)
+    assert len(context.sessions) == 2
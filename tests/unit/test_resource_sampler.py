@@ -0,0 +1,127 @@
+"""Unit tests for the process-wide ResourceSampler.
+
+cgroup files are simulated in a temporary directory. No browser or network
+required.
+"""
+
+import threading
+import tracemalloc
+
+import pytest
+
+from crawl4ai.async_configs import CrawlerRunConfig
+from crawl4ai.async_dispatcher import MemoryAdaptiveDispatcher
+from crawl4ai.models import CrawlResult
+from crawl4ai.resource_sampler import ResourceSampler, _CgroupMemory
+
+GB = 1024 ** 3
+
+
+def _write(root, files):
+    for name, content in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+
+class TestCgroupMemory:
+    def test_v2_limit_excludes_inactive_file(self, tmp_path):
+        _write(tmp_path, {
+            "memory.current": str(3 * GB),
+            "memory.max": str(4 * GB),
+            "memory.stat": f"anon 123\ninactive_file {1 * GB}\nactive_file 5\n",
+        })
+        assert _CgroupMemory(str(tmp_path)).read(host_total=64 * GB) == (2 * GB, 4 * GB)
+
+    def test_v2_without_limit_falls_back(self, tmp_path):
+        _write(tmp_path, {"memory.current": "100", "memory.max": "max\n"})
+        assert _CgroupMemory(str(tmp_path)).read(host_total=64 * GB) is None
+
+    def test_v1(self, tmp_path):
+        _write(tmp_path, {
+            "memory/memory.usage_in_bytes": str(2 * GB),
+            "memory/memory.limit_in_bytes": str(8 * GB),
+            "memory/memory.stat": "total_inactive_file 0\n",
+        })
+        assert _CgroupMemory(str(tmp_path)).read(host_total=64 * GB) == (2 * GB, 8 * GB)
+
+    def test_v1_unlimited_is_larger_than_host(self, tmp_path):
+        _write(tmp_path, {
+            "memory/memory.usage_in_bytes": "100",
+            "memory/memory.limit_in_bytes": "9223372036854771712",
+        })
+        assert _CgroupMemory(str(tmp_path)).read(host_total=64 * GB) is None
+
+    def test_sampler_reports_cgroup_source(self, tmp_path):
+        _write(tmp_path, {"memory.current": str(1 * GB), "memory.max": str(2 * GB)})
+        sample = ResourceSampler(cgroup_root=str(tmp_path)).sample_now()
+        assert sample.source == "cgroup"
+        assert sample.memory_percent == pytest.approx(50.0)
+        assert sample.memory_limit_mb == 2048
+
+
+class TestSamplerThread:
+    def test_history_is_a_ring_buffer(self, tmp_path):
+        sampler = ResourceSampler(history_size=3, cgroup_root=str(tmp_path))
+        for _ in range(5):
+            sampler._tick()
+        assert len(sampler.history) == 3
+
+    def test_subscribers_and_refcount(self, tmp_path):
+        sampler = ResourceSampler(interval=0.01, cgroup_root=str(tmp_path))
+        received = threading.Event()
+        unsubscribe = sampler.subscribe(lambda sample: received.set())
+
+        sampler.acquire()
+        sampler.acquire()
+        assert received.wait(1.0)
+        sampler.release()
+        assert sampler.running
+        sampler.release()
+        assert not sampler.running
+
+        unsubscribe()
+        received.clear()
+        sampler._tick()
+        assert not received.is_set()
+
+    def test_allocations_by_stage(self, tmp_path):
+        sampler = ResourceSampler(trace_allocations=True, trace_every=1, cgroup_root=str(tmp_path))
+        assert sampler.allocations_by_stage() == {}
+        sampler.acquire()
+        try:
+            assert tracemalloc.is_tracing()
+            stages = sampler.allocations_by_stage()
+            assert stages and all(size > 0 for size in stages.values())
+        finally:
+            sampler.release()
+        assert not tracemalloc.is_tracing()
+
+
+class StaticSampler(ResourceSampler):
+    def __init__(self, memory_percent):
+        super().__init__(interval=0.01)
+        self.memory_percent = memory_percent
+
+    def sample_now(self):
+        sample = super().sample_now()
+        sample.memory_percent = self.memory_percent
+        return sample
+
+
+class OkCrawler:
+    async def arun(self, url, config=None, session_id=None):
+        return CrawlResult(url=url, html="<p>ok</p>", success=True, status_code=200)
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_reads_memory_from_sampler():
+    sampler = StaticSampler(memory_percent=42.0)
+    dispatcher = MemoryAdaptiveDispatcher(check_interval=0.01, sampler=sampler)
+    results = await dispatcher.run_urls(
+        urls=["https://example.com/a", "https://example.com/b"],
+        crawler=OkCrawler(), config=CrawlerRunConfig(),
+    )
+    assert all(r.result.success for r in results)
+    assert dispatcher.current_memory_percent == 42.0
+    assert not sampler.running
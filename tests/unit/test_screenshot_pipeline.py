@@ -0,0 +1,207 @@
+"""Unit tests for the screenshot pipeline (format, bounds, stitching, file sink).
+
+Pages and the crawler strategy are fakes; no browser required.
+"""
+
+import base64
+import os
+import uuid
+from io import BytesIO
+from unittest.mock import MagicMock
+
+import pytest
+from PIL import Image
+
+from crawl4ai import AsyncWebCrawler, CacheMode
+from crawl4ai.async_configs import CrawlerRunConfig
+from crawl4ai.async_crawler_strategy import AsyncCrawlerStrategy, AsyncPlaywrightCrawlerStrategy
+from crawl4ai.models import AsyncCrawlResponse
+from crawl4ai.screenshot_pipeline import (
+    normalize_format,
+    reencode,
+    stitch,
+    write_to_sink,
+)
+
+
+def _png(width=100, height=50, color="red") -> bytes:
+    buf = BytesIO()
+    Image.new("RGB", (width, height), color=color).save(buf, format="PNG")
+    return buf.getvalue()
+
+
+def _open(data: bytes) -> Image.Image:
+    return Image.open(BytesIO(data))
+
+
+def test_normalize_format():
+    assert normalize_format(None) == "png"
+    assert normalize_format("JPG") == "jpeg"
+    assert normalize_format("webp") == "webp"
+    with pytest.raises(ValueError):
+        normalize_format("gif")
+
+
+@pytest.mark.parametrize("fmt,pil_format", [("png", "PNG"), ("jpeg", "JPEG"), ("webp", "WEBP")])
+def test_reencode_format(fmt, pil_format):
+    assert _open(reencode(_png(), fmt)).format == pil_format
+
+
+def test_reencode_downscales_keeping_aspect_ratio():
+    img = _open(reencode(_png(400, 200), "jpeg", max_width=100))
+    assert img.size == (100, 50)
+    img = _open(reencode(_png(400, 200), "png", max_width=1000, max_height=50))
+    assert img.size == (100, 50)
+    # Never upscales
+    assert _open(reencode(_png(40, 20), "png", max_width=100)).size == (40, 20)
+
+
+def test_lower_quality_is_smaller():
+    noisy = Image.effect_noise((300, 300), 64).convert("RGB")
+    buf = BytesIO()
+    noisy.save(buf, format="PNG")
+    data = buf.getvalue()
+    assert len(reencode(data, "jpeg", quality=30)) < len(reencode(data, "jpeg", quality=95))
+
+
+def test_stitch_stacks_segments():
+    img = _open(stitch([_png(100, 50), _png(100, 30, "blue")], "png"))
+    assert img.size == (100, 80)
+    assert img.convert("RGB").getpixel((0, 70)) == (0, 0, 255)
+
+
+def test_sink_dedupes_by_content(tmp_path):
+    first = write_to_sink(_png(), str(tmp_path), "png")
+    second = write_to_sink(_png(), str(tmp_path), "png")
+    other = write_to_sink(_png(color="blue"), str(tmp_path), "jpeg")
+    assert first == second and first.endswith(".png")
+    assert other.endswith(".jpg")
+    assert sorted(os.listdir(tmp_path)) == sorted([os.path.basename(first), os.path.basename(other)])
+
+
+def test_config_roundtrip():
+    config = CrawlerRunConfig(
+        screenshot_format="jpg", screenshot_quality=60,
+        screenshot_max_width=1280, screenshot_dir="/tmp/shots",
+    )
+    clone = CrawlerRunConfig.load(config.dump())
+    assert clone.screenshot_format == "jpeg"
+    assert (clone.screenshot_quality, clone.screenshot_max_width, clone.screenshot_dir) == (60, 1280, "/tmp/shots")
+    with pytest.raises(ValueError):
+        CrawlerRunConfig(screenshot_format="bmp")
+
+
+class FakePage:
+    def __init__(self, data: bytes):
+        self.data = data
+        self.calls = []
+
+    async def screenshot(self, **kwargs):
+        self.calls.append(kwargs)
+        return self.data
+
+
+def _strategy():
+    strategy = AsyncPlaywrightCrawlerStrategy.__new__(AsyncPlaywrightCrawlerStrategy)
+    strategy.logger = MagicMock()
+    return strategy
+
+
+@pytest.mark.asyncio
+async def test_viewport_jpeg_is_captured_directly():
+    page = FakePage(_png())
+    await _strategy().take_screenshot_naive(page, screenshot_format="jpeg", screenshot_quality=40)
+    assert page.calls == [{"full_page": False, "type": "jpeg", "quality": 40}]
+
+
+@pytest.mark.asyncio
+async def test_viewport_bounds_are_applied():
+    page = FakePage(_png(400, 200))
+    encoded = await _strategy().take_screenshot_naive(
+        page, screenshot_format="webp", screenshot_max_width=200
+    )
+    img = _open(base64.b64decode(encoded))
+    assert img.format == "WEBP" and img.size == (200, 100)
+
+
+@pytest.mark.asyncio
+async def test_capture_screenshot_returns_bytes_and_error_image():
+    strategy = _strategy()
+    data = await strategy.capture_screenshot(FakePage(_png()), force_viewport_screenshot=True)
+    assert _open(data).format == "PNG"
+
+    class BrokenPage:
+        async def screenshot(self, **kwargs):
+            raise RuntimeError("gone")
+
+    data = await strategy.capture_screenshot(BrokenPage(), force_viewport_screenshot=True)
+    assert _open(data).size == (800, 600)
+
+
+@pytest.mark.asyncio
+async def test_error_image_written_to_sink_matches_its_extension(tmp_path):
+    class BrokenPage:
+        async def screenshot(self, **kwargs):
+            raise RuntimeError("gone")
+
+    for fmt, pil_format in (("png", "PNG"), ("webp", "WEBP")):
+        data = await _strategy().capture_screenshot(
+            BrokenPage(), force_viewport_screenshot=True, screenshot_format=fmt
+        )
+        path = write_to_sink(data, str(tmp_path), fmt)
+        assert path.endswith(f".{fmt}") and _open(open(path, "rb").read()).format == pil_format
+
+
+class SinkStrategy(AsyncCrawlerStrategy):
+    """Serves one page and writes its screenshot to the file sink, like the browser strategy."""
+
+    serves_local_content = True
+
+    def __init__(self):
+        self.crawls = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    async def start(self):
+        pass
+
+    async def close(self):
+        pass
+
+    def set_hook(self, hook_type, hook):
+        pass
+
+    def update_user_agent(self, user_agent):
+        pass
+
+    async def crawl(self, url, config=None, **kwargs):
+        self.crawls += 1
+        return AsyncCrawlResponse(
+            html="<html><body><h1>Shot</h1><p>A page with a screenshot.</p></body></html>",
+            response_headers={},
+            status_code=200,
+            screenshot_path=write_to_sink(_png(), config.screenshot_dir, "png"),
+        )
+
+
+@pytest.mark.asyncio
+async def test_file_sink_screenshots_are_served_from_cache(tmp_path):
+    url = f"https://example.com/shot-{uuid.uuid4().hex}"
+    config = CrawlerRunConfig(cache_mode=CacheMode.ENABLED, screenshot=True, screenshot_dir=str(tmp_path))
+    strategy = SinkStrategy()
+    async with AsyncWebCrawler(crawler_strategy=strategy) as crawler:
+        first = await crawler.arun(url, config=config)
+        assert first.cache_status == "miss" and os.path.isfile(first.screenshot_path)
+
+        again = await crawler.arun(url, config=config)
+        assert again.cache_status == "hit" and again.screenshot_path == first.screenshot_path
+        assert strategy.crawls == 1
+
+        # A screenshot file that is gone is taken again
+        os.remove(first.screenshot_path)
+        refetched = await crawler.arun(url, config=config)
+        assert refetched.cache_status == "miss" and strategy.crawls == 2
@@ -0,0 +1,102 @@
+"""Unit tests for in-flight request coalescing."""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from crawl4ai import AsyncWebCrawler, CacheMode, CrawlerRunConfig, ProxyConfig
+from crawl4ai.async_crawler_strategy import AsyncHTTPCrawlerStrategy
+from crawl4ai.single_flight import SingleFlight, coalesce_url, fetch_key
+
+
+@pytest_asyncio.fixture
+async def server(serve):
+    hits = {"count": 0}
+
+    async def page(request):
+        hits["count"] += 1
+        await asyncio.sleep(0.1)
+        body = (
+            "<html><head><title>Shared</title></head><body>"
+            "<div id='a'>" + "<p>Section A text of the page.</p>" * 20 + "</div>"
+            "<div id='b'>" + "<p>Section B text of the page.</p>" * 20 + "</div>"
+            "</body></html>"
+        )
+        return web.Response(text=body, content_type="text/html")
+
+    return await serve({"/page": page}) + "/page", hits
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_result_and_errors():
+    flight = SingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"body": "shared"}
+
+    results = await asyncio.gather(*(flight.do("k", fetch, share=dict) for _ in range(5)))
+    assert len(calls) == 1 and all(r == {"body": "shared"} for r in results)
+    assert flight.stats == {"leaders": 1, "followers": 4} and flight.in_flight == 0
+
+    async def fail():
+        await asyncio.sleep(0.05)
+        raise RuntimeError("boom")
+
+    outcomes = await asyncio.gather(*(flight.do("e", fail) for _ in range(3)), return_exceptions=True)
+    assert all(isinstance(o, RuntimeError) for o in outcomes)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_hands_over_to_a_follower():
+    flight = SingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "done"
+
+    leader = asyncio.create_task(flight.do("k", fetch))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(flight.do("k", fetch))
+    await asyncio.sleep(0.01)
+    leader.cancel()
+    assert await follower == "done"
+    assert len(calls) == 2
+
+
+def test_fetch_key_ignores_post_processing_only():
+    url = "https://Example.com:443/a?q=1#top"
+    assert coalesce_url(url) == "https://example.com/a?q=1"
+    base = fetch_key(url, CrawlerRunConfig())
+    assert fetch_key("https://example.com/a?q=1", CrawlerRunConfig(css_selector="#a", word_count_threshold=50)) == base
+    assert fetch_key(url, CrawlerRunConfig(screenshot=True)) != base
+    assert fetch_key(url, CrawlerRunConfig(js_code="1")) != base
+    assert fetch_key("https://example.com/a?q=2", CrawlerRunConfig()) != base
+    # Equal proxies compare by content, different ones do not
+    proxied = fetch_key(url, CrawlerRunConfig(proxy_config=ProxyConfig(server="http://p:1")))
+    assert proxied == fetch_key(url, CrawlerRunConfig(proxy_config=ProxyConfig(server="http://p:1")))
+    assert proxied != fetch_key(url, CrawlerRunConfig(proxy_config=ProxyConfig(server="http://p:2")))
+
+
+@pytest.mark.asyncio
+async def test_arun_coalesces_and_post_processes_per_caller(server):
+    url, hits = server
+    async with AsyncWebCrawler(crawler_strategy=AsyncHTTPCrawlerStrategy()) as crawler:
+        configs = [
+            CrawlerRunConfig(cache_mode=CacheMode.BYPASS, css_selector=selector)
+            for selector in ("#a", "#b", "#a")
+        ]
+        results = await asyncio.gather(*(crawler.arun(url, config=c) for c in configs))
+        assert hits["count"] == 1
+        assert "Section A" in results[0].markdown and "Section B" not in results[0].markdown
+        assert "Section B" in results[1].markdown and "Section A" not in results[1].markdown
+
+        off = CrawlerRunConfig(cache_mode=CacheMode.BYPASS, coalesce_requests=False)
+        await asyncio.gather(*(crawler.arun(url, config=off) for _ in range(2)))
+        assert hits["count"] == 3
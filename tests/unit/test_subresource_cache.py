@@ -0,0 +1,142 @@
+"""Unit tests for the on-disk subresource cache.
+
+Routes and responses are fakes; no browser or network required.
+"""
+
+import time
+
+import pytest
+
+from crawl4ai.subresource_cache import SubresourceCache, freshness_lifetime
+
+
+class TestFreshness:
+    @pytest.mark.parametrize("headers,expected", [
+        ({"Cache-Control": "public, max-age=600"}, 600),
+        ({"Cache-Control": "max-age=60, s-maxage=300"}, 300),
+        ({"Cache-Control": "private, max-age=600"}, None),
+        ({"Cache-Control": "no-store"}, None),
+        ({"Cache-Control": "no-cache, max-age=600"}, None),
+        ({"Cache-Control": "max-age=0"}, None),
+        ({"Cache-Control": "max-age=600", "Vary": "Cookie"}, None),
+        ({"Cache-Control": "max-age=600", "Vary": "Accept-Encoding"}, 600),
+        ({}, None),
+    ])
+    def test_cache_control(self, headers, expected):
+        assert freshness_lifetime(headers) == expected
+
+    def test_expires(self):
+        headers = {"Expires": "Thu, 01 Jan 2099 00:00:00 GMT"}
+        assert freshness_lifetime(headers) > 0
+        assert freshness_lifetime({"Expires": "Thu, 01 Jan 1998 00:00:00 GMT"}) is None
+        assert freshness_lifetime({"Expires": "0"}) is None
+
+
+class FakeRequest:
+    def __init__(self, url, resource_type="script", method="GET", headers=None):
+        self.url = url
+        self.resource_type = resource_type
+        self.method = method
+        self.headers = headers or {}
+
+
+class FakeResponse:
+    def __init__(self, body, headers, status=200):
+        self._body = body
+        self.headers = headers
+        self.status = status
+
+    async def body(self):
+        return self._body
+
+
+class FakeRoute:
+    def __init__(self, request, response=None):
+        self.request = request
+        self.response = response
+        self.fetched = 0
+        self.outcome = None
+
+    async def fetch(self):
+        self.fetched += 1
+        return self.response
+
+    async def fulfill(self, response=None, status=None, headers=None, body=None):
+        self.outcome = ("fulfill", response is not None, status, headers, body)
+
+    async def fallback(self):
+        self.outcome = ("fallback",)
+
+
+CACHEABLE = {"Cache-Control": "max-age=3600", "Content-Type": "text/javascript",
+             "Content-Encoding": "gzip"}
+
+
+@pytest.mark.asyncio
+async def test_miss_then_hit(tmp_path):
+    cache = SubresourceCache(str(tmp_path))
+    url = "https://example.com/app.js"
+
+    first = FakeRoute(FakeRequest(url), FakeResponse(b"console.log(1)", CACHEABLE))
+    await cache.handle_route(first)
+    assert first.fetched == 1 and first.outcome[1] is True
+
+    second = FakeRoute(FakeRequest(url))
+    await cache.handle_route(second)
+    _, _, status, headers, body = second.outcome
+    assert second.fetched == 0
+    assert (status, body) == (200, b"console.log(1)")
+    assert "Content-Encoding" not in headers  # body is stored decoded
+    assert cache.stats == {"hits": 1, "misses": 1, "stored": 1, "bytes_saved": 14}
+
+
+@pytest.mark.asyncio
+async def test_identical_bodies_share_one_blob(tmp_path):
+    cache = SubresourceCache(str(tmp_path))
+    for url in ("https://a.example.com/lib.js", "https://b.example.com/lib.js"):
+        assert await cache.put(url, 200, CACHEABLE, b"same")
+    assert len(list((tmp_path / "blobs").iterdir())) == 1
+    assert len(list((tmp_path / "index").iterdir())) == 2
+
+
+@pytest.mark.asyncio
+async def test_uncacheable_requests(tmp_path):
+    cache = SubresourceCache(str(tmp_path))
+    doc = FakeRoute(FakeRequest("https://example.com/", resource_type="document"))
+    await cache.handle_route(doc)
+    assert doc.outcome == ("fallback",)
+
+    authed = FakeRoute(FakeRequest("https://example.com/a.js", headers={"authorization": "x"}))
+    await cache.handle_route(authed)
+    assert authed.outcome == ("fallback",)
+
+    private = FakeRoute(
+        FakeRequest("https://example.com/p.js"),
+        FakeResponse(b"p", {"Cache-Control": "private, max-age=60"}),
+    )
+    await cache.handle_route(private)
+    assert private.outcome[0] == "fulfill" and cache.stats["stored"] == 0
+
+
+@pytest.mark.asyncio
+async def test_expired_entries_are_refetched(tmp_path, monkeypatch):
+    cache = SubresourceCache(str(tmp_path))
+    await cache.put("https://example.com/a.css", 200, {"Cache-Control": "max-age=10"}, b"a{}")
+    assert await cache.get("https://example.com/a.css") is not None
+    real_time = time.time
+    monkeypatch.setattr(time, "time", lambda: real_time() + 60)
+    assert await cache.get("https://example.com/a.css") is None
+
+
+@pytest.mark.asyncio
+async def test_prune_keeps_newest(tmp_path):
+    cache = SubresourceCache(str(tmp_path))
+    await cache.put("https://example.com/old.js", 200, CACHEABLE, b"o" * 100)
+    await cache.put("https://example.com/new.js", 200, CACHEABLE, b"n" * 100)
+    assert cache.prune(max_bytes=150) == 100
+    assert await cache.get("https://example.com/old.js") is None
+    assert await cache.get("https://example.com/new.js") is not None
+
+
+def test_for_directory_shares_instances(tmp_path):
+    assert SubresourceCache.for_directory(str(tmp_path)) is SubresourceCache.for_directory(str(tmp_path) + "/")
@@ -0,0 +1,92 @@
+"""Unit tests for WARC archiving and replay.
+
+Pages are fetched from a local aiohttp server, archived with WARCWriter and
+replayed through WARCReplayCrawlerStrategy.
+"""
+
+import gzip
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from crawl4ai import AsyncWebCrawler, CacheMode, CrawlerRunConfig, HTTPCrawlerConfig
+from crawl4ai.async_crawler_strategy import AsyncHTTPCrawlerStrategy
+from crawl4ai.warc import WARCWriter, build_index, parse_record, read_index
+from crawl4ai.warc_replay_strategy import WARCRecordNotFound, WARCReplayCrawlerStrategy
+
+ARTICLE = "<p>An archived article, long enough to count as real content.</p>" * 20
+
+
+@pytest_asyncio.fixture
+async def server(serve):
+    async def page(request):
+        body = f"<html><head><title>Archived</title></head><body><h1>Café</h1>{ARTICLE}</body></html>"
+        return web.Response(body=body.encode("latin-1"), headers={"Content-Type": "text/html; charset=iso-8859-1"})
+
+    async def moved(request):
+        raise web.HTTPFound("/page")
+
+    return await serve({"/page": page, "/moved": moved})
+
+
+async def archive(base, path, http2=False):
+    async with WARCWriter(path) as writer:
+        config = HTTPCrawlerConfig(http2=http2)
+        async with AsyncHTTPCrawlerStrategy(browser_config=config, warc_writer=writer) as strategy:
+            await strategy.crawl(f"{base}/moved", CrawlerRunConfig())
+    return writer
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("http2", [False, True])
+async def test_http_fetches_are_archived_with_redirects(server, tmp_path, http2):
+    path = str(tmp_path / "crawl.warc.gz")
+    writer = await archive(server, path, http2)
+    assert writer.records == 2
+
+    entries = read_index(path)
+    assert [(e.url, e.status) for e in entries] == [(f"{server}/moved", 302), (f"{server}/page", 200)]
+    # The sidecar matches a scan of the file
+    assert build_index(path) == entries
+
+    # One gzip member per record: warcinfo, then response + request per fetch
+    records = gzip.decompress(open(path, "rb").read()).split(b"WARC/1.1\r\n")[1:]
+    types = [parse_record(b"WARC/1.1\r\n" + r).headers["WARC-Type"] for r in records]
+    assert types == ["warcinfo", "response", "request", "response", "request"]
+
+
+@pytest.mark.asyncio
+async def test_replay_serves_archived_pages(server, tmp_path):
+    path = str(tmp_path / "crawl.warc.gz")
+    await archive(server, path)
+
+    async with WARCReplayCrawlerStrategy(str(tmp_path / "*.warc.gz")) as replay:
+        assert f"{server}/page" in replay and f"{server}/moved" in replay
+        response = await replay.crawl(f"{server}/moved")
+        assert response.status_code == 200
+        assert response.redirected_url == f"{server}/page"
+        assert "<h1>Café</h1>" in response.html
+        with pytest.raises(WARCRecordNotFound):
+            await replay.crawl(f"{server}/never-crawled")
+
+    # The whole pipeline runs offline over the archive
+    async with AsyncWebCrawler(crawler_strategy=WARCReplayCrawlerStrategy(path)) as crawler:
+        result = await crawler.arun(f"{server}/page", config=CrawlerRunConfig(cache_mode=CacheMode.BYPASS))
+        assert result.success and "# Café" in result.markdown.raw_markdown
+
+
+def test_uncompressed_archives_are_indexed(tmp_path):
+    body = b"<html><body>plain</body></html>"
+    block = b"HTTP/1.1 200 OK\r\nContent-Type: text/html\r\n\r\n" + body
+    record = (
+        b"WARC/1.0\r\nWARC-Type: response\r\nWARC-Target-URI: <https://example.com/>\r\n"
+        b"Content-Length: %d\r\n\r\n" % len(block) + block + b"\r\n\r\n"
+    )
+    path = tmp_path / "plain.warc"
+    path.write_bytes(record * 2)
+    entries = read_index(str(path))
+    assert [(e.url, e.offset, e.status) for e in entries] == [
+        ("https://example.com/", 0, 200),
+        ("https://example.com/", len(record), 200),
+    ]